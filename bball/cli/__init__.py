@@ -3,25 +3,38 @@
 from sportscore.cli.base import SportsCLI
 
 
+def _db_factory():
+    # pymongo is only imported once a command actually needs the database
+    from bball.mongo import Mongo
+    return Mongo().db
+
+
 def create_cli() -> SportsCLI:
     from bball.league_config import load_league_config, get_available_leagues
-    from bball.mongo import Mongo
     from bball.cli.commands.train import TrainCommand
     from bball.cli.commands.ensemble import EnsembleCommand
     from bball.cli.commands.models import ModelsCommand
     from bball.cli.commands.predict import PredictCommand
+    from bball.cli.commands.elo_sweep import EloSweepCommand
+    from bball.cli.commands.index_advisor import IndexAdvisorCommand
+    from bball.cli.commands.bench import BenchCommand
+    from bball.cli.commands.synth import SynthLeagueCommand
 
     cli = SportsCLI(
         prog="basketball",
         description="Basketball analytics and prediction platform",
         league_loader=load_league_config,
-        db_factory=lambda: Mongo().db,
+        db_factory=_db_factory,
         available_leagues=get_available_leagues,
     )
     cli.register(TrainCommand())
     cli.register(EnsembleCommand())
     cli.register(ModelsCommand())
     cli.register(PredictCommand())
+    cli.register(EloSweepCommand())
+    cli.register(IndexAdvisorCommand())
+    cli.register(BenchCommand())
+    cli.register(SynthLeagueCommand())
     return cli
 
 
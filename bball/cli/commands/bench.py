@@ -0,0 +1,107 @@
+"""BenchCommand — basketball bench nba --synthetic [--only features_row,per_game] [--save main] [--compare main]"""
+
+import argparse
+from sportscore.cli.base import BaseCommand, format_table
+
+
+class BenchCommand(BaseCommand):
+    name = "bench"
+    help = "Benchmark feature generation, PER, prediction and dataset hot paths"
+    description = "Times calculate_features_for_row, get_game_per_features, predict_date, the master CSV load and build_dataset, and saves or compares JSON baselines. Runs against an in-memory synthetic league (--synthetic) or another database (--uri/--db-name); the configured database only with --allow-configured-db. Exits non-zero when --compare finds a regression beyond --threshold."
+    epilog = """
+Examples:
+  basketball bench nba --synthetic --save main
+  basketball bench nba --synthetic --synthetic-scale 5 --only features_row,per_game --compare main
+  basketball bench nba --uri mongodb://bench-host:27017 --db-name bball --rows 500 --compare main
+  basketball bench nba --allow-configured-db --only predict_date
+  basketball bench nba --report /tmp/after.json --compare /tmp/before.json
+"""
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("--only", type=str, default=None,
+                            help="Comma-separated benchmarks (default: all)")
+        parser.add_argument("--rows", type=int, default=200, help="Sample games per benchmark (default: 200)")
+        parser.add_argument("--repeats", type=int, default=3, help="Timed repeats; the median is kept (default: 3)")
+        parser.add_argument("--season", type=str, default=None,
+                            help="Season to sample (default: latest with completed games)")
+        parser.add_argument("--save", type=str, default=None,
+                            help="Save the run as a baseline name (benchmarks/baselines/<league>/) or .json path")
+        parser.add_argument("--compare", type=str, default=None,
+                            help="Baseline name or .json path to compare against")
+        parser.add_argument("--report", type=str, default=None,
+                            help="Compare this saved report instead of running benchmarks")
+        parser.add_argument("--threshold", type=float, default=None,
+                            help="Relative slowdown counted as a regression (default: 0.10)")
+        parser.add_argument("--baseline-dir", type=str, default=None,
+                            help="Directory for named baselines (default: benchmarks/baselines)")
+        parser.add_argument("--synthetic", action="store_true",
+                            help="Benchmark an in-memory synthetic league (requires mongomock)")
+        parser.add_argument("--synthetic-seasons", type=int, default=2,
+                            help="Seasons in the synthetic league (default: 2)")
+        parser.add_argument("--synthetic-scale", type=float, default=1.0,
+                            help="Team count multiplier for the synthetic league (default: 1)")
+        parser.add_argument("--uri", type=str, default=None,
+                            help="MongoDB URI of the database to benchmark (default: mongodb://localhost:27017)")
+        parser.add_argument("--db-name", type=str, default=None,
+                            help="Database to benchmark, e.g. one filled by synth_league")
+        parser.add_argument("--allow-configured-db", action="store_true",
+                            help="Allow benchmarking the configured database")
+
+    def handle(self, args: argparse.Namespace, league, db) -> None:
+        from bball.utils.benchmarks import (
+            DEFAULT_THRESHOLD,
+            baseline_path,
+            benchmark_database,
+            compare_reports,
+            format_result,
+            load_report,
+            run_benchmarks,
+            save_report,
+        )
+
+        if args.report:
+            report = load_report(baseline_path(league.league_id, args.report, args.baseline_dir))
+        else:
+            names = [n.strip() for n in args.only.split(",") if n.strip()] if args.only else None
+            try:
+                target = benchmark_database(
+                    db, league, uri=args.uri, db_name=args.db_name, synthetic=args.synthetic,
+                    allow_configured_db=args.allow_configured_db,
+                    seasons=args.synthetic_seasons, scale=args.synthetic_scale,
+                )
+                report = run_benchmarks(
+                    league, target, names=names, rows=args.rows, repeats=args.repeats, season=args.season,
+                    synthetic=args.synthetic,
+                )
+            except ValueError as e:
+                self.error(str(e))
+
+        rows = [[name, format_result(entry), entry.get("samples", "-")]
+                for name, entry in report["results"].items()]
+        print(f"\nBenchmarks ({report['league']}, season {report.get('season')}, rev {report.get('git_rev')}):")
+        print(format_table(["Benchmark", "Result", "Samples"], rows))
+
+        if args.save:
+            path = save_report(report, baseline_path(league.league_id, args.save, args.baseline_dir))
+            print(f"\nSaved baseline to {path}")
+
+        if not args.compare:
+            return
+        baseline = load_report(baseline_path(league.league_id, args.compare, args.baseline_dir))
+        threshold = args.threshold if args.threshold is not None else DEFAULT_THRESHOLD
+        comparison = compare_reports(report, baseline, threshold=threshold)
+        rows = [
+            [c["name"],
+             format_result(c["baseline"]) if c["baseline"] else "-",
+             format_result(c["current"]) if c["current"] else "-",
+             f"{c['change']:+.1%}" if c["change"] is not None else "-",
+             c["status"]]
+            for c in comparison
+        ]
+        print(f"\nCompared with {args.compare} (rev {baseline.get('git_rev')}, threshold {threshold:.0%}):")
+        print(format_table(["Benchmark", "Baseline", "Current", "Change", "Status"], rows))
+
+        regressions = [c["name"] for c in comparison if c["status"] == "regression"]
+        if regressions:
+            print(f"\nRegressions: {', '.join(regressions)}")
+            raise SystemExit(1)
@@ -0,0 +1,75 @@
+"""EloSweepCommand — basketball elo_sweep nba [--k 12,16,20] [--home-advantage 40,60,80] [--carryover none,0.85]"""
+
+import argparse
+from sportscore.cli.base import BaseCommand, format_table
+
+
+def _parse_values(raw: str):
+    """'12,16,none' -> [12.0, 16.0, None] ('none'/'league' mean the league's own rule)."""
+    values = []
+    for part in raw.split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        values.append(None if part in ("none", "league") else float(part))
+    return values
+
+
+class EloSweepCommand(BaseCommand):
+    name = "elo_sweep"
+    help = "Score a grid of Elo K / home advantage / carryover values"
+    description = "Replays every game once for all combinations and reports log loss, Brier and accuracy per combination. Uses the league elo: config for neutral-site and game-type home advantage overrides."
+    epilog = """
+Examples:
+  basketball elo_sweep nba
+  basketball elo_sweep nba --k 12,16,20,league --home-advantage 40,60,80,100
+  basketball elo_sweep cbb --carryover none,0.6,0.75 --eval-from-season 2015-2016 --top 20
+"""
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("--k", type=str, default="12,16,20,24,28,league",
+                            help="Comma-separated K values ('league' = league K schedule)")
+        parser.add_argument("--home-advantage", type=str, default="40,60,80,100,120",
+                            help="Comma-separated home advantage values")
+        parser.add_argument("--carryover", type=str, default="none,0.75,0.85",
+                            help="Comma-separated season carryover factors ('none' = no regression)")
+        parser.add_argument("--eval-from-season", type=str, default=None,
+                            help="Only score games from this season on (e.g., 2015-2016)")
+        parser.add_argument("--top", type=int, default=10, help="Number of combinations to show (default: 10)")
+
+    def handle(self, args: argparse.Namespace, league, db) -> None:
+        from bball.stats.elo_engine import EloParams, load_elo_games
+        from bball.stats.elo_sweep import sweep_elo_params
+
+        k_values = _parse_values(args.k)
+        home_advantages = [v for v in _parse_values(args.home_advantage) if v is not None]
+        carryover_alphas = _parse_values(args.carryover)
+        if not k_values or not home_advantages or not carryover_alphas:
+            self.error("--k, --home-advantage and --carryover must each have at least one value")
+
+        base = EloParams.from_league(league)
+        games = load_elo_games(db, league)
+        results = sweep_elo_params(
+            games,
+            k_values=k_values,
+            home_advantages=home_advantages,
+            carryover_alphas=carryover_alphas,
+            base=base,
+            eval_from_season=args.eval_from_season,
+        )
+        if not results or not results[0]["games"]:
+            print("No completed games to score.")
+            return
+
+        print(f"Scored {results[0]['games']} games x {len(results)} combinations")
+        rows = []
+        for r in results[:args.top]:
+            rows.append([
+                "league" if r["k"] is None else f"{r['k']:g}",
+                f"{r['home_advantage']:g}",
+                "none" if r["carryover_alpha"] is None else f"{r['carryover_alpha']:g}",
+                f"{r['log_loss']:.4f}",
+                f"{r['brier']:.4f}",
+                f"{r['accuracy'] * 100:.2f}%",
+            ])
+        print(format_table(["K", "Home Adv", "Carryover", "Log Loss", "Brier", "Accuracy"], rows))
@@ -0,0 +1,83 @@
+"""IndexAdvisorCommand — basketball index_advisor nba --profile-dir /tmp/bball_queries [--save] [--apply]"""
+
+import argparse
+import os
+from sportscore.cli.base import BaseCommand, format_table
+
+
+class IndexAdvisorCommand(BaseCommand):
+    name = "index_advisor"
+    help = "Recommend compound indexes from recorded query shapes"
+    description = "Reads query-shape profiles recorded with BBALL_QUERY_PROFILE_DIR set and recommends compound indexes (equality, sort, range) not already covered by existing indexes. --save stores them for ensure_indexes; --apply creates them now."
+    epilog = """
+Examples:
+  BBALL_QUERY_PROFILE_DIR=/tmp/bball_queries basketball predict nba --date 2025-01-15
+  basketball index_advisor nba --profile-dir /tmp/bball_queries
+  basketball index_advisor nba --profile-dir /tmp/bball_queries --min-count 5 --save --apply
+"""
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("--profile-dir", type=str, default=os.environ.get("BBALL_QUERY_PROFILE_DIR"),
+                            help="Directory with recorded profiles (default: $BBALL_QUERY_PROFILE_DIR)")
+        parser.add_argument("--min-count", type=int, default=1, help="Ignore shapes seen fewer times (default: 1)")
+        parser.add_argument("--shapes", type=int, default=10, help="Number of slowest shapes to show (default: 10)")
+        parser.add_argument("--save", action="store_true", help="Save recommendations for ensure_indexes")
+        parser.add_argument("--apply", action="store_true", help="Create the recommended indexes now")
+
+    def handle(self, args: argparse.Namespace, league, db) -> None:
+        from bball.data.query_profile import (
+            apply_index_specs,
+            load_index_recommendations,
+            load_profiles,
+            recommend_indexes,
+            save_index_recommendations,
+        )
+
+        if not args.profile_dir:
+            self.error("--profile-dir is required (or set BBALL_QUERY_PROFILE_DIR)")
+        shapes = load_profiles(args.profile_dir)
+        if not shapes:
+            print(f"No query profiles found in {args.profile_dir}")
+            return
+
+        league_collections = set(league.collections.values())
+        shapes = [s for s in shapes if s["collection"] in league_collections]
+        print(f"Slowest query shapes ({len(shapes)} recorded for {league.league_id}):")
+        rows = [
+            [s["collection"], s["op"], str(s["filter"])[:60], ",".join(s["sort"]) or "-",
+             s["count"], f"{s['total_ms']:.0f}", f"{s['max_ms']:.1f}"]
+            for s in shapes[:args.shapes]
+        ]
+        print(format_table(["Collection", "Op", "Filter", "Sort", "Count", "Total ms", "Max ms"], rows))
+
+        existing = {
+            name: list(db[name].index_information().values())
+            for name in {s["collection"] for s in shapes}
+        }
+        recommendations = recommend_indexes(shapes, league=league, existing=existing, min_count=args.min_count)
+        if not recommendations:
+            print("\nExisting indexes cover every recorded query shape.")
+            return
+
+        print("\nRecommended indexes:")
+        rows = []
+        for coll_key, entries in recommendations.items():
+            for entry in entries:
+                keys = ", ".join(f"{k}:{d}" for k, d in entry["keys"])
+                rows.append([coll_key, keys, entry["queries"], f"{entry['total_ms']:.0f}"])
+        print(format_table(["Collection", "Keys", "Queries", "Total ms"], rows))
+
+        if args.save:
+            path = save_index_recommendations(league, recommendations)
+            print(f"\nSaved to {path} (applied by ensure_indexes)")
+        if args.apply:
+            if args.save:
+                specs = load_index_recommendations(league)
+            else:
+                specs = [
+                    (league.collections[coll_key], [(k, int(d)) for k, d in entry["keys"]], {})
+                    for coll_key, entries in recommendations.items()
+                    for entry in entries
+                ]
+            created = apply_index_specs(db, specs)
+            print(f"Created {created} index(es)")
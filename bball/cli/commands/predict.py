@@ -72,4 +72,5 @@ Examples:
         headers = ["Home", "Away", "Winner", "Home%", "Away%", "Odds", "Points"]
         print(format_table(headers, rows))
         if args.save:
+            service.materialize_chat_baselines(args.date)
             print("\nPredictions saved to DB.")
\ No newline at end of file
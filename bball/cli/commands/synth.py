@@ -0,0 +1,75 @@
+"""SynthLeagueCommand — basketball synth_league nba --seasons 3 --scale 5 [--db-name bball_synthetic] [--drop]"""
+
+import argparse
+import time
+from sportscore.cli.base import BaseCommand, format_table
+
+
+class SynthLeagueCommand(BaseCommand):
+    name = "synth_league"
+    help = "Generate a synthetic league for offline profiling and load tests"
+    description = "Simulates seasons of games, box scores, player stats, injuries, venues, pregame lines and rosters in the league's collection schema. Writes to a separate database (--uri/--db-name), never the configured one. To benchmark an in-memory league without a MongoDB server, use 'bench --synthetic', which generates and benchmarks in one process."
+    epilog = """
+Examples:
+  basketball synth_league nba --seasons 3
+  basketball synth_league nba --seasons 5 --scale 5 --db-name bball_synth_5x --drop
+  basketball synth_league nba --scale 20 --also cbb --db-name bball_synth_20x
+  basketball bench nba --db-name bball_synth_20x
+"""
+
+    def add_arguments(self, parser: argparse.ArgumentParser) -> None:
+        parser.add_argument("--seasons", type=int, default=3, help="Number of seasons (default: 3)")
+        parser.add_argument("--end-season", type=str, default=None,
+                            help="Last season, e.g. 2024-2025 (default: last completed season)")
+        parser.add_argument("--teams", type=int, default=30, help="Teams per league before --scale (default: 30)")
+        parser.add_argument("--games-per-team", type=int, default=82, help="Regular-season games per team (default: 82)")
+        parser.add_argument("--roster-size", type=int, default=15, help="Players per roster (default: 15)")
+        parser.add_argument("--scale", type=float, default=1.0, help="Multiplies the team count (default: 1)")
+        parser.add_argument("--also", type=str, default=None,
+                            help="Comma-separated extra leagues to generate into the same database")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+        parser.add_argument("--uri", type=str, default="mongodb://localhost:27017",
+                            help="Target MongoDB URI (default: mongodb://localhost:27017)")
+        parser.add_argument("--db-name", type=str, default="bball_synthetic",
+                            help="Target database name (default: bball_synthetic)")
+        parser.add_argument("--drop", action="store_true", help="Replace existing synthetic collections")
+
+    def handle(self, args: argparse.Namespace, league, db) -> None:
+        from pymongo import MongoClient
+        from bball.data.synthetic import SyntheticLeagueSpec, generate_synthetic_league
+        from bball.league_config import load_league_config
+
+        if args.db_name == getattr(db, "name", None):
+            self.error(f"--db-name {args.db_name} is the configured database; pick another name")
+        target = MongoClient(args.uri)[args.db_name]
+
+        leagues = [league] + [
+            load_league_config(name.strip()) for name in (args.also or "").split(",") if name.strip()
+        ]
+        rows = []
+        for i, lg in enumerate(leagues):
+            spec = SyntheticLeagueSpec(
+                seasons=args.seasons,
+                end_season=args.end_season,
+                teams=args.teams,
+                games_per_team=args.games_per_team,
+                roster_size=args.roster_size,
+                scale=args.scale,
+                seed=args.seed + i,
+            )
+            print(f"\nGenerating {lg.league_id}: {spec.team_count} teams x {args.seasons} season(s) -> {args.db_name}")
+            start = time.time()
+            try:
+                summary = generate_synthetic_league(
+                    target, lg, spec, drop=args.drop, id_offset=i * 10_000_000,
+                    progress=lambda season, games: print(f"  {season}: {games} games"),
+                )
+            except ValueError as e:
+                self.error(str(e))
+            elapsed = time.time() - start
+            for coll, count in sorted(summary["counts"].items()):
+                rows.append([lg.league_id, coll, count])
+            print(f"  Done in {elapsed:.1f}s")
+
+        print()
+        print(format_table(["League", "Collection", "Documents"], rows))
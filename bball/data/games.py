@@ -232,7 +232,7 @@ class GamesRepository(BaseRepository):
         """Insert or update a game by game_id."""
         result = self.update_one(
             {'game_id': game_id},
-            {'$set': game_data},
+            {'$set': {**game_data, 'updated_at': datetime.utcnow()}},
             upsert=True
         )
         return result.acknowledged
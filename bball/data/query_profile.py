@@ -0,0 +1,416 @@
+"""
+Query Profile - query-shape profiler and index advisor for MongoDB access.
+
+Profiling hooks into pymongo command monitoring, so it sees every read issued
+by the repositories (GamesRepository, PlayerStatsRepository, ...) as well as
+the raw db[...] fallback paths in feature code. Each command is reduced to a
+shape - collection, operation, filter fields/operators and sort keys, with
+literal values dropped - and counted with its latency.
+
+The advisor turns recorded shapes into compound indexes (equality fields,
+then sort fields, then range fields), drops the ones an existing index or a
+longer recommendation already covers, and saves them per league under
+leagues/indexes/, where ensure_indexes picks them up.
+
+Usage:
+    # Record: any process that connects through bball.mongo
+    BBALL_QUERY_PROFILE_DIR=/tmp/bball_queries basketball predict nba --date 2025-01-15
+
+    # Advise / apply
+    basketball index_advisor nba --profile-dir /tmp/bball_queries --save --apply
+
+    from bball.data.query_profile import load_profiles, recommend_indexes
+    recs = recommend_indexes(load_profiles('/tmp/bball_queries'), league)
+"""
+
+import atexit
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pymongo import monitoring
+
+# Commands whose filters are worth indexing for
+_READ_COMMANDS = ("find", "aggregate", "count", "distinct", "update", "delete", "findAndModify")
+
+# Operators that bound a range (index after equality and sort fields)
+_RANGE_OPS = {"$gt", "$gte", "$lt", "$lte"}
+# Equality-like operators
+_EQUALITY_OPS = {"$eq", "$in"}
+# Operators an index can't use selectively; such fields are left out
+_UNINDEXABLE_OPS = {"$exists", "$ne", "$nin", "$not", "$regex", "$type", "$size", "$elemMatch"}
+
+PROFILE_FILE_PREFIX = "queries-"
+
+
+# =============================================================================
+# Shapes
+# =============================================================================
+
+def query_shape(value: Any) -> Any:
+    """Filter with literal values replaced by '?' (operators and field names kept)."""
+    if isinstance(value, dict):
+        return {k: query_shape(v) for k, v in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        # Logical operator branches keep their shapes; literal lists collapse
+        if value and all(isinstance(v, dict) for v in value):
+            return [query_shape(v) for v in value]
+        return "?"
+    return "?"
+
+
+def _command_shape(name: str, command: Dict[str, Any]) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """(collection, {op, filter, sort}) for a command, or None if not profiled."""
+    collection = command.get(name)
+    if not isinstance(collection, str):
+        return None
+    filt: Any = {}
+    sort: List[str] = []
+    if name == "find":
+        filt = command.get("filter") or {}
+        sort = list((command.get("sort") or {}).keys())
+    elif name == "aggregate":
+        pipeline = command.get("pipeline") or []
+        if pipeline and "$match" in pipeline[0]:
+            filt = pipeline[0]["$match"]
+            if len(pipeline) > 1 and "$sort" in pipeline[1]:
+                sort = list(pipeline[1]["$sort"].keys())
+    elif name in ("count", "distinct"):
+        filt = command.get("query") or {}
+    elif name in ("update", "delete"):
+        statements = command.get("updates") or command.get("deletes") or []
+        filt = statements[0].get("q", {}) if statements else {}
+    elif name == "findAndModify":
+        filt = command.get("query") or {}
+        sort = list((command.get("sort") or {}).keys())
+    return collection, {"op": name, "filter": query_shape(filt), "sort": sort}
+
+
+def _shape_key(collection: str, shape: Dict[str, Any]) -> str:
+    return json.dumps([collection, shape], sort_keys=True)
+
+
+# =============================================================================
+# Profiler
+# =============================================================================
+
+class QueryProfiler(monitoring.CommandListener):
+    """Command listener aggregating count / latency per query shape."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[Any, int], str] = {}
+        self._shapes: Dict[str, Dict[str, Any]] = {}
+
+    def started(self, event) -> None:
+        if event.command_name not in _READ_COMMANDS:
+            return
+        parsed = _command_shape(event.command_name, event.command)
+        if parsed is None:
+            return
+        collection, shape = parsed
+        key = _shape_key(collection, shape)
+        with self._lock:
+            if key not in self._shapes:
+                self._shapes[key] = {
+                    "collection": collection,
+                    **shape,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                }
+            self._pending[(event.connection_id, event.request_id)] = key
+
+    def succeeded(self, event) -> None:
+        self._finish(event)
+
+    def failed(self, event) -> None:
+        self._finish(event)
+
+    def _finish(self, event) -> None:
+        with self._lock:
+            key = self._pending.pop((event.connection_id, event.request_id), None)
+            if key is None:
+                return
+            ms = event.duration_micros / 1000.0
+            entry = self._shapes[key]
+            entry["count"] += 1
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Recorded shapes, slowest total first."""
+        with self._lock:
+            shapes = [dict(s) for s in self._shapes.values() if s["count"]]
+        return sorted(shapes, key=lambda s: -s["total_ms"])
+
+    def reset(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+            self._pending.clear()
+
+    def dump(self, directory: str) -> Optional[str]:
+        """Write this process's shapes to directory (one file per process)."""
+        shapes = self.snapshot()
+        if not shapes:
+            return None
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"{PROFILE_FILE_PREFIX}{os.getpid()}.json")
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"pid": os.getpid(), "written_at": datetime.utcnow().isoformat(), "shapes": shapes}, f)
+        os.replace(tmp_path, path)
+        return path
+
+
+_profiler: Optional[QueryProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def enable_query_profiling(directory: Optional[str] = None) -> QueryProfiler:
+    """
+    Register the process-wide QueryProfiler.
+
+    Only MongoClients created afterwards are monitored, so call this before
+    the first connection (bball.mongo does when BBALL_QUERY_PROFILE_DIR is
+    set). With a directory, shapes are written there at interpreter exit;
+    multiprocessing workers skip atexit hooks, so they should call
+    get_query_profiler().dump(directory) themselves before returning.
+    """
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = QueryProfiler()
+            monitoring.register(_profiler)
+            if directory:
+                atexit.register(_profiler.dump, directory)
+    return _profiler
+
+
+def get_query_profiler() -> Optional[QueryProfiler]:
+    """The registered QueryProfiler, if profiling is enabled."""
+    return _profiler
+
+
+def load_profiles(directory: str) -> List[Dict[str, Any]]:
+    """Merge every per-process profile file in directory into one shape list."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    if not os.path.isdir(directory):
+        return []
+    for name in sorted(os.listdir(directory)):
+        if not (name.startswith(PROFILE_FILE_PREFIX) and name.endswith(".json")):
+            continue
+        try:
+            with open(os.path.join(directory, name)) as f:
+                shapes = json.load(f).get("shapes") or []
+        except (OSError, ValueError):
+            continue
+        for s in shapes:
+            key = _shape_key(s["collection"], {"op": s["op"], "filter": s["filter"], "sort": s["sort"]})
+            if key not in merged:
+                merged[key] = dict(s)
+            else:
+                entry = merged[key]
+                entry["count"] += s["count"]
+                entry["total_ms"] += s["total_ms"]
+                entry["max_ms"] = max(entry["max_ms"], s["max_ms"])
+    return sorted(merged.values(), key=lambda s: -s["total_ms"])
+
+
+# =============================================================================
+# Advisor
+# =============================================================================
+
+def _index_for_filter(filt: Dict[str, Any], sort: List[str]) -> Tuple[List[Tuple[str, int]], int]:
+    """(keys, number of leading equality fields): equality fields, then sort fields, then range fields."""
+    equality: List[str] = []
+    ranges: List[str] = []
+    for field, cond in filt.items():
+        if field.startswith("$"):
+            continue
+        if isinstance(cond, dict) and any(k.startswith("$") for k in cond):
+            ops = set(cond)
+            if ops & _UNINDEXABLE_OPS:
+                continue
+            if ops <= _EQUALITY_OPS:
+                equality.append(field)
+            elif ops & _RANGE_OPS:
+                ranges.append(field)
+        else:
+            equality.append(field)
+
+    keys: List[str] = sorted(equality)
+    keys += [f for f in sort if f not in keys]
+    keys += [f for f in ranges if f not in keys]
+    return [(k, 1) for k in keys], len(equality)
+
+
+def _candidate_indexes(shape: Dict[str, Any]) -> List[Tuple[List[Tuple[str, int]], int]]:
+    """Indexes serving one shape; top-level $or needs one per branch."""
+    filt = shape.get("filter") or {}
+    sort = shape.get("sort") or []
+    branches = filt.get("$or")
+    if isinstance(branches, list) and branches:
+        base = {k: v for k, v in filt.items() if k != "$or"}
+        return [_index_for_filter({**base, **branch}, sort) for branch in branches if isinstance(branch, dict)]
+    return [_index_for_filter(filt, sort)]
+
+
+def _is_prefix(short: List[Tuple[str, int]], long: List[Tuple[str, int]]) -> bool:
+    return len(short) <= len(long) and [k for k, _ in long[:len(short)]] == [k for k, _ in short]
+
+
+def _serves(index: List[Tuple[str, int]], keys: List[Tuple[str, int]], n_eq: int) -> bool:
+    """Whether index serves a query needing keys (its first n_eq equality fields in any order)."""
+    if len(index) < len(keys):
+        return False
+    fields = [k for k, _ in index]
+    wanted = [k for k, _ in keys]
+    return set(fields[:n_eq]) == set(wanted[:n_eq]) and fields[n_eq:len(wanted)] == wanted[n_eq:]
+
+
+def recommend_indexes(
+    shapes: List[Dict[str, Any]],
+    league=None,
+    existing: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    min_count: int = 1,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compound indexes for recorded query shapes.
+
+    Args:
+        shapes: Recorded shapes (QueryProfiler.snapshot / load_profiles)
+        league: LeagueConfig; restricts to its collections and keys the result
+            by collection config key ('games', 'player_stats', ...)
+        existing: {collection_name: index_information() values} already in place
+        min_count: Ignore shapes seen fewer times than this
+
+    Returns:
+        {collection_key: [{keys, queries, total_ms}, ...]}, heaviest first
+    """
+    if league is not None:
+        name_to_key = {name: key for key, name in league.collections.items()}
+    else:
+        name_to_key = None
+    existing = existing or {}
+
+    # collection -> index key tuple -> usage
+    candidates: Dict[str, Dict[Tuple[Tuple[str, int], ...], Dict[str, Any]]] = {}
+    for shape in shapes:
+        if shape.get("count", 0) < min_count:
+            continue
+        collection = shape["collection"]
+        if name_to_key is not None and collection not in name_to_key:
+            continue
+        for keys, n_eq in _candidate_indexes(shape):
+            if not keys:
+                continue
+            usage = candidates.setdefault(collection, {}).setdefault(
+                tuple(keys), {"queries": 0, "total_ms": 0.0, "n_eq": n_eq}
+            )
+            usage["queries"] += shape.get("count", 0)
+            usage["total_ms"] += shape.get("total_ms", 0.0)
+
+    result: Dict[str, List[Dict[str, Any]]] = {}
+    for collection, by_keys in candidates.items():
+        present = []
+        for info in existing.get(collection, []):
+            present.append(([(k, int(d)) for k, d in info.get("key", [])], bool(info.get("unique"))))
+
+        # Longest first so a recommendation that is a prefix of another is folded into it
+        kept: List[Tuple[List[Tuple[str, int]], Dict[str, Any]]] = []
+        for keys, usage in sorted(by_keys.items(), key=lambda kv: -len(kv[0])):
+            keys = list(keys)
+            n_eq = usage["n_eq"]
+            covered = any(_serves(idx, keys, n_eq) for idx, _ in present)
+            # A unique index on leading equality fields already pins the query to one document
+            covered = covered or any(
+                unique and len(idx) <= n_eq and {k for k, _ in idx} <= {k for k, _ in keys[:n_eq]}
+                for idx, unique in present
+            )
+            if covered:
+                continue
+            host = next((k for k in kept if _serves(k[0], keys, n_eq)), None)
+            if host is not None:
+                host[1]["queries"] += usage["queries"]
+                host[1]["total_ms"] += usage["total_ms"]
+                continue
+            kept.append((keys, dict(usage)))
+
+        if kept:
+            out_key = name_to_key[collection] if name_to_key is not None else collection
+            result[out_key] = [
+                {"keys": [list(k) for k in keys], "queries": usage["queries"],
+                 "total_ms": round(usage["total_ms"], 3)}
+                for keys, usage in sorted(kept, key=lambda kv: -kv[1]["total_ms"])
+            ]
+    return result
+
+
+# =============================================================================
+# Per-league recommendation files
+# =============================================================================
+
+def index_recommendations_path(league_id: str) -> str:
+    """leagues/indexes/<league_id>_indexes.json"""
+    from bball.league_config import _leagues_dir
+    return os.path.join(_leagues_dir(), "indexes", f"{league_id}_indexes.json")
+
+
+def save_index_recommendations(league, recommendations: Dict[str, List[Dict[str, Any]]]) -> str:
+    """Write recommendations for a league (replacing any previous ones)."""
+    path = index_recommendations_path(league.league_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as f:
+        json.dump({
+            "league": league.league_id,
+            "generated_at": datetime.utcnow().isoformat(),
+            "indexes": recommendations,
+        }, f, indent=2)
+        f.write("\n")
+    return path
+
+
+def load_index_recommendations(league) -> List[Tuple[str, List[Tuple[str, int]], Dict[str, Any]]]:
+    """
+    Saved recommendations as ensure_indexes specs: [(collection_name, keys, kwargs)].
+
+    Entries for collection keys the league doesn't define are skipped.
+    """
+    path = index_recommendations_path(league.league_id)
+    try:
+        with open(path) as f:
+            saved = json.load(f).get("indexes") or {}
+    except (OSError, ValueError):
+        return []
+    specs = []
+    for coll_key, entries in saved.items():
+        coll_name = league.collections.get(coll_key)
+        if not coll_name:
+            continue
+        for entry in entries:
+            keys = [(k, int(d)) for k, d in entry.get("keys") or []]
+            if keys:
+                specs.append((coll_name, keys, {}))
+    return specs
+
+
+def apply_index_specs(db, index_specs: List[Tuple[str, List[Tuple[str, int]], Dict[str, Any]]]) -> int:
+    """Create each (collection, keys, kwargs) index unless an index with the same keys exists."""
+    created = 0
+    existing_by_coll: Dict[str, List[Any]] = {}
+    for coll_name, keys, kwargs in index_specs:
+        if coll_name not in existing_by_coll:
+            existing_by_coll[coll_name] = [
+                idx.get("key") for idx in db[coll_name].index_information().values()
+            ]
+        key_list = [(k, int(d)) for k, d in keys]
+        if any(idx == key_list for idx in existing_by_coll[coll_name]):
+            continue
+        db[coll_name].create_index(keys, **kwargs)
+        existing_by_coll[coll_name].append(key_list)
+        created += 1
+    return created
@@ -0,0 +1,568 @@
+"""
+Synthetic League - realistic fake league data for offline profiling and load tests.
+
+Generates N seasons of completed games for a league's collections in the same
+document shapes espn_sync._process_game writes:
+
+- games (stats_nba): team box scores, quarter lines, OT, game type, venue,
+  pregame lines and homeTeam/awayTeam.injured_players
+- player_stats (stats_nba_players): one document per rostered player per
+  game, with DNP documents for injured players
+- players, teams, venues (with location for travel features) and rosters
+
+Games are simulated, not random noise: teams have a strength that drifts
+between seasons, scores follow strength and home advantage, box scores add
+up to the final score, player lines add up to the team box score, injuries
+last several games, and pregame lines come from the expected margin/total.
+
+Volume is controlled by SyntheticLeagueSpec (seasons, teams, games per team,
+roster size) and `scale`, which multiplies the team count (1x ~ one NBA
+season per season; 20x ~ a 600-team league). Generating into several leagues
+gives each league its own collections.
+
+Usage:
+    from bball.data.synthetic import SyntheticLeagueSpec, generate_synthetic_league
+
+    summary = generate_synthetic_league(db, league, SyntheticLeagueSpec(seasons=3, scale=5))
+"""
+
+import math
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+CITIES = [
+    "Ashford", "Bayview", "Cedar Falls", "Dunmore", "Eastport", "Fairhaven", "Glenrock", "Harbor City",
+    "Ironwood", "Jasper", "Kingsbridge", "Lakemont", "Marlowe", "Northgate", "Oakridge", "Pinecrest",
+    "Queensport", "Riverton", "Stonebrook", "Tidewater", "Union City", "Valemont", "Westbury", "Yardley",
+    "Zephyr Hills", "Brightwater", "Copperton", "Driftwood", "Emberly", "Foxhollow",
+]
+MASCOTS = [
+    "Comets", "Foxes", "Rangers", "Herons", "Miners", "Pilots", "Wolves", "Mariners", "Falcons", "Titans",
+    "Lynx", "Hawks", "Stags", "Bison", "Vipers", "Owls", "Knights", "Ravens", "Otters", "Cyclones",
+]
+FIRST_NAMES = [
+    "Aaron", "Ben", "Caleb", "Darius", "Eli", "Felix", "Gabe", "Hugo", "Isaac", "Jalen", "Kai", "Leo",
+    "Marcus", "Nate", "Omar", "Pierce", "Quinn", "Reggie", "Sam", "Theo", "Victor", "Wes", "Xavier", "Zion",
+]
+LAST_NAMES = [
+    "Abbott", "Barnes", "Coleman", "Dawson", "Ellis", "Fisher", "Grant", "Hayes", "Irving", "Jensen",
+    "Keller", "Lowry", "Morris", "Nolan", "Owens", "Porter", "Reed", "Sutton", "Turner", "Vaughn",
+    "Walker", "Young",
+]
+POSITIONS = [("Guard", "G"), ("Guard", "G"), ("Forward", "F"), ("Forward", "F"), ("Center", "C")]
+# Minutes weight by roster slot (starters first)
+SLOT_MINUTES = [34, 33, 32, 30, 28, 24, 21, 18, 14, 10, 6, 4, 2, 1, 1]
+
+INSERT_BATCH = 5000
+GAME_ID_START = 900_000_000
+PLAYER_ID_START = 9_000_000
+
+
+@dataclass
+class SyntheticLeagueSpec:
+    """Scale knobs for a synthetic league."""
+    seasons: int = 3
+    end_season: Optional[str] = None     # default: last completed season
+    teams: int = 30
+    games_per_team: int = 82
+    preseason_games: int = 2             # per team, game_type 'preseason'
+    roster_size: int = 15
+    scale: float = 1.0                   # multiplies the team count
+    injury_rate: float = 0.015           # per player per game
+    seed: int = 0
+
+    @property
+    def team_count(self) -> int:
+        n = max(2, int(round(self.teams * self.scale)))
+        return n + (n % 2)
+
+    def season_list(self, today: Optional[date] = None) -> List[str]:
+        if self.end_season:
+            end_start = int(self.end_season.split("-")[0])
+        else:
+            today = today or date.today()
+            end_start = today.year - 1 if today.month >= 10 else today.year - 2
+        return [f"{y}-{y + 1}" for y in range(end_start - self.seasons + 1, end_start + 1)]
+
+
+@dataclass
+class _Player:
+    player_id: str
+    name: str
+    short_name: str
+    guid: str
+    position: Tuple[str, str]
+    usage: float
+    out_games: int = 0
+
+
+@dataclass
+class _Team:
+    index: int
+    team_id: str
+    abbreviation: str
+    location: str
+    nickname: str
+    conference: str
+    venue_guid: str
+    strength: float = 0.0
+
+    @property
+    def display_name(self) -> str:
+        return f"{self.location} {self.nickname}"
+
+
+def _team_code(i: int) -> str:
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return "".join(letters[(i // 26 ** k) % 26] for k in (2, 1, 0))
+
+
+def _american_odds(p: float) -> int:
+    p = min(max(p, 0.01), 0.99)
+    return -int(round(100 * p / (1 - p))) if p >= 0.5 else int(round(100 * (1 - p) / p))
+
+
+class _BulkWriter:
+    """Buffered insert_many per collection."""
+
+    def __init__(self, db):
+        self.db = db
+        self.buffers: Dict[str, List[Dict]] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, collection: str, doc: Dict) -> None:
+        buf = self.buffers.setdefault(collection, [])
+        buf.append(doc)
+        if len(buf) >= INSERT_BATCH:
+            self.flush(collection)
+
+    def flush(self, collection: Optional[str] = None) -> None:
+        for name in [collection] if collection else list(self.buffers):
+            buf = self.buffers.get(name)
+            if buf:
+                self.db[name].insert_many(buf, ordered=False)
+                self.counts[name] = self.counts.get(name, 0) + len(buf)
+                self.buffers[name] = []
+
+
+class SyntheticLeagueGenerator:
+    """Simulates seasons for one league and writes them through a _BulkWriter."""
+
+    def __init__(self, league, spec: SyntheticLeagueSpec, writer: _BulkWriter, id_offset: int = 0):
+        self.league = league
+        self.spec = spec
+        self.writer = writer
+        self.rng = np.random.default_rng(spec.seed)
+        self.colls = league.collections
+        self.include_team_id = bool(getattr(league, "include_team_id", False))
+        self._next_game_id = GAME_ID_START + id_offset
+        self._next_player_id = PLAYER_ID_START + id_offset
+        self.teams = self._make_teams()
+        self.rosters: Dict[str, List[_Player]] = {t.abbreviation: [] for t in self.teams}
+
+    # --- League setup ---
+
+    def _make_teams(self) -> List[_Team]:
+        n = self.spec.team_count
+        conferences = max(2, n // 15)
+        teams = []
+        for i in range(n):
+            city = CITIES[i % len(CITIES)]
+            if i >= len(CITIES):
+                city = f"{city} {i // len(CITIES) + 1}"
+            team_id = str(1000 + i)
+            teams.append(_Team(
+                index=i,
+                team_id=team_id,
+                abbreviation=_team_code(i),
+                location=city,
+                nickname=MASCOTS[(i * 7) % len(MASCOTS)],
+                conference=("Eastern Conference", "Western Conference")[i % 2] if conferences == 2
+                else f"Conference {i % conferences + 1}",
+                venue_guid=str(uuid.uuid5(uuid.NAMESPACE_URL, f"{self.league.league_id}/venue/{team_id}")),
+                strength=float(self.rng.normal(0, 4)),
+            ))
+        return teams
+
+    def _write_teams_and_venues(self) -> None:
+        for t in self.teams:
+            self.writer.add(self.colls["teams"], {
+                "team_id": t.team_id,
+                "id": t.team_id,
+                "abbreviation": t.abbreviation,
+                "displayName": t.display_name,
+                "shortDisplayName": t.nickname,
+                "name": t.nickname,
+                "location": t.location,
+                "slug": t.display_name.lower().replace(" ", "-"),
+                "uid": f"s:40~l:46~t:{t.team_id}",
+                "color": "1d428a",
+                "alternateColor": "c8102e",
+                "logo": "",
+                "links": [],
+                "nickname": t.nickname,
+                "isActive": True,
+                "conference": t.conference,
+                "last_update": datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f"),
+            })
+            self.writer.add(self.colls["venues"], {
+                "venue_guid": t.venue_guid,
+                "id": t.team_id,
+                "fullName": f"{t.location} Arena",
+                "shortName": f"{t.location} Arena",
+                "address": {"city": t.location, "state": "ST"},
+                "grass": False,
+                "images": [],
+                "location": {
+                    "lat": round(float(self.rng.uniform(25.5, 48.5)), 4),
+                    "lon": round(float(self.rng.uniform(-123.0, -70.5)), 4),
+                },
+            })
+
+    def _new_player(self) -> _Player:
+        pid = str(self._next_player_id)
+        self._next_player_id += 1
+        first = FIRST_NAMES[int(self.rng.integers(len(FIRST_NAMES)))]
+        last = LAST_NAMES[int(self.rng.integers(len(LAST_NAMES)))]
+        player = _Player(
+            player_id=pid,
+            name=f"{first} {last}",
+            short_name=f"{first[0]}. {last}",
+            guid=str(uuid.uuid5(uuid.NAMESPACE_URL, f"{self.league.league_id}/player/{pid}")),
+            position=POSITIONS[int(self.rng.integers(len(POSITIONS)))],
+            usage=float(self.rng.lognormal(0, 0.3)),
+        )
+        self.writer.add(self.colls["players"], {
+            "player_id": pid,
+            "player_name": player.name,
+            "pos_name": player.position[0],
+            "pos_display_name": player.position[0],
+        })
+        return player
+
+    def _refresh_rosters(self) -> None:
+        """New season: ~15% turnover, strength drift, injuries healed."""
+        for t in self.teams:
+            roster = [p for p in self.rosters[t.abbreviation] if self.rng.random() > 0.15]
+            while len(roster) < self.spec.roster_size:
+                roster.append(self._new_player())
+            for p in roster:
+                p.out_games = 0
+            # Slot order: higher usage plays more
+            roster.sort(key=lambda p: -p.usage)
+            self.rosters[t.abbreviation] = roster[:self.spec.roster_size]
+            t.strength = 0.6 * t.strength + float(self.rng.normal(0, 2.5))
+
+    # --- Schedule ---
+
+    def _schedule(self, season: str) -> List[Tuple[date, _Team, _Team, str]]:
+        start_year = int(season.split("-")[0])
+        opening = date(start_year, 10, 22)
+        days = (date(start_year + 1, 4, 12) - opening).days
+        games = []
+        # Rounds of random pairings: every team plays once per round
+        rounds = self.spec.games_per_team
+        spacing = days / max(rounds, 1)
+        for k in range(rounds):
+            order = self.rng.permutation(len(self.teams))
+            day = opening + timedelta(days=int(k * spacing))
+            for a, b in zip(order[0::2], order[1::2]):
+                home, away = (self.teams[a], self.teams[b]) if (k + a) % 2 else (self.teams[b], self.teams[a])
+                offset = int(self.rng.integers(2)) if spacing >= 2 else 0
+                games.append((day + timedelta(days=offset), home, away, "regseason"))
+        for k in range(self.spec.preseason_games):
+            order = self.rng.permutation(len(self.teams))
+            day = date(start_year, 10, 4) + timedelta(days=3 * k)
+            for a, b in zip(order[0::2], order[1::2]):
+                games.append((day, self.teams[a], self.teams[b], "preseason"))
+        games.sort(key=lambda g: (g[0], g[1].index))
+        return games
+
+    # --- Simulation ---
+
+    def _team_box(self, points: int) -> Dict:
+        rng = self.rng
+        three_att = int(rng.poisson(34))
+        three_made = min(int(rng.binomial(three_att, 0.36)), points // 3)
+        ft_att = int(rng.poisson(22))
+        ft_made = min(int(rng.binomial(ft_att, 0.78)), points - 3 * three_made)
+        rem = points - 3 * three_made - ft_made
+        if rem % 2:
+            ft_made += 1
+            ft_att = max(ft_att, ft_made)
+            rem -= 1
+        fg2_made = rem // 2
+        fg2_att = max(fg2_made, int(round(fg2_made / rng.uniform(0.48, 0.57))))
+        fg_made, fg_att = fg2_made + three_made, fg2_att + three_att
+        off_reb, def_reb = int(rng.poisson(10)), int(rng.poisson(33))
+        box = {
+            "FG_made": fg_made, "FG_att": fg_att,
+            "FGp": round(fg_made / fg_att, 3) if fg_att else 0.0,
+            "three_made": three_made, "three_att": three_att,
+            "three_percent": round(three_made / three_att, 3) if three_att else 0.0,
+            "FT_made": ft_made, "FT_att": ft_att,
+            "FTp": round(ft_made / ft_att, 3) if ft_att else 0.0,
+            "total_reb": off_reb + def_reb, "off_reb": off_reb, "def_reb": def_reb,
+            "assists": int(rng.binomial(fg_made, 0.6)),
+            "steals": int(rng.poisson(7.5)),
+            "blocks": int(rng.poisson(5)),
+            "TO": int(rng.poisson(13.5)),
+            "pts_off_TO": int(rng.poisson(16)),
+            "fast_break_pts": 2 * int(rng.poisson(6.5)),
+            "pts_in_paint": 2 * int(rng.binomial(fg2_made, 0.6)),
+            "PF": int(rng.poisson(19.5)),
+        }
+        if fg_att:
+            box["shooting_metric"] = (fg_made + 0.5 * three_made) / float(fg_att)
+        return box
+
+    def _split(self, total: int, weights: np.ndarray) -> np.ndarray:
+        return self.rng.multinomial(max(int(total), 0), weights)
+
+    def _player_lines(self, box: Dict, active: List[_Player], minutes_total: float, margin: int) -> List[Dict]:
+        slots = np.array([SLOT_MINUTES[min(i, len(SLOT_MINUTES) - 1)] for i in range(len(active))], dtype=float)
+        minutes = slots * self.rng.gamma(20, 1 / 20, size=len(active))
+        minutes = minutes / minutes.sum() * minutes_total
+        weights = minutes * np.array([p.usage for p in active])
+        weights = weights / weights.sum()
+        mweights = minutes / minutes.sum()
+
+        three_made = self._split(box["three_made"], weights)
+        three_miss = self._split(box["three_att"] - box["three_made"], weights)
+        fg2_made = self._split(box["FG_made"] - box["three_made"], weights)
+        fg2_miss = self._split(box["FG_att"] - box["FG_made"] - (box["three_att"] - box["three_made"]), weights)
+        ft_made = self._split(box["FT_made"], weights)
+        ft_miss = self._split(box["FT_att"] - box["FT_made"], weights)
+        oreb = self._split(box["off_reb"], mweights)
+        dreb = self._split(box["def_reb"], mweights)
+        ast = self._split(box["assists"], weights)
+        to = self._split(box["TO"], weights)
+        stl = self._split(box["steals"], mweights)
+        blk = self._split(box["blocks"], mweights)
+        pf = self._split(box["PF"], mweights)
+
+        lines = []
+        for i in range(len(active)):
+            fg_made = int(fg2_made[i] + three_made[i])
+            lines.append({
+                "min": round(float(minutes[i]), 2),
+                "pts": int(2 * fg2_made[i] + 3 * three_made[i] + ft_made[i]),
+                "fg_made": fg_made,
+                "fg_att": int(fg_made + fg2_miss[i] + three_miss[i]),
+                "three_made": int(three_made[i]),
+                "three_att": int(three_made[i] + three_miss[i]),
+                "ft_made": int(ft_made[i]),
+                "ft_att": int(ft_made[i] + ft_miss[i]),
+                "reb": int(oreb[i] + dreb[i]),
+                "oreb": int(oreb[i]),
+                "dreb": int(dreb[i]),
+                "ast": int(ast[i]),
+                "to": int(to[i]),
+                "stl": int(stl[i]),
+                "blk": int(blk[i]),
+                "pf": int(pf[i]),
+                "plus_minus": int(round(margin * minutes[i] / 48 + self.rng.normal(0, 4))),
+            })
+        return lines
+
+    def _update_injuries(self, team: _Team) -> List[_Player]:
+        """Players out for this game (and age existing injuries)."""
+        out = []
+        for p in self.rosters[team.abbreviation]:
+            if p.out_games > 0:
+                p.out_games -= 1
+                out.append(p)
+            elif self.rng.random() < self.spec.injury_rate:
+                p.out_games = int(self.rng.geometric(1 / 6))
+                out.append(p)
+        return out
+
+    def _simulate_game(self, season: str, game_day: date, home: _Team, away: _Team, game_type: str) -> None:
+        rng = self.rng
+        game_id = str(self._next_game_id)
+        self._next_game_id += 1
+
+        diff = home.strength - away.strength
+        pace = rng.normal(1.0, 0.03)
+        home_exp = (113 + diff / 2 + 1.5) * pace
+        away_exp = (113 - diff / 2 - 1.5) * pace
+        home_q = rng.multinomial(max(int(round(rng.normal(home_exp, 11))), 70), [0.25] * 4)
+        away_q = rng.multinomial(max(int(round(rng.normal(away_exp, 11))), 70), [0.25] * 4)
+        home_ot = away_ot = ot_periods = 0
+        while home_q.sum() + home_ot == away_q.sum() + away_ot:
+            ot_periods += 1
+            home_ot += int(rng.poisson(10))
+            away_ot += int(rng.poisson(10))
+        home_points = int(home_q.sum()) + home_ot
+        away_points = int(away_q.sum()) + away_ot
+
+        home_out = self._update_injuries(home)
+        away_out = self._update_injuries(away)
+
+        sides = {}
+        for side, team, points, quarters, ot_points, out in (
+            ("homeTeam", home, home_points, home_q, home_ot, home_out),
+            ("awayTeam", away, away_points, away_q, away_ot, away_out),
+        ):
+            box = self._team_box(points)
+            box.update({
+                "team_id": team.team_id,
+                "name": team.abbreviation,
+                "points": points,
+                "points1q": int(quarters[0]), "points2q": int(quarters[1]),
+                "points3q": int(quarters[2]), "points4q": int(quarters[3]),
+                "pointsOT": ot_points,
+                "injured_players": sorted(p.player_id for p in out),
+            })
+            sides[side] = box
+
+        possessions = sum(
+            b["FG_att"] - b["off_reb"] + b["TO"] + 0.4 * b["FT_att"] for b in sides.values()
+        ) / 2.0
+        for side, other in (("homeTeam", "awayTeam"), ("awayTeam", "homeTeam")):
+            if possessions > 0:
+                sides[side]["TO_metric"] = sides[side]["TO"] / possessions
+            total_reb = sides[side]["off_reb"] + sides[other]["def_reb"]
+            if total_reb > 0:
+                sides[side]["off_reb_metric"] = sides[side]["off_reb"] / float(total_reb)
+
+        exp_margin = home_exp - away_exp
+        home_win_p = 1.0 / (1.0 + math.exp(-exp_margin / 6.5))
+        preseason = game_type == "preseason"
+        doc = {
+            "game_id": game_id,
+            "date": game_day.strftime("%Y-%m-%d"),
+            "year": game_day.year,
+            "month": game_day.month,
+            "day": game_day.day,
+            "season": season,
+            "espn_season_year": int(season.split("-")[1]),
+            "game_type": game_type,
+            "season_type_id": 1 if preseason else 2,
+            "season_type_slug": "preseason" if preseason else "regular-season",
+            "season_type_name": "Preseason" if preseason else "Regular Season",
+            "season_type_abbrev": "pre" if preseason else "reg",
+            "isTournament": False,
+            "neutralSite": False,
+            "description": "Preseason" if preseason else "Regular Season",
+            "homeWon": home_points > away_points,
+            "OT": ot_periods > 0,
+            "venue_guid": home.venue_guid,
+            "espn_link": f"https://www.espn.com/{self.league.league_id}/boxscore/_/gameId/{game_id}",
+            "gametime": datetime(game_day.year, game_day.month, game_day.day, 23, 30, tzinfo=timezone.utc),
+            "pregame_lines": {
+                "over_under": round((home_exp + away_exp) * 2) / 2,
+                "spread": -round(exp_margin * 2) / 2,
+                "home_ml": _american_odds(home_win_p),
+                "away_ml": _american_odds(1 - home_win_p),
+            },
+            "homeTeam": sides["homeTeam"],
+            "awayTeam": sides["awayTeam"],
+        }
+        self.writer.add(self.colls["games"], doc)
+
+        minutes_total = 240 + 25 * ot_periods
+        for team, opponent, is_home, out, margin in (
+            (home, away, True, home_out, home_points - away_points),
+            (away, home, False, away_out, away_points - home_points),
+        ):
+            out_ids = {p.player_id for p in out}
+            active = [p for p in self.rosters[team.abbreviation] if p.player_id not in out_ids]
+            lines = self._player_lines(sides["homeTeam" if is_home else "awayTeam"], active, minutes_total, margin)
+            starters = {p.player_id for p in active[:5]}
+            for player, line in list(zip(active, lines)) + [(p, None) for p in out]:
+                pdoc = {
+                    "player_id": player.player_id,
+                    "game_id": game_id,
+                    "date": doc["date"],
+                    "season": season,
+                    "team": team.abbreviation,
+                    "home": is_home,
+                    "opponent": opponent.abbreviation,
+                    "starter": player.player_id in starters,
+                    "active": line is not None,
+                    "didNotPlay": line is None,
+                    "guid": player.guid,
+                    "short_name": player.short_name,
+                    "player_name": player.name,
+                    "stats": line or {},
+                }
+                if self.include_team_id:
+                    pdoc["team_id"] = team.team_id
+                    pdoc["opponent_id"] = opponent.team_id
+                self.writer.add(self.colls["player_stats"], pdoc)
+
+    def _write_rosters(self, season: str) -> None:
+        for t in self.teams:
+            roster = self.rosters[t.abbreviation]
+            self.writer.add(self.colls["rosters"], {
+                "team": t.abbreviation,
+                "season": season,
+                "roster": [{"player_id": p.player_id, "starter": i < 5} for i, p in enumerate(roster)],
+                "updated_at": datetime.utcnow(),
+            })
+
+    def run(self, seasons: List[str], progress=None) -> None:
+        self._write_teams_and_venues()
+        for season in seasons:
+            self._refresh_rosters()
+            schedule = self._schedule(season)
+            for game_day, home, away, game_type in schedule:
+                self._simulate_game(season, game_day, home, away, game_type)
+            self._write_rosters(season)
+            self.writer.flush()
+            if progress:
+                progress(season, len(schedule))
+
+
+def league_collections(league) -> List[str]:
+    colls = league.collections
+    return [colls[k] for k in ("games", "player_stats", "players", "teams", "venues", "rosters")] + [
+        f"{colls['games']}_team_records"
+    ]
+
+
+def generate_synthetic_league(
+    db,
+    league,
+    spec: Optional[SyntheticLeagueSpec] = None,
+    drop: bool = False,
+    id_offset: int = 0,
+    progress=None,
+) -> Dict:
+    """
+    Generate a synthetic league into `db` (pymongo or mongomock database).
+
+    Args:
+        db: Target database
+        league: LeagueConfig whose collection names are used
+        spec: Scale knobs (default: SyntheticLeagueSpec())
+        drop: Drop the league's collections first; otherwise they must be empty
+        id_offset: Added to game/player ids (keeps ids unique across leagues)
+        progress: Optional callback(season, games) after each season
+
+    Returns:
+        {league, seasons, teams, counts: {collection: documents}}
+    """
+    spec = spec or SyntheticLeagueSpec()
+    games_coll = league.collections["games"]
+    if drop:
+        for name in league_collections(league):
+            db[name].drop()
+    elif db[games_coll].estimated_document_count():
+        raise ValueError(f"{games_coll} is not empty; pass drop=True to replace it")
+
+    seasons = spec.season_list()
+    writer = _BulkWriter(db)
+    SyntheticLeagueGenerator(league, spec, writer, id_offset=id_offset).run(seasons, progress=progress)
+
+    from bball.pipeline.full_pipeline import ensure_indexes
+    from bball.stats.team_records import rebuild_team_records
+
+    ensure_indexes(league, db=db)
+    rebuild_team_records(db, league, seasons)
+    return {"league": league.league_id, "seasons": seasons, "teams": spec.team_count, "counts": writer.counts}
@@ -14,9 +14,6 @@ Import them directly: from bball.features.generator import SharedFeatureGenerato
 from bball.features.registry import FeatureRegistry
 from bball.features.groups import FeatureGroups
 
-# Feature sets
-from bball.features.sets import FEATURE_SETS
-
 # Parser utilities
 from bball.features.parser import parse_feature_name
 
@@ -38,6 +35,15 @@ from bball.features.prediction_mapping import (
 # Use direct imports: from bball.features.generator import SharedFeatureGenerator
 # Use direct imports: from bball.features.manager import FeatureManager
 
+
+def __getattr__(name):
+    # FEATURE_SETS is built on first access (see bball.features.sets)
+    if name == 'FEATURE_SETS':
+        from bball.features import sets
+        return sets.FEATURE_SETS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # Registry
     'FeatureRegistry',
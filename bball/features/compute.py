@@ -25,6 +25,8 @@ from sportscore.features.stat_engine import StatEngine
 from bball.features.registry import FeatureRegistry
 from bball.features.custom_stats import CUSTOM_HANDLERS
 from bball.features.parser import parse_feature_name
+from bball.features.plan import FAILED, FeaturePlan, compile_feature_plan
+from bball.features.schedule import ScheduleIndex
 
 
 class BasketballFeatureComputer:
@@ -55,12 +57,14 @@ class BasketballFeatureComputer:
         # Team index for fast bisect lookups
         self._team_games_index = {}  # {season: {team: [(date_str, game_doc), ...]}}
         self._team_dates_index = {}  # {season: {team: [date_str, ...]}}
+        self._schedule_index = None  # ScheduleIndex over _team_games_index
 
         # Caches
         self._team_games_cache = {}   # (team, season, date_str) -> [game_doc]
         self._elo_cache = None
         self._conference_cache = {}   # {team_abbrev: conference_name}
         self._conf_teams_cache = {}   # {conference_name: set(team_abbrevs/ids)}
+        self._last_plan = None        # (feature_names tuple, FeaturePlan)
 
         # Exclude game types from league config
         if league:
@@ -99,6 +103,8 @@ class BasketballFeatureComputer:
                 lon = loc.get("lon") if "lon" in loc else loc.get("long")
                 if lat is not None and lon is not None:
                     self._venue_cache[guid] = (lat, lon)
+        # Travel legs depend on venue coordinates
+        self._schedule_index = None
 
     def _build_team_index(self):
         """Build sorted team game index for O(log N) bisect lookups."""
@@ -125,6 +131,15 @@ class BasketballFeatureComputer:
 
         self._team_games_index = team_index
         self._team_dates_index = dates_index
+        self._schedule_index = None  # rebuilt lazily from the new index
+
+    def _get_schedule_index(self) -> Optional[ScheduleIndex]:
+        """Schedule index over the preloaded games (None without preloaded data)."""
+        if self._schedule_index is None and self._team_games_index:
+            self._schedule_index = ScheduleIndex(
+                self._team_games_index, self._venue_cache, self._exclude_game_types,
+            )
+        return self._schedule_index
 
     # ------------------------------------------------------------------
     # Game retrieval
@@ -197,6 +212,34 @@ class BasketballFeatureComputer:
             game_date: YYYY-MM-DD
             venue_guid: Optional venue GUID for travel features
 
+        Returns:
+            Dict mapping feature name -> computed value (or 0.0)
+        """
+        names = tuple(feature_names)
+        # Callers pass the same feature list row after row; reuse its plan
+        # instead of rehashing the names on every call
+        if self._last_plan is None or self._last_plan[0] != names:
+            self._last_plan = (names, compile_feature_plan(names, route_external=False))
+        plan = self._last_plan[1]
+        return self.execute_plan(
+            plan, home_team, away_team, season, game_date, venue_guid=venue_guid,
+        )
+
+    def execute_plan(
+        self,
+        plan: FeaturePlan,
+        home_team: str,
+        away_team: str,
+        season: str,
+        game_date: str,
+        venue_guid: Optional[str] = None,
+    ) -> Dict[str, Optional[float]]:
+        """Execute the regular and composite operations of a compiled plan.
+
+        Each unique engine sub-feature is computed once (grouped by window),
+        then regular and composite operations are resolved from those values.
+        PER, injury and special features in the plan are left to the caller.
+
         Returns:
             Dict mapping feature name -> computed value (or 0.0)
         """
@@ -209,48 +252,32 @@ class BasketballFeatureComputer:
             home_team, away_team, season, game_date, venue_guid,
         )
 
+        # Compute each engine feature once, window by window
+        engine_values: Dict[str, object] = {}
+        for names in plan.windows.values():
+            for fname in names:
+                try:
+                    engine_values[fname] = self.engine.compute_feature(
+                        fname, home_team, away_team,
+                        home_games, away_games, context,
+                    )
+                except Exception as e:
+                    print(f"[BasketballFeatureComputer] Error computing {fname}: {e}")
+                    engine_values[fname] = FAILED
+
         results: Dict[str, Optional[float]] = {}
 
-        # Categorize features: regular vs composite time periods
-        regular = []
-        composite = []
-
-        for fname in feature_names:
-            parts = fname.split("|")
-            if len(parts) >= 4:
-                time_period = parts[1]
-                if (time_period.startswith("blend:") or
-                        time_period.startswith("delta:") or
-                        time_period.startswith("blend-delta:")):
-                    composite.append(fname)
-                else:
-                    regular.append(fname)
-            else:
-                regular.append(fname)
-
-        # Compute regular features via engine
-        for fname in regular:
-            try:
-                val = self.engine.compute_feature(
-                    fname, home_team, away_team,
-                    home_games, away_games, context,
-                )
-                results[fname] = val if val is not None else 0.0
-            except Exception as e:
-                print(f"[BasketballFeatureComputer] Error computing {fname}: {e}")
-                results[fname] = 0.0
+        for op in plan.regular:
+            val = op.evaluate(engine_values)
+            results[op.name] = val if val is not None else 0.0
 
-        # Compute composite time period features
-        for fname in composite:
+        for op in plan.composite:
             try:
-                val = self._compute_composite(
-                    fname, home_team, away_team,
-                    home_games, away_games, context,
-                )
-                results[fname] = val if val is not None else 0.0
+                val = op.evaluate(engine_values)
+                results[op.name] = val if val is not None else 0.0
             except Exception as e:
-                print(f"[BasketballFeatureComputer] Error computing composite {fname}: {e}")
-                results[fname] = 0.0
+                print(f"[BasketballFeatureComputer] Error computing composite {op.name}: {e}")
+                results[op.name] = 0.0
 
         return results
 
@@ -275,160 +302,10 @@ class BasketballFeatureComputer:
             "games_home": self.games_home,
             "games_away": self.games_away,
             "team_games_index": self._team_games_index,
+            "schedule_index": self._get_schedule_index(),
             "game_doc": game_doc,
             "target_venue_guid": venue_guid,
             "exclude_game_types": self._exclude_game_types,
             "conference_cache": self._conference_cache,
             "conf_teams_cache": self._conf_teams_cache,
         }
-
-    # ------------------------------------------------------------------
-    # Composite time periods (blend / delta / blend-delta)
-    # ------------------------------------------------------------------
-
-    def _compute_composite(
-        self, feature_name, home_team, away_team,
-        home_games, away_games, context,
-    ) -> Optional[float]:
-        """Handle blend: and delta: composite time periods.
-
-        blend:tp1:w1/tp2:w2 — weighted combination of time periods
-        delta:recent-baseline — difference between two time periods
-        blend-delta:tp1:w1/tp2:w2-baseline — blend first, then delta
-        """
-        parts = feature_name.split("|")
-        if len(parts) == 5:
-            stat_name, time_period, calc_weight, perspective, _ = parts
-        elif len(parts) == 4:
-            stat_name, time_period, calc_weight, perspective = parts
-        else:
-            return None
-
-        if time_period.startswith("blend-delta:"):
-            return self._compute_blend_delta(
-                stat_name, time_period, calc_weight, perspective,
-                home_team, away_team, home_games, away_games, context,
-            )
-
-        if time_period.startswith("blend:"):
-            return self._compute_blend(
-                stat_name, time_period, calc_weight, perspective,
-                home_team, away_team, home_games, away_games, context,
-            )
-
-        if time_period.startswith("delta:"):
-            return self._compute_delta(
-                stat_name, time_period, calc_weight, perspective,
-                home_team, away_team, home_games, away_games, context,
-            )
-
-        return None
-
-    def _compute_blend(
-        self, stat_name, time_period, calc_weight, perspective,
-        home_team, away_team, home_games, away_games, context,
-    ) -> Optional[float]:
-        """blend:tp1:w1/tp2:w2[/tp3:w3] — weighted sum of sub-features."""
-        spec = time_period[len("blend:"):]
-        segments = spec.split("/")
-
-        total = 0.0
-        total_weight = 0.0
-
-        for seg in segments:
-            parts = seg.rsplit(":", 1)
-            if len(parts) != 2:
-                continue
-            tp, w_str = parts
-            try:
-                w = float(w_str)
-            except ValueError:
-                continue
-
-            sub_feature = f"{stat_name}|{tp}|{calc_weight}|{perspective}"
-            val = self.engine.compute_feature(
-                sub_feature, home_team, away_team,
-                home_games, away_games, context,
-            )
-            if val is not None:
-                total += float(val) * w
-                total_weight += w
-
-        return total / total_weight if total_weight > 0 else None
-
-    def _compute_delta(
-        self, stat_name, time_period, calc_weight, perspective,
-        home_team, away_team, home_games, away_games, context,
-    ) -> Optional[float]:
-        """delta:recent-baseline — recent minus baseline."""
-        spec = time_period[len("delta:"):]
-        parts = spec.split("-", 1)
-        if len(parts) != 2:
-            return None
-
-        recent_tp, baseline_tp = parts
-
-        recent_val = self._compute_sub_feature(
-            stat_name, recent_tp, calc_weight, perspective,
-            home_team, away_team, home_games, away_games, context,
-        )
-        baseline_val = self._compute_sub_feature(
-            stat_name, baseline_tp, calc_weight, perspective,
-            home_team, away_team, home_games, away_games, context,
-        )
-
-        if recent_val is not None and baseline_val is not None:
-            return float(recent_val) - float(baseline_val)
-        return None
-
-    def _compute_sub_feature(
-        self, stat_name, tp, calc_weight, perspective,
-        home_team, away_team, home_games, away_games, context,
-    ) -> Optional[float]:
-        """Compute a sub-feature value, routing blend: time periods correctly."""
-        if tp.startswith("blend:"):
-            return self._compute_blend(
-                stat_name, tp, calc_weight, perspective,
-                home_team, away_team, home_games, away_games, context,
-            )
-        feature = f"{stat_name}|{tp}|{calc_weight}|{perspective}"
-        return self.engine.compute_feature(
-            feature, home_team, away_team,
-            home_games, away_games, context,
-        )
-
-    def _compute_blend_delta(
-        self, stat_name, time_period, calc_weight, perspective,
-        home_team, away_team, home_games, away_games, context,
-    ) -> Optional[float]:
-        """blend-delta:tp1:w1/tp2:w2-baseline — blend then subtract baseline."""
-        spec = time_period[len("blend-delta:"):]
-
-        # Split on last '-' that separates blend spec from baseline
-        # But blend spec may contain '-' in time period names, so we need
-        # to find the baseline which is after the last segment separator
-        # Format: tp1:w1/tp2:w2-baseline
-        # The baseline is after the last '-' that follows a weight
-        parts = spec.rsplit("-", 1)
-        if len(parts) != 2:
-            return None
-
-        blend_spec, baseline_tp = parts
-
-        # Compute blend
-        blend_feature_tp = f"blend:{blend_spec}"
-        blend_val = self._compute_blend(
-            stat_name, blend_feature_tp, calc_weight, perspective,
-            home_team, away_team, home_games, away_games, context,
-        )
-
-        # Compute baseline
-        baseline_feature = f"{stat_name}|{baseline_tp}|{calc_weight}|{perspective}"
-        baseline_val = self.engine.compute_feature(
-            baseline_feature, home_team, away_team,
-            home_games, away_games, context,
-        )
-
-        if blend_val is not None and baseline_val is not None:
-            return float(blend_val) - float(baseline_val)
-        return None
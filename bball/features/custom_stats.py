@@ -828,13 +828,13 @@ def compute_schedule(
         return _apply_perspective(home_val, away_val, perspective)
 
     if stat_name in ("days_rest", "rest"):
-        home_rest = float(_get_days_rest(home_team, home_games, reference_date))
-        away_rest = float(_get_days_rest(away_team, away_games, reference_date))
+        home_rest = float(_get_days_rest(home_team, home_games, reference_date, context=context))
+        away_rest = float(_get_days_rest(away_team, away_games, reference_date, context=context))
         return _apply_perspective(home_rest, away_rest, perspective)
 
     if stat_name == "b2b":
-        home_rest = _get_days_rest(home_team, home_games, reference_date)
-        away_rest = _get_days_rest(away_team, away_games, reference_date)
+        home_rest = _get_days_rest(home_team, home_games, reference_date, context=context)
+        away_rest = _get_days_rest(away_team, away_games, reference_date, context=context)
         home_b2b = 1.0 if home_rest == 1 else 0.0
         away_b2b = 1.0 if away_rest == 1 else 0.0
         return _apply_perspective(home_b2b, away_b2b, perspective)
@@ -856,24 +856,32 @@ def compute_schedule(
     return None
 
 
-def _get_days_rest(team, games, reference_date, cap=7):
+def _get_days_rest(team, games, reference_date, cap=7, context=None):
     """Days since last game, capped at `cap`. Returns cap if no prior game."""
     if not reference_date:
         return cap
+
+    schedule = _get_team_schedule(team, context)
+    if schedule is not None:
+        return schedule.days_rest(reference_date, cap)
+
     try:
         target = datetime.strptime(reference_date, "%Y-%m-%d").date()
     except (ValueError, TypeError):
         return cap
 
+    # Latest parseable date before the reference date (parse only what's needed)
+    prior_dates = sorted(
+        (g.get("date", "") for g in games if g.get("date", "") < reference_date),
+        reverse=True,
+    )
     last_date = None
-    for g in sorted(games, key=lambda x: x.get("date", ""), reverse=True):
+    for date_str in prior_dates:
         try:
-            gd = datetime.strptime(g.get("date", ""), "%Y-%m-%d").date()
+            last_date = datetime.strptime(date_str, "%Y-%m-%d").date()
+            break
         except (ValueError, TypeError):
             continue
-        if gd < target:
-            last_date = gd
-            break
 
     if last_date is None:
         return cap
@@ -881,6 +889,27 @@ def _get_days_rest(team, games, reference_date, cap=7):
     return min(max(days, 0), cap)
 
 
+def _get_team_schedule(team, context):
+    """TeamSchedule for the team's current season from the schedule index, if any."""
+    if not context:
+        return None
+    schedule_index = context.get("schedule_index")
+    season = context.get("season")
+    if schedule_index is None or not season:
+        return None
+    return schedule_index.get(team, season)
+
+
+def _game_venue_guid(game):
+    """Venue GUID of a game document (checks the legacy field names too)."""
+    return (
+        game.get("venue_guid") or game.get("venueGuid") or
+        game.get("arena_guid") or game.get("arenaId") or
+        (game.get("venue") or {}).get("venue_guid") or
+        (game.get("venue") or {}).get("guid")
+    )
+
+
 def _team_plays_tomorrow(team, reference_date, context):
     """Check if team plays the day after reference_date."""
     if not reference_date:
@@ -896,19 +925,21 @@ def _team_plays_tomorrow(team, reference_date, context):
     season = context.get("season", "")
     exclude = context.get("exclude_game_types", ["preseason", "allstar"])
 
+    schedule_index = context.get("schedule_index")
+    if schedule_index is not None:
+        return schedule_index.plays_on(team, tomorrow_str, season)
+
     if games_home is not None and games_away is not None:
         # Check preloaded data
         for s_key in ([season] if season else list(games_home.keys())):
             if s_key in games_home:
-                date_games = games_home[s_key].get(tomorrow_str, {})
-                for t, g in date_games.items():
-                    if t == team and g.get("game_type", "regseason") not in exclude:
-                        return True
+                g = games_home[s_key].get(tomorrow_str, {}).get(team)
+                if g is not None and g.get("game_type", "regseason") not in exclude:
+                    return True
             if s_key in games_away:
-                date_games = games_away[s_key].get(tomorrow_str, {})
-                for t, g in date_games.items():
-                    if t == team and g.get("game_type", "regseason") not in exclude:
-                        return True
+                g = games_away[s_key].get(tomorrow_str, {}).get(team)
+                if g is not None and g.get("game_type", "regseason") not in exclude:
+                    return True
         return False
 
     # Fall back to DB query
@@ -951,6 +982,12 @@ def _compute_travel_distance(team, games, reference_date, time_period, context):
     else:
         return 0.0
 
+    schedule = _get_team_schedule(team, context)
+    if schedule is not None:
+        target_venue_guid = context.get("target_venue_guid")
+        target_coords = venue_cache.get(target_venue_guid) if target_venue_guid else None
+        return schedule.travel_miles(reference_date, n_days, target_coords)
+
     start_date = target - timedelta(days=n_days)
     start_str = start_date.strftime("%Y-%m-%d")
     end_str = reference_date
@@ -969,12 +1006,7 @@ def _compute_travel_distance(team, games, reference_date, time_period, context):
     prev_lat, prev_lon = None, None
 
     for game in range_games:
-        venue_guid = (
-            game.get("venue_guid") or game.get("venueGuid") or
-            game.get("arena_guid") or game.get("arenaId") or
-            (game.get("venue") or {}).get("venue_guid") or
-            (game.get("venue") or {}).get("guid")
-        )
+        venue_guid = _game_venue_guid(game)
         if not venue_guid:
             continue
 
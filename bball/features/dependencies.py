@@ -11,8 +11,11 @@ Key dependency types:
 4. Net stats depend on the base stat and opponent stats
 """
 
-from typing import Dict, List, Set, Tuple, Optional
+from collections import deque
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional
+import hashlib
 import re
+import threading
 from bball.features.registry import FeatureRegistry
 
 
@@ -296,6 +299,126 @@ def get_direct_dependencies(feature_name: str) -> List[str]:
     return dependencies
 
 
+# =============================================================================
+# MEMOIZED DEPENDENCY GRAPH
+# =============================================================================
+
+class DependencyGraph:
+    """
+    Memoized dependency graph over the feature universe.
+
+    Direct dependencies are parsed once per feature and transitive closures
+    are memoized per node, so closure and topological-order queries over
+    thousands of master columns become graph lookups after the first call.
+    One graph is shared per registry version (see get_dependency_graph).
+    """
+
+    def __init__(self, version: str = ""):
+        self.version = version
+        self._direct: Dict[str, Tuple[str, ...]] = {}
+        self._closure: Dict[str, FrozenSet[str]] = {}
+        self._lock = threading.Lock()
+
+    def direct(self, feature_name: str) -> Tuple[str, ...]:
+        """Direct dependencies of a feature (memoized get_direct_dependencies)."""
+        deps = self._direct.get(feature_name)
+        if deps is None:
+            deps = tuple(get_direct_dependencies(feature_name))
+            with self._lock:
+                self._direct[feature_name] = deps
+        return deps
+
+    def closure(self, feature_name: str) -> FrozenSet[str]:
+        """All transitive dependencies of a feature (excluding itself unless cyclic)."""
+        cached = self._closure.get(feature_name)
+        if cached is not None:
+            return cached
+
+        result: Set[str] = set()
+        queue = deque(self.direct(feature_name))
+        while queue:
+            dep = queue.popleft()
+            if dep in result:
+                continue
+            result.add(dep)
+            dep_closure = self._closure.get(dep)
+            if dep_closure is not None:
+                # Already complete for this node - no need to expand it
+                result.update(dep_closure)
+                continue
+            queue.extend(d for d in self.direct(dep) if d not in result)
+
+        frozen = frozenset(result)
+        with self._lock:
+            self._closure[feature_name] = frozen
+        return frozen
+
+    def topological_order(self, features: Set[str]) -> List[str]:
+        """Order features so dependencies come before their dependents (Kahn's algorithm)."""
+        in_degree = {f: 0 for f in features}
+        dependents = {f: [] for f in features}
+
+        for feature in features:
+            for dep in self.direct(feature):
+                if dep in features:
+                    in_degree[feature] += 1
+                    dependents[dep].append(feature)
+
+        queue = deque(sorted(f for f in features if in_degree[f] == 0))
+        result = []
+
+        while queue:
+            current = queue.popleft()
+            result.append(current)
+
+            for dependent in dependents[current]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+
+        # If we couldn't process all features, there's a cycle (shouldn't happen)
+        if len(result) != len(features):
+            # Fall back to sorted order
+            remaining = set(features) - set(result)
+            result.extend(sorted(remaining))
+
+        return result
+
+
+def _registry_version() -> str:
+    """Fingerprint of the inputs that determine dependency edges."""
+    stat_names = sorted(FeatureRegistry.STAT_DEFINITIONS.keys())
+    explicit = sorted((k, tuple(v)) for k, v in EXPLICIT_DEPENDENCIES.items())
+    return hashlib.md5(repr((stat_names, explicit)).encode()).hexdigest()
+
+
+def _registry_identity() -> Tuple[int, int, int, int]:
+    """Cheap identity of the registry inputs; the version is only rehashed when it changes."""
+    stats = FeatureRegistry.STAT_DEFINITIONS
+    return (id(stats), len(stats), id(EXPLICIT_DEPENDENCIES), len(EXPLICIT_DEPENDENCIES))
+
+
+_GRAPH: Optional[DependencyGraph] = None
+_GRAPH_IDENTITY: Optional[Tuple[int, int, int, int]] = None
+_GRAPH_LOCK = threading.Lock()
+
+
+def get_dependency_graph() -> DependencyGraph:
+    """Return the process-wide dependency graph, rebuilt when the registry version changes."""
+    global _GRAPH, _GRAPH_IDENTITY
+    identity = _registry_identity()
+    graph = _GRAPH
+    if graph is not None and _GRAPH_IDENTITY == identity:
+        return graph
+    with _GRAPH_LOCK:
+        if _GRAPH is None or _GRAPH_IDENTITY != identity:
+            version = _registry_version()
+            if _GRAPH is None or _GRAPH.version != version:
+                _GRAPH = DependencyGraph(version)
+            _GRAPH_IDENTITY = identity
+        return _GRAPH
+
+
 def resolve_dependencies(
     feature_names: List[str],
     include_transitive: bool = True
@@ -312,38 +435,19 @@ def resolve_dependencies(
         - Set of all features to regenerate (original + all dependencies)
         - Dict mapping each original feature to its direct dependencies
     """
+    graph = get_dependency_graph()
     all_features = set(feature_names)
-    dependency_map = {f: set() for f in feature_names}
+    dependency_map = {f: set(graph.direct(f)) for f in feature_names}
 
     if not include_transitive:
         # Just get direct dependencies
-        for feature in feature_names:
-            deps = get_direct_dependencies(feature)
-            dependency_map[feature] = set(deps)
+        for deps in dependency_map.values():
             all_features.update(deps)
         return all_features, dependency_map
 
-    # Transitive closure: keep resolving until no new dependencies found
-    to_process = set(feature_names)
-    processed = set()
-
-    while to_process:
-        current = to_process.pop()
-        if current in processed:
-            continue
-
-        processed.add(current)
-        deps = get_direct_dependencies(current)
-
-        # Track direct dependencies for original features
-        if current in feature_names:
-            dependency_map[current].update(deps)
-
-        # Add new dependencies to process
-        for dep in deps:
-            if dep not in processed and dep not in to_process:
-                to_process.add(dep)
-                all_features.add(dep)
+    # Transitive closure via memoized per-feature closures
+    for feature in feature_names:
+        all_features.update(graph.closure(feature))
 
     return all_features, dependency_map
 
@@ -362,12 +466,8 @@ def get_dependents(feature_name: str, candidate_features: List[str]) -> List[str
     Returns:
         List of features from candidate_features that depend on feature_name
     """
-    dependents = []
-    for feature in candidate_features:
-        deps = get_direct_dependencies(feature)
-        if feature_name in deps:
-            dependents.append(feature)
-    return dependents
+    graph = get_dependency_graph()
+    return [f for f in candidate_features if feature_name in graph.direct(f)]
 
 
 def categorize_features(
@@ -412,34 +512,4 @@ def get_regeneration_order(features: Set[str]) -> List[str]:
     Returns:
         List of features in correct regeneration order
     """
-    # Build dependency graph
-    in_degree = {f: 0 for f in features}
-    dependents = {f: [] for f in features}
-
-    for feature in features:
-        deps = get_direct_dependencies(feature)
-        for dep in deps:
-            if dep in features:
-                in_degree[feature] += 1
-                dependents[dep].append(feature)
-
-    # Topological sort using Kahn's algorithm
-    queue = [f for f in features if in_degree[f] == 0]
-    result = []
-
-    while queue:
-        current = queue.pop(0)
-        result.append(current)
-
-        for dependent in dependents[current]:
-            in_degree[dependent] -= 1
-            if in_degree[dependent] == 0:
-                queue.append(dependent)
-
-    # If we couldn't process all features, there's a cycle (shouldn't happen)
-    if len(result) != len(features):
-        # Fall back to sorted order
-        remaining = features - set(result)
-        result.extend(sorted(remaining))
-
-    return result
+    return get_dependency_graph().topological_order(features)
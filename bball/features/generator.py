@@ -22,6 +22,7 @@ from bball.stats.per_calculator import PERCalculator
 from bball.features.compute import BasketballFeatureComputer
 from bball.features.injury import InjuryFeatureCalculator
 from bball.features.parser import parse_feature_name
+from bball.features.plan import compile_feature_plan
 from bball.data import GamesRepository, RostersRepository
 
 
@@ -91,6 +92,9 @@ class SharedFeatureGenerator:
         # Prediction context reference (set via set_prediction_context)
         self._prediction_context = None
 
+        # Last compiled plan: (feature_names tuple, FeaturePlan)
+        self._last_plan = None
+
     def set_prediction_context(self, context) -> None:
         """
         Inject preloaded prediction context to avoid per-feature DB calls.
@@ -232,62 +236,34 @@ class SharedFeatureGenerator:
         self._per_player_lists = {}
         self._injury_player_lists = {}
 
-        # Known special features that are NOT pipe-delimited
-        VALID_SPECIAL_FEATURES = {
-            'pred_margin',
-            'SeasonStartYear', 'Year', 'Month', 'Day',
-        }
-
-        # Categorize features for efficient processing
-        regular_features: List[str] = []
-        per_features: List[str] = []
-        injury_features: List[str] = []
-        special_features: List[str] = []
-
+        # Categorize features via the compiled feature plan (reused while the list is unchanged)
         import time as _time
-        _start_categorize = _time.time()
-
-        for feature_name in feature_names:
-            if '|' not in feature_name:
-                special_features.append(feature_name)
-            elif feature_name.startswith('player_') or feature_name.startswith('per_available'):
-                per_features.append(feature_name)
-            elif feature_name.startswith('inj_'):
-                injury_features.append(feature_name)
-            else:
-                regular_features.append(feature_name)
+        names = tuple(feature_names)
+        if self._last_plan is None or self._last_plan[0] != names:
+            self._last_plan = (names, compile_feature_plan(names))
+        plan = self._last_plan[1]
+        per_features: List[str] = list(plan.per)
+        injury_features: List[str] = list(plan.injury)
 
         print(f"[SharedFeatureGenerator] Categorized {len(feature_names)} features: "
-              f"{len(regular_features)} regular, {len(per_features)} PER, "
-              f"{len(injury_features)} injury, {len(special_features)} special")
+              f"{len(plan.regular) + len(plan.composite)} regular, {len(per_features)} PER, "
+              f"{len(injury_features)} injury, {len(plan.special)} special")
 
         # 1. Handle special non-pipe features
-        for feature_name in special_features:
-            if feature_name == 'SeasonStartYear':
-                features_dict[feature_name] = int(year) if int(month) >= 10 else int(year) - 1
-            elif feature_name == 'Year':
-                features_dict[feature_name] = int(year)
-            elif feature_name == 'Month':
-                features_dict[feature_name] = int(month)
-            elif feature_name == 'Day':
-                features_dict[feature_name] = int(day)
-            elif feature_name == 'pred_margin':
-                # Will be overwritten by additional_features if provided
-                features_dict[feature_name] = 0.0
-            else:
-                features_dict[feature_name] = 0.0
+        # (pred_margin will be overwritten by additional_features if provided)
+        features_dict.update(plan.special_values(year, month, day))
 
         # 2. Calculate regular stat features via BasketballFeatureComputer
         _start_regular = _time.time()
 
-        regular_results = self._computer.compute_matchup_features(
-            regular_features, home_team, away_team, season,
+        regular_results = self._computer.execute_plan(
+            plan, home_team, away_team, season,
             game_date, venue_guid=venue_guid,
         )
         features_dict.update(regular_results)
 
         _elapsed_regular = _time.time() - _start_regular
-        print(f"[SharedFeatureGenerator] Regular features: {_elapsed_regular:.2f}s for {len(regular_features)} features")
+        print(f"[SharedFeatureGenerator] Regular features: {_elapsed_regular:.2f}s for {len(regular_results)} features")
 
         # 3. Calculate PER features if any are needed
         if per_features:
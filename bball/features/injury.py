@@ -31,6 +31,47 @@ from bball.data import (
 from bball.league_config import LeagueConfig, load_league_config
 
 
+class TeamSeasonMinutes:
+    """Per-player prefix sums of minutes/games for one (team, season).
+
+    Built once from the preloaded (date-sorted) player records; answers
+    "season-to-date as of date" usage queries with one bisect per player
+    instead of re-aggregating every record before the date.
+    """
+
+    __slots__ = ("team", "_players")
+
+    def __init__(self, team, records):
+        self.team = team
+        # pid -> (date strings, cumulative minutes, date ordinals)
+        by_player = defaultdict(lambda: ([], [0.0], []))
+        for record in records:
+            minutes = record.get("stats", {}).get("min", 0.0)
+            if minutes > 0:
+                dates, cum_min, ordinals = by_player[str(record.get("player_id"))]
+                date_str = record.get("date")
+                dates.append(date_str)
+                cum_min.append(cum_min[-1] + minutes)
+                ordinals.append(date.fromisoformat(date_str).toordinal())
+        self._players = dict(by_player)
+
+    def stats_as_of(self, before_date):
+        """{pid: {mpg, games_played, per, last_played_date, last_game_team}} before a date."""
+        result = {}
+        for pid, (dates, cum_min, ordinals) in self._players.items():
+            games = bisect.bisect_left(dates, before_date)
+            if games == 0:
+                continue
+            result[pid] = {
+                "mpg": cum_min[games] / games,
+                "games_played": games,
+                "per": 0.0,
+                "last_played_date": date.fromordinal(ordinals[games - 1]),
+                "last_game_team": self.team,
+            }
+        return result
+
+
 class InjuryFeatureCalculator:
     """Standalone calculator for injury-impact features."""
 
@@ -71,6 +112,7 @@ class InjuryFeatureCalculator:
         self._injury_max_mpg_cache = {}        # (team, season, date_str) -> float
         self._injury_rotation_mpg_cache = {}   # (team, season, date_str) -> float
         self._injury_preloaded_players = {}    # (team, season) -> [player_records]
+        self._injury_minutes_index = {}        # (team, season) -> TeamSeasonMinutes
         self._injury_cache_loaded = False
         self._team_weighted_per_mass_cache = {}
         self._season_injury_severity_cache = {}
@@ -985,6 +1027,16 @@ class InjuryFeatureCalculator:
     # Player stats helpers
     # ------------------------------------------------------------------
 
+    def _preloaded_stats_as_of(self, team, season, before_date):
+        """Season-to-date player stats from the preloaded records, or None if not preloaded."""
+        if not self._injury_cache_loaded or (team, season) not in self._injury_preloaded_players:
+            return None
+        index = self._injury_minutes_index.get((team, season))
+        if index is None:
+            index = TeamSeasonMinutes(team, self._injury_preloaded_players[(team, season)])
+            self._injury_minutes_index[(team, season)] = index
+        return index.stats_as_of(before_date)
+
     def _get_player_season_stats(self, team, season, before_date, player_ids):
         """Get season-to-date stats for players (MPG, last game date/team)."""
         if not player_ids:
@@ -993,35 +1045,34 @@ class InjuryFeatureCalculator:
         player_ids_set = set(str(pid) for pid in player_ids)
         cache_key = (team, season, before_date)
 
+        if cache_key not in self._injury_player_stats_cache:
+            preloaded = self._preloaded_stats_as_of(team, season, before_date)
+            if preloaded is not None:
+                self._injury_player_stats_cache[cache_key] = preloaded
+
         if cache_key in self._injury_player_stats_cache:
             cached = self._injury_player_stats_cache[cache_key]
             return {pid: cached[pid] for pid in player_ids_set if pid in cached}
 
-        # Use preloaded data or fall back to DB
-        if self._injury_cache_loaded and (team, season) in self._injury_preloaded_players:
-            player_records = [
-                r for r in self._injury_preloaded_players[(team, season)]
-                if r.get("date", "") < before_date
-            ]
-        else:
-            if not hasattr(self, "_db_fallback_player_stats"):
-                self._db_fallback_player_stats = 0
-            self._db_fallback_player_stats += 1
-            if self._db_fallback_player_stats <= 3:
-                print(
-                    f"[DB FALLBACK] _get_player_season_stats #{self._db_fallback_player_stats}: "
-                    f"team={team}, season={season}"
-                )
-            player_records = self._players_repo.find(
-                {
-                    "team": team, "season": season,
-                    "date": {"$lt": before_date},
-                    "stats.min": {"$gt": 0},
-                    "game_type": {"$nin": self._exclude_game_types},
-                },
-                projection={"player_id": 1, "team": 1, "date": 1, "stats.min": 1},
-                sort=[("date", 1)],
+        # Not preloaded: fall back to DB
+        if not hasattr(self, "_db_fallback_player_stats"):
+            self._db_fallback_player_stats = 0
+        self._db_fallback_player_stats += 1
+        if self._db_fallback_player_stats <= 3:
+            print(
+                f"[DB FALLBACK] _get_player_season_stats #{self._db_fallback_player_stats}: "
+                f"team={team}, season={season}"
             )
+        player_records = self._players_repo.find(
+            {
+                "team": team, "season": season,
+                "date": {"$lt": before_date},
+                "stats.min": {"$gt": 0},
+                "game_type": {"$nin": self._exclude_game_types},
+            },
+            projection={"player_id": 1, "team": 1, "date": 1, "stats.min": 1},
+            sort=[("date", 1)],
+        )
 
         if not player_records:
             self._injury_player_stats_cache[cache_key] = {}
@@ -1065,20 +1116,23 @@ class InjuryFeatureCalculator:
             return self._injury_max_mpg_cache[cache_key]
 
         if self._injury_cache_loaded and (team, season) in self._injury_preloaded_players:
-            all_players = [
-                r for r in self._injury_preloaded_players[(team, season)]
-                if r.get("date", "") < before_date
-            ]
-        else:
-            all_players = self._players_repo.find(
-                {
-                    "team": team, "season": season,
-                    "date": {"$lt": before_date},
-                    "stats.min": {"$gt": 0},
-                    "game_type": {"$nin": self._exclude_game_types},
-                },
-                projection={"player_id": 1, "stats.min": 1},
+            self._warm_player_stats_cache(team, season, before_date)
+            max_mpg = max(
+                (s["mpg"] for s in self._injury_player_stats_cache[cache_key].values()),
+                default=0.0,
             )
+            self._injury_max_mpg_cache[cache_key] = max_mpg
+            return max_mpg
+
+        all_players = self._players_repo.find(
+            {
+                "team": team, "season": season,
+                "date": {"$lt": before_date},
+                "stats.min": {"$gt": 0},
+                "game_type": {"$nin": self._exclude_game_types},
+            },
+            projection={"player_id": 1, "stats.min": 1},
+        )
 
         if not all_players:
             self._injury_max_mpg_cache[cache_key] = 0.0
@@ -1113,28 +1167,31 @@ class InjuryFeatureCalculator:
             return self._injury_rotation_mpg_cache[cache_key]
 
         if self._injury_cache_loaded and (team, season) in self._injury_preloaded_players:
-            all_players = [
-                r for r in self._injury_preloaded_players[(team, season)]
-                if r.get("date", "") < before_date
-            ]
-        else:
-            if not hasattr(self, "_db_fallback_rotation_mpg"):
-                self._db_fallback_rotation_mpg = 0
-            self._db_fallback_rotation_mpg += 1
-            if self._db_fallback_rotation_mpg <= 3:
-                print(
-                    f"[DB FALLBACK] _get_team_rotation_mpg #{self._db_fallback_rotation_mpg}: "
-                    f"team={team}, season={season}"
-                )
-            all_players = self._players_repo.find(
-                {
-                    "team": team, "season": season,
-                    "date": {"$lt": before_date},
-                    "stats.min": {"$gt": 0},
-                    "game_type": {"$nin": self._exclude_game_types},
-                },
-                projection={"player_id": 1, "stats.min": 1},
+            self._warm_player_stats_cache(team, season, before_date)
+            total_rotation_mpg = 0.0
+            for stats in self._injury_player_stats_cache[cache_key].values():
+                if stats["mpg"] >= mpg_thresh:
+                    total_rotation_mpg += stats["mpg"]
+            self._injury_rotation_mpg_cache[cache_key] = total_rotation_mpg
+            return total_rotation_mpg
+
+        if not hasattr(self, "_db_fallback_rotation_mpg"):
+            self._db_fallback_rotation_mpg = 0
+        self._db_fallback_rotation_mpg += 1
+        if self._db_fallback_rotation_mpg <= 3:
+            print(
+                f"[DB FALLBACK] _get_team_rotation_mpg #{self._db_fallback_rotation_mpg}: "
+                f"team={team}, season={season}"
             )
+        all_players = self._players_repo.find(
+            {
+                "team": team, "season": season,
+                "date": {"$lt": before_date},
+                "stats.min": {"$gt": 0},
+                "game_type": {"$nin": self._exclude_game_types},
+            },
+            projection={"player_id": 1, "stats.min": 1},
+        )
 
         if not all_players:
             self._injury_rotation_mpg_cache[cache_key] = 0.0
@@ -1243,22 +1300,21 @@ class InjuryFeatureCalculator:
         if cache_key in self._injury_player_stats_cache:
             return
 
-        if self._injury_cache_loaded and (team, season) in self._injury_preloaded_players:
-            player_records = [
-                r for r in self._injury_preloaded_players[(team, season)]
-                if r.get("date", "") < before_date
-            ]
-        else:
-            player_records = self._players_repo.find(
-                {
-                    "team": team, "season": season,
-                    "date": {"$lt": before_date},
-                    "stats.min": {"$gt": 0},
-                    "game_type": {"$nin": self._exclude_game_types},
-                },
-                projection={"player_id": 1, "team": 1, "date": 1, "stats.min": 1},
-                sort=[("date", 1)],
-            )
+        preloaded = self._preloaded_stats_as_of(team, season, before_date)
+        if preloaded is not None:
+            self._injury_player_stats_cache[cache_key] = preloaded
+            return
+
+        player_records = self._players_repo.find(
+            {
+                "team": team, "season": season,
+                "date": {"$lt": before_date},
+                "stats.min": {"$gt": 0},
+                "game_type": {"$nin": self._exclude_game_types},
+            },
+            projection={"player_id": 1, "team": 1, "date": 1, "stats.min": 1},
+            sort=[("date", 1)],
+        )
 
         if not player_records:
             self._injury_player_stats_cache[cache_key] = {}
@@ -0,0 +1,287 @@
+"""
+Compiled feature plans.
+
+A feature plan is a one-time transformation of a feature list into typed,
+pre-parsed operations so per-row code never re-splits pipe-delimited names:
+
+- special features (SeasonStartYear, Year, Month, Day, pred_margin, ...)
+- regular stat features, computed directly by the StatEngine
+- composite features (blend: / delta: / blend-delta:), pre-expanded into
+  weighted sub-feature terms
+- PER and injury features, routed to PERCalculator / InjuryFeatureCalculator
+
+Engine sub-features are de-duplicated across regular and composite features
+and grouped by time period (window), so each engine feature is computed once
+per row even when several blends share it.
+
+Usage:
+    plan = compile_feature_plan(feature_names)   # cached by feature-set hash
+    results = computer.execute_plan(plan, home, away, season, game_date)
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Prefixes of composite time periods (longest first: blend-delta before blend)
+COMPOSITE_PREFIXES = ("blend-delta:", "blend:", "delta:")
+
+# Sentinel stored for engine sub-features that raised during computation
+FAILED = object()
+
+
+@dataclass(frozen=True)
+class FeatureOp:
+    """A pre-parsed feature operation.
+
+    For composite features the value is the weighted mean of ``terms``
+    (sub-feature name, weight), minus the weighted mean of ``baseline_terms``
+    when present. A plain time period is a single term of weight 1.0.
+    """
+
+    name: str
+    kind: str                    # 'regular' or 'composite'
+    stat_name: str = ""
+    time_period: str = ""
+    calc_weight: str = ""
+    perspective: str = ""
+    is_side: bool = False
+    terms: Tuple[Tuple[str, float], ...] = ()
+    baseline_terms: Tuple[Tuple[str, float], ...] = ()
+
+    def sub_features(self) -> List[str]:
+        """Engine feature names this operation reads."""
+        if self.kind == "regular":
+            return [self.name]
+        return [name for name, _ in self.terms + self.baseline_terms]
+
+    def evaluate(self, engine_values: Dict[str, object]) -> Optional[float]:
+        """Combine precomputed engine values for this operation."""
+        if self.kind == "regular":
+            val = engine_values.get(self.name)
+            return None if val is FAILED else val
+
+        if not self.terms:
+            return None
+        recent = _weighted_mean(self.terms, engine_values)
+        if not self.baseline_terms:
+            return recent
+        baseline = _weighted_mean(self.baseline_terms, engine_values)
+        if recent is not None and baseline is not None:
+            return float(recent) - float(baseline)
+        return None
+
+
+def _weighted_mean(terms, engine_values) -> Optional[float]:
+    total = 0.0
+    total_weight = 0.0
+    for name, weight in terms:
+        val = engine_values.get(name)
+        if val is FAILED:
+            raise ValueError(f"sub-feature {name} failed")
+        if val is not None:
+            total += float(val) * weight
+            total_weight += weight
+    return total / total_weight if total_weight > 0 else None
+
+
+@dataclass(frozen=True)
+class FeaturePlan:
+    """Compiled, immutable execution plan for an ordered feature list."""
+
+    feature_names: Tuple[str, ...]
+    feature_set_hash: str
+    special: Tuple[str, ...] = ()
+    regular: Tuple[FeatureOp, ...] = ()
+    composite: Tuple[FeatureOp, ...] = ()
+    per: Tuple[str, ...] = ()
+    injury: Tuple[str, ...] = ()
+    # time period -> unique engine feature names computed for that window
+    windows: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+
+    @property
+    def stat_feature_names(self) -> List[str]:
+        """Regular + composite names (what compute_matchup_features receives)."""
+        return [op.name for op in self.regular] + [op.name for op in self.composite]
+
+    def special_values(self, year: int, month: int, day: int) -> Dict[str, float]:
+        """Values for the non-pipe special features of this plan."""
+        values = {}
+        for name in self.special:
+            if name == 'SeasonStartYear':
+                values[name] = int(year) if int(month) >= 10 else int(year) - 1
+            elif name == 'Year':
+                values[name] = int(year)
+            elif name == 'Month':
+                values[name] = int(month)
+            elif name == 'Day':
+                values[name] = int(day)
+            else:
+                # pred_margin and unknown specials default to 0.0
+                values[name] = 0.0
+        return values
+
+
+def feature_set_hash(feature_names: Iterable[str]) -> str:
+    """Order-preserving MD5 hash of a feature list."""
+    return hashlib.md5('\n'.join(feature_names).encode()).hexdigest()
+
+
+def _expand_time_period(stat_name, time_period, calc_weight, perspective):
+    """Expand a (possibly blend:) time period into weighted sub-feature terms."""
+    if not time_period.startswith("blend:"):
+        return ((f"{stat_name}|{time_period}|{calc_weight}|{perspective}", 1.0),)
+
+    terms = []
+    for seg in time_period[len("blend:"):].split("/"):
+        parts = seg.rsplit(":", 1)
+        if len(parts) != 2:
+            continue
+        tp, w_str = parts
+        try:
+            weight = float(w_str)
+        except ValueError:
+            continue
+        terms.append((f"{stat_name}|{tp}|{calc_weight}|{perspective}", weight))
+    return tuple(terms)
+
+
+def _compile_composite(feature_name: str, parts: List[str]) -> FeatureOp:
+    """Compile a blend:/delta:/blend-delta: feature into weighted terms."""
+    if len(parts) not in (4, 5):
+        return FeatureOp(name=feature_name, kind="composite")
+
+    stat_name, time_period, calc_weight, perspective = parts[:4]
+    is_side = len(parts) == 5 and parts[4] == 'side'
+    terms: Tuple[Tuple[str, float], ...] = ()
+    baseline_terms: Tuple[Tuple[str, float], ...] = ()
+
+    if time_period.startswith("blend-delta:"):
+        spec_parts = time_period[len("blend-delta:"):].rsplit("-", 1)
+        if len(spec_parts) == 2:
+            blend_spec, baseline_tp = spec_parts
+            terms = _expand_time_period(stat_name, f"blend:{blend_spec}", calc_weight, perspective)
+            baseline_terms = ((f"{stat_name}|{baseline_tp}|{calc_weight}|{perspective}", 1.0),)
+    elif time_period.startswith("blend:"):
+        terms = _expand_time_period(stat_name, time_period, calc_weight, perspective)
+    elif time_period.startswith("delta:"):
+        spec_parts = time_period[len("delta:"):].split("-", 1)
+        if len(spec_parts) == 2:
+            recent_tp, baseline_tp = spec_parts
+            terms = _expand_time_period(stat_name, recent_tp, calc_weight, perspective)
+            baseline_terms = _expand_time_period(stat_name, baseline_tp, calc_weight, perspective)
+
+    # A delta needs both sides; an unparseable spec yields an empty (0.0) op
+    if time_period.startswith(("delta:", "blend-delta:")) and not baseline_terms:
+        terms = ()
+
+    return FeatureOp(
+        name=feature_name,
+        kind="composite",
+        stat_name=stat_name,
+        time_period=time_period,
+        calc_weight=calc_weight,
+        perspective=perspective,
+        is_side=is_side,
+        terms=terms,
+        baseline_terms=baseline_terms,
+    )
+
+
+def _compile(feature_names: Tuple[str, ...], plan_hash: str, route_external: bool) -> FeaturePlan:
+    special, per, injury = [], [], []
+    regular: List[FeatureOp] = []
+    composite: List[FeatureOp] = []
+
+    for fname in feature_names:
+        if route_external and '|' not in fname:
+            special.append(fname)
+        elif route_external and (fname.startswith('player_') or fname.startswith('per_available')):
+            per.append(fname)
+        elif route_external and fname.startswith('inj_'):
+            injury.append(fname)
+        else:
+            parts = fname.split("|")
+            if len(parts) >= 4 and parts[1].startswith(COMPOSITE_PREFIXES):
+                composite.append(_compile_composite(fname, parts))
+            else:
+                regular.append(FeatureOp(
+                    name=fname,
+                    kind="regular",
+                    stat_name=parts[0],
+                    time_period=parts[1] if len(parts) > 1 else "",
+                    calc_weight=parts[2] if len(parts) > 2 else "",
+                    perspective=parts[3] if len(parts) > 3 else "",
+                    is_side=len(parts) > 4 and parts[4] == 'side',
+                ))
+
+    # Group unique engine features by window (time period)
+    windows: Dict[str, List[str]] = {}
+    seen = set()
+    for op in regular + composite:
+        for sub in op.sub_features():
+            if sub in seen:
+                continue
+            seen.add(sub)
+            sub_parts = sub.split("|")
+            window = sub_parts[1] if len(sub_parts) > 1 else ""
+            windows.setdefault(window, []).append(sub)
+
+    return FeaturePlan(
+        feature_names=feature_names,
+        feature_set_hash=plan_hash,
+        special=tuple(special),
+        regular=tuple(regular),
+        composite=tuple(composite),
+        per=tuple(per),
+        injury=tuple(injury),
+        windows={w: tuple(names) for w, names in windows.items()},
+    )
+
+
+# Compiled plans, least recently used first. Feature sets in use are few
+# (model feature lists, master columns), so a small bound keeps them all hot.
+PLAN_CACHE_MAX_ENTRIES = 64
+_PLAN_CACHE: "OrderedDict[Tuple[str, bool], FeaturePlan]" = OrderedDict()
+_PLAN_CACHE_LOCK = threading.Lock()
+
+
+def compile_feature_plan(feature_names: Iterable[str], route_external: bool = True) -> FeaturePlan:
+    """Compile (or fetch the cached) plan for an ordered feature list.
+
+    Args:
+        feature_names: Ordered feature names
+        route_external: If True, special, PER and injury features are split
+            out for the caller. If False, every name is treated as a stat
+            feature (the compute_matchup_features contract).
+    """
+    names = tuple(feature_names)
+    plan_hash = feature_set_hash(names)
+    cache_key = (plan_hash, route_external)
+    with _PLAN_CACHE_LOCK:
+        plan = _PLAN_CACHE.get(cache_key)
+        if plan is not None:
+            _PLAN_CACHE.move_to_end(cache_key)
+            return plan
+    plan = _compile(names, plan_hash, route_external)
+    with _PLAN_CACHE_LOCK:
+        plan = _PLAN_CACHE.setdefault(cache_key, plan)
+        _PLAN_CACHE.move_to_end(cache_key)
+        while len(_PLAN_CACHE) > PLAN_CACHE_MAX_ENTRIES:
+            _PLAN_CACHE.popitem(last=False)
+    return plan
+
+
+def compile_uncached_feature_plan(feature_names: Iterable[str], route_external: bool = True) -> FeaturePlan:
+    """Compile a plan without storing it (one-off subsets, e.g. cache misses)."""
+    names = tuple(feature_names)
+    return _compile(names, feature_set_hash(names), route_external)
+
+
+def clear_feature_plan_cache():
+    """Drop all cached plans (e.g. after the feature registry changes)."""
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE.clear()
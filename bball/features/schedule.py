@@ -0,0 +1,147 @@
+"""
+Per (team, season) schedule index for rest, back-to-back and travel features.
+
+Built from BasketballFeatureComputer's preloaded team game index. Each team
+schedule stores sorted dates and their ordinals, plus the chain of games with
+known venue coordinates and a prefix sum over the legs between them, so:
+
+- days rest and plays-on-date are bisect lookups
+- travel miles over days_N is a prefix-sum difference plus one final leg
+
+Usage:
+    index = ScheduleIndex(team_games_index, venue_cache, exclude_game_types)
+    schedule = index.get("LAL", "2024-2025")
+    schedule.days_rest("2025-01-15")
+"""
+
+from bisect import bisect_left
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from bball.features.custom_stats import haversine_miles, _game_venue_guid
+
+
+class TeamSchedule:
+    """Sorted schedule arrays for one team in one season."""
+
+    __slots__ = ("dates", "ordinals", "coord_dates", "coords", "leg_prefix")
+
+    def __init__(self, games: List[dict], venue_cache: Dict[str, Tuple[float, float]]):
+        # games must be sorted by date
+        self.dates: List[str] = []
+        self.ordinals: List[int] = []
+        # Games with known venue coordinates, and cumulative leg miles:
+        # leg_prefix[i] = miles travelled from coords[0] through coords[i]
+        self.coord_dates: List[str] = []
+        self.coords: List[Tuple[float, float]] = []
+        self.leg_prefix: List[float] = []
+
+        for game in games:
+            date_str = game.get("date", "")
+            try:
+                ordinal = date.fromisoformat(date_str).toordinal()
+            except (ValueError, TypeError):
+                continue
+            self.dates.append(date_str)
+            self.ordinals.append(ordinal)
+
+            venue_guid = _game_venue_guid(game)
+            coords = venue_cache.get(venue_guid) if venue_guid else None
+            if coords is None:
+                continue
+            if self.coords:
+                leg = haversine_miles(*self.coords[-1], *coords)
+                self.leg_prefix.append(self.leg_prefix[-1] + leg)
+            else:
+                self.leg_prefix.append(0.0)
+            self.coord_dates.append(date_str)
+            self.coords.append(coords)
+
+    def days_rest(self, reference_date: str, cap: int = 7) -> int:
+        """Days since the last game before reference_date, capped at `cap`."""
+        try:
+            target = date.fromisoformat(reference_date).toordinal()
+        except (ValueError, TypeError):
+            return cap
+        idx = bisect_left(self.dates, reference_date)
+        if idx == 0:
+            return cap
+        return min(max(target - self.ordinals[idx - 1], 0), cap)
+
+    def plays_on(self, date_str: str) -> bool:
+        """Whether the team has a game on date_str."""
+        idx = bisect_left(self.dates, date_str)
+        return idx < len(self.dates) and self.dates[idx] == date_str
+
+    def travel_miles(
+        self,
+        reference_date: str,
+        n_days: int,
+        target_coords: Optional[Tuple[float, float]] = None,
+    ) -> float:
+        """Miles travelled between games in [reference_date - n_days, reference_date).
+
+        Adds the leg from the last of those games to target_coords when given.
+        """
+        start_str = _days_before(reference_date, n_days)
+        if start_str is None:
+            return 0.0
+        lo = bisect_left(self.coord_dates, start_str)
+        hi = bisect_left(self.coord_dates, reference_date)
+        if hi <= lo:
+            return 0.0
+
+        total = self.leg_prefix[hi - 1] - self.leg_prefix[lo]
+        if target_coords:
+            total += haversine_miles(*self.coords[hi - 1], *target_coords)
+        return total
+
+
+def _days_before(reference_date: str, n_days: int) -> Optional[str]:
+    try:
+        target = date.fromisoformat(reference_date)
+    except (ValueError, TypeError):
+        return None
+    return (target - timedelta(days=n_days)).isoformat()
+
+
+class ScheduleIndex:
+    """Lazily built, memoized TeamSchedule per (team, season)."""
+
+    def __init__(self, team_games_index, venue_cache, exclude_game_types):
+        """
+        Args:
+            team_games_index: {season: {team: [(date_str, game_doc), ...]}} sorted by date
+            venue_cache: {venue_guid: (lat, lon)}
+            exclude_game_types: Game types left out of the schedule
+        """
+        self._team_games_index = team_games_index
+        self._venue_cache = venue_cache
+        self._exclude = set(exclude_game_types)
+        self._schedules: Dict[Tuple[str, str], Optional[TeamSchedule]] = {}
+
+    def get(self, team: str, season: str) -> Optional[TeamSchedule]:
+        """Schedule for a team-season, or None if the team has no games in it."""
+        key = (team, season)
+        if key in self._schedules:
+            return self._schedules[key]
+
+        pairs = self._team_games_index.get(season, {}).get(team)
+        schedule = None
+        if pairs:
+            games = [
+                g for _, g in pairs
+                if g.get("game_type", "regseason") not in self._exclude
+            ]
+            schedule = TeamSchedule(games, self._venue_cache)
+        self._schedules[key] = schedule
+        return schedule
+
+    def plays_on(self, team: str, date_str: str, season: str = "") -> bool:
+        """Whether the team plays on date_str (any season when season is empty)."""
+        seasons = [season] if season else list(self._team_games_index.keys())
+        for s_key in seasons:
+            schedule = self.get(team, s_key)
+            if schedule is not None and schedule.plays_on(date_str):
+                return True
+        return False
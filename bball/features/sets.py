@@ -13,6 +13,10 @@ This module provides convenience functions for accessing features by group/layer
 with optional filtering by model type or availability in master training CSV.
 """
 
+import hashlib
+import json
+import os
+import threading
 from typing import List, Dict, Set, Optional
 from bball.features.registry import FeatureRegistry, FeatureGroups
 
@@ -20,36 +24,119 @@ from bball.features.registry import FeatureRegistry, FeatureGroups
 # =============================================================================
 # FEATURE SETS - Derived from FeatureGroups (SSoT)
 # =============================================================================
+#
+# FEATURE_SETS, FEATURE_SET_DESCRIPTIONS and FEATURE_LAYERS are built on first
+# access (module __getattr__) rather than at import time: expanding every
+# stat x period x weight x perspective is the slowest part of importing
+# bball.features. Set BASKETBALL_FEATURE_SETS_CACHE to a JSON path to persist
+# the tables across processes; the file is keyed by a registry fingerprint and
+# rebuilt whenever the group or stat definitions change.
+
+FEATURE_SETS_CACHE_ENV = "BASKETBALL_FEATURE_SETS_CACHE"
+
+_TABLES: Optional[Dict[str, dict]] = None
+_TABLES_LOCK = threading.Lock()
+
 
 def _build_feature_sets() -> Dict[str, List[str]]:
     """Build FEATURE_SETS from FeatureGroups (SSoT)."""
     return FeatureGroups.get_all_features(include_side=True)
 
 
-# FEATURE_SETS is derived from FeatureGroups - the SSoT
-# This is computed once at import time
-FEATURE_SETS: Dict[str, List[str]] = _build_feature_sets()
-
-
-# =============================================================================
-# FEATURE SET DESCRIPTIONS - Derived from FeatureGroups
-# =============================================================================
+def _build_feature_set_descriptions() -> Dict[str, str]:
+    return {
+        group_name: FeatureGroups.get_group_description(group_name)
+        for group_name in FeatureGroups.get_all_groups()
+    }
 
-FEATURE_SET_DESCRIPTIONS: Dict[str, str] = {
-    group_name: FeatureGroups.get_group_description(group_name)
-    for group_name in FeatureGroups.get_all_groups()
-}
 
+def _build_feature_layers() -> Dict[str, List[str]]:
+    layers = {}
+    for layer in [1, 2, 3, 4]:
+        groups = FeatureGroups.get_groups_by_layer(layer)
+        if groups:  # Only include non-empty layers
+            layers[f"layer_{layer}"] = groups
+    return layers
+
+
+def _registry_fingerprint() -> str:
+    """Fingerprint of the registry inputs the feature-set tables derive from."""
+    return hashlib.md5(repr((
+        FeatureGroups.GROUP_DEFINITIONS,
+        FeatureGroups.EXTENDED_GROUP_DEFINITIONS,
+        FeatureGroups.ACTUAL_PLAYER_FEATURES,
+        FeatureGroups.ACTUAL_INJURY_FEATURES,
+        sorted((k, repr(getattr(v, '__dict__', v))) for k, v in FeatureRegistry.STAT_DEFINITIONS.items()),
+        FeatureRegistry.get_all_time_periods(),
+        FeatureRegistry.get_all_calc_weights(),
+        FeatureRegistry.get_all_perspectives(),
+    )).encode()).hexdigest()
+
+
+def _load_persisted_tables(path: str, fingerprint: str) -> Optional[Dict[str, dict]]:
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('fingerprint') != fingerprint:
+        return None
+    return data.get('tables')
+
+
+def _persist_tables(path: str, fingerprint: str, tables: Dict[str, dict]) -> None:
+    try:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'fingerprint': fingerprint, 'tables': tables}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # persistence is best-effort
+
+
+def get_feature_set_tables() -> Dict[str, dict]:
+    """
+    Return the memoized feature-set tables, building them on first use.
 
-# =============================================================================
-# LAYER DEFINITIONS - Derived from FeatureGroups
-# =============================================================================
+    Returns:
+        Dict with 'FEATURE_SETS', 'FEATURE_SET_DESCRIPTIONS' and 'FEATURE_LAYERS'
+    """
+    global _TABLES
+    if _TABLES is not None:
+        return _TABLES
+
+    with _TABLES_LOCK:
+        if _TABLES is not None:
+            return _TABLES
+
+        cache_path = os.environ.get(FEATURE_SETS_CACHE_ENV)
+        fingerprint = _registry_fingerprint() if cache_path else None
+        tables = _load_persisted_tables(cache_path, fingerprint) if cache_path else None
+        if tables is None:
+            tables = {
+                'FEATURE_SETS': _build_feature_sets(),
+                'FEATURE_SET_DESCRIPTIONS': _build_feature_set_descriptions(),
+                'FEATURE_LAYERS': _build_feature_layers(),
+            }
+            if cache_path:
+                _persist_tables(cache_path, fingerprint, tables)
+        _TABLES = tables
+    return _TABLES
+
+
+def clear_feature_set_tables() -> None:
+    """Drop the memoized tables (e.g. after the feature registry changes)."""
+    global _TABLES
+    with _TABLES_LOCK:
+        _TABLES = None
+
+
+def __getattr__(name):
+    # FEATURE_SETS / FEATURE_SET_DESCRIPTIONS / FEATURE_LAYERS (lazy, PEP 562)
+    if name in ('FEATURE_SETS', 'FEATURE_SET_DESCRIPTIONS', 'FEATURE_LAYERS'):
+        return get_feature_set_tables()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-FEATURE_LAYERS: Dict[str, List[str]] = {
-    f"layer_{layer}": FeatureGroups.get_groups_by_layer(layer)
-    for layer in [1, 2, 3, 4]
-    if FeatureGroups.get_groups_by_layer(layer)  # Only include non-empty layers
-}
 
 LAYER_DESCRIPTIONS: Dict[str, str] = {
     "layer_1": "Outcome & ratings - core strength comparison",
@@ -229,10 +316,11 @@ def get_features_by_layers(layer_names: List[str], model_type: Optional[str] = N
     Returns:
         List of feature names, filtered if model_type is provided
     """
+    feature_layers = get_feature_set_tables()['FEATURE_LAYERS']
     feature_sets = []
     for layer_name in layer_names:
-        if layer_name in FEATURE_LAYERS:
-            feature_sets.extend(FEATURE_LAYERS[layer_name])
+        if layer_name in feature_layers:
+            feature_sets.extend(feature_layers[layer_name])
 
     return get_features_by_sets(feature_sets, model_type=model_type)
 
@@ -245,7 +333,7 @@ def get_layer_info() -> Dict[str, dict]:
         Dict mapping layer names to their feature counts and set names
     """
     info = {}
-    for layer_name, set_names in FEATURE_LAYERS.items():
+    for layer_name, set_names in get_feature_set_tables()['FEATURE_LAYERS'].items():
         total_features = sum(
             len(FeatureGroups.get_features_for_group(set_name, include_side=True))
             for set_name in set_names
@@ -7,12 +7,14 @@ Uses the public API at api.elections.kalshi.com (no auth required for reads).
 
 import time
 import logging
-from datetime import datetime, date
-from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, time as dt_time, timezone
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from threading import Lock
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from bball.league_config import load_league_config
 
@@ -74,9 +76,12 @@ class KalshiPublicClient:
 
     BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, pool_maxsize: int = 16):
         self.timeout = timeout
         self.session = requests.Session()
+        # Keep-alive connection pool so repeated/concurrent calls reuse sockets
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
 
     def _get(self, path: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make GET request to public API with retry on 429."""
@@ -111,14 +116,20 @@ class KalshiPublicClient:
         self,
         series_ticker: Optional[str] = None,
         limit: int = 100,
-        cursor: Optional[str] = None
+        cursor: Optional[str] = None,
+        with_nested_markets: bool = False,
+        min_close_ts: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Get events, optionally filtered by series."""
+        """Get events, optionally filtered by series (and with their markets inline)."""
         params = {"limit": limit}
         if series_ticker:
             params["series_ticker"] = series_ticker
         if cursor:
             params["cursor"] = cursor
+        if with_nested_markets:
+            params["with_nested_markets"] = "true"
+        if min_close_ts:
+            params["min_close_ts"] = min_close_ts
         return self._get("/events", params)
 
     def get_market(self, ticker: str) -> Dict[str, Any]:
@@ -143,6 +154,20 @@ class KalshiPublicClient:
         return self._get("/markets", params)
 
 
+_public_client: Optional[KalshiPublicClient] = None
+_public_client_lock = Lock()
+
+
+def get_public_client() -> KalshiPublicClient:
+    """Shared KalshiPublicClient (one pooled session per process)."""
+    global _public_client
+    if _public_client is None:
+        with _public_client_lock:
+            if _public_client is None:
+                _public_client = KalshiPublicClient()
+    return _public_client
+
+
 def get_team_abbrev_map(league_id: str = "nba") -> Dict[str, str]:
     """
     Get mapping from Kalshi abbreviations to internal DB abbreviations.
@@ -413,7 +438,7 @@ def get_game_market_data(
             return cached
 
     # Fetch from API
-    client = KalshiPublicClient()
+    client = get_public_client()
     try:
         data = client.get_event(event_ticker)
     except requests.exceptions.HTTPError as e:
@@ -426,8 +451,25 @@ def get_game_market_data(
         logger.error(f"Error fetching market data for {event_ticker}: {e}")
         return None
 
-    # Parse response
-    markets = data.get("markets", [])
+    result = _build_market_data(
+        event_ticker, data.get("markets", []), home_team, away_team, league_id
+    )
+
+    # Cache result
+    if use_cache and result is not None:
+        _market_cache.set(cache_key, result, cache_ttl)
+
+    return result
+
+
+def _build_market_data(
+    event_ticker: str,
+    markets: list,
+    home_team: str,
+    away_team: str,
+    league_id: str = "nba",
+) -> Optional[MarketData]:
+    """Normalize an event's team markets into MarketData."""
     if not markets:
         logger.debug(f"No markets in response for {event_ticker}")
         return None
@@ -474,7 +516,7 @@ def get_game_market_data(
     # Use home market status as primary (they should be the same)
     status = home_status if home_market else away_status
 
-    result = MarketData(
+    return MarketData(
         event_ticker=event_ticker,
         home_team=home_team,
         away_team=away_team,
@@ -491,11 +533,84 @@ def get_game_market_data(
         last_updated=datetime.utcnow(),
     )
 
-    # Cache result
-    if use_cache:
-        _market_cache.set(cache_key, result, cache_ttl)
 
-    return result
+def get_slate_market_data(
+    game_date: date,
+    matchups: List[Tuple[str, str]],
+    league_id: str = "nba",
+    use_cache: bool = True,
+    cache_ttl: int = 60,
+    max_workers: int = 8,
+) -> Dict[Tuple[str, str], MarketData]:
+    """
+    Get market data for every game on a date with one paged events listing.
+
+    Events for the date are fetched with their markets nested, so a full
+    slate costs a few paged requests instead of one get_event call per game.
+    Every game found is written to the per-game cache used by
+    get_game_market_data(). Games missing from an incomplete listing fall
+    back to concurrent per-event requests over the pooled session.
+
+    Args:
+        game_date: Date of the games
+        matchups: (away_team, home_team) internal DB abbreviations
+        league_id: League identifier
+        use_cache: Whether to read/write the per-game cache
+        cache_ttl: Cache TTL in seconds
+        max_workers: Concurrency for per-event fallback requests
+
+    Returns:
+        Dict mapping (away_team, home_team) -> MarketData (games without a
+        market are omitted)
+    """
+    results: Dict[Tuple[str, str], MarketData] = {}
+    pending: Dict[str, Tuple[str, str]] = {}  # event_ticker -> matchup
+
+    for away_team, home_team in dict.fromkeys(matchups):
+        event_ticker = build_event_ticker(game_date, away_team, home_team, league_id)
+        cached = _market_cache.get(f"market:{event_ticker}") if use_cache else None
+        if cached is not None:
+            results[(away_team, home_team)] = cached
+        else:
+            pending[event_ticker] = (away_team, home_team)
+
+    if not pending:
+        return results
+
+    events, complete = _fetch_events_for_date(game_date, league_id)
+    events_by_ticker = {e.get("event_ticker", ""): e for e in events}
+
+    fallback = []
+    for event_ticker, (away_team, home_team) in pending.items():
+        event = events_by_ticker.get(event_ticker)
+        if event is None:
+            # Absent from a complete listing means no market for this game
+            if not complete:
+                fallback.append((away_team, home_team))
+            continue
+        market_data = _build_market_data(
+            event_ticker, event.get("markets", []), home_team, away_team, league_id
+        )
+        if market_data is None:
+            continue
+        results[(away_team, home_team)] = market_data
+        if use_cache:
+            _market_cache.set(f"market:{event_ticker}", market_data, cache_ttl)
+
+    if fallback:
+        def fetch_one(matchup):
+            away_team, home_team = matchup
+            return matchup, get_game_market_data(
+                game_date, away_team, home_team, league_id,
+                use_cache=use_cache, cache_ttl=cache_ttl,
+            )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(fallback))) as executor:
+            for matchup, market_data in executor.map(fetch_one, fallback):
+                if market_data is not None:
+                    results[matchup] = market_data
+
+    return results
 
 
 def clear_market_cache() -> None:
@@ -602,7 +717,7 @@ def get_kalshi_events_for_date(
         cache_ttl: Cache TTL in seconds
 
     Returns:
-        List of event dicts from Kalshi API
+        List of event dicts from Kalshi API (each with its 'markets' nested)
     """
     cache_key = f"events:{league_id}:{game_date.isoformat()}"
 
@@ -611,6 +726,28 @@ def get_kalshi_events_for_date(
         if cached is not None:
             return cached
 
+    all_events, _ = _fetch_events_for_date(game_date, league_id)
+
+    if use_cache and all_events:
+        _market_cache.set(cache_key, all_events, cache_ttl)
+
+    return all_events
+
+
+def _fetch_events_for_date(
+    game_date: date,
+    league_id: str = "nba",
+    max_pages: int = 5,
+) -> Tuple[list, bool]:
+    """
+    Page through the league's series events (markets nested) for one date.
+
+    Only events whose markets close on or after the game date are listed,
+    which keeps a slate to one or two pages.
+
+    Returns:
+        (events for the date, whether the listing was exhausted without errors)
+    """
     # Get series ticker from config
     try:
         league = load_league_config(league_id)
@@ -619,30 +756,33 @@ def get_kalshi_events_for_date(
         series_ticker = "KXNBAGAME"
         logger.warning(f"Could not load series_ticker from league config for '{league_id}', using default")
 
-    client = KalshiPublicClient()
-    all_events = []
+    client = get_public_client()
+    date_prefix = f"{game_date.strftime('%y')}{game_date.strftime('%b').upper()}{game_date.strftime('%d')}"
+    min_close_ts = int(datetime.combine(game_date, dt_time.min, tzinfo=timezone.utc).timestamp())
 
+    all_events = []
+    cursor = None
     try:
-        # Fetch events for the series
-        data = client.get_events(series_ticker=series_ticker, limit=200)
-        events = data.get("events", [])
-
-        # Filter by date
-        date_prefix = f"{game_date.strftime('%y')}{game_date.strftime('%b').upper()}{game_date.strftime('%d')}"
-
-        for event in events:
-            ticker = event.get("event_ticker", "")
-            # Check if this event is for the target date
-            if f"-{date_prefix}" in ticker:
-                all_events.append(event)
-
+        for _ in range(max_pages):
+            data = client.get_events(
+                series_ticker=series_ticker,
+                limit=200,
+                cursor=cursor,
+                with_nested_markets=True,
+                min_close_ts=min_close_ts,
+            )
+            for event in data.get("events", []):
+                ticker = event.get("event_ticker", "")
+                # Check if this event is for the target date
+                if f"-{date_prefix}" in ticker:
+                    all_events.append(event)
+            cursor = data.get("cursor")
+            if not cursor:
+                return all_events, True
     except Exception as e:
         logger.error(f"Error fetching Kalshi events for {game_date}: {e}")
 
-    if use_cache and all_events:
-        _market_cache.set(cache_key, all_events, cache_ttl)
-
-    return all_events
+    return all_events, False
 
 
 @dataclass
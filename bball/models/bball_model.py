@@ -26,12 +26,6 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split, TimeSeriesSplit, GridSearchCV
-from sklearn.ensemble import GradientBoostingClassifier
-from sklearn.metrics import accuracy_score, mean_squared_error, log_loss, brier_score_loss
-from sklearn.feature_selection import SelectKBest, f_classif
-from sklearn.calibration import CalibratedClassifierCV
 
 from bball.mongo import Mongo
 from bball.features.compute import BasketballFeatureComputer
@@ -48,9 +42,8 @@ from bball.stats.league_cache import (
 )
 from bball.stats.per_calculator import PERCalculator
 from bball.features.parser import parse_feature_name
+from bball.features.plan import compile_feature_plan
 from bball.features.registry import FeatureRegistry
-from sportscore.training.model_factory import create_model_with_c
-from sportscore.training.model_evaluation import compute_feature_importance
 
 
 class BballModel:
@@ -116,7 +109,8 @@ class BballModel:
         preload_data: bool = True,
         master_training_mode: bool = False,
         league: LeagueConfig = None,
-        max_workers: int = None
+        max_workers: int = None,
+        db=None
     ):
         """
         Initialize BballModel.
@@ -134,6 +128,7 @@ class BballModel:
             preload_data: If True, preload all game data and player stats (fast for training, slow init).
                          If False, skip preloading and query on-demand (fast init, slower per-query for prediction).
             league: LeagueConfig for the target league. If None, defaults to NBA.
+            db: MongoDB database. If None, connects to the configured one.
         """
         # Initialize league config (default to NBA if not provided)
         if league is None:
@@ -176,10 +171,14 @@ class BballModel:
             self.output_dir = output_dir
         
         # Initialize MongoDB connection
-        print("Connecting to MongoDB...")
-        self.mongo = Mongo()
-        self.db = self.mongo.db
-        print("Connected to MongoDB.")
+        if db is None:
+            print("Connecting to MongoDB...")
+            self.mongo = Mongo()
+            self.db = self.mongo.db
+            print("Connected to MongoDB.")
+        else:
+            self.mongo = None
+            self.db = db
 
         # Initialize repositories with league config
         self._games_repo = GamesRepository(self.db, league=self.league)
@@ -214,6 +213,7 @@ class BballModel:
         print("Initializing feature computers...")
         _alpha = exponential_lambda if use_exponential_weighting else 0.0
         self._computer = BasketballFeatureComputer(db=self.db, league=self.league, recency_alpha=_alpha)
+        self._last_plan = None  # (feature_names tuple, FeaturePlan)
         if all_games:
             games_home, games_away = all_games
             self._computer.set_preloaded_data(games_home, games_away)
@@ -485,45 +485,17 @@ class BballModel:
             K: Elo K-factor (sensitivity to results)
             home_advantage: Elo points added for home team
         """
-        elo = defaultdict(lambda: starting_elo)
-        self.elo_history = {}
-        
+        from bball.stats.elo_engine import EloEngine, EloParams
+
         # Filter out games without 'season' field
         games_with_season = [g for g in games if 'season' in g and g.get('season')]
         if len(games_with_season) < len(games):
             print(f"Warning: {len(games) - len(games_with_season)} games missing 'season' field in Elo calculation, excluding them")
-        
-        for game in sorted(games_with_season, key=lambda g: g.get('date', '')):
-            # Additional safety checks
-            if 'homeTeam' not in game or 'awayTeam' not in game or 'date' not in game:
-                continue
-            if 'homeWon' not in game:
-                # Skip games without result
-                continue
-                
-            home = game['homeTeam']['name']
-            away = game['awayTeam']['name']
-            game_date = game['date']
-            season = game['season']
-            
-            # Store pre-game Elo
-            key = (home, game_date, season)
-            self.elo_history[key] = elo[home]
-            key = (away, game_date, season)
-            self.elo_history[key] = elo[away]
-            
-            # Calculate expected win probability for home team
-            home_elo_adj = elo[home] + home_advantage
-            expected_home = 1 / (1 + 10 ** ((elo[away] - home_elo_adj) / 400))
-            
-            # Update based on result
-            actual_home = 1 if game['homeWon'] else 0
-            elo_change = K * (actual_home - expected_home)
-            
-            elo[home] += elo_change
-            elo[away] -= elo_change
-        
-        self.elo_ratings = dict(elo)
+
+        # Fixed K / home advantage, no season carryover (training-time ratings)
+        engine = EloEngine(EloParams(starting_rating=starting_elo, home_advantage=home_advantage, k=K))
+        self.elo_history = engine.replay(games_with_season).history()
+        self.elo_ratings = engine.ratings()
     
     def _get_elo_for_game(self, team: str, game_date: str, season: str) -> float:
         """Get pre-game Elo rating for a team."""
@@ -546,18 +518,19 @@ class BballModel:
             Number of days since last game (capped at 7 if no recent game found)
         """
         target_date = date(year, month, day)
-        
-        for game in sorted(games, key=lambda g: g['date'], reverse=True):
-            game_date = datetime.strptime(game['date'], '%Y-%m-%d').date()
-            if game_date < target_date:
-                team_in_game = (
-                    game['homeTeam']['name'] == team or 
-                    game['awayTeam']['name'] == team
-                )
-                if team_in_game:
-                    return (target_date - game_date).days
-        
-        return 7  # Default if no prior games found
+        target_str = target_date.isoformat()
+
+        # Single pass for the latest prior game; only that date is parsed
+        last_date_str = None
+        for game in games:
+            game_date_str = game['date']
+            if game_date_str < target_str and (last_date_str is None or game_date_str > last_date_str):
+                if game['homeTeam']['name'] == team or game['awayTeam']['name'] == team:
+                    last_date_str = game_date_str
+
+        if last_date_str is None:
+            return 7  # Default if no prior games found
+        return (target_date - datetime.strptime(last_date_str, '%Y-%m-%d').date()).days
     
     # =========================================================================
     # TRAINING DATA CREATION
@@ -1524,6 +1497,7 @@ class BballModel:
 
     def _standardize_csv(self, csv_path: str) -> str:
         """Standardize feature columns in a CSV file."""
+        from sklearn.preprocessing import StandardScaler
         df = self._read_csv_safe(csv_path)
         
         # Identify metadata and target columns
@@ -1578,6 +1552,9 @@ class BballModel:
         Returns:
             Dict of model_name -> average accuracy percentage
         """
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import accuracy_score, log_loss, brier_score_loss
+        from sportscore.training.model_factory import create_model_with_c
         csv_path = csv_path or self.classifier_csv
         if not csv_path:
             raise ValueError("No training data available. Run create_training_data first.")
@@ -1661,6 +1638,9 @@ class BballModel:
         Returns:
             Dict with per-fold and average metrics
         """
+        from sklearn.model_selection import TimeSeriesSplit
+        from sklearn.metrics import accuracy_score, log_loss, brier_score_loss
+        from sportscore.training.model_factory import create_model_with_c
         csv_path = csv_path or self.classifier_csv
         if not csv_path:
             raise ValueError("No training data available. Run create_training_data first.")
@@ -1739,6 +1719,8 @@ class BballModel:
         Returns:
             Dict with best params and score
         """
+        from sklearn.model_selection import GridSearchCV
+        from sklearn.ensemble import GradientBoostingClassifier
         csv_path = csv_path or self.classifier_csv
         if not csv_path:
             raise ValueError("No training data available. Run create_training_data first.")
@@ -1794,6 +1776,8 @@ class BballModel:
         Returns:
             List of (feature_name, score) tuples sorted by importance
         """
+        from sklearn.model_selection import train_test_split
+        from sklearn.feature_selection import SelectKBest, f_classif
         csv_path = csv_path or self.classifier_csv
         if not csv_path:
             raise ValueError("No training data available. Run create_training_data first.")
@@ -1838,6 +1822,8 @@ class BballModel:
         Returns:
             List of (feature_name, importance) tuples
         """
+        from sklearn.ensemble import GradientBoostingClassifier
+        from sportscore.training.model_evaluation import compute_feature_importance
         csv_path = csv_path or self.classifier_csv
         if not csv_path:
             raise ValueError("No training data available.")
@@ -1888,6 +1874,9 @@ class BballModel:
             calibrate: If True, apply probability calibration (Phase 4.3)
             use_tuned_params: If True and model_type is GradientBoosting, use tuned params
         """
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.ensemble import GradientBoostingClassifier
+        from sportscore.training.model_factory import create_model_with_c
         csv_path = csv_path or self.classifier_csv
         if not csv_path:
             raise ValueError("No training data available. Run create_training_data first.")
@@ -1964,6 +1953,8 @@ class BballModel:
         Args:
             no_per: If True, load cache without PER features
         """
+        from sklearn.preprocessing import StandardScaler
+        from sportscore.training.model_factory import create_model_with_c
         import json
         import os
         from bball.training.cache_utils import load_model_cache
@@ -2508,42 +2499,26 @@ class BballModel:
             logging.info(f"[DEBUG] First 10 feature_names: {self.feature_names[:10]}")
             self._debug_features_logged = True
         
-        # Categorize features
-        regular_features = []
+        # Categorize features via the compiled feature plan (reused while
+        # feature_names is unchanged); PER and injury features are handled separately below
+        names = tuple(self.feature_names)
+        if self._last_plan is None or self._last_plan[0] != names:
+            self._last_plan = (names, compile_feature_plan(names))
+        plan = self._last_plan[1]
         game_date_str = f"{year}-{month:02d}-{day:02d}"
-        for feature_name in self.feature_names:
-            if '|' not in feature_name:
-                # Special non-pipe features (metadata, computed values)
-                if feature_name == 'SeasonStartYear':
-                    features_dict[feature_name] = int(year) if int(month) >= 10 else int(year) - 1
-                elif feature_name == 'Year':
-                    features_dict[feature_name] = int(year)
-                elif feature_name == 'Month':
-                    features_dict[feature_name] = int(month)
-                elif feature_name == 'Day':
-                    features_dict[feature_name] = int(day)
-                elif feature_name == 'pred_margin':
-                    features_dict[feature_name] = 0.0
-                else:
-                    features_dict[feature_name] = 0.0
-            elif feature_name.startswith('player_') or feature_name.startswith('per_available'):
-                pass  # PER features - handled separately below
-            elif feature_name.startswith('inj_'):
-                pass  # Injury features - handled separately below
-            else:
-                regular_features.append(feature_name)
+        features_dict.update(plan.special_values(year, month, day))
 
         # Batch compute regular features via BasketballFeatureComputer
-        if regular_features:
-            regular_results = self._computer.compute_matchup_features(
-                regular_features, home_team, away_team, season,
+        if plan.regular or plan.composite:
+            regular_results = self._computer.execute_plan(
+                plan, home_team, away_team, season,
                 game_date_str, venue_guid=target_venue_guid,
             )
             features_dict.update(regular_results)
         
         # Add PER features - calculate if ANY PER features are in feature_names (regardless of include_per_features flag)
         # The flag should only control training, not prediction-time calculation
-        has_per_features = any(fname.startswith('player_') or fname.startswith('per_available') for fname in self.feature_names)
+        has_per_features = bool(plan.per)
         if has_per_features and self.per_calculator:
             game_date_str = f"{year}-{month:02d}-{day:02d}"
             
@@ -2913,6 +2888,8 @@ class BballModel:
         Returns:
             Dict with per-season metrics
         """
+        from sklearn.metrics import accuracy_score, log_loss, brier_score_loss
+        from sportscore.training.model_factory import create_model_with_c
         csv_path = csv_path or self.classifier_csv
         if not csv_path:
             raise ValueError("No training data available.")
@@ -2993,6 +2970,8 @@ class BballModel:
         Returns:
             Dict with early vs late season metrics
         """
+        from sklearn.metrics import accuracy_score, log_loss, brier_score_loss
+        from sportscore.training.model_factory import create_model_with_c
         csv_path = csv_path or self.classifier_csv
         if not csv_path:
             raise ValueError("No training data available.")
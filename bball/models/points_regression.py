@@ -10,6 +10,7 @@ import os
 import json
 import pickle
 import math
+import bisect
 import numpy as np
 import pandas as pd
 from datetime import datetime, date, timedelta
@@ -40,6 +41,8 @@ except ImportError:
     SHAP_AVAILABLE = False
 
 from bball.mongo import Mongo
+from bball.data import GamesRepository
+from bball.league_config import load_league_config
 from bball.features.compute import BasketballFeatureComputer
 from bball.features.injury import InjuryFeatureCalculator
 from bball.stats.per_calculator import PERCalculator
@@ -147,12 +150,23 @@ class PointsRegressionTrainer:
     
     # Default recency decay constant for injury features
     DEFAULT_RECENCY_DECAY_K = 15.0
+
+    # Game document fields needed by feature computation (stat engine, custom
+    # handlers, injury features). Everything else is left in MongoDB when
+    # preloading the training index.
+    PRELOAD_GAME_FIELDS = [
+        'game_id', 'date', 'year', 'month', 'day', 'season', 'game_type',
+        'homeWon', 'OT', 'neutralSite', 'venue_guid',
+        'pregame_lines', 'vegas', 'spread', 'over_under',
+        'homeTeam', 'awayTeam',
+    ]
     
     def __init__(
         self,
         db=None,
         output_dir: str = './models/point_regression',
-        reports_dir: str = './reports'
+        reports_dir: str = './reports',
+        league=None,
     ):
         """
         Initialize PointsRegressionTrainer.
@@ -161,8 +175,10 @@ class PointsRegressionTrainer:
             db: MongoDB database connection
             output_dir: Directory to save model artifacts
             reports_dir: Directory to save diagnostic reports
+            league: League configuration (defaults to NBA)
         """
         self.db = db if db is not None else Mongo().db
+        self.league = league if league is not None else load_league_config("nba")
         self.output_dir = output_dir
         self.reports_dir = reports_dir
         self.artifacts_dir = os.path.join(output_dir, 'artifacts')
@@ -175,6 +191,7 @@ class PointsRegressionTrainer:
         # Caches for optimization (built during create_training_data)
         self._venue_location_cache = {}  # dict[venue_guid] -> (lat, lon)
         self._top_ppg_cache = {}  # dict[(team, season, date_str)] -> float
+        self._team_stat_prefix_cache = {}  # dict[(team, season)] -> prefix-sum arrays
         
         # Initialize components
         self._computer = None
@@ -228,6 +245,116 @@ class PointsRegressionTrainer:
         else:
             raise ValueError(f"Unknown model type: {model_type}")
     
+    # Team box-score fields summed for base features, and the opponent fields
+    # used for defensive metrics (indexes into the prefix-sum arrays below)
+    BASE_TEAM_FIELDS = (
+        'points', 'FG_made', 'FG_att', 'three_made', 'three_att',
+        'FT_made', 'FT_att', 'off_reb', 'total_reb', 'TO', 'assists',
+    )
+    BASE_OPP_FIELDS = ('points', 'FG_made', 'FG_att', 'three_made', 'three_att')
+
+    def _build_team_stat_prefix(self, team_name: str, games: list) -> Dict:
+        """
+        Build cumulative stat arrays over a team's chronologically ordered games.
+
+        Row i of each array holds the sum over games[:i], so the totals for any
+        window games[lo:hi] are prefix[hi] - prefix[lo]. Incomplete games (no
+        home points) contribute zeros but still occupy a slot, matching the
+        original "last N games, then drop incomplete" windowing.
+
+        Returns:
+            Dict with 'dates', 'team' (n+1, len(BASE_TEAM_FIELDS)),
+            'opp' (n+1, len(BASE_OPP_FIELDS)), 'poss' (n+1,) and 'complete' (n+1,)
+        """
+        n = len(games)
+        team_vals = np.zeros((n, len(self.BASE_TEAM_FIELDS)))
+        opp_vals = np.zeros((n, len(self.BASE_OPP_FIELDS)))
+        complete = np.zeros(n)
+        dates = []
+
+        for i, g in enumerate(games):
+            dates.append(g.get('date', ''))
+            if not g.get('homeTeam', {}).get('points', 0) > 0:
+                continue
+            if g['homeTeam']['name'] == team_name:
+                team_data, opp_data = g.get('homeTeam', {}), g.get('awayTeam', {})
+            else:
+                team_data, opp_data = g.get('awayTeam', {}), g.get('homeTeam', {})
+            complete[i] = 1
+            for j, field in enumerate(self.BASE_TEAM_FIELDS):
+                team_vals[i, j] = team_data.get(field, 0) or 0
+            for j, field in enumerate(self.BASE_OPP_FIELDS):
+                opp_vals[i, j] = opp_data.get(field, 0) or 0
+
+        fg_att = team_vals[:, self.BASE_TEAM_FIELDS.index('FG_att')]
+        off_reb = team_vals[:, self.BASE_TEAM_FIELDS.index('off_reb')]
+        to = team_vals[:, self.BASE_TEAM_FIELDS.index('TO')]
+        ft_att = team_vals[:, self.BASE_TEAM_FIELDS.index('FT_att')]
+        poss = fg_att - off_reb + to + 0.4 * ft_att
+
+        def prefix(values):
+            out = np.zeros((n + 1,) + values.shape[1:])
+            np.cumsum(values, axis=0, out=out[1:])
+            return out
+
+        return {
+            'dates': dates,
+            'team': prefix(team_vals),
+            'opp': prefix(opp_vals),
+            'poss': prefix(poss),
+            'complete': prefix(complete),
+        }
+
+    def _get_team_stat_prefix(self, team_name: str, season: str, game_date_str: str) -> Tuple[Dict, int]:
+        """
+        Get the (team, season) prefix-sum arrays and the number of games before game_date_str.
+
+        With a preloaded game index the arrays cover the whole season and are
+        built once per (team, season); otherwise they are built from the team's
+        games before the date on each call.
+        """
+        dates_index = self._computer._team_dates_index
+        if not dates_index:
+            games = self._computer._get_team_season_games(team_name, season, game_date_str)
+            return self._build_team_stat_prefix(team_name, games), len(games)
+
+        cache_key = (team_name, season)
+        prefix = self._team_stat_prefix_cache.get(cache_key)
+        if prefix is None:
+            exclude_set = set(self._computer._exclude_game_types)
+            pairs = self._computer._team_games_index.get(season, {}).get(team_name, [])
+            season_games = [
+                g for _, g in pairs
+                if g.get('game_type', 'regseason') not in exclude_set
+            ]
+            prefix = self._build_team_stat_prefix(team_name, season_games)
+            self._team_stat_prefix_cache[cache_key] = prefix
+
+        return prefix, bisect.bisect_left(prefix['dates'], game_date_str)
+
+    def _window_team_stats(self, prefix: Dict, lo: int, hi: int) -> Dict:
+        """Compute rate stats for games[lo:hi] from prefix-sum arrays in O(1)."""
+        n_games = prefix['complete'][hi] - prefix['complete'][lo]
+        if n_games <= 0:
+            return {}
+
+        agg = dict(zip(self.BASE_TEAM_FIELDS, prefix['team'][hi] - prefix['team'][lo]))
+        against_agg = dict(zip(self.BASE_OPP_FIELDS, prefix['opp'][hi] - prefix['opp'][lo]))
+        possessions = prefix['poss'][hi] - prefix['poss'][lo]
+
+        stats = {}
+        stats['offRtg'] = 100 * (agg['points'] / possessions) if possessions > 0 else 0
+        stats['defRtg'] = 100 * (against_agg['points'] / possessions) if possessions > 0 else 0
+        stats['pace'] = possessions / n_games
+        stats['efg'] = (agg['FG_made'] + 0.5 * agg['three_made']) / agg['FG_att'] if agg['FG_att'] > 0 else 0
+        stats['TOV_pct'] = agg['TO'] / possessions if possessions > 0 else 0
+        stats['ORB_pct'] = agg['off_reb'] / (agg['off_reb'] + (agg['total_reb'] - agg['off_reb'])) if agg['total_reb'] > 0 else 0
+        stats['3PA_rate'] = agg['three_att'] / agg['FG_att'] if agg['FG_att'] > 0 else 0
+        stats['3P_pct_allowed'] = against_agg['three_made'] / against_agg['three_att'] if against_agg['three_att'] > 0 else 0
+        stats['points_avg'] = agg['points'] / n_games
+
+        return stats
+
     def _get_base_features(self, game: dict, before_date: str) -> Dict:
         """
         Extract base team efficiency and pace features.
@@ -244,6 +371,9 @@ class PointsRegressionTrainer:
         - home_points_last5_avg, away_points_last5_avg
         - home_3PA_rate, away_3PA_rate (for interaction features)
         - home_3P_pct_allowed, away_3P_pct_allowed (opponent 3P% defense)
+
+        Season-to-date and last-N windows are differences of per (team, season)
+        prefix sums (see _build_team_stat_prefix).
         """
         if self._computer is None:
             self._computer = BasketballFeatureComputer(db=self.db, recency_alpha=0.1)
@@ -256,89 +386,14 @@ class PointsRegressionTrainer:
         day = game.get('day', 1)
 
         game_date_str = f"{year}-{month:02d}-{day:02d}"
-        home_games = self._computer._get_team_season_games(home_team, season, game_date_str)
-        away_games = self._computer._get_team_season_games(away_team, season, game_date_str)
+        home_prefix, home_n = self._get_team_stat_prefix(home_team, season, game_date_str)
+        away_prefix, away_n = self._get_team_stat_prefix(away_team, season, game_date_str)
 
         features = {}
-
-        # Helper function to compute team stats from games
-        def compute_team_stats(games, team_name, is_home=True):
-            if not games:
-                return {}
-            
-            complete_games = [g for g in games if g.get('homeTeam', {}).get('points', 0) > 0]
-            if not complete_games:
-                return {}
-            
-            # Aggregate stats
-            agg = {
-                'points': 0, 'FG_made': 0, 'FG_att': 0, 'three_made': 0, 'three_att': 0,
-                'FT_made': 0, 'FT_att': 0, 'off_reb': 0, 'total_reb': 0, 'TO': 0,
-                'assists': 0, 'possessions': 0
-            }
-            against_agg = {
-                'points': 0, 'FG_made': 0, 'FG_att': 0, 'three_made': 0, 'three_att': 0
-            }
-            
-            for g in complete_games:
-                if g['homeTeam']['name'] == team_name:
-                    side = 'homeTeam'
-                    opp = 'awayTeam'
-                else:
-                    side = 'awayTeam'
-                    opp = 'homeTeam'
-                
-                team_data = g.get(side, {})
-                opp_data = g.get(opp, {})
-                
-                agg['points'] += team_data.get('points', 0)
-                agg['FG_made'] += team_data.get('FG_made', 0)
-                agg['FG_att'] += team_data.get('FG_att', 0)
-                agg['three_made'] += team_data.get('three_made', 0)
-                agg['three_att'] += team_data.get('three_att', 0)
-                agg['FT_made'] += team_data.get('FT_made', 0)
-                agg['FT_att'] += team_data.get('FT_att', 0)
-                agg['off_reb'] += team_data.get('off_reb', 0)
-                agg['total_reb'] += team_data.get('total_reb', 0)
-                agg['TO'] += team_data.get('TO', 0)
-                agg['assists'] += team_data.get('assists', 0)
-                
-                # Possessions for this game
-                fg_att = team_data.get('FG_att', 0)
-                off_reb = team_data.get('off_reb', 0)
-                to = team_data.get('TO', 0)
-                ft_att = team_data.get('FT_att', 0)
-                poss = fg_att - off_reb + to + 0.4 * ft_att
-                agg['possessions'] += poss
-                
-                # Opponent stats (for defensive metrics)
-                against_agg['points'] += opp_data.get('points', 0)
-                against_agg['FG_made'] += opp_data.get('FG_made', 0)
-                against_agg['FG_att'] += opp_data.get('FG_att', 0)
-                against_agg['three_made'] += opp_data.get('three_made', 0)
-                against_agg['three_att'] += opp_data.get('three_att', 0)
-            
-            n_games = len(complete_games)
-            if n_games == 0:
-                return {}
-            
-            # Compute rates and percentages
-            stats = {}
-            stats['offRtg'] = 100 * (agg['points'] / agg['possessions']) if agg['possessions'] > 0 else 0
-            stats['defRtg'] = 100 * (against_agg['points'] / agg['possessions']) if agg['possessions'] > 0 else 0
-            stats['pace'] = agg['possessions'] / n_games if n_games > 0 else 0
-            stats['efg'] = (agg['FG_made'] + 0.5 * agg['three_made']) / agg['FG_att'] if agg['FG_att'] > 0 else 0
-            stats['TOV_pct'] = agg['TO'] / agg['possessions'] if agg['possessions'] > 0 else 0
-            stats['ORB_pct'] = agg['off_reb'] / (agg['off_reb'] + (agg['total_reb'] - agg['off_reb'])) if agg['total_reb'] > 0 else 0
-            stats['3PA_rate'] = agg['three_att'] / agg['FG_att'] if agg['FG_att'] > 0 else 0
-            stats['3P_pct_allowed'] = against_agg['three_made'] / against_agg['three_att'] if against_agg['three_att'] > 0 else 0
-            stats['points_avg'] = agg['points'] / n_games
-            
-            return stats
         
         # Compute stats for both teams
-        home_stats = compute_team_stats(home_games, home_team)
-        away_stats = compute_team_stats(away_games, away_team)
+        home_stats = self._window_team_stats(home_prefix, 0, home_n)
+        away_stats = self._window_team_stats(away_prefix, 0, away_n)
         
         # Season averages
         features['home_offRtg_szn_avg'] = home_stats.get('offRtg', 0)
@@ -358,12 +413,9 @@ class PointsRegressionTrainer:
         features['home_3P_pct_allowed'] = home_stats.get('3P_pct_allowed', 0)
         features['away_3P_pct_allowed'] = away_stats.get('3P_pct_allowed', 0)
         
-        # Last 10 games (simplified - use last 10 from season games)
-        home_last10 = home_games[-10:] if len(home_games) >= 10 else home_games
-        away_last10 = away_games[-10:] if len(away_games) >= 10 else away_games
-        
-        home_stats_10 = compute_team_stats(home_last10, home_team)
-        away_stats_10 = compute_team_stats(away_last10, away_team)
+        # Last 10 games
+        home_stats_10 = self._window_team_stats(home_prefix, max(0, home_n - 10), home_n)
+        away_stats_10 = self._window_team_stats(away_prefix, max(0, away_n - 10), away_n)
         
         features['home_offRtg_last10'] = home_stats_10.get('offRtg', 0)
         features['away_offRtg_last10'] = away_stats_10.get('offRtg', 0)
@@ -371,16 +423,11 @@ class PointsRegressionTrainer:
         features['away_pace_last10'] = away_stats_10.get('pace', 0)
         
         # Last 5 games points average
-        home_last5 = home_games[-5:] if len(home_games) >= 5 else home_games
-        away_last5 = away_games[-5:] if len(away_games) >= 5 else away_games
-        
-        home_points_5 = [g['homeTeam']['points'] if g['homeTeam']['name'] == home_team else g['awayTeam']['points'] 
-                        for g in home_last5 if g.get('homeTeam', {}).get('points', 0) > 0]
-        away_points_5 = [g['homeTeam']['points'] if g['homeTeam']['name'] == away_team else g['awayTeam']['points'] 
-                        for g in away_last5 if g.get('homeTeam', {}).get('points', 0) > 0]
+        home_stats_5 = self._window_team_stats(home_prefix, max(0, home_n - 5), home_n)
+        away_stats_5 = self._window_team_stats(away_prefix, max(0, away_n - 5), away_n)
         
-        features['home_points_last5_avg'] = np.mean(home_points_5) if home_points_5 else 0
-        features['away_points_last5_avg'] = np.mean(away_points_5) if away_points_5 else 0
+        features['home_points_last5_avg'] = home_stats_5.get('points_avg', 0)
+        features['away_points_last5_avg'] = away_stats_5.get('points_avg', 0)
         
         return features
     
@@ -589,7 +636,7 @@ class PointsRegressionTrainer:
         print(f"    Computing top PPG for {len(teams_seasons)} team/season combinations...")
         for (team, season), dates in teams_seasons.items():
             # Get all player stats for this team/season
-            player_stats = list(self.db['nba_player_stats'].find(
+            player_stats = list(self.db[self.league.collections.get('player_stats', 'nba_player_stats')].find(
                 {
                     'team': team,
                     'season': season,
@@ -685,7 +732,7 @@ class PointsRegressionTrainer:
                 }
             ]
             
-            result = list(self.db['nba_player_stats'].aggregate(pipeline))
+            result = list(self.db[self.league.collections.get('player_stats', 'nba_player_stats')].aggregate(pipeline))
             
             if result and len(result) > 0:
                 top_ppg = result[0].get('ppg', 0)
@@ -1003,9 +1050,116 @@ class PointsRegressionTrainer:
 
         return feature_vector, feature_names
     
-    def create_training_data(self, query: dict = None, selected_features: List[str] = None, progress_callback: callable = None, limit: int = None) -> pd.DataFrame:
+    def _preload_training_games(self, games: list):
+        """
+        Build the preloaded games_home/games_away index used by SharedFeatureContext.
+
+        Loads every game in the training seasons (plus the previous season for
+        lookback) with only PRELOAD_GAME_FIELDS projected, and injects it into
+        the feature computer and injury calculator so per-game feature building
+        never falls back to lazy DB queries.
+        """
+        seasons = set()
+        for game in games:
+            season = game.get('season')
+            if not season:
+                continue
+            seasons.add(season)
+            try:
+                start_year = int(season.split('-')[0])
+                seasons.add(f"{start_year - 1}-{start_year}")
+            except (ValueError, IndexError):
+                pass
+        preload_seasons = sorted(seasons)
+
+        print(f"  Preloading game index for {len(preload_seasons)} season(s)...")
+        games_repo = GamesRepository(self.db, league=self.league)
+        projection = {field: 1 for field in self.PRELOAD_GAME_FIELDS}
+        index_games = list(games_repo.find(
+            {'season': {'$in': preload_seasons}},
+            projection=projection,
+        ))
+
+        games_home = {}
+        games_away = {}
+        for g in index_games:
+            season = g.get('season')
+            date_str = g.get('date')
+            home = g.get('homeTeam', {}).get('name')
+            away = g.get('awayTeam', {}).get('name')
+            if not season or not date_str:
+                continue
+            if home:
+                games_home.setdefault(season, {}).setdefault(date_str, {})[home] = g
+            if away:
+                games_away.setdefault(season, {}).setdefault(date_str, {})[away] = g
+        print(f"    Indexed {len(index_games)} games")
+
+        self._computer = BasketballFeatureComputer(db=self.db, league=self.league, recency_alpha=0.1)
+        self._computer.set_preloaded_data(games_home, games_away)
+        self._team_stat_prefix_cache = {}
+        try:
+            self._computer.preload_venue_cache()
+        except Exception:
+            pass
+
+        if self._injury_calculator is None:
+            self._injury_calculator = InjuryFeatureCalculator(
+                db=self.db, league=self.league, batch_training_mode=True,
+            )
+        self._injury_calculator.set_preloaded_data(games_home, games_away)
+
+        return preload_seasons
+
+    def _build_training_rows(self, games: list, selected_features: List[str], on_game_done: callable = None) -> list:
+        """
+        Build feature rows for games, in order.
+
+        Returns a list of (feature_vector, feature_names, home_points, away_points, metadata)
+        tuples in the same order as games. Games without a final score are skipped.
+        """
+        rows = []
+        for game in games:
+            try:
+                year = game.get('year', 0)
+                month = game.get('month', 0)
+                day = game.get('day', 0)
+                before_date = f"{year}-{month:02d}-{day:02d}"
+
+                feature_vector, feature_names = self._build_feature_vector(game, before_date, selected_features)
+
+                home_points = game.get('homeTeam', {}).get('points', 0)
+                away_points = game.get('awayTeam', {}).get('points', 0)
+
+                if home_points > 0 and away_points > 0:
+                    rows.append((feature_vector, feature_names, home_points, away_points, {
+                        'year': year,
+                        'month': month,
+                        'day': day,
+                        'home': game['homeTeam']['name'],
+                        'away': game['awayTeam']['name']
+                    }))
+            except Exception as e:
+                logger.warning(f"Error processing game: {e}")
+            finally:
+                if on_game_done:
+                    on_game_done()
+        return rows
+
+    def create_training_data(
+        self,
+        query: dict = None,
+        selected_features: List[str] = None,
+        progress_callback: callable = None,
+        limit: int = None,
+    ) -> pd.DataFrame:
         """
         Create training data DataFrame from MongoDB games.
+
+        Games are loaded once into the same preloaded games_home/games_away index
+        SharedFeatureContext uses, then features are built game by game against it.
+        Feature building is CPU-bound Python and shares the trainer's caches, so it
+        runs in a single loop rather than a thread pool.
         
         Args:
             query: MongoDB query filter
@@ -1020,7 +1174,12 @@ class PointsRegressionTrainer:
         
         # Fetch games
         print("  Fetching games from database...")
-        all_games = list(self.db.stats_nba.find(query).sort([('year', 1), ('month', 1), ('day', 1)]))
+        games_repo = GamesRepository(self.db, league=self.league)
+        all_games = list(games_repo.find(
+            query,
+            projection={field: 1 for field in self.PRELOAD_GAME_FIELDS},
+            sort=[('year', 1), ('month', 1), ('day', 1)],
+        ))
         total_games_available = len(all_games)
         
         # Apply limit if specified
@@ -1031,6 +1190,9 @@ class PointsRegressionTrainer:
             games = all_games
             print(f"  Found {total_games_available} games")
         logger.info(f"Processing {len(games)} games for training (limit={limit})")
+
+        # Preload the team-season game index so feature handlers never hit the DB
+        preload_seasons = self._preload_training_games(games)
         
         # Precompute caches to avoid per-game DB queries
         print("  Building caches (venue locations, top PPG)...")
@@ -1049,55 +1211,43 @@ class PointsRegressionTrainer:
         
         if needs_injury_features:
             print("  Preloading injury feature cache...")
-            if self._injury_calculator is None:
-                self._injury_calculator = InjuryFeatureCalculator(db=self.db)
             self._injury_calculator.preload_injury_cache(games)
             print("    Injury cache preloaded")
+
+        # Create the PER calculator up front (preloaded for the training seasons)
+        needs_per = needs_injury_features or any(
+            f.startswith('player_') or 'per' in f.lower() for f in (selected_features or [])
+        )
+        if needs_per and self.per_calculator is None:
+            self.per_calculator = PERCalculator(
+                self.db, preload=True, league=self.league, preload_seasons=preload_seasons,
+            )
         
+        total_games_to_process = len(games)
+        print("  Processing games and building features...")
+        processed = [0]
+
+        def on_game_done():
+            processed[0] += 1
+            done = processed[0]
+            if progress_callback and (done % 50 == 0 or done == 1 or done == total_games_to_process):
+                progress_pct = (done / total_games_to_process * 100) if total_games_to_process > 0 else 0
+                progress_callback(done, total_games_to_process, progress_pct)
+
         X_list = []
         y_home = []
         y_away = []
         metadata = []
-        
-        total_games_to_process = len(games)
-        print("  Processing games and building features...")
-        for i, game in enumerate(games):
-            try:
-                year = game.get('year', 0)
-                month = game.get('month', 0)
-                day = game.get('day', 0)
-                before_date = f"{year}-{month:02d}-{day:02d}"
-                
-                # Build feature vector
-                feature_vector, feature_names = self._build_feature_vector(game, before_date, selected_features)
-                
-                # Store feature names (should be same for all games)
-                if not self.feature_names:
-                    self.feature_names = feature_names
-                
-                # Get targets
-                home_points = game.get('homeTeam', {}).get('points', 0)
-                away_points = game.get('awayTeam', {}).get('points', 0)
-                
-                if home_points > 0 and away_points > 0:
-                    X_list.append(feature_vector)
-                    y_home.append(home_points)
-                    y_away.append(away_points)
-                    metadata.append({
-                        'year': year,
-                        'month': month,
-                        'day': day,
-                        'home': game['homeTeam']['name'],
-                        'away': game['awayTeam']['name']
-                    })
-                
-                # Progress callback (use limited total for progress calculation)
-                if progress_callback and ((i + 1) % 50 == 0 or i == 0 or i == total_games_to_process - 1):
-                    progress_pct = ((i + 1) / total_games_to_process * 100) if total_games_to_process > 0 else 0
-                    progress_callback(i + 1, total_games_to_process, progress_pct)
-            except Exception as e:
-                logger.warning(f"Error processing game: {e}")
-                continue
+        for feature_vector, feature_names, home_points, away_points, meta in self._build_training_rows(
+            games, selected_features, on_game_done
+        ):
+            # Store feature names (should be same for all games)
+            if not self.feature_names:
+                self.feature_names = feature_names
+            X_list.append(feature_vector)
+            y_home.append(home_points)
+            y_away.append(away_points)
+            metadata.append(meta)
         
         # Create DataFrame
         print("  Creating DataFrame...")
@@ -1107,12 +1257,11 @@ class PointsRegressionTrainer:
         df['away_points'] = y_away
         
         # Add metadata
-        for i, meta in enumerate(metadata):
-            df.loc[i, 'Year'] = meta['year']
-            df.loc[i, 'Month'] = meta['month']
-            df.loc[i, 'Day'] = meta['day']
-            df.loc[i, 'Home'] = meta['home']
-            df.loc[i, 'Away'] = meta['away']
+        df['Year'] = [meta['year'] for meta in metadata]
+        df['Month'] = [meta['month'] for meta in metadata]
+        df['Day'] = [meta['day'] for meta in metadata]
+        df['Home'] = [meta['home'] for meta in metadata]
+        df['Away'] = [meta['away'] for meta in metadata]
         
         print(f"  Successfully created training data: {len(df)} games, {len(self.feature_names)} features")
         logger.info(f"Created training data: {len(df)} games, {len(self.feature_names)} features")
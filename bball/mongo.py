@@ -1,4 +1,12 @@
 """MongoDB connection — re-exports from sportscore."""
+import os
+
 from sportscore.db.mongo import Mongo
 
+# Query-shape profiling (see bball.data.query_profile) must be registered
+# before the first MongoClient is created
+if os.environ.get("BBALL_QUERY_PROFILE_DIR"):
+    from bball.data.query_profile import enable_query_profiling
+    enable_query_profiling(os.environ["BBALL_QUERY_PROFILE_DIR"])
+
 __all__ = ['Mongo']
@@ -27,6 +27,12 @@ class TrainingConfig:
     preload_venues: bool = True
     preload_per_cache: bool = True
     preload_injury_cache: bool = True
+    # Reuse unchanged (game, feature) values from earlier runs
+    feature_cache: bool = True
+    feature_cache_dir: Optional[str] = None
+    # >1: process seasons independently in this many processes, each holding
+    # only its season and the previous one (flat memory with history length)
+    season_processes: int = 0
 
 
 @dataclass
@@ -181,6 +187,8 @@ class PipelineConfig:
             preload_venues=preload.get('venues', True),
             preload_per_cache=preload.get('per_cache', True),
             preload_injury_cache=preload.get('injury_cache', True),
+            feature_cache=training_raw.get('feature_cache', True),
+            season_processes=training_raw.get('season_processes', 0),
         )
 
         odds_backfill = OddsBackfillConfig(
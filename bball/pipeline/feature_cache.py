@@ -0,0 +1,371 @@
+"""
+Feature Value Cache — persistent (game, feature) values across training runs.
+
+Regenerating the master training CSV recomputes every (game, feature) cell.
+Most cells are unchanged between runs: a feature for a game only depends on
+the games played before it. This cache stores each computed cell with a
+fingerprint of the game data it was computed from, and a later run reuses
+the value while the fingerprint still matches.
+
+Fingerprints per scope:
+
+- team scope (stat features): the game's own document, both teams' games in
+  the season before the game date, and both teams' previous season, from
+  the preloaded games (games_home/games_away)
+- league scope (Elo, whose ratings carry over across every earlier season):
+  the game's own document and a history chain over every game that feeds
+  Elo before the game date, all seasons included, seeded with the Elo
+  params (league_history_chain). The chain is built once per run and passed
+  to season partitions; without it league-scope cells are not cached.
+
+Neither fingerprint depends on which seasons a run preloads. That makes a
+cached value valid for full runs and season partitions alike only if the
+feature reads nothing outside its scope, so features that can (see below)
+are not cached.
+
+Adding a late game therefore only invalidates cells for games after it (for
+its two teams, or league-wide for Elo), and regenerating one feature group
+leaves every other cached cell untouched.
+
+Some features are never cached because the fingerprints don't cover what
+they read: PER, player_* and inj_* features (player_stats, injuries and
+rosters), first_of_b2b (the next day's schedule) and head-to-head stats over
+last_N games (h2h_win_pct, margin_h2h, h2h_games_count), which search every
+preloaded season for the pair's meetings.
+
+Values live in one .npz file per season next to the master CSV
+(MASTER_TRAINING.csv -> MASTER_TRAINING.feature_cache/). The feature
+definitions (stats.yaml) and FEATURE_CACHE_VERSION are part of every
+fingerprint; bump the version (or delete the directory) after changing
+feature code.
+
+Usage:
+    from bball.pipeline.feature_cache import (
+        FeatureValueCache, GameDataFingerprints, league_history_chain,
+    )
+
+    history = league_history_chain(load_elo_games(db, league), seed=elo_params_fingerprint)
+    cache = FeatureValueCache(directory, GameDataFingerprints(games_home, games_away, league_history=history))
+    fps = cache.row_fingerprints(season, '2024-01-15', 'BOS', 'NYK')
+    cached, missing = cache.lookup(season, game_id, feature_names, fps)
+    ...compute missing...
+    cache.store(season, game_id, computed, fps)
+    cache.flush()
+"""
+
+import bisect
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# Bump when feature computation code changes in a way stats.yaml doesn't capture
+FEATURE_CACHE_VERSION = 1
+# Game document fields that change without changing the game's data
+VOLATILE_FIELDS = {"_id", "updated_at", "created_at", "last_updated"}
+
+_STATS_YAML = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "features", "stats.yaml")
+
+
+def feature_cache_dir_for(csv_path: str) -> str:
+    return os.path.splitext(os.path.abspath(csv_path))[0] + ".feature_cache"
+
+
+# Features reading data outside the game documents (player_stats, injuries)
+UNCACHED_PREFIXES = ("player_", "per_available", "inj_")
+# Stats that read games after the game date
+FORWARD_LOOKING_STATS = {"first_of_b2b"}
+# Head-to-head stats: outside the season window they read every earlier season
+H2H_STATS = {"h2h_win_pct", "margin_h2h", "h2h_games_count"}
+
+
+def reads_h2h_history(feature_name: str) -> bool:
+    """Head-to-head stats outside the season window: they search every earlier season."""
+    parts = feature_name.split("|")
+    return parts[0].lower() in H2H_STATS and (len(parts) < 2 or parts[1] != "season")
+
+
+def feature_scope(feature_name: str) -> Optional[str]:
+    """'team', 'league', or None for features that are never cached."""
+    base = feature_name.split("|", 1)[0].lower()
+    if (feature_name.startswith(UNCACHED_PREFIXES) or base.endswith("_per")
+            or base in FORWARD_LOOKING_STATS or reads_h2h_history(feature_name)):
+        return None
+    if base.startswith("elo"):
+        return "league"
+    return "team"
+
+
+def game_digest(game: Dict) -> bytes:
+    payload = {k: v for k, v in game.items() if k not in VOLATILE_FIELDS}
+    return hashlib.md5(json.dumps(payload, sort_keys=True, default=str).encode()).digest()
+
+
+def default_salt(league_id: str = "") -> bytes:
+    """Salt mixed into every fingerprint: cache version, league and stats.yaml."""
+    h = hashlib.md5(f"{FEATURE_CACHE_VERSION}|{league_id}".encode())
+    try:
+        with open(_STATS_YAML, "rb") as f:
+            h.update(f.read())
+    except OSError:
+        pass
+    return h.digest()
+
+
+def _chain(prev: bytes, digests: Iterable[bytes]) -> bytes:
+    h = hashlib.md5(prev)
+    for d in sorted(digests):
+        h.update(d)
+    return h.digest()
+
+
+def _prev_season(season: str) -> Optional[str]:
+    try:
+        start = int(season.split("-")[0])
+    except (ValueError, IndexError):
+        return None
+    return f"{start - 1}-{start}"
+
+
+def league_history_chain(games: Iterable[Dict], seed: bytes = b"") -> Tuple[List[str], List[bytes]]:
+    """
+    (dates, chains) over games of every season; chains[i] covers all games
+    dated up to dates[i]. Pass the games Elo is computed from (e.g.
+    load_elo_games) and the Elo params as seed.
+    """
+    days: Dict[str, List[bytes]] = {}
+    for game in games:
+        days.setdefault(str(game.get("date", ""))[:10], []).append(game_digest(game))
+    dates, chains, prev = sorted(days), [], hashlib.md5(seed).digest()
+    for date_str in dates:
+        prev = _chain(prev, days[date_str])
+        chains.append(prev)
+    return dates, chains
+
+
+class GameDataFingerprints:
+    """Prefix-hash chains over preloaded games per team-season, plus the league history chain."""
+
+    def __init__(
+        self,
+        games_home: Dict,
+        games_away: Dict,
+        salt: bytes = b"",
+        league_history: Optional[Tuple[List[str], List[bytes]]] = None,
+    ):
+        self.salt = salt
+        self._games_home = games_home
+        # (season, team) -> (dates, chains); chains[i] covers dates[:i + 1]
+        self._team: Dict[Tuple[str, str], Tuple[List[str], List[bytes]]] = {}
+        # (dates, chains) over every game feeding Elo (league_history_chain)
+        self._league_history = league_history
+        self._digests: Dict[int, bytes] = {}
+
+        team_days: Dict[Tuple[str, str], Dict[str, List[bytes]]] = {}
+        for side in (games_home, games_away):
+            for season, by_date in side.items():
+                for date_str, by_team in by_date.items():
+                    for team, game in by_team.items():
+                        team_days.setdefault((season, team), {}).setdefault(date_str, []).append(self._digest(game))
+        for key, days in team_days.items():
+            self._team[key] = self._build_chain(days)
+
+    def _digest(self, game: Dict) -> bytes:
+        key = id(game)
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = self._digests[key] = game_digest(game)
+        return digest
+
+    @staticmethod
+    def _build_chain(days: Dict[str, List[bytes]]) -> Tuple[List[str], List[bytes]]:
+        dates = sorted(days)
+        chains, prev = [], b""
+        for date_str in dates:
+            prev = _chain(prev, days[date_str])
+            chains.append(prev)
+        return dates, chains
+
+    @staticmethod
+    def _before(index: Optional[Tuple[List[str], List[bytes]]], date_str: Optional[str]) -> bytes:
+        if not index or not index[0]:
+            return b""
+        dates, chains = index
+        hi = len(dates) if date_str is None else bisect.bisect_left(dates, date_str)
+        return chains[hi - 1] if hi else b""
+
+    def find_game(self, season: str, date_str: str, home: str) -> Optional[Dict]:
+        return self._games_home.get(season, {}).get(date_str, {}).get(home)
+
+    def row(self, season: str, date_str: str, home: str, away: str) -> Optional[Dict[str, Optional[int]]]:
+        """
+        Fingerprint per scope for one game, or None if the game isn't loaded.
+        The league fingerprint is None (not cacheable) without a history chain.
+        """
+        game = self.find_game(season, date_str, home)
+        if game is None:
+            return None
+        own = self._digest(game)
+        prev = _prev_season(season)
+        team = hashlib.md5(self.salt + own)
+        for t in (home, away):
+            team.update(self._before(self._team.get((season, t)), date_str))
+            team.update(self._before(self._team.get((prev, t)), None))
+        league = None
+        if self._league_history is not None:
+            history = hashlib.md5(self.salt + own)
+            history.update(self._before(self._league_history, date_str))
+            league = _fp_int(history.digest())
+        return {"team": _fp_int(team.digest()), "league": league}
+
+
+def _fp_int(digest: bytes) -> int:
+    # 0 marks an empty cell in the store
+    return int.from_bytes(digest[:8], "little") or 1
+
+
+class _SeasonShard:
+    def __init__(self, game_ids=(), features=(), values=None, fps=None):
+        self.rows = {g: i for i, g in enumerate(game_ids)}
+        self.features = {f: i for i, f in enumerate(features)}
+        self.values = values if values is not None else np.zeros((0, 0))
+        self.fps = fps if fps is not None else np.zeros((0, 0), dtype=np.uint64)
+        self.pending: Dict[Tuple[str, str], Tuple[float, int]] = {}
+
+
+class FeatureValueCache:
+    """Persistent (game_id, feature) -> value cache validated by data fingerprints."""
+
+    def __init__(self, directory: str, fingerprints: GameDataFingerprints):
+        self.directory = directory
+        self.fingerprints = fingerprints
+        self._shards: Dict[str, _SeasonShard] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def row_fingerprints(self, season: str, date_str: str, home: str, away: str) -> Optional[Dict[str, Optional[int]]]:
+        return self.fingerprints.row(season, date_str, home, away)
+
+    def lookup(
+        self,
+        season: str,
+        game_id: str,
+        feature_names: List[str],
+        fps: Optional[Dict[str, Optional[int]]],
+    ) -> Tuple[Dict[str, float], List[str]]:
+        """Split features into (cached values, names still to compute)."""
+        if fps is None or not game_id:
+            return {}, list(feature_names)
+        shard = self._shard(season)
+        row = shard.rows.get(str(game_id))
+        cached, missing = {}, []
+        for name in feature_names:
+            scope = feature_scope(name)
+            col = shard.features.get(name)
+            if (scope is not None and fps[scope] is not None and row is not None
+                    and col is not None and shard.fps[row, col] == fps[scope]):
+                value = shard.values[row, col]
+                cached[name] = None if np.isnan(value) else float(value)
+            else:
+                missing.append(name)
+        with self._lock:
+            self.hits += len(cached)
+            self.misses += len(missing)
+        return cached, missing
+
+    def store(self, season: str, game_id: str, values: Dict[str, object],
+              fps: Optional[Dict[str, Optional[int]]]) -> None:
+        if fps is None or not game_id:
+            return
+        entries = {}
+        for name, value in values.items():
+            scope = feature_scope(name)
+            if scope is None or fps[scope] is None:
+                continue
+            try:
+                value = float(value) if value is not None else np.nan
+            except (TypeError, ValueError):
+                continue
+            entries[(str(game_id), name)] = (value, fps[scope])
+        shard = self._shard(season)
+        with self._lock:
+            shard.pending.update(entries)
+
+    def flush(self) -> int:
+        """Write seasons with new cells to disk; returns cells written."""
+        written = 0
+        with self._lock:
+            for season, shard in self._shards.items():
+                if shard.pending:
+                    written += len(shard.pending)
+                    self._write_shard(season, shard)
+        return written
+
+    # --- Internals ---
+
+    def _path(self, season: str) -> str:
+        return os.path.join(self.directory, f"{season}.npz")
+
+    def _shard(self, season: str) -> _SeasonShard:
+        shard = self._shards.get(season)
+        if shard is None:
+            with self._lock:
+                shard = self._shards.get(season)
+                if shard is None:
+                    shard = self._shards[season] = self._read_shard(season)
+        return shard
+
+    def _read_shard(self, season: str) -> _SeasonShard:
+        path = self._path(season)
+        if not os.path.exists(path):
+            return _SeasonShard()
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                return _SeasonShard(
+                    data["game_ids"].tolist(), data["features"].tolist(),
+                    data["values"], data["fps"],
+                )
+        except Exception as e:
+            print(f"Warning: ignoring unreadable feature cache {path}: {e}")
+            return _SeasonShard()
+
+    def _write_shard(self, season: str, shard: _SeasonShard) -> None:
+        rows, features = dict(shard.rows), dict(shard.features)
+        for game_id, name in shard.pending:
+            rows.setdefault(game_id, len(rows))
+            features.setdefault(name, len(features))
+
+        values = np.full((len(rows), len(features)), np.nan)
+        fps = np.zeros((len(rows), len(features)), dtype=np.uint64)
+        old_rows, old_cols = shard.values.shape
+        values[:old_rows, :old_cols] = shard.values
+        fps[:old_rows, :old_cols] = shard.fps
+        for (game_id, name), (value, fp) in shard.pending.items():
+            values[rows[game_id], features[name]] = value
+            fps[rows[game_id], features[name]] = fp
+
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(
+                    f,
+                    game_ids=np.array(list(rows), dtype=str),
+                    features=np.array(list(features), dtype=str),
+                    values=values,
+                    fps=fps,
+                )
+            os.replace(tmp_path, self._path(season))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+        shard.rows, shard.features = rows, features
+        shard.values, shard.fps = values, fps
+        shard.pending = {}
@@ -339,7 +339,7 @@ def run_elo_cache(config: PipelineConfig, dry_run: bool = False):
     try:
         mongo = Mongo()
         elo_cache = EloCache(mongo.db, league=config.league)
-        stats = elo_cache.compute_and_cache_all()
+        stats = elo_cache.compute_and_cache_incremental()
         print(f"    Done - {stats.get('ratings_cached', 0)} ratings cached.")
     except Exception as e:
         print(f"    Warning: ELO cache failed: {str(e)[:200]}")
@@ -417,11 +417,21 @@ def run_csv_registration(config: PipelineConfig, dry_run: bool = False):
         return False
 
 
-def ensure_indexes(league_config: LeagueConfig):
-    """Ensure MongoDB indexes exist for the league's collections before ingestion."""
-    from bball.mongo import Mongo
+def ensure_indexes(league_config: LeagueConfig, db=None):
+    """
+    Ensure MongoDB indexes exist for the league's collections before ingestion.
+
+    Besides the base set, applies the compound indexes recommended for the
+    league by the index advisor (leagues/indexes/<league>_indexes.json).
+
+    Args:
+        db: Target database (default: the configured Mongo connection)
+    """
+    from bball.data.query_profile import apply_index_specs, load_index_recommendations
 
-    db = Mongo().db
+    if db is None:
+        from bball.mongo import Mongo
+        db = Mongo().db
     colls = league_config.collections
 
     index_specs = [
@@ -432,19 +442,17 @@ def ensure_indexes(league_config: LeagueConfig):
         (colls["venues"], [("venue_guid", 1)], {"unique": True}),
         (colls["teams"], [("abbreviation", 1)], {}),
         (colls["rosters"], [("team", 1), ("season", 1)], {}),
+        # Feature fallback paths: season/date scans and per-team history ($or on team names)
+        (colls["games"], [("season", 1), ("date", 1)], {}),
+        (colls["games"], [("homeTeam.name", 1), ("date", 1)], {}),
+        (colls["games"], [("awayTeam.name", 1), ("date", 1)], {}),
+        (colls["player_stats"], [("team", 1), ("season", 1), ("date", 1)], {}),
+        # Materialized W-L records (bball.stats.team_records)
+        (f"{colls['games']}_team_records", [("team", 1), ("season", 1)], {"unique": True}),
     ]
+    index_specs += load_index_recommendations(league_config)
 
-    created = 0
-    for coll_name, keys, kwargs in index_specs:
-        existing = db[coll_name].index_information()
-        # Check if an equivalent index already exists
-        key_list = [(k, int(d)) for k, d in keys]
-        already_exists = any(
-            idx.get("key") == key_list for idx in existing.values()
-        )
-        if not already_exists:
-            db[coll_name].create_index(keys, **kwargs)
-            created += 1
+    created = apply_index_specs(db, index_specs)
 
     if created:
         print(f"  Created {created} MongoDB index(es)")
@@ -263,6 +263,10 @@ def process_season(
         )
         return {'games_processed': 0, 'games_updated': 0, 'injured': 0, 'error': str(e)}
 
+    finally:
+        # Free this season's player maps before the worker picks up the next one
+        injury_manager.release_season(season)
+
 
 def run_injuries_pipeline(
     league_config: LeagueConfig,
@@ -328,7 +332,7 @@ def run_injuries_pipeline(
     monitor_thread.start()
 
     try:
-        # Phase 1: Build player maps (shared across all seasons)
+        # Phase 1: Build player summaries (shared; per-season maps are built by each worker)
         state.overall_phase = "Building player maps..."
 
         def build_progress(current, total, message):
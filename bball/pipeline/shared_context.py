@@ -13,6 +13,7 @@ from typing import List, Dict, Optional, Any
 import threading
 
 from bball.league_config import LeagueConfig
+from bball.features.plan import compile_feature_plan, compile_uncached_feature_plan
 
 
 class SharedFeatureContext:
@@ -38,6 +39,7 @@ class SharedFeatureContext:
         preload_per_cache: bool = True,
         preload_injury_cache: bool = True,
         preload_seasons: List[str] = None,
+        db=None,
     ):
         """
         Initialize shared feature context by pre-loading all necessary data.
@@ -51,6 +53,7 @@ class SharedFeatureContext:
             preload_injury_cache: If True, preload injury data
             preload_seasons: Optional list of seasons to preload (e.g., ['2023-2024']).
                            If None, loads all seasons.
+            db: Optional MongoDB database. Connects to the configured one if None.
         """
         self.preload_seasons = preload_seasons
         from bball.mongo import Mongo
@@ -76,29 +79,27 @@ class SharedFeatureContext:
         self._needs_injuries = any(f.startswith("inj_") for f in feature_names)
         self._needs_elo = any(f.split("|", 1)[0].lower().startswith("elo") for f in feature_names)
 
-        # Categorize features upfront for efficient per-row processing
-        self._regular_features = []
-        self._per_feature_names = []
-        self._injury_feature_names = []
-        for fname in feature_names:
-            if '|' not in fname:
-                continue  # special features handled inline
-            elif fname.startswith('player_') or fname.startswith('per_available'):
-                self._per_feature_names.append(fname)
-            elif fname.startswith('inj_'):
-                self._injury_feature_names.append(fname)
-            else:
-                self._regular_features.append(fname)
+        # Compile the feature plan once; rows only execute it
+        self._plan = compile_feature_plan(feature_names)
+        self._regular_features = self._plan.stat_feature_names
+        self._per_feature_names = list(self._plan.per)
+        self._injury_feature_names = list(self._plan.injury)
+        # Last feature subset a row asked for (feature-cache misses) and its plan
+        self._subset_plan = None
 
         print("=" * 60)
         print(f"INITIALIZING SHARED FEATURE CONTEXT ({league_config.league_id.upper()})")
         print("=" * 60)
 
         # Single MongoDB connection
-        print("Connecting to MongoDB...")
-        self.mongo = Mongo()
-        self.db = self.mongo.db
-        print("Connected to MongoDB.")
+        if db is None:
+            print("Connecting to MongoDB...")
+            self.mongo = Mongo()
+            self.db = self.mongo.db
+            print("Connected to MongoDB.")
+        else:
+            self.mongo = None
+            self.db = db
 
         # Build team name normalization map (displayName -> abbreviation)
         self._team_name_map = {}
@@ -288,7 +289,8 @@ class SharedFeatureContext:
         day: int,
         game_id: str = None,
         venue_guid: str = None,
-        existing_row_data: Dict[str, float] = None
+        existing_row_data: Dict[str, float] = None,
+        feature_names: Optional[List[str]] = None,
     ) -> Dict[str, float]:
         """
         Calculate features for a single row using the shared pre-loaded data.
@@ -302,6 +304,8 @@ class SharedFeatureContext:
             game_id: Optional game ID for venue lookup
             venue_guid: Optional venue GUID for travel features
             existing_row_data: Optional dict of existing column values from the row
+            feature_names: Optional subset of the context's features to calculate
+                (e.g. the cells missing from the feature value cache)
 
         Returns:
             Dict mapping feature names to their values
@@ -309,6 +313,20 @@ class SharedFeatureContext:
         features_dict = {}
         game_date_str = f"{year}-{month:02d}-{day:02d}"
 
+        if feature_names is None:
+            plan = self._plan
+            feature_names = self.feature_names
+        else:
+            # Miss subsets vary per row; compile outside the shared plan cache
+            names = tuple(feature_names)
+            subset = self._subset_plan
+            if subset is None or subset[0] != names:
+                subset = self._subset_plan = (names, compile_uncached_feature_plan(names))
+            plan = subset[1]
+        regular_features = plan.stat_feature_names
+        per_feature_names = list(plan.per)
+        injury_feature_names = list(plan.injury)
+
         # Normalize team names to abbreviations
         home_team = self.normalize_team_name(home_team)
         away_team = self.normalize_team_name(away_team)
@@ -318,35 +336,22 @@ class SharedFeatureContext:
             venue_guid = self.venue_guid_cache.get(str(game_id))
 
         # Handle special non-pipe features
-        for feature_name in self.feature_names:
-            if '|' not in feature_name:
-                if feature_name == 'SeasonStartYear':
-                    features_dict[feature_name] = int(year) if int(month) >= 10 else int(year) - 1
-                elif feature_name == 'Year':
-                    features_dict[feature_name] = int(year)
-                elif feature_name == 'Month':
-                    features_dict[feature_name] = int(month)
-                elif feature_name == 'Day':
-                    features_dict[feature_name] = int(day)
-                elif feature_name == 'pred_margin':
-                    features_dict[feature_name] = 0.0
-                else:
-                    features_dict[feature_name] = 0.0
+        features_dict.update(plan.special_values(year, month, day))
 
         # Batch compute regular features via BasketballFeatureComputer
-        if self._regular_features:
+        if regular_features:
             try:
-                regular_results = self._computer.compute_matchup_features(
-                    self._regular_features, home_team, away_team, season,
+                regular_results = self._computer.execute_plan(
+                    plan, home_team, away_team, season,
                     game_date_str, venue_guid=venue_guid,
                 )
                 features_dict.update(regular_results)
             except Exception:
-                for fname in self._regular_features:
+                for fname in regular_features:
                     features_dict[fname] = 0.0
 
         # Add PER features if needed
-        if self._per_feature_names and self.per_calculator:
+        if per_feature_names and self.per_calculator:
             injured_players_dict = None
             try:
                 # Use preloaded games cache - NO DB CALLS in row iterations
@@ -378,17 +383,17 @@ class SharedFeatureContext:
                     game_id=game_id  # Enable cross-team aggregation for traded players
                 )
                 if per_features:
-                    for fname in self._per_feature_names:
+                    for fname in per_feature_names:
                         if fname in per_features:
                             features_dict[fname] = per_features[fname]
                         else:
                             features_dict[fname] = 0.0
             except Exception:
-                for fname in self._per_feature_names:
+                for fname in per_feature_names:
                     features_dict[fname] = 0.0
 
         # Add injury features if needed
-        if self._injury_feature_names:
+        if injury_feature_names:
             try:
                 # Use preloaded games cache - NO DB CALLS in row iterations
                 game_doc = None
@@ -405,7 +410,7 @@ class SharedFeatureContext:
                     precomputed_season_severity=self._precomputed_season_severity
                 )
                 if injury_features:
-                    for fname in self._injury_feature_names:
+                    for fname in injury_feature_names:
                         if fname in injury_features:
                             features_dict[fname] = injury_features[fname]
                         else:
@@ -419,11 +424,11 @@ class SharedFeatureContext:
                     )
 
             except Exception:
-                for fname in self._injury_feature_names:
+                for fname in injury_feature_names:
                     features_dict[fname] = 0.0
 
         # Ensure all requested features have a value
-        for fname in self.feature_names:
+        for fname in feature_names:
             if fname not in features_dict:
                 features_dict[fname] = 0.0
 
@@ -254,7 +254,7 @@ def run_elo_cache(
     try:
         mongo = Mongo()
         elo_cache = EloCache(mongo.db, league=league_config)
-        stats = elo_cache.compute_and_cache_all()
+        stats = elo_cache.compute_and_cache_incremental()
         if verbose:
             print(f"    Done - {stats.get('ratings_cached', 0)} ratings cached")
         return {'success': True, **stats}
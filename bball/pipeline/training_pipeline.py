@@ -6,6 +6,8 @@ Uses SharedFeatureContext for efficient parallel processing:
 - Pre-loads all data ONCE in main thread
 - Processes in 500-row chunks with 32 workers (configurable)
 - Thread-safe progress tracking
+- Reuses unchanged (game, feature) values from earlier runs (feature_cache.py)
+- Optional per-season fan-out across processes (--season-processes)
 
 Usage:
     python -m bball.pipeline.training_pipeline nba
@@ -14,6 +16,7 @@ Usage:
 """
 
 import argparse
+import dataclasses
 import fnmatch
 import math
 import sys
@@ -299,6 +302,7 @@ def process_chunk(
     feature_names: List[str],
     shared_context: SharedFeatureContext,
     progress_callback: Callable[[int], None] = None,
+    feature_cache=None,
 ) -> pd.DataFrame:
     """
     Process one chunk of rows using shared context.
@@ -309,6 +313,8 @@ def process_chunk(
         feature_names: Features to calculate
         shared_context: Pre-loaded shared context
         progress_callback: Optional callback for progress updates
+        feature_cache: Optional FeatureValueCache; only cells it can't
+            supply are calculated, and those are stored back
 
     Returns:
         DataFrame with features filled in
@@ -345,17 +351,34 @@ def process_chunk(
         # Existing row data for share feature calculations
         existing_row_data = row.to_dict()
 
-        # Use shared context to calculate features
-        features_dict = shared_context.calculate_features_for_row(
-            home_team=home_team,
-            away_team=away_team,
-            season=season,
-            year=year,
-            month=month,
-            day=day,
-            game_id=game_id,
-            existing_row_data=existing_row_data,
-        )
+        cached, missing, fps = {}, feature_names, None
+        if feature_cache is not None and game_id and year:
+            date_str = f"{year}-{month:02d}-{day:02d}"
+            home_key = home_team
+            if feature_cache.fingerprints.find_game(season, date_str, home_key) is None:
+                home_key = shared_context.normalize_team_name(home_team)
+            fps = feature_cache.row_fingerprints(
+                season, date_str, home_key, shared_context.normalize_team_name(away_team)
+            )
+            cached, missing = feature_cache.lookup(season, game_id, feature_names, fps)
+
+        features_dict = dict(cached)
+        if missing:
+            # Use shared context to calculate features
+            computed = shared_context.calculate_features_for_row(
+                home_team=home_team,
+                away_team=away_team,
+                season=season,
+                year=year,
+                month=month,
+                day=day,
+                game_id=game_id,
+                existing_row_data=existing_row_data,
+                feature_names=None if len(missing) == len(feature_names) else missing,
+            )
+            if feature_cache is not None:
+                feature_cache.store(season, game_id, {f: computed.get(f) for f in missing}, fps)
+            features_dict.update({f: computed[f] for f in missing if f in computed})
 
         # Update chunk DataFrame
         for feature_name in feature_names:
@@ -374,6 +397,8 @@ def generate_training_chunked(
     config: PipelineConfig,
     progress_callback: Callable[[int, int, float], None] = None,
     target_seasons_override: List[str] = None,
+    generate_predictions: bool = True,
+    league_history=None,
 ) -> pd.DataFrame:
     """
     Generate training features using chunked parallel processing.
@@ -392,10 +417,22 @@ def generate_training_chunked(
         target_seasons_override: If provided, only preload data for these seasons
             (plus lookback). Used in --add --season mode where the DataFrame
             contains all seasons but we only need to regenerate specific ones.
+        generate_predictions: Fill pred_* columns from the selected points
+            model (season partitions leave this to the parent)
+        league_history: Feature cache league history chain, if already built
+            (season partitions get the parent's)
 
     Returns:
         DataFrame with features populated
     """
+    if config.training.season_processes > 1 and 'Season' in df.columns:
+        seasons = target_seasons_override or df['Season'].dropna().unique().tolist()
+        if len(seasons) > 1:
+            return generate_training_by_season(
+                df, feature_names, config, sorted(seasons), progress_callback,
+                generate_predictions=generate_predictions,
+            )
+
     chunk_size = config.training.chunk_size
     max_workers = config.training.workers
 
@@ -460,6 +497,13 @@ def generate_training_chunked(
             except (ValueError, IndexError):
                 pass
 
+        if _needs_h2h_history(feature_names):
+            # h2h over last_N games reads the pair's meetings in every earlier season
+            from bball.mongo import Mongo
+
+            preload_seasons_set.update(
+                _seasons_through(Mongo().db, config.league, max(preload_seasons_set))
+            )
         preload_seasons = sorted(preload_seasons_set)
         print(f"Seasons to preload (including lookback): {preload_seasons}")
 
@@ -475,6 +519,8 @@ def generate_training_chunked(
         preload_seasons=preload_seasons,
     )
 
+    feature_cache = _open_feature_cache(config, shared_context, league_history)
+
     # Initialize points model predictor (single DB query at startup)
     print("Checking for selected points model...")
     points_predictor = PointsModelPredictor(shared_context.db, config.league)
@@ -570,7 +616,10 @@ def generate_training_chunked(
             chunk_counter[0] += 1
         on_chunk_start()
         try:
-            return process_chunk(chunk_df, chunk_idx, feature_names, shared_context, update_progress)
+            return process_chunk(
+                chunk_df, chunk_idx, feature_names, shared_context, update_progress,
+                feature_cache=feature_cache,
+            )
         finally:
             on_chunk_done()
 
@@ -588,6 +637,13 @@ def generate_training_chunked(
     rate = total_rows / elapsed if elapsed > 0 else 0
     print(f"\n  Completed: {total_rows:,} games in {format_time(elapsed)} ({rate:,.1f} games/sec)")
 
+    if feature_cache is not None:
+        looked_up = feature_cache.hits + feature_cache.misses
+        hit_pct = 100.0 * feature_cache.hits / looked_up if looked_up else 0.0
+        written = feature_cache.flush()
+        print(f"  Feature cache: {feature_cache.hits:,}/{looked_up:,} cells reused ({hit_pct:.1f}%), "
+              f"{written:,} stored")
+
     print(f"\n[4/4] Merging results...")
 
     # Deduplicate feature_names to avoid "non-unique columns" error
@@ -613,12 +669,173 @@ def generate_training_chunked(
     shared_context.print_normalization_stats()
 
     # Generate prediction columns if points model is loaded
-    if points_predictor.is_loaded():
+    if generate_predictions and points_predictor.is_loaded():
         df = points_predictor.generate_predictions(df)
 
     return df
 
 
+def _generate_season_partition(
+    league_id: str,
+    training: TrainingConfig,
+    season_df: pd.DataFrame,
+    feature_names: List[str],
+    league_history=None,
+) -> pd.DataFrame:
+    """Process-pool entry point: generate one season with its own context."""
+    league_config = load_league_config(league_id)
+    config = PipelineConfig.from_league(league_config)
+    config.training = training
+    result = generate_training_chunked(
+        season_df, feature_names, config, generate_predictions=False, league_history=league_history,
+    )
+    return result[list(dict.fromkeys(feature_names))]
+
+
+def generate_training_by_season(
+    df: pd.DataFrame,
+    feature_names: List[str],
+    config: PipelineConfig,
+    seasons: List[str],
+    progress_callback: Callable[[int, int, float], None] = None,
+    generate_predictions: bool = True,
+) -> pd.DataFrame:
+    """
+    Generate features season by season in separate processes.
+
+    Each process builds a SharedFeatureContext preloading only its season and
+    the previous one (lookback), so peak memory per process does not grow
+    with history length. Head-to-head features over last_N games are the
+    exception: they read every earlier season, so with them each process
+    preloads all seasons up to its own (as a single-context run does).
+    Thread workers are split across the processes.
+    Rows of seasons not in `seasons` keep their existing values.
+
+    Args:
+        df: DataFrame with game rows (must have a Season column)
+        feature_names: List of feature names to calculate
+        config: Pipeline configuration (training.season_processes > 1)
+        seasons: Seasons to generate
+        progress_callback: Optional callback(processed, total, pct), per season
+        generate_predictions: Fill pred_* columns once all seasons are merged
+
+    Returns:
+        DataFrame with features populated
+    """
+    import multiprocessing
+    import time as time_module
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    unique_features = list(dict.fromkeys(feature_names))
+    missing_cols = [fname for fname in unique_features if fname not in df.columns]
+    if missing_cols:
+        df = pd.concat([df, pd.DataFrame(0.0, index=df.index, columns=missing_cols)], axis=1)
+
+    partitions = {s: df[df['Season'] == s] for s in seasons}
+    partitions = {s: part for s, part in partitions.items() if len(part)}
+    total_rows = sum(len(part) for part in partitions.values())
+    if not partitions:
+        print("Warning: No rows match target seasons. Nothing to process.")
+        return df
+
+    processes = min(config.training.season_processes, len(partitions))
+    training = dataclasses.replace(
+        config.training,
+        workers=max(1, config.training.workers // processes),
+        season_processes=0,
+    )
+    print(f"Generating {len(unique_features)} features for {total_rows:,} rows "
+          f"in {len(partitions)} season partitions")
+    print(f"  Processes: {processes} x {training.workers} workers")
+
+    # Built once here: partitions preload their season and its lookback, the chain covers all of them
+    league_history = None
+    if _needs_league_history(training, unique_features):
+        from bball.mongo import Mongo
+
+        league_history = _build_league_history(Mongo().db, config.league)
+
+    start = time_module.time()
+    processed = 0
+    # spawn: children must not inherit the parent's Mongo client or threads
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=mp_context) as pool:
+        # Largest seasons first so the slowest partitions start earliest
+        futures = {
+            pool.submit(
+                _generate_season_partition, config.league.league_id, training, part, feature_names,
+                league_history,
+            ): season
+            for season, part in sorted(partitions.items(), key=lambda item: -len(item[1]))
+        }
+        for future in as_completed(futures):
+            season = futures[future]
+            result = future.result()
+            df.loc[result.index, unique_features] = result[unique_features]
+            processed += len(result)
+            pct = processed / total_rows * 100
+            print(f"  [{season}] done: {len(result):,} rows "
+                  f"({processed:,}/{total_rows:,}, {pct:.1f}%, {time_module.time() - start:.0f}s)")
+            if progress_callback:
+                progress_callback(processed, total_rows, pct)
+
+    if generate_predictions:
+        from bball.mongo import Mongo
+
+        points_predictor = PointsModelPredictor(Mongo().db, config.league)
+        if points_predictor.is_loaded():
+            df = points_predictor.generate_predictions(df)
+
+    return df
+
+
+def _needs_h2h_history(feature_names: List[str]) -> bool:
+    from bball.pipeline.feature_cache import reads_h2h_history
+
+    return any(reads_h2h_history(f) for f in feature_names)
+
+
+def _seasons_through(db, league, last_season: str) -> List[str]:
+    """Every season in the games collection up to and including last_season."""
+    seasons = db[league.collections.get('games', 'stats_nba')].distinct('season')
+    return sorted(s for s in seasons if s and s <= last_season)
+
+
+def _needs_league_history(training: TrainingConfig, feature_names: List[str]) -> bool:
+    from bball.pipeline.feature_cache import feature_scope
+
+    return (bool(training.feature_cache and training.feature_cache_dir)
+            and any(feature_scope(f) == "league" for f in feature_names))
+
+
+def _build_league_history(db, league):
+    """History chain over every game feeding Elo, seeded with the Elo params."""
+    from bball.pipeline.feature_cache import league_history_chain
+    from bball.stats.elo_engine import EloParams, load_elo_games
+
+    print("Fingerprinting Elo game history for the feature cache...")
+    seed = EloParams.from_league(league).fingerprint().encode()
+    return league_history_chain(load_elo_games(db, league), seed=seed)
+
+
+def _open_feature_cache(config: PipelineConfig, shared_context: SharedFeatureContext, league_history=None):
+    """FeatureValueCache over the preloaded games, or None if disabled/unavailable."""
+    training = config.training
+    if not training.feature_cache or not training.feature_cache_dir or not shared_context.all_games:
+        return None
+    from bball.pipeline.feature_cache import FeatureValueCache, GameDataFingerprints, default_salt
+
+    if league_history is None and _needs_league_history(training, shared_context.feature_names):
+        league_history = _build_league_history(shared_context.db, config.league)
+    print(f"Fingerprinting preloaded games for the feature cache ({training.feature_cache_dir})...")
+    games_home, games_away = shared_context.all_games
+    fingerprints = GameDataFingerprints(
+        games_home, games_away, salt=default_salt(config.league.league_id),
+        league_history=league_history,
+    )
+    return FeatureValueCache(training.feature_cache_dir, fingerprints)
+
+
 def load_games_for_training(
     config: PipelineConfig,
     season: Optional[str] = None,
@@ -750,6 +967,8 @@ Examples:
     python -m bball.pipeline.training_pipeline nba --add --features "col1,col2"  # Update columns only
     python -m bball.pipeline.training_pipeline nba --add --season 2024-2025     # Replace season rows
     python -m bball.pipeline.training_pipeline nba --add --seasons "2023-2024,2024-2025"
+    python -m bball.pipeline.training_pipeline nba --no-feature-cache           # Recompute every cell
+    python -m bball.pipeline.training_pipeline nba --season-processes 4         # Seasons in parallel
         """
     )
     parser.add_argument("league", choices=available_leagues,
@@ -776,6 +995,10 @@ Examples:
                        help="Comma-separated list of seasons (e.g., '2023-2024,2024-2025')")
     parser.add_argument("--exclude-features", type=str, default=None,
                        help="Comma-separated list of feature names or patterns to EXCLUDE (e.g., 'player_*,inj_*')")
+    parser.add_argument("--season-processes", type=int, default=None,
+                       help="Generate seasons independently in N processes (each preloads one season + lookback)")
+    parser.add_argument("--no-feature-cache", action="store_true",
+                       help="Recompute every cell instead of reusing unchanged values from earlier runs")
     parser.add_argument("--add", action="store_true",
                        help="Add/update to existing CSV: with --features updates columns, with --season/--seasons replaces season rows")
     args = parser.parse_args(argv)
@@ -796,6 +1019,8 @@ Examples:
         config.training.workers = args.workers
     if args.chunk_size:
         config.training.chunk_size = args.chunk_size
+    if args.season_processes is not None:
+        config.training.season_processes = args.season_processes
     if args.no_player:
         config.training.include_player_features = False
         config.training.preload_per_cache = False
@@ -815,13 +1040,22 @@ Examples:
     else:
         output_path = league_config.master_training_csv
 
+    if args.no_feature_cache:
+        config.training.feature_cache = False
+    else:
+        from bball.pipeline.feature_cache import feature_cache_dir_for
+        config.training.feature_cache_dir = feature_cache_dir_for(output_path)
+
     print("\n" + "=" * 70)
     print(f"  {league_config.display_name} Master Training Generation")
     print("=" * 70)
     print(f"  League:      {args.league.upper()}")
     print(f"  Workers:     {config.training.workers}")
     print(f"  Chunk size:  {config.training.chunk_size}")
+    if config.training.season_processes > 1:
+        print(f"  Season proc: {config.training.season_processes}")
     print(f"  Player feat: {'No' if not config.training.include_player_features else 'Yes'}")
+    print(f"  Feat. cache: {'Yes' if config.training.feature_cache else 'No'}")
     if args.add:
         has_feature_filter = args.features or args.exclude_features
         if has_feature_filter and (args.season or args.seasons):
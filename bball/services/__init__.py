@@ -3,6 +3,7 @@ Business Services Module.
 
 This module contains high-level service orchestration:
 - PredictionService: Single source of truth for predictions
+- PredictionServiceRegistry: Shared, warm PredictionService per league
 - ModelConfigManager: Model configuration management
 - ModelBusinessLogic: Business logic utilities
 - ArtifactManager: Model artifact management
@@ -11,6 +12,7 @@ This module contains high-level service orchestration:
 - LineupService: Live game lineup data from ESPN
 - NewsService: News/content fetcher from configured sources
 - RosterService: Build team rosters from player game stats
+- LiveSnapshots: Shared background poller for market prices and live scores
 
 Import directly from submodules to avoid circular imports:
     from bball.services.prediction import PredictionService
@@ -25,6 +27,11 @@ def __getattr__(name):
         from bball.services import prediction
         return getattr(prediction, name)
 
+    _registry = {"PredictionServiceRegistry", "get_prediction_registry", "get_prediction_service"}
+    if name in _registry:
+        from bball.services import prediction_registry
+        return getattr(prediction_registry, name)
+
     _config_manager = {"ModelConfigManager"}
     if name in _config_manager:
         from bball.services.config_manager import ModelConfigManager
@@ -82,11 +89,17 @@ def __getattr__(name):
         from bball.services import jobs
         return getattr(jobs, name)
 
+    _live = {"SnapshotPoller", "Snapshot", "get_snapshot_poller"}
+    if name in _live:
+        from bball.services import live_snapshots
+        return getattr(live_snapshots, name)
+
     raise AttributeError(f"module 'bball.services' has no attribute {name!r}")
 
 
 __all__ = [
     'PredictionService', 'PredictionResult', 'MatchupInfo',
+    'PredictionServiceRegistry', 'get_prediction_registry', 'get_prediction_service',
     'ModelConfigManager',
     'ModelBusinessLogic',
     'ArtifactManager',
@@ -102,4 +115,5 @@ __all__ = [
     'get_game_detail', 'get_team_players', 'get_team_info',
     'build_rosters',
     'create_job', 'update_job_progress', 'complete_job', 'fail_job', 'get_job',
+    'SnapshotPoller', 'Snapshot', 'get_snapshot_poller',
 ]
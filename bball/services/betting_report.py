@@ -55,7 +55,7 @@ def generate_betting_report(
     Returns:
         List of BetRecommendation objects, sorted by game time
     """
-    from bball.market.kalshi import get_game_market_data
+    from bball.market.kalshi import get_slate_market_data
 
     # Get collection names from league config
     if league is not None:
@@ -92,6 +92,20 @@ def generate_betting_report(
         if game_id:
             games_by_id[game_id] = game
 
+    # Fetch market data for the whole slate at once
+    matchups = []
+    for game_id, pred in predictions_by_game.items():
+        game = games_by_id.get(game_id)
+        if not game:
+            continue
+        home_team = pred.get('home_team') or game.get('homeTeam', {}).get('name')
+        away_team = pred.get('away_team') or game.get('awayTeam', {}).get('name')
+        if home_team and away_team:
+            matchups.append((away_team, home_team))
+    slate_markets = get_slate_market_data(
+        game_date_obj, matchups, league_id=league_id, use_cache=True
+    )
+
     recommendations = []
     force_set = set(force_include_game_ids) if force_include_game_ids else set()
     included_game_ids = set()
@@ -115,14 +129,7 @@ def generate_betting_report(
         model_home_prob = model_home_prob / 100.0 if model_home_prob > 1 else model_home_prob
         model_away_prob = model_away_prob / 100.0 if model_away_prob > 1 else model_away_prob
 
-        # Fetch market data from Kalshi
-        market_data = get_game_market_data(
-            game_date=game_date_obj,
-            away_team=away_team,
-            home_team=home_team,
-            league_id=league_id,
-            use_cache=True
-        )
+        market_data = slate_markets.get((away_team, home_team))
 
         if not market_data:
             continue
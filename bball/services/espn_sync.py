@@ -668,7 +668,15 @@ def _process_game(
                     flat_update[f'{key}.{nested_key}'] = nested_value
             else:
                 flat_update[key] = value
+        # Watermark for cache invalidation (PredictionServiceRegistry._data_version)
+        flat_update['updated_at'] = datetime.utcnow()
         league_db.stats_nba.update_one(query, {'$set': flat_update}, upsert=True)
+        try:
+            from bball.stats.team_records import record_game
+            record_game(db, league, game_data)
+        except Exception as e:
+            if not quiet:
+                print(f"  Warning: could not update team records for {game_id}: {e}")
 
     if not quiet:
         if dry_run:
@@ -711,6 +719,7 @@ def _process_game(
                             position_data = pstats.pop('_position_for_players', None)
 
                             pquery = {'game_id': game_id, 'player_id': pstats['player_id']}
+                            pstats['updated_at'] = datetime.utcnow()
                             league_db.stats_nba_players.update_one(pquery, {'$set': pstats}, upsert=True)
 
                             players_update = {
@@ -1742,7 +1751,7 @@ def backfill_field_from_scoreboard(
                 if not dry_run:
                     league_db.stats_nba.update_one(
                         {'game_id': gid},
-                        {'$set': {field_name: values_by_game[gid]}}
+                        {'$set': {field_name: values_by_game[gid], 'updated_at': datetime.utcnow()}}
                     )
                 games_updated += 1
             else:
@@ -382,6 +382,17 @@ def get_team_stats(db, team: str, season: str, before_date: str,
     team_id_field = league.team_primary_identifier  # 'name' or 'id'
     exclude_game_types = league.exclude_game_types if hasattr(league, 'exclude_game_types') else []
 
+    # Materialized (team, season) records: one indexed lookup instead of an aggregation
+    if season:
+        try:
+            from bball.stats.team_records import get_team_records
+            records = get_team_records(db, league, [team], season, before_date,
+                                       exclude_game_types=exclude_game_types)
+            if records is not None:
+                return records[str(team)]
+        except Exception as e:
+            print(f"Team records lookup failed for {team} ({season}), aggregating instead: {e}")
+
     # Build base query - completed games have homeWon field
     # Match on both primary identifier field AND 'name' for flexibility
     # (CBB games may only have 'name' even though league config says 'id')
@@ -15,7 +15,9 @@ League-aware: Uses normalized collection names (games, player_stats) that work
 with LeagueDbProxy for multi-league support.
 """
 
-from datetime import datetime
+import threading
+from bisect import bisect_left
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set, Tuple
 from pymongo.database import Database
 
@@ -24,6 +26,18 @@ from pymongo.database import Database
 RECENCY_THRESHOLD_DAYS = 25
 
 
+class _SeasonShard:
+    """Player maps for one season (plus the recency lookback window)."""
+
+    __slots__ = ('team_dates', 'played')
+
+    def __init__(self):
+        # team -> player_id -> sorted unique dates the player played for the team
+        self.team_dates: Dict[str, Dict[str, List[str]]] = {}
+        # (game_id, team) -> player_ids who played
+        self.played: Dict[Tuple[str, str], Set[str]] = {}
+
+
 class InjuryManager:
     """
     Manages injury detection and updates for NBA games.
@@ -51,146 +65,156 @@ class InjuryManager:
         """
         self.db = db
 
-        # Precomputed maps (populated on demand)
-        self._player_team_dates: Dict[str, Dict[str, List[str]]] = {}
-        self._team_players: Dict[str, Set[str]] = {}
-        self._game_team_players_played: Dict[Tuple[str, str], Set[str]] = {}
+        # Global summaries (populated on demand, one entry per player-team pair):
+        # (player_id, team) -> last date the player played for the team
+        self._player_team_last_date: Dict[Tuple[str, str], str] = {}
+        # player_id -> {'date', 'team', 'season'} of the player's last game
         self._player_last_game_info: Dict[str, dict] = {}
         self._maps_built = False
 
+        # Per-season shards, built lazily and released once a season is done
+        self._season_shards: Dict[Optional[str], _SeasonShard] = {}
+        self._shard_locks: Dict[Optional[str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
     def _build_precomputed_maps(self, progress_callback: callable = None) -> int:
         """
-        Build precomputed maps from player_stats for efficient injury detection.
+        Build the global player summaries used by the roster check.
+
+        Only one entry per player-team pair is kept in memory; per-game data
+        lives in per-season shards (see _get_season_shard).
 
         Args:
             progress_callback: Optional callback(current, total, message) for progress
 
         Returns:
-            Total player records processed
+            Total player records summarized
         """
         if self._maps_built:
             return 0
 
-        self._player_team_dates = {}
-        self._team_players = {}
-        self._game_team_players_played = {}
-        self._player_last_game_info = {}
-
-        # Single scan over player_stats collection
-        player_stats_cursor = self.db.player_stats.find(
-            {'stats.min': {'$gt': 0}},  # Only players who actually played
-            {'player_id': 1, 'team': 1, 'date': 1, 'game_id': 1, 'season': 1}
-        )
-
-        total_records = 0
-        for player_record in player_stats_cursor:
-            total_records += 1
-
-            player_id = player_record.get('player_id')
-            team = player_record.get('team')
-            game_date = player_record.get('date')
-            game_id = player_record.get('game_id')
-            season = player_record.get('season')
-
-            if not player_id or not team or not game_date or not game_id:
-                continue
-
-            # Build player_team_dates
-            if player_id not in self._player_team_dates:
-                self._player_team_dates[player_id] = {}
-            if team not in self._player_team_dates[player_id]:
-                self._player_team_dates[player_id][team] = []
-
-            if game_date not in self._player_team_dates[player_id][team]:
-                self._player_team_dates[player_id][team].append(game_date)
-
-            # Build team_players
-            if team not in self._team_players:
-                self._team_players[team] = set()
-            self._team_players[team].add(player_id)
-
-            # Build game_team_players_played
-            key = (game_id, team)
-            if key not in self._game_team_players_played:
-                self._game_team_players_played[key] = set()
-            self._game_team_players_played[key].add(player_id)
-
-            # Track last game info for each player
-            if player_id not in self._player_last_game_info:
-                self._player_last_game_info[player_id] = {
-                    'date': game_date, 'team': team, 'season': season
-                }
-            else:
-                current_last_date = self._player_last_game_info[player_id]['date']
-                if game_date > current_last_date:
-                    self._player_last_game_info[player_id] = {
-                        'date': game_date, 'team': team, 'season': season
+        with self._lock:
+            if self._maps_built:
+                return 0
+
+            pipeline = [
+                {'$match': {
+                    'stats.min': {'$gt': 0},  # Only players who actually played
+                    'player_id': {'$nin': [None, '']},
+                    'team': {'$nin': [None, '']},
+                    'date': {'$nin': [None, '']},
+                    'game_id': {'$nin': [None, '']},
+                }},
+                {'$group': {
+                    '_id': {'player_id': '$player_id', 'team': '$team'},
+                    # Season strings ('YYYY-YYYY') sort in date order, so the
+                    # max season is the season of the max date
+                    'last_date': {'$max': '$date'},
+                    'last_season': {'$max': '$season'},
+                    'count': {'$sum': 1},
+                }},
+            ]
+
+            player_team_last_date = {}
+            player_last_game_info = {}
+            total_records = 0
+            for idx, doc in enumerate(self.db.player_stats.aggregate(pipeline, allowDiskUse=True)):
+                player_id = doc['_id']['player_id']
+                team = doc['_id']['team']
+                last_date = doc['last_date']
+                total_records += doc['count']
+
+                player_team_last_date[(player_id, team)] = last_date
+                current = player_last_game_info.get(player_id)
+                if current is None or last_date > current['date']:
+                    player_last_game_info[player_id] = {
+                        'date': last_date, 'team': team, 'season': doc.get('last_season')
                     }
 
-            if progress_callback and total_records % 10000 == 0:
-                progress_callback(total_records, 0, f'Building maps: {total_records} records...')
-
-        # Sort all date lists
-        for player_id in self._player_team_dates:
-            for team in self._player_team_dates[player_id]:
-                self._player_team_dates[player_id][team].sort()
+                if progress_callback and (idx + 1) % 10000 == 0:
+                    progress_callback(idx + 1, 0, f'Building maps: {idx + 1} player-teams...')
 
-        self._maps_built = True
+            self._player_team_last_date = player_team_last_date
+            self._player_last_game_info = player_last_game_info
+            self._maps_built = True
         return total_records
 
-    def _get_roster_for_game(
-        self,
-        team: str,
-        game_date: str,
-        game_season: str
-    ) -> Set[str]:
+    def _get_season_shard(self, season: Optional[str]) -> '_SeasonShard':
         """
-        Get the roster (active players) for a team on a given game date.
-
-        A player is considered on the roster if:
-        - They have played for this team before the game date
-        - Either they played for this team after the game date, OR
-          their last game for any team was for this team in this season
-
-        Args:
-            team: Team name
-            game_date: Game date (YYYY-MM-DD)
-            game_season: Season string
+        Get (building on first use) the player maps for one season.
 
-        Returns:
-            Set of player IDs on the roster
+        The shard holds every played record of the season plus the records
+        dated up to RECENCY_THRESHOLD_DAYS before its first game, so recency
+        checks for early-season games can see the end of the prior season.
+        Concurrent callers for the same season wait for a single build.
         """
-        roster = set()
-
-        if team not in self._team_players:
-            return roster
-
-        for player_id in self._team_players[team]:
-            if player_id not in self._player_team_dates:
-                continue
-            if team not in self._player_team_dates[player_id]:
-                continue
-
-            dates = self._player_team_dates[player_id][team]
-            if not dates:
-                continue
-
-            first_date = dates[0]
-            last_date = dates[-1]
-
-            # Player was active for this team during the game date
-            if first_date <= game_date <= last_date:
-                roster.add(player_id)
-            elif first_date <= game_date:
-                # Player's first game is before game_date but last is also before
-                # Check if their last game (for any team) was for this team in this season
-                if player_id in self._player_last_game_info:
-                    last_game_info = self._player_last_game_info[player_id]
-                    if (last_game_info['team'] == team and
-                        last_game_info['season'] == game_season):
-                        roster.add(player_id)
+        shard = self._season_shards.get(season)
+        if shard is not None:
+            return shard
+
+        with self._lock:
+            shard_lock = self._shard_locks.setdefault(season, threading.Lock())
+        with shard_lock:
+            shard = self._season_shards.get(season)
+            if shard is None:
+                shard = self._build_season_shard(season)
+                self._season_shards[season] = shard
+        return shard
+
+    def _build_season_shard(self, season: Optional[str]) -> '_SeasonShard':
+        """Build a season shard in a single pass over its player_stats records."""
+        projection = {'player_id': 1, 'team': 1, 'date': 1, 'game_id': 1}
+        shard = _SeasonShard()
+        team_dates: Dict[str, Dict[str, Set[str]]] = {}
+
+        def add(record) -> Optional[str]:
+            player_id = record.get('player_id')
+            team = record.get('team')
+            game_date = record.get('date')
+            game_id = record.get('game_id')
+            if not player_id or not team or not game_date or not game_id:
+                return None
+            team_dates.setdefault(team, {}).setdefault(player_id, set()).add(game_date)
+            shard.played.setdefault((game_id, team), set()).add(player_id)
+            return game_date
+
+        first_date = last_date = None
+        for record in self.db.player_stats.find(
+            {'season': season, 'stats.min': {'$gt': 0}}, projection
+        ):
+            game_date = add(record)
+            if game_date:
+                if first_date is None or game_date < first_date:
+                    first_date = game_date
+                if last_date is None or game_date > last_date:
+                    last_date = game_date
+
+        if first_date is not None:
+            lookback_start = (
+                datetime.strptime(first_date, '%Y-%m-%d').date() -
+                timedelta(days=RECENCY_THRESHOLD_DAYS)
+            ).isoformat()
+            for record in self.db.player_stats.find(
+                {
+                    'date': {'$gte': lookback_start, '$lte': last_date},
+                    'season': {'$ne': season},
+                    'stats.min': {'$gt': 0},
+                },
+                projection
+            ):
+                add(record)
+
+        shard.team_dates = {
+            team: {player_id: sorted(dates) for player_id, dates in players.items()}
+            for team, players in team_dates.items()
+        }
+        return shard
 
-        return roster
+    def release_season(self, season: Optional[str]) -> None:
+        """Drop a season's shard once its games have been processed."""
+        with self._lock:
+            self._season_shards.pop(season, None)
+            self._shard_locks.pop(season, None)
 
     def _get_injured_players_for_game(
         self,
@@ -202,6 +226,11 @@ class InjuryManager:
         """
         Get list of injured players for a team in a specific game.
 
+        A player is injured if they did not play in the game, their last prior
+        game for this team is within RECENCY_THRESHOLD_DAYS, and they are
+        still on the roster: they played for this team on or after the game
+        date, or their last game for any team was for this team this season.
+
         Args:
             game_id: Game ID
             team: Team name
@@ -211,45 +240,45 @@ class InjuryManager:
         Returns:
             List of injured player IDs
         """
-        roster = self._get_roster_for_game(team, game_date, game_season)
-        played = self._game_team_players_played.get((game_id, team), set())
+        shard = self._get_season_shard(game_season)
+        team_players = shard.team_dates.get(team)
+        if not team_players:
+            return []
 
-        injured_candidates = roster - played
-        injured_players = []
+        played = shard.played.get((game_id, team), set())
+        cutoff = (
+            datetime.strptime(game_date, '%Y-%m-%d').date() -
+            timedelta(days=RECENCY_THRESHOLD_DAYS)
+        ).isoformat()
 
-        for player_id in injured_candidates:
-            if player_id not in self._player_team_dates:
-                continue
-            if team not in self._player_team_dates[player_id]:
+        injured_players = []
+        for player_id, dates in team_players.items():
+            if player_id in played:
                 continue
 
-            dates = self._player_team_dates[player_id][team]
-            if not dates:
+            # Last prior game for this team (dates < game_date) within threshold
+            idx = bisect_left(dates, game_date)
+            if idx == 0 or dates[idx - 1] < cutoff:
                 continue
 
-            # Get prior game dates (dates < game_date)
-            prior_dates = [d for d in dates if d < game_date]
-
-            # Check: at least 1 prior game
-            if len(prior_dates) == 0:
+            # Still on the roster
+            if self._player_team_last_date.get((player_id, team), '') >= game_date:
+                injured_players.append(player_id)
                 continue
-
-            # Check: last prior game within threshold
-            last_prior_date = prior_dates[-1]
-            date_diff = (
-                datetime.strptime(game_date, '%Y-%m-%d').date() -
-                datetime.strptime(last_prior_date, '%Y-%m-%d').date()
-            ).days
-
-            if date_diff <= RECENCY_THRESHOLD_DAYS:
+            last_game_info = self._player_last_game_info.get(player_id)
+            if (last_game_info and last_game_info['team'] == team and
+                    last_game_info['season'] == game_season):
                 injured_players.append(player_id)
 
-        return injured_players
+        return sorted(injured_players)
 
     def compute_injuries_for_game(self, game: dict) -> Tuple[List[str], List[str]]:
         """
         Compute injured players for a single game.
 
+        The game's season shard is built on first use and kept until
+        release_season() is called.
+
         Args:
             game: Game document with game_id, date, season, homeTeam.name, awayTeam.name
 
@@ -342,7 +371,10 @@ class InjuryManager:
         if progress_callback:
             progress_callback('fetch', 1, 1, f'Found {len(games)} games')
 
-        # Stage 3: Process games
+        # Stage 3: Process games season by season so each shard can be released
+        games.sort(key=lambda g: (g.get('season') or '', g.get('date') or ''))
+        current_season = _NO_SEASON = object()
+
         updated_count = 0
         skipped_count = 0
         error_count = 0
@@ -352,6 +384,11 @@ class InjuryManager:
         for idx, game in enumerate(games):
             game_id = game.get('game_id')
 
+            if game.get('season') != current_season:
+                if current_season is not _NO_SEASON:
+                    self.release_season(current_season)
+                current_season = game.get('season')
+
             if progress_callback and (idx + 1) % 100 == 0:
                 progress_callback('process', idx + 1, len(games),
                     f'Processing game {idx + 1}/{len(games)}...')
@@ -383,6 +420,9 @@ class InjuryManager:
             except Exception as e:
                 error_count += 1
 
+        if current_season is not _NO_SEASON:
+            self.release_season(current_season)
+
         if progress_callback:
             progress_callback('process', len(games), len(games), 'Complete!')
 
@@ -0,0 +1,367 @@
+"""
+Live Snapshots Service
+
+Background polling of market prices (Kalshi) and live scores (ESPN) per
+league/date, shared by every web client.
+
+Each feed (kind, league, date) is refreshed on a fixed cadence by one
+background thread while clients keep reading it, and dropped once idle.
+Refreshes are single-flight: concurrent readers of a cold feed wait for one
+upstream fetch instead of each issuing their own. Readers get an immutable,
+versioned Snapshot from memory; the version only changes when the data does,
+so server-sent-event streams can push just the changes.
+
+Usage:
+    from bball.services.live_snapshots import get_snapshot_poller, fetch_live_games
+
+    poller = get_snapshot_poller()
+    snapshot = poller.get(('live', 'nba', '2025-01-15'),
+                          lambda: fetch_live_games(league, '2025-01-15'),
+                          interval=LIVE_POLL_SECONDS)
+    snapshot.data, snapshot.version
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Refresh cadence per feed kind (seconds)
+MARKET_POLL_SECONDS = 30
+LIVE_POLL_SECONDS = 15
+
+# Feeds nobody has read for this long stop polling and are dropped
+IDLE_TIMEOUT_SECONDS = 120
+
+# Server-sent event streams: keep-alive cadence, and lifetime after which the
+# stream ends and the client reconnects (frees the worker thread it holds)
+STREAM_KEEPALIVE_SECONDS = 25
+STREAM_MAX_SECONDS = 300
+STREAM_RETRY_MS = 2000
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Immutable result of one feed refresh."""
+    version: int          # Bumped only when data changes
+    data: Any
+    fetched_at: float     # time.time() of the last refresh attempt
+    error: Optional[str] = None  # Error from the last refresh (data is then the previous good data)
+
+
+class _Feed:
+    __slots__ = ('key', 'fetch', 'interval', 'snapshot', 'last_access', 'refresh_lock')
+
+    def __init__(self, key, fetch, interval):
+        self.key = key
+        self.fetch = fetch
+        self.interval = interval
+        self.snapshot: Optional[Snapshot] = None
+        self.last_access = time.time()
+        self.refresh_lock = threading.Lock()
+
+
+class SnapshotPoller:
+    """Background, single-flight poller publishing versioned snapshots."""
+
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT_SECONDS):
+        self.idle_timeout = idle_timeout
+        self._feeds: Dict[Hashable, _Feed] = {}
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self, key: Hashable, fetch: Callable[[], Any], interval: float) -> Snapshot:
+        """
+        Latest snapshot for a feed, registering it on first use.
+
+        The first read of a feed fetches synchronously (single-flight); later
+        reads return the in-memory snapshot kept fresh by the poller thread.
+        """
+        feed = self._touch(key, fetch, interval)
+        if feed.snapshot is None:
+            self._refresh(feed)
+        return feed.snapshot
+
+    def wait_for_update(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Any],
+        interval: float,
+        after_version: int,
+        timeout: float,
+    ) -> Snapshot:
+        """Block until the feed's version exceeds after_version (or timeout)."""
+        feed = self._touch(key, fetch, interval)
+        if feed.snapshot is None:
+            self._refresh(feed)
+        deadline = time.time() + timeout
+        with self._cond:
+            while feed.snapshot.version <= after_version:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+                feed.last_access = time.time()
+        return feed.snapshot
+
+    def _touch(self, key, fetch, interval) -> _Feed:
+        with self._cond:
+            feed = self._feeds.get(key)
+            if feed is None:
+                feed = _Feed(key, fetch, interval)
+                self._feeds[key] = feed
+            feed.last_access = time.time()
+            self._ensure_thread()
+            return feed
+
+    def _refresh(self, feed: _Feed) -> None:
+        """Fetch a feed once; callers arriving mid-fetch reuse its result."""
+        seen = feed.snapshot
+        with feed.refresh_lock:
+            if feed.snapshot is not seen:
+                return  # Another caller refreshed while we waited
+
+            previous = feed.snapshot
+            error = None
+            try:
+                data = feed.fetch()
+            except Exception as e:
+                logger.warning(f"Snapshot refresh failed for {feed.key}: {e}")
+                data = previous.data if previous else None
+                error = str(e)
+
+            version = previous.version if previous else 0
+            if previous is None or data != previous.data:
+                version += 1
+
+            with self._cond:
+                feed.snapshot = Snapshot(version=version, data=data, fetched_at=time.time(), error=error)
+                self._cond.notify_all()
+
+    def _ensure_thread(self) -> None:
+        # Called with self._cond held
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="snapshot-poller", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            now = time.time()
+            due = []
+            with self._cond:
+                for key, feed in list(self._feeds.items()):
+                    if now - feed.last_access > self.idle_timeout:
+                        del self._feeds[key]
+                    elif feed.snapshot is not None and now - feed.snapshot.fetched_at >= feed.interval:
+                        due.append(feed)
+                if not self._feeds:
+                    self._thread = None
+                    return
+
+            for feed in due:
+                self._refresh(feed)
+
+            with self._cond:
+                next_due = min(
+                    (f.snapshot.fetched_at + f.interval for f in self._feeds.values() if f.snapshot),
+                    default=time.time() + 1.0,
+                )
+                self._cond.wait(max(0.5, min(next_due - time.time(), 5.0)))
+
+
+_poller: Optional[SnapshotPoller] = None
+_poller_lock = threading.Lock()
+
+
+def get_snapshot_poller() -> SnapshotPoller:
+    """Process-wide SnapshotPoller."""
+    global _poller
+    if _poller is None:
+        with _poller_lock:
+            if _poller is None:
+                _poller = SnapshotPoller()
+    return _poller
+
+
+def snapshot_events(
+    poller: SnapshotPoller,
+    key: Hashable,
+    fetch: Callable[[], Any],
+    interval: float,
+    payload_key: str,
+    max_seconds: float = STREAM_MAX_SECONDS,
+    keepalive: float = STREAM_KEEPALIVE_SECONDS,
+) -> Iterator[str]:
+    """
+    Server-sent events for a feed: one `snapshot` event per new version.
+
+    The stream ends after max_seconds (the `retry:` hint makes EventSource
+    reconnect), and stops as soon as the server closes the generator when the
+    client disconnects.
+    """
+    deadline = time.time() + max_seconds
+    version = 0
+    try:
+        yield f"retry: {STREAM_RETRY_MS}\n\n"
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return
+            snapshot = poller.wait_for_update(key, fetch, interval, version, timeout=min(keepalive, remaining))
+            if snapshot.version > version:
+                version = snapshot.version
+                body = {
+                    'success': True,
+                    payload_key: snapshot.data or {},
+                    'version': snapshot.version,
+                    'updated_at': datetime.utcfromtimestamp(snapshot.fetched_at).isoformat() + 'Z',
+                }
+                yield f"id: {version}\nevent: snapshot\ndata: {json.dumps(body)}\n\n"
+            else:
+                yield ": keep-alive\n\n"
+    except GeneratorExit:
+        # Client went away; nothing to release beyond this generator
+        return
+
+
+# =============================================================================
+# Feed fetchers
+# =============================================================================
+
+def fetch_market_prices(db, league, date_str: str) -> Dict[str, dict]:
+    """
+    Kalshi market prices for every game on a date.
+
+    Returns:
+        Dict mapping game_id -> MarketData.to_dict() without 'last_updated'
+        (the snapshot's fetched_at carries the refresh time, and leaving it
+        out keeps the snapshot version stable while prices are unchanged)
+    """
+    from bball.market.kalshi import get_slate_market_data
+
+    game_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+    league_id = league.league_id if league else 'nba'
+    games_collection = league.collections.get('games', 'stats_nba') if league else 'stats_nba'
+
+    games = db[games_collection].find(
+        {'date': date_str},
+        {'game_id': 1, 'homeTeam.name': 1, 'awayTeam.name': 1}
+    )
+    matchups = {}
+    for game in games:
+        home_team = game.get('homeTeam', {}).get('name', '')
+        away_team = game.get('awayTeam', {}).get('name', '')
+        if home_team and away_team:
+            matchups[game.get('game_id')] = (away_team, home_team)
+
+    if not matchups:
+        return {}
+
+    # The poller cadence is the cache; always read fresh prices upstream
+    slate_markets = get_slate_market_data(
+        game_date, list(matchups.values()), league_id=league_id, use_cache=False
+    )
+    markets = {}
+    for game_id, matchup in matchups.items():
+        if matchup in slate_markets:
+            market = slate_markets[matchup].to_dict()
+            market.pop('last_updated', None)
+            markets[game_id] = market
+    return markets
+
+
+def fetch_live_games(league, date_str: str) -> Dict[str, dict]:
+    """
+    Live game state (scores, period, clock, status) from the ESPN scoreboard.
+
+    Returns:
+        Dict mapping ESPN game_id -> {status, completed, period, clock,
+        status_detail, home_score, away_score}
+    """
+    import requests
+
+    date_yyyymmdd = date_str.replace('-', '')
+    try:
+        espn_url = league.espn_endpoint('scoreboard_site_template').format(YYYYMMDD=date_yyyymmdd)
+    except Exception:
+        # Fallback for NBA
+        espn_url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_yyyymmdd}"
+
+    resp = requests.get(espn_url, timeout=10)
+    resp.raise_for_status()
+    data = resp.json()
+
+    live_games = {}
+    for event in data.get('events', []):
+        game_id = event.get('id')
+        if not game_id:
+            continue
+
+        # Extract status - can be string or dict
+        status_obj = event.get('status', {})
+        game_status = 'pre'
+        game_completed = False
+        period = None
+        clock = None
+        status_detail = None
+
+        if isinstance(status_obj, str):
+            if status_obj.lower() in ('final', 'completed', 'post'):
+                game_status = 'post'
+                game_completed = True
+            elif status_obj.lower() in ('active', 'in', 'in progress', 'live'):
+                game_status = 'in'
+            else:
+                game_status = 'pre'
+        elif isinstance(status_obj, dict):
+            status_type = status_obj.get('type', {})
+            if isinstance(status_type, dict):
+                raw_status = status_type.get('name', '').lower()
+                game_completed = status_type.get('completed', False)
+                # Get human-readable status detail (e.g., "Halftime", "End of 3rd")
+                status_detail = status_type.get('shortDetail') or status_type.get('detail')
+                # Normalize ESPN status names to 'pre', 'in', or 'post'
+                if game_completed or 'final' in raw_status or 'post' in raw_status:
+                    game_status = 'post'
+                elif 'progress' in raw_status or 'halftime' in raw_status or raw_status == 'in':
+                    game_status = 'in'
+                else:
+                    game_status = 'pre'
+            period = status_obj.get('period')
+            clock = status_obj.get('displayClock')
+
+        # Extract scores from competitors
+        home_score = None
+        away_score = None
+        competitions = event.get('competitions', [])
+        if competitions:
+            competitors = competitions[0].get('competitors', [])
+            for comp in competitors:
+                score_val = comp.get('score')
+                # Only parse if score exists and is not empty
+                if score_val is not None and score_val != '':
+                    try:
+                        score = int(score_val)
+                        if comp.get('homeAway') == 'home':
+                            home_score = score
+                        else:
+                            away_score = score
+                    except (ValueError, TypeError):
+                        pass
+
+        live_games[game_id] = {
+            'status': game_status,
+            'completed': game_completed,
+            'period': period,
+            'clock': clock,
+            'status_detail': status_detail,
+            'home_score': home_score,
+            'away_score': away_score
+        }
+
+    return live_games
@@ -3,11 +3,13 @@ from __future__ import annotations
 import json
 import hashlib
 import re
+import threading
 from typing import Any, Dict, List, Optional, Tuple, Callable
 
 from bball.services.matchup_chat.context_repository import SharedContextRepository
 from bball.services.matchup_chat.prediction_bootstrap import ensure_shared_context_baseline
 from bball.services.matchup_chat.tool_cache import ToolCache
+from bball.services.matchup_chat.workflow import build_step_dependencies, run_steps
 from bball.services.matchup_chat.schemas import (
     AgentAction,
     ControllerOptions,
@@ -25,8 +27,8 @@ class Controller:
     Code-level orchestrator (SSoT) for matchup multi-agent workflow.
 
     This class calls the Planner to produce a `turn_plan`, then runs the
-    specialist agents in order, stores outputs into shared context, and
-    returns the final synthesis.
+    specialist agents (independent ones in parallel), stores outputs into
+    shared context, and returns the final synthesis.
     """
 
     def __init__(self, db, league=None, league_id: str = "nba"):
@@ -36,6 +38,9 @@ class Controller:
         self.repo = SharedContextRepository(db=db, league_id=self.league_id)
         # Mongo-backed cache for repeated DB tool calls within a matchup.
         self.tool_cache = ToolCache(db=db, league_id=self.league_id, ttl_s=60 * 60 * 12)
+        # Serializes history appends (append_history reads the length first);
+        # parallel workflow steps buffer their entries and merge them in step order.
+        self._history_lock = threading.Lock()
 
     # ---------------------------------------------------------------------
     # Public API
@@ -67,6 +72,12 @@ class Controller:
         self.repo.update_fields(game_id, baseline_fields)
         shared = self.repo.get(game_id) or baseline_fields
 
+        # Warm the in-process tool cache so repeated Stats tool calls skip Mongo.
+        try:
+            self.tool_cache.prefetch(game_id)
+        except Exception:
+            pass
+
         agent_actions: List[AgentAction] = []
 
         # 2) Planner (LLM) -> JSON plan (fallback if invalid/unavailable)
@@ -235,27 +246,55 @@ class Controller:
                 return None
 
         # 3) Execute workflow steps (best-effort; LLM agents will replace these stubs)
-        workflow_outputs: Dict[str, str] = {}
-        did_contradiction_requeue = False
-        for step in turn_plan.get("workflow", []):
+        # Steps form a DAG (see workflow.build_step_dependencies); independent agents
+        # run in parallel. Each step collects its own agent_actions / outputs / history
+        # entries, which are merged in workflow order so the result is the same as a
+        # serial run. Serial runs persist history live so the UI can stream it.
+        workflow: List[Dict[str, Any]] = [s for s in (turn_plan.get("workflow", []) or []) if isinstance(s, dict)]
+        step_deps = build_step_dependencies(workflow)
+        ancestors: List[List[int]] = []
+        for i, d in enumerate(step_deps):
+            closure = set(d)
+            for k in d:
+                closure.update(ancestors[k])
+            ancestors.append(sorted(closure))
+
+        step_outputs: List[Dict[str, str]] = [{} for _ in workflow]
+        step_actions: List[List[AgentAction]] = [[] for _ in workflow]
+        max_workers = options.max_parallel_agents if options.parallel_agents else 1
+        buffer_history = max_workers > 1 and len(workflow) > 1
+        step_history: List[Optional[List[HistoryEntry]]] = [[] if buffer_history else None for _ in workflow]
+        requeue_lock = threading.Lock()
+        requeue_state = {"done": False}
+
+        def _run_step(i: int) -> None:
+            step = workflow[i]
             agent = step.get("agent") or ""
             instruction = step.get("instruction") or ""
+            actions = step_actions[i]
+            history = step_history[i]
+            # Outputs visible to this step: everything it (transitively) waited for, in order.
+            prior_outputs: Dict[str, str] = {}
+            for k in ancestors[i]:
+                prior_outputs.update(step_outputs[k])
+
             out = self._run_network_agent(
                 game_id=game_id,
                 agent=agent,
                 instruction=instruction,
                 shared=self.repo.get(game_id) or shared,
                 conversation_history=self._conversation_for_agent(agent, conversation_history),
-                prior_outputs=workflow_outputs,
+                prior_outputs=prior_outputs,
                 user_message=user_message,
                 options=options,
-                agent_actions=agent_actions,
+                agent_actions=actions,
+                history=history,
             )
-            workflow_outputs[agent] = out
+            outputs = {agent: out}
 
             # Contradiction loop (bounded): after Stats executes audits, if it reports
             # high-severity contradictions, immediately requeue Model Inspector once.
-            if agent == "stats_agent" and (not did_contradiction_requeue):
+            if agent == "stats_agent":
                 audit = _extract_labeled_json_object(out or "", "AuditResultsJSON:")
                 contradictions = []
                 try:
@@ -272,8 +311,12 @@ class Controller:
                         if sev == "high":
                             high.append(c)
 
-                if high:
-                    did_contradiction_requeue = True
+                with requeue_lock:
+                    requeue = bool(high) and not requeue_state["done"]
+                    if requeue:
+                        requeue_state["done"] = True
+
+                if requeue:
                     # Keep the packet small: pass only the contradiction list, not full stats output.
                     packet = {
                         "version": 1,
@@ -296,13 +339,29 @@ class Controller:
                         instruction=followup_instruction,
                         shared=self.repo.get(game_id) or shared,
                         conversation_history=self._conversation_for_agent("model_inspector", conversation_history),
-                        prior_outputs=workflow_outputs,
+                        prior_outputs={**prior_outputs, **outputs},
                         user_message=user_message,
                         options=options,
-                        agent_actions=agent_actions,
+                        agent_actions=actions,
+                        history=history,
                     )
                     # Overwrite model_inspector output for synthesis so the final answer uses the investigation result.
-                    workflow_outputs["model_inspector"] = out2
+                    outputs["model_inspector"] = out2
+
+            step_outputs[i] = outputs
+
+        try:
+            run_steps(len(workflow), step_deps, _run_step, max_workers=max_workers)
+        finally:
+            # Persist whatever the steps recorded (even if one raised), in step order.
+            for entries in step_history:
+                for entry in entries or []:
+                    self._append_history(game_id, entry, None)
+
+        workflow_outputs: Dict[str, str] = {}
+        for i in range(len(workflow)):
+            workflow_outputs.update(step_outputs[i])
+            agent_actions.extend(step_actions[i])
 
         # 4) Final synthesis (LLM; fallback if unavailable)
         try:
@@ -365,6 +424,7 @@ class Controller:
         agent_actions: List[AgentAction],
         tools: Optional[List[Dict[str, Any]]] = None,
         system: str = "",
+        history: Optional[List[HistoryEntry]] = None,
     ) -> None:
         ts = utc_now_iso()
         entry: HistoryEntry = {
@@ -374,7 +434,7 @@ class Controller:
             "output": output,
             "timestamp": ts,
         }
-        self.repo.append_history(game_id, entry)
+        self._append_history(game_id, entry, history)
 
         agent_actions.append(
             {
@@ -489,6 +549,13 @@ class Controller:
         # Planner + final synthesizer can see full conversation (already user+assistant only).
         return conversation
 
+    def _append_history(self, game_id: str, entry: HistoryEntry, history: Optional[List[HistoryEntry]]) -> None:
+        if history is not None:
+            history.append(entry)
+            return
+        with self._history_lock:
+            self.repo.append_history(game_id, entry)
+
     def _record_tool_event(
         self,
         *,
@@ -499,9 +566,11 @@ class Controller:
         output: Any,
         agent_actions: List[AgentAction],
         system: str = "",
+        history: Optional[List[HistoryEntry]] = None,
     ) -> None:
         """
         Persist a tool call immediately so the UI can stream it live via shared context history polling.
+        Parallel workflow steps pass a `history` buffer instead; it is persisted after the steps finish.
         """
         ts = utc_now_iso()
         entry: HistoryEntry = {
@@ -510,7 +579,7 @@ class Controller:
             "tools": [{"name": tool_name, "args": args or {}, "output": output}],
             "timestamp": ts,
         }
-        self.repo.append_history(game_id, entry)
+        self._append_history(game_id, entry, history)
         agent_actions.append(
             {
                 "kind": "tool_call",
@@ -536,6 +605,7 @@ class Controller:
         user_message: str,
         options: ControllerOptions,
         agent_actions: List[AgentAction],
+        history: Optional[List[HistoryEntry]] = None,
     ) -> str:
         """
         Run a matchup network agent.
@@ -549,7 +619,7 @@ class Controller:
         # If tool-calling runtime isn't available, fall back to deterministic stub behavior.
         if not LANGCHAIN_AVAILABLE:
             out, tools = self._run_stub_agent(agent=agent, instruction=instruction, shared=shared, options=options)
-            self._record_agent_output(game_id=game_id, agent=agent, output=out, tools=tools, agent_actions=agent_actions)
+            self._record_agent_output(game_id=game_id, agent=agent, output=out, tools=tools, agent_actions=agent_actions, history=history)
             return out
 
         system = load_rendered_system_message(agent)
@@ -675,6 +745,7 @@ class Controller:
                     args=kwargs,
                     output=record_output,
                     agent_actions=agent_actions,
+                    history=history,
                     system=system_ref,
                 )
                 # Return toon-encoded tool output to keep the agent context window small.
@@ -1044,7 +1115,7 @@ class Controller:
         else:
             # Unknown agent: fall back
             out, tools_used = self._run_stub_agent(agent=agent, instruction=instruction, shared=shared, options=options)
-            self._record_agent_output(game_id=game_id, agent=agent, output=out, tools=tools_used, agent_actions=agent_actions)
+            self._record_agent_output(game_id=game_id, agent=agent, output=out, tools=tools_used, agent_actions=agent_actions, history=history)
             return out
 
         try:
@@ -1061,14 +1132,15 @@ class Controller:
                 system_ref=system_ref,
                 trace_msgs=trace_msgs,
                 agent_actions=agent_actions,
+                history=history,
             )
         except Exception as e:
             # Do not fail the entire request on a single tool/agent error.
             out = f"[ERROR] {agent} failed: {e}"
-            self._record_agent_output(game_id=game_id, agent=agent, output=out, agent_actions=agent_actions, system=system_ref)
+            self._record_agent_output(game_id=game_id, agent=agent, output=out, agent_actions=agent_actions, system=system_ref, history=history)
             return out
 
-        self._record_agent_output(game_id=game_id, agent=agent, output=out, agent_actions=agent_actions, system=system_ref)
+        self._record_agent_output(game_id=game_id, agent=agent, output=out, agent_actions=agent_actions, system=system_ref, history=history)
         return out
 
     def _record_tool_errors_from_trace(
@@ -1079,6 +1151,7 @@ class Controller:
         system_ref: str,
         trace_msgs: List[Any],
         agent_actions: List[AgentAction],
+        history: Optional[List[HistoryEntry]] = None,
     ) -> None:
         """
         Persist tool-call failures that happen before our python tool wrapper executes
@@ -1111,6 +1184,7 @@ class Controller:
                     args=args or {},
                     output=payload,
                     agent_actions=agent_actions,
+                    history=history,
                     system=system_ref,
                 )
             except Exception:
@@ -1142,9 +1216,9 @@ class Controller:
 
         if agent == "model_inspector":
             # Minimal stub: fetch prediction doc directly from SSoT when shared context doesn't contain it
-            from bball.services.prediction import PredictionService
+            from bball.services.prediction_registry import get_prediction_service
 
-            svc = PredictionService(db=self.db, league=self.league)
+            svc = get_prediction_service(db=self.db, league=self.league)
             pred_info = svc.get_prediction_for_game(game_id) or {}
 
             hw = pred_info.get("home_win_prob")
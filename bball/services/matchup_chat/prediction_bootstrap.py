@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional, Tuple
 
+from pymongo import UpdateOne
+
 from bball.services.matchup_chat.schemas import SharedContext
-from bball.services.prediction import PredictionService
+from bball.services.prediction_registry import get_prediction_service
 from bball.market.kalshi import get_game_market_data
 from bball.services.espn_odds import get_live_pregame_lines
 
@@ -41,6 +43,139 @@ def _team_meta(db, league, abbrev: str) -> Dict[str, str]:
     }
 
 
+# Bump when the chat baseline document shape changes (older docs are ignored).
+CHAT_BASELINE_VERSION = 1
+
+
+def chat_baselines_collection(league_id: str) -> str:
+    return f"{(league_id or 'nba').lower()}_matchup_chat_baselines"
+
+
+def materialize_chat_baselines(*, db, league, game_date: str, league_id: str = "nba") -> int:
+    """
+    Write a compact chat baseline doc for every game on a date with a stored prediction.
+
+    Built from the persisted predictions (so the baseline always matches the
+    SSoT prediction doc) plus team metadata, using one predictions query, one
+    teams query and one bulk write. ensure_shared_context_baseline() then
+    opens a chat session for these games with a single indexed read.
+
+    Returns:
+      Number of baselines written.
+    """
+    league_id = (league_id or "nba").lower()
+    predictions_coll = _get_coll(league, "model_predictions", "nba_model_predictions")
+    teams_coll = _get_coll(league, "teams", "teams_nba")
+
+    predictions = list(db[predictions_coll].find(
+        {"game_date": game_date},
+        {"_id": 0, "game_id": 1, "game_date": 1, "home_team": 1, "away_team": 1, "home_win_prob": 1, "predicted_at": 1},
+    ))
+    predictions = [p for p in predictions if p.get("game_id") and p.get("home_team") and p.get("away_team")]
+    if not predictions:
+        return 0
+
+    abbrevs = sorted({p["home_team"] for p in predictions} | {p["away_team"] for p in predictions})
+    team_docs = {
+        d.get("abbreviation"): d
+        for d in db[teams_coll].find(
+            {"abbreviation": {"$in": abbrevs}},
+            {"_id": 0, "abbreviation": 1, "team_id": 1, "id": 1, "displayName": 1, "name": 1},
+        )
+    }
+
+    def _meta(abbrev: str) -> Dict[str, str]:
+        doc = team_docs.get(abbrev) or {}
+        team_id = doc.get("team_id") or doc.get("id") or ""
+        return {
+            "name": abbrev,
+            "full_name": doc.get("displayName") or doc.get("name") or "",
+            "team_id": str(team_id) if team_id is not None else "",
+        }
+
+    now = datetime.now(timezone.utc).isoformat()
+    ops = []
+    for p in predictions:
+        p_home = None
+        try:
+            if p.get("home_win_prob") is not None:
+                p_home = float(p["home_win_prob"]) / 100.0
+        except Exception:
+            p_home = None
+        ops.append(UpdateOne(
+            {"game_id": p["game_id"]},
+            {"$set": {
+                "game_id": p["game_id"],
+                "version": CHAT_BASELINE_VERSION,
+                "game": {
+                    "date": _safe_date_str(p.get("game_date")),
+                    "away": _meta(p["away_team"]),
+                    "home": _meta(p["home_team"]),
+                },
+                "ensemble_model": {**({"p_home": p_home} if p_home is not None else {})},
+                "home_win_prob": p.get("home_win_prob"),
+                "predicted_at": p.get("predicted_at"),
+                "materialized_at": now,
+            }},
+            upsert=True,
+        ))
+
+    coll = db[chat_baselines_collection(league_id)]
+    try:
+        coll.create_index([("game_id", 1)], unique=True, name="game_id_unique")
+    except Exception:
+        pass
+    coll.bulk_write(ops, ordered=False)
+    return len(ops)
+
+
+def refresh_chat_baseline(*, db, prediction_doc: Dict[str, Any], league_id: str = "nba") -> None:
+    """
+    Bring an existing chat baseline in line with a newly saved prediction.
+
+    Called from PredictionService.save_prediction so every writer of the
+    prediction doc (predict_date, /api/predict, `predict --save`, chat
+    bootstrap) keeps the baseline's p_home current. A baseline whose teams no
+    longer match the prediction is dropped; sessions then take the full path.
+    """
+    game_id = prediction_doc.get("game_id")
+    if not game_id:
+        return
+    p_home = None
+    try:
+        if prediction_doc.get("home_win_prob") is not None:
+            p_home = float(prediction_doc["home_win_prob"]) / 100.0
+    except Exception:
+        p_home = None
+
+    coll = db[chat_baselines_collection(league_id)]
+    result = coll.update_one(
+        {
+            "game_id": game_id,
+            "game.home.name": prediction_doc.get("home_team"),
+            "game.away.name": prediction_doc.get("away_team"),
+        },
+        {"$set": {
+            "ensemble_model": {**({"p_home": p_home} if p_home is not None else {})},
+            "home_win_prob": prediction_doc.get("home_win_prob"),
+            "predicted_at": prediction_doc.get("predicted_at"),
+            "materialized_at": datetime.now(timezone.utc).isoformat(),
+        }},
+    )
+    if not result.matched_count:
+        coll.delete_one({"game_id": game_id})
+
+
+def _load_chat_baseline(db, game_id: str, league_id: str) -> Optional[Dict[str, Any]]:
+    try:
+        doc = db[chat_baselines_collection(league_id)].find_one({"game_id": game_id}, {"_id": 0})
+    except Exception:
+        return None
+    if not doc or doc.get("version") != CHAT_BASELINE_VERSION or not (doc.get("game") or {}).get("home"):
+        return None
+    return doc
+
+
 def ensure_shared_context_baseline(
     *,
     db,
@@ -56,45 +191,60 @@ def ensure_shared_context_baseline(
     - `market_snapshot` (Kalshi + vegas odds) for this game (best-effort)
     - a persisted prediction document in the model predictions collection (SSoT)
 
+    Games predicted by `predict_date` have a materialized chat baseline (see
+    materialize_chat_baselines); for those the game metadata and p_home come
+    from one indexed read, and prediction_info is the compact baseline doc
+    rather than the full prediction document.
+
     Returns:
       (fields_to_set_in_shared_context, prediction_info)
     """
     existing = existing or {}
     league_id = (league_id or "nba").lower()
 
-    games_coll = _get_coll(league, "games", "stats_nba")
-    game_doc = db[games_coll].find_one({"game_id": game_id}) or {}
-
-    home_abbrev = (game_doc.get("homeTeam") or {}).get("name") or ""
-    away_abbrev = (game_doc.get("awayTeam") or {}).get("name") or ""
-    game_date = _safe_date_str(game_doc.get("date"))
-
-    game_meta: Dict[str, Any] = {"date": game_date}
-    if away_abbrev:
-        game_meta["away"] = _team_meta(db, league, away_abbrev)
-    if home_abbrev:
-        game_meta["home"] = _team_meta(db, league, home_abbrev)
-
-    # Prediction persistence is handled by PredictionService (SSoT)
-    service = PredictionService(db=db, league=league)
-    prediction_info = service.get_prediction_for_game(game_id) or {}
-
-    if not prediction_info and home_abbrev and away_abbrev and game_date:
-        # Compute + persist
-        result = service.predict_matchup(home_team=home_abbrev, away_team=away_abbrev, game_date=game_date)
-        # best-effort save (prediction doc contains rich info used by agents)
-        date_obj = _parse_date_yyyy_mm_dd(game_date)
-        if date_obj:
-            prediction_info = service.save_prediction(
-                result=result,
-                game_id=game_id,
-                game_date=date_obj,
-                home_team=home_abbrev,
-                away_team=away_abbrev,
-            )
-        else:
-            # fallback to an unserialized dict view
-            prediction_info = result.to_dict()
+    baseline = _load_chat_baseline(db, game_id, league_id)
+    if baseline is not None:
+        # Warm start: predict_date already stored the prediction and game metadata.
+        game_doc: Optional[Dict[str, Any]] = None
+        game_meta: Dict[str, Any] = baseline["game"]
+        home_abbrev = (game_meta.get("home") or {}).get("name") or ""
+        away_abbrev = (game_meta.get("away") or {}).get("name") or ""
+        game_date = game_meta.get("date") or ""
+        prediction_info: Dict[str, Any] = baseline
+    else:
+        games_coll = _get_coll(league, "games", "stats_nba")
+        game_doc = db[games_coll].find_one({"game_id": game_id}) or {}
+
+        home_abbrev = (game_doc.get("homeTeam") or {}).get("name") or ""
+        away_abbrev = (game_doc.get("awayTeam") or {}).get("name") or ""
+        game_date = _safe_date_str(game_doc.get("date"))
+
+        game_meta = {"date": game_date}
+        if away_abbrev:
+            game_meta["away"] = _team_meta(db, league, away_abbrev)
+        if home_abbrev:
+            game_meta["home"] = _team_meta(db, league, home_abbrev)
+
+        # Prediction persistence is handled by PredictionService (SSoT)
+        service = get_prediction_service(db=db, league=league)
+        prediction_info = service.get_prediction_for_game(game_id) or {}
+
+        if not prediction_info and home_abbrev and away_abbrev and game_date:
+            # Compute + persist
+            result = service.predict_matchup(home_team=home_abbrev, away_team=away_abbrev, game_date=game_date)
+            # best-effort save (prediction doc contains rich info used by agents)
+            date_obj = _parse_date_yyyy_mm_dd(game_date)
+            if date_obj:
+                prediction_info = service.save_prediction(
+                    result=result,
+                    game_id=game_id,
+                    game_date=date_obj,
+                    home_team=home_abbrev,
+                    away_team=away_abbrev,
+                )
+            else:
+                # fallback to an unserialized dict view
+                prediction_info = result.to_dict()
 
     # Normalize p_home from prediction_info if present (PredictionService stores win_prob as 0-100)
     p_home = None
@@ -114,47 +264,76 @@ def ensure_shared_context_baseline(
 
     # Market snapshot (best-effort). Keep it small and explicitly distinguish it from model p_home.
     # Avoid repeated calls if we already have a recent snapshot.
+    snap = existing.get("market_snapshot") if isinstance(existing, dict) else None
+    if isinstance(snap, dict) and snap and not _snapshot_is_stale(snap):
+        fields_to_set["market_snapshot"] = snap
+    else:
+        snapshot = _build_market_snapshot(
+            db=db,
+            league=league,
+            league_id=league_id,
+            game_id=game_id,
+            game_doc=game_doc,
+            game_date=game_date,
+            home_abbrev=home_abbrev,
+            away_abbrev=away_abbrev,
+        )
+        if snapshot is not None:
+            fields_to_set["market_snapshot"] = snapshot
+
+    return fields_to_set, prediction_info
+
+
+def _snapshot_is_stale(snap: Dict[str, Any]) -> bool:
+    """Market snapshots are refreshed when older than 1 hour."""
     try:
-        snap = existing.get("market_snapshot") if isinstance(existing, dict) else None
-        snap_ts = None
-        if isinstance(snap, dict):
-            snap_ts = str(snap.get("timestamp") or "")
-        is_stale = True
-        try:
-            if snap_ts:
-                t = datetime.fromisoformat(snap_ts.replace("Z", "+00:00"))
-                # refresh if older than 1 hour
-                is_stale = (datetime.now(t.tzinfo) - t).total_seconds() > 3600
-        except Exception:
-            is_stale = True
-
-        if not snap or is_stale:
-            vegas_odds = get_live_pregame_lines(game_id, league=league) or (game_doc.get("pregame_lines") or game_doc.get("vegas") or {})
-            vegas_odds_source = "espn_api" if (isinstance(vegas_odds, dict) and ("over_under" in vegas_odds or "spread" in vegas_odds or "home_ml" in vegas_odds or "away_ml" in vegas_odds)) else "db_snapshot"
-
-            prediction_markets: Optional[Dict[str, Any]] = None
-            try:
-                date_str = str(game_doc.get("date") or "")[:10]
-                game_date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
-                away = away_abbrev
-                home = home_abbrev
-                md = get_game_market_data(game_date=game_date_obj, away_team=away, home_team=home, league_id=league_id)
-                prediction_markets = md.to_dict() if md is not None else None
-            except Exception as e:
-                prediction_markets = {"error": str(e)}
-
-            fields_to_set["market_snapshot"] = {
-                "timestamp": datetime.utcnow().replace(tzinfo=None).isoformat() + "+00:00",
-                "source": "baseline",
-                "prediction_markets": prediction_markets,
-                "vegas_odds": vegas_odds,
-                "vegas_odds_source": vegas_odds_source,
-                "note": "market_snapshot reflects public market/vegas pricing; it is distinct from model p_home.",
-            }
-        else:
-            fields_to_set["market_snapshot"] = snap
+        snap_ts = str(snap.get("timestamp") or "")
+        if not snap_ts:
+            return True
+        t = datetime.fromisoformat(snap_ts.replace("Z", "+00:00"))
+        return (datetime.now(t.tzinfo) - t).total_seconds() > 3600
     except Exception:
-        pass
+        return True
 
-    return fields_to_set, prediction_info
 
+def _build_market_snapshot(
+    *,
+    db,
+    league,
+    league_id: str,
+    game_id: str,
+    game_doc: Optional[Dict[str, Any]],
+    game_date: str,
+    home_abbrev: str,
+    away_abbrev: str,
+) -> Optional[Dict[str, Any]]:
+    """Kalshi + vegas odds snapshot for a game (best-effort; None on failure)."""
+    try:
+        vegas_odds = get_live_pregame_lines(game_id, league=league)
+        if not vegas_odds:
+            if game_doc is None:
+                games_coll = _get_coll(league, "games", "stats_nba")
+                game_doc = db[games_coll].find_one(
+                    {"game_id": game_id}, {"pregame_lines": 1, "vegas": 1}
+                ) or {}
+            vegas_odds = game_doc.get("pregame_lines") or game_doc.get("vegas") or {}
+        vegas_odds_source = "espn_api" if (isinstance(vegas_odds, dict) and ("over_under" in vegas_odds or "spread" in vegas_odds or "home_ml" in vegas_odds or "away_ml" in vegas_odds)) else "db_snapshot"
+
+        prediction_markets: Optional[Dict[str, Any]] = None
+        try:
+            game_date_obj = datetime.strptime(game_date[:10], "%Y-%m-%d").date()
+            md = get_game_market_data(game_date=game_date_obj, away_team=away_abbrev, home_team=home_abbrev, league_id=league_id)
+            prediction_markets = md.to_dict() if md is not None else None
+        except Exception as e:
+            prediction_markets = {"error": str(e)}
+
+        return {
+            "timestamp": datetime.utcnow().replace(tzinfo=None).isoformat() + "+00:00",
+            "source": "baseline",
+            "prediction_markets": prediction_markets,
+            "vegas_odds": vegas_odds,
+            "vegas_odds_source": vegas_odds_source,
+            "note": "market_snapshot reflects public market/vegas pricing; it is distinct from model p_home.",
+        }
+    except Exception:
+        return None
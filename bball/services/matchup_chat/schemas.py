@@ -84,4 +84,7 @@ class TurnPlan(TypedDict, total=False):
 class ControllerOptions:
     force_web_refresh: bool = False
     show_agent_actions: bool = False
+    # Run independent workflow agents concurrently (see workflow.build_step_dependencies).
+    parallel_agents: bool = True
+    max_parallel_agents: int = 4
 
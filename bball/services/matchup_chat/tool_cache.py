@@ -1,10 +1,34 @@
 from __future__ import annotations
 
+import copy
 import hashlib
 import json
+import threading
 import time
 from typing import Any, Dict, Optional
 
+from bball.services.result_cache import ResultCache
+
+# Per-process L1 in front of the Mongo collection, shared by all ToolCache
+# instances (controllers are created per request).
+L1_MAX_ENTRIES = 4096
+L1_MAX_BYTES = 64 * 1024 * 1024
+# How long a prefetched game is trusted to have no other cached outputs
+# (misses for it skip Mongo). Writes from other processes show up after this.
+PREFETCH_TTL_S = 10 * 60
+
+_l1: Optional[ResultCache] = None
+_l1_lock = threading.Lock()
+
+
+def _get_l1() -> ResultCache:
+    global _l1
+    if _l1 is None:
+        with _l1_lock:
+            if _l1 is None:
+                _l1 = ResultCache(max_entries=L1_MAX_ENTRIES, max_bytes=L1_MAX_BYTES)
+    return _l1
+
 
 def _json_safe(obj: Any) -> Any:
     """
@@ -22,6 +46,11 @@ class ToolCache:
 
     Designed for agent DB tools that are frequently repeated within a matchup session
     (e.g. get_team_games, get_player_stats). Uses a TTL index on expires_at.
+
+    Reads go through a per-process, size-bounded L1 (honoring expires_at).
+    prefetch(game_id) loads every live output for a game in one query, after
+    which lookups for that game make no Mongo round trips. get() returns a
+    copy, so callers may mutate results without touching the shared L1.
     """
 
     def __init__(self, *, db, league_id: str = "nba", ttl_s: int = 60 * 60 * 12):
@@ -54,15 +83,65 @@ class ToolCache:
 
     @staticmethod
     def _hash_args(args: Dict[str, Any], *, cache_schema_version: int = 1) -> str:
-        payload = {"_v": int(cache_schema_version), "args": _json_safe(args or {})}
-        s = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        try:
+            # JSON-native args (the common case) hash identically without the round trip
+            s = json.dumps(
+                {"_v": int(cache_schema_version), "args": args or {}},
+                sort_keys=True, separators=(",", ":"), ensure_ascii=False,
+            )
+        except (TypeError, ValueError):
+            payload = {"_v": int(cache_schema_version), "args": _json_safe(args or {})}
+            s = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
         return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
+    def _l1_key(self, game_id: str, tool: str, args_hash: str) -> str:
+        return f"{self.league_id}:{game_id}:{tool}:{args_hash}"
+
+    def _prefetch_key(self, game_id: str) -> str:
+        return f"{self.league_id}:{game_id}:__prefetched__"
+
+    def _l1_put(self, game_id: str, tool: str, args_hash: str, output: Any, expires_at: float) -> None:
+        ttl = expires_at - time.time()
+        if ttl > 0:
+            _get_l1().set(self._l1_key(game_id, tool, args_hash), output, ttl)
+
+    def prefetch(self, game_id: str) -> int:
+        """
+        Load all unexpired cached tool outputs for a game into L1 (one query).
+
+        Returns the number of outputs loaded. No-op while a previous prefetch
+        for the game is still fresh.
+        """
+        game_id = str(game_id)
+        l1 = _get_l1()
+        if l1.get(self._prefetch_key(game_id)):
+            return 0
+        now = time.time()
+        try:
+            docs = list(self.coll.find(
+                {"game_id": game_id, "cache_schema_version": self.cache_schema_version, "expires_at": {"$gt": now}},
+                {"_id": 0, "tool": 1, "args_hash": 1, "output": 1, "expires_at": 1},
+            ))
+        except Exception:
+            return 0
+        for doc in docs:
+            self._l1_put(game_id, str(doc.get("tool")), doc.get("args_hash"), doc.get("output"), float(doc.get("expires_at") or 0))
+        l1.set(self._prefetch_key(game_id), True, PREFETCH_TTL_S)
+        return len(docs)
+
     def get(self, *, game_id: str, tool: str, args: Dict[str, Any]) -> Optional[Any]:
         now = time.time()
+        game_id, tool = str(game_id), str(tool)
         args_hash = self._hash_args(args, cache_schema_version=self.cache_schema_version)
+        l1 = _get_l1()
+        cached = l1.get(self._l1_key(game_id, tool, args_hash))
+        if cached is not None:
+            return copy.deepcopy(cached)
+        if l1.get(self._prefetch_key(game_id)):
+            # Everything cached for this game was loaded by prefetch()
+            return None
         try:
-            doc = self.coll.find_one({"game_id": str(game_id), "tool": str(tool), "args_hash": args_hash})
+            doc = self.coll.find_one({"game_id": game_id, "tool": tool, "args_hash": args_hash})
         except Exception:
             doc = None
         if not doc:
@@ -73,7 +152,10 @@ class ToolCache:
             expires_at = 0
         if expires_at and expires_at < now:
             return None
-        return doc.get("output")
+        output = doc.get("output")
+        if expires_at:
+            self._l1_put(game_id, tool, args_hash, output, expires_at)
+        return copy.deepcopy(output)
 
     def set(self, *, game_id: str, tool: str, args: Dict[str, Any], output: Any) -> None:
         now = time.time()
@@ -88,6 +170,7 @@ class ToolCache:
             "created_at": now,
             "expires_at": now + float(self.ttl_s),
         }
+        self._l1_put(doc["game_id"], doc["tool"], args_hash, doc["output"], doc["expires_at"])
         try:
             self.coll.update_one(
                 {"game_id": doc["game_id"], "tool": doc["tool"], "args_hash": doc["args_hash"]},
@@ -97,4 +180,3 @@ class ToolCache:
         except Exception:
             # Best-effort: cache miss is acceptable.
             return
-
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Sequence, Set
+
+from bball.services.matchup_chat.schemas import TurnPlanStep
+
+# Agent -> agents whose output (this turn) it reads via `prior_outputs`.
+AGENT_INPUTS: Dict[str, Set[str]] = {
+    "research_media_agent": {"stats_agent"},
+    "stats_agent": {"model_inspector"},
+    "model_inspector": {"experimenter"},
+}
+
+# Agents that only read shared state. Anything else (e.g. the experimenter,
+# which moves players between roster buckets and re-runs predictions) is a
+# barrier: it waits for every earlier step and every later step waits for it.
+READ_ONLY_AGENTS: Set[str] = {"model_inspector", "stats_agent", "research_media_agent"}
+
+
+def build_step_dependencies(workflow: Sequence[TurnPlanStep]) -> List[Set[int]]:
+    """
+    Dependency DAG for a turn plan workflow.
+
+    deps[j] holds indices i < j that step j must wait for:
+      - the latest earlier step of each agent j reads output from
+      - the latest earlier step of the same agent (outputs overwrite by agent)
+      - barriers (non read-only agents) in either direction
+
+    Dependencies only point backwards, so running steps in workflow order is
+    always a valid schedule and matches the serial behavior.
+    """
+    deps: List[Set[int]] = []
+    latest_by_agent: Dict[str, int] = {}
+    last_barrier = -1
+    for j, step in enumerate(workflow):
+        agent = (step or {}).get("agent") or ""
+        step_deps: Set[int] = set()
+        if agent not in READ_ONLY_AGENTS:
+            step_deps.update(range(j))
+        else:
+            if last_barrier >= 0:
+                step_deps.add(last_barrier)
+            for upstream in AGENT_INPUTS.get(agent, set()) | {agent}:
+                if upstream in latest_by_agent:
+                    step_deps.add(latest_by_agent[upstream])
+        deps.append(step_deps)
+        latest_by_agent[agent] = j
+        if agent not in READ_ONLY_AGENTS:
+            last_barrier = j
+    return deps
+
+
+def run_steps(
+    count: int,
+    deps: Sequence[Set[int]],
+    run: Callable[[int], Any],
+    *,
+    max_workers: int = 4,
+) -> List[Any]:
+    """
+    Run steps 0..count-1 respecting deps, with independent steps in parallel.
+
+    Ready steps are started in index order. Returns results by index; an
+    exception from run() propagates after in-flight steps finish.
+    """
+    results: List[Any] = [None] * count
+    if count == 0:
+        return results
+    if max_workers <= 1:
+        for i in range(count):
+            results[i] = run(i)
+        return results
+
+    remaining = {i: set(deps[i]) for i in range(count)}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="matchup-agent") as executor:
+        running = {}
+        while remaining or running:
+            for i in sorted(i for i, d in remaining.items() if not d):
+                del remaining[i]
+                running[executor.submit(run, i)] = i
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                i = running.pop(future)
+                results[i] = future.result()
+                for d in remaining.values():
+                    d.discard(i)
+    return results
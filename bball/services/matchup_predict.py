@@ -19,7 +19,7 @@ from bball.models.points_regression import PointsRegressionTrainer
 from bball.utils import get_season_from_date
 from bball.services.config_manager import ModelConfigManager
 from bball.models.artifact_loader import ArtifactLoader
-from bball.services.prediction import PredictionService
+from bball.services.prediction_registry import get_prediction_service
 
 
 def load_model_from_config(config: Dict, db=None) -> Optional[BballModel]:
@@ -253,7 +253,7 @@ def predict(
 
     # Use PredictionService (SSoT for all prediction workflows)
     # Rosters are the single source of truth for player lists
-    service = PredictionService(db=db, league=league)
+    service = get_prediction_service(db=db, league=league)
     result = service.predict_matchup(
         home_team=home,
         away_team=away,
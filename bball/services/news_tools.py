@@ -20,16 +20,20 @@ Fallback (via SERP API):
 - _news_search for news-specific searches
 
 Caching:
-- in-memory TTL cache (1 hour) keyed by league_id + entity/query
+- bounded LRU + TTL cache (1 hour) keyed by league_id + entity/query
+- extracted article text cached per URL; concurrent fetches of one URL
+  are deduplicated (single-flight)
+- optional Mongo/disk second tier shared across workers (NEWS_CACHE_BACKEND)
 - force_refresh bypasses cache
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import re
-import time
-from dataclasses import dataclass
+import tempfile
+import threading
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
@@ -39,34 +43,70 @@ from bball.config import config
 from bball.mongo import Mongo
 from bball.services.webpage_parser import WebpageParser
 from bball.services.news_service import NewsService
+from bball.services.result_cache import CacheTier, DiskCacheTier, MongoCacheTier, ResultCache
 from bball.league_config import load_league_config
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
-class _CacheEntry:
-    value: Any
-    expires_at: float
-
-
-_CACHE: Dict[str, _CacheEntry] = {}
 _DEFAULT_TTL_S = 60 * 60  # 1 hour
+_ARTICLE_TTL_S = 6 * 60 * 60  # extracted article text changes rarely
 _MIN_EXTRACT_CHARS = 400  # heuristic: avoid thin/snippet-only pages
 
+# Cache sizing / sharing (env overrides):
+# - NEWS_CACHE_MAX_ENTRIES, NEWS_CACHE_MAX_MB: in-memory budget per process
+# - NEWS_CACHE_BACKEND: "mongo" or "disk" to share fetched content across workers
+# - NEWS_CACHE_DIR: directory for the disk backend
+_CACHE: Optional[ResultCache] = None
+_CACHE_LOCK = threading.Lock()
+
+
+def _build_cache_tier() -> Optional[CacheTier]:
+    backend = (os.environ.get("NEWS_CACHE_BACKEND") or "").strip().lower()
+    try:
+        if backend == "mongo":
+            return MongoCacheTier(Mongo().db, "news_tools_cache")
+        if backend == "disk":
+            directory = os.environ.get("NEWS_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "bball_news_cache")
+            return DiskCacheTier(directory)
+    except Exception as e:
+        logger.warning(f"News cache backend '{backend}' unavailable, using memory only: {e}")
+    return None
+
+
+def get_news_cache() -> ResultCache:
+    """Process-wide cache for news/web-search tool results and fetched articles."""
+    global _CACHE
+    if _CACHE is None:
+        with _CACHE_LOCK:
+            if _CACHE is None:
+                _CACHE = ResultCache(
+                    max_entries=int(os.environ.get("NEWS_CACHE_MAX_ENTRIES", 2048)),
+                    max_bytes=int(float(os.environ.get("NEWS_CACHE_MAX_MB", 128)) * 1024 * 1024),
+                    default_ttl_s=_DEFAULT_TTL_S,
+                    tier=_build_cache_tier(),
+                )
+    return _CACHE
+
+
+def configure_news_cache(cache: ResultCache) -> None:
+    """Replace the news tools cache (e.g. with a shared tier or a different budget)."""
+    global _CACHE
+    with _CACHE_LOCK:
+        _CACHE = cache
+
+
+def get_news_cache_stats() -> Dict[str, int]:
+    """Hit/miss/eviction counters and current size of the news tools cache."""
+    return get_news_cache().stats()
+
 
 def _cache_get(key: str) -> Optional[Any]:
-    entry = _CACHE.get(key)
-    if entry is None:
-        return None
-    if time.time() > entry.expires_at:
-        _CACHE.pop(key, None)
-        return None
-    return entry.value
+    return get_news_cache().get(key)
 
 
 def _cache_set(key: str, value: Any, ttl_s: int = _DEFAULT_TTL_S) -> None:
-    _CACHE[key] = _CacheEntry(value=value, expires_at=time.time() + ttl_s)
+    get_news_cache().set(key, value, ttl_s)
 
 
 def _normalize_query(q: str) -> str:
@@ -139,6 +179,21 @@ def _fetch_and_extract(url: str, *, timeout: int = 10) -> str:
     return WebpageParser.extract_from_html(html)
 
 
+def _fetch_and_extract_cached(url: str, *, timeout: int = 10, force_refresh: bool = False) -> str:
+    """
+    _fetch_and_extract through the shared cache.
+
+    Concurrent requests for the same URL (e.g. several agents researching one
+    matchup) share a single download; failures are not cached.
+    """
+    return get_news_cache().get_or_compute(
+        f"article:{url}",
+        lambda: _fetch_and_extract(url, timeout=timeout),
+        ttl_s=_ARTICLE_TTL_S,
+        force_refresh=force_refresh,
+    )
+
+
 def _normalize_terms(terms: List[str]) -> List[str]:
     out: List[str] = []
     seen = set()
@@ -287,7 +342,7 @@ def web_search(
         content = ""
         if link:
             try:
-                content = _fetch_and_extract(link, timeout=10)
+                content = _fetch_and_extract_cached(link, timeout=10, force_refresh=force_refresh)
             except Exception:
                 content = ""
 
@@ -376,7 +431,7 @@ def _news_search(
 
         # Must successfully load + extract, and content must match relevance terms (if provided).
         try:
-            content = _fetch_and_extract(link, timeout=10)
+            content = _fetch_and_extract_cached(link, timeout=10, force_refresh=force_refresh)
         except Exception:
             continue
         if not _content_is_relevant(content, required_terms=required_terms):
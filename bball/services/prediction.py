@@ -26,6 +26,7 @@ Usage:
 import os
 import pickle
 import json
+import threading
 from datetime import datetime, date
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Optional, Any, TYPE_CHECKING
@@ -40,7 +41,7 @@ from bball.data import GamesRepository, ClassifierConfigRepository, PointsConfig
 from bball.market.kalshi import get_team_abbrev_map
 from sportscore.services.base_prediction import BasePredictionContext, BasePredictionService
 from sportscore.services.betting_report import prob_to_american_odds
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 import time
 
 if TYPE_CHECKING:
@@ -317,8 +318,16 @@ class PredictionService(BasePredictionService):
     - CLI (train.py predict mode)
 
     All prediction requests should go through this service.
+
+    A service instance is safe to share across threads (see
+    bball.services.prediction_registry): context creation is single-flight
+    and predictions are serialized, since cached models hold the active
+    prediction context.
     """
 
+    # Team-scoped contexts accumulate in long-lived services; keep the most recent
+    MAX_CACHED_CONTEXTS = 16
+
     def __init__(self, db=None, league: Optional["LeagueConfig"] = None):
         """
         Initialize PredictionService.
@@ -335,8 +344,11 @@ class PredictionService(BasePredictionService):
         self._games_repo = GamesRepository(self.db, league=league)
         self._classifier_config_repo = ClassifierConfigRepository(self.db, league=league)
         self._points_config_repo = PointsConfigRepository(self.db, league=league)
-        # Prediction context cache - avoids repeated data loading per season
-        self._context_cache: Dict[str, PredictionContext] = {}
+        # Prediction context cache - avoids repeated data loading per season (LRU)
+        self._context_cache: "OrderedDict[str, PredictionContext]" = OrderedDict()
+        self._context_lock = threading.Lock()
+        # Held while a cached model is bound to a context and predicting
+        self._predict_lock = threading.RLock()
         # Team abbreviation mapping (ESPN/Kalshi -> internal DB format)
         league_id = league.league_id if league else "nba"
         self._team_abbrev_map = get_team_abbrev_map(league_id)
@@ -375,19 +387,38 @@ class PredictionService(BasePredictionService):
             PredictionContext with preloaded data for the season
         """
         cache_key = f"{season}|{'_'.join(sorted(teams))}" if teams else season
-        if cache_key not in self._context_cache:
-            self._context_cache[cache_key] = PredictionContext(
-                db=self.db,
-                season=season,
-                include_previous_season=True,
-                league=self.league,
-                teams=teams,
-            )
-        return self._context_cache[cache_key]
+        with self._context_lock:
+            context = self._context_cache.get(cache_key)
+            if context is not None:
+                self._context_cache.move_to_end(cache_key)
+                return context
+
+        # Preload outside the lock so other seasons/teams keep being served;
+        # if two requests build the same context, the first one stored wins
+        context = PredictionContext(
+            db=self.db,
+            season=season,
+            include_previous_season=True,
+            league=self.league,
+            teams=teams,
+        )
+        with self._context_lock:
+            context = self._context_cache.setdefault(cache_key, context)
+            self._context_cache.move_to_end(cache_key)
+            while len(self._context_cache) > self.MAX_CACHED_CONTEXTS:
+                self._context_cache.popitem(last=False)
+            return context
 
     def clear_context_cache(self):
         """Clear the prediction context cache. Call this to free memory."""
-        self._context_cache.clear()
+        with self._context_lock:
+            self._context_cache.clear()
+
+    def clear_model_cache(self):
+        """Drop cached classifier and points models (e.g. after the selected config changes)."""
+        with self._predict_lock:
+            self._model_cache.clear()
+            self._points_model_cache.clear()
 
     # =========================================================================
     # PUBLIC API
@@ -487,17 +518,10 @@ class PredictionService(BasePredictionService):
         # Get or create prediction context for this season (preloads data once).
         # If a full-season context already exists (e.g., from predict_date batch),
         # reuse it. Otherwise, create a team-scoped context for faster single-game loads.
-        if season in self._context_cache:
-            context = self._context_cache[season]
-        else:
+        context = self._context_cache.get(season)
+        if context is None:
             context = self._get_or_create_context(season, teams=[home_team, away_team])
 
-        # Load classifier model with preloaded context
-        model = self._load_classifier_model(classifier_config, context)
-        if not model:
-            return self._error_result(home_team, away_team, game_date, game_id,
-                                      'Failed to load classifier model.')
-
         # Build player filters from rosters (single source of truth)
         player_filters = build_player_lists_for_prediction(
             home_team=home_team,
@@ -507,6 +531,43 @@ class PredictionService(BasePredictionService):
             league=self.league
         )
 
+        # Get venue_guid for travel feature calculations
+        # Prefer explicitly passed venue_guid (from predict_date matchup),
+        # fall back to game_doc (from DB — set by web app or ESPN sync)
+        if not venue_guid and game_doc:
+            venue_guid = game_doc.get('venue_guid')
+
+        # Cached models are shared: bind the context and predict under the lock
+        with self._predict_lock:
+            return self._predict_with_models(
+                home_team, away_team, game_date, game_date_obj, season, game_id, game_doc,
+                include_points, classifier_config, points_config, venue_guid,
+                context, player_filters,
+            )
+
+    def _predict_with_models(
+        self,
+        home_team: str,
+        away_team: str,
+        game_date: str,
+        game_date_obj,
+        season: str,
+        game_id: Optional[str],
+        game_doc: Optional[Dict],
+        include_points: bool,
+        classifier_config: Dict,
+        points_config: Optional[Dict],
+        venue_guid: Optional[str],
+        context: PredictionContext,
+        player_filters: Dict,
+    ) -> PredictionResult:
+        """Model part of predict_matchup; runs under _predict_lock."""
+        # Load classifier model with preloaded context
+        model = self._load_classifier_model(classifier_config, context)
+        if not model:
+            return self._error_result(home_team, away_team, game_date, game_id,
+                                      'Failed to load classifier model.')
+
         # Get points prediction if enabled
         additional_features = {}
         points_prediction = None
@@ -525,12 +586,6 @@ class PredictionService(BasePredictionService):
                     if pred_margin is not None:
                         additional_features['pred_margin'] = pred_margin
 
-        # Get venue_guid for travel feature calculations
-        # Prefer explicitly passed venue_guid (from predict_date matchup),
-        # fall back to game_doc (from DB — set by web app or ESPN sync)
-        if not venue_guid and game_doc:
-            venue_guid = game_doc.get('venue_guid')
-
         # Make classifier prediction
         try:
             use_calibrated = classifier_config.get('use_time_calibration', False)
@@ -618,10 +673,11 @@ class PredictionService(BasePredictionService):
         context = self._get_or_create_context(season)
 
         # OPTIMIZATION: Pre-load models once with context (they will be cached for subsequent calls)
-        if classifier_config:
-            self._load_classifier_model(classifier_config, context)
-        if include_points and points_config:
-            self._load_points_model(points_config)
+        with self._predict_lock:
+            if classifier_config:
+                self._load_classifier_model(classifier_config, context)
+            if include_points and points_config:
+                self._load_points_model(points_config)
 
         # Update progress: starting predictions
         if job_id:
@@ -657,8 +713,30 @@ class PredictionService(BasePredictionService):
                 msg = f'Predicted {i + 1}/{total_games}: {matchup.away_team} @ {matchup.home_team}'
                 update_job_progress(job_id, progress, msg, league=self.league)
 
+        # Predictions are persisted by on_prediction; materialize the compact
+        # chat baselines from them so matchup chat sessions warm-start.
+        if on_prediction:
+            self.materialize_chat_baselines(game_date)
+
         return results
 
+    def materialize_chat_baselines(self, game_date: str) -> int:
+        """
+        Write matchup chat baseline docs for all stored predictions on a date.
+
+        Best-effort; returns the number of baselines written (0 on failure).
+        """
+        from bball.services.matchup_chat.prediction_bootstrap import materialize_chat_baselines
+
+        league_id = self.league.league_id if self.league else "nba"
+        try:
+            return materialize_chat_baselines(
+                db=self.db, league=self.league, game_date=game_date, league_id=league_id
+            )
+        except Exception as e:
+            print(f"Error materializing chat baselines for {game_date}: {e}")
+            return 0
+
     def get_selected_configs(self) -> Dict[str, Optional[Dict]]:
         """
         Get currently selected classifier and points configs.
@@ -727,9 +805,9 @@ class PredictionService(BasePredictionService):
                 include_per_features=True,
                 include_injuries=False,
                 preload_data=False,
-                league=self.league
+                league=self.league,
+                db=self.db
             )
-            model.db = self.db
 
             # Load model using ArtifactLoader (prioritizes artifacts, uses cache)
             classifier, scaler, feature_names = ArtifactLoader.create_model(config, use_artifacts=True)
@@ -791,9 +869,9 @@ class PredictionService(BasePredictionService):
                 include_per_features=True,
                 include_injuries=False,
                 preload_data=False,
-                league=self.league
+                league=self.league,
+                db=self.db
             )
-            model.db = self.db
 
             # Mark as ensemble
             model.is_ensemble = True
@@ -1273,6 +1351,17 @@ class PredictionService(BasePredictionService):
             upsert=True
         )
 
+        # Keep the matchup chat baseline (if materialized) in step with this prediction
+        from bball.services.matchup_chat.prediction_bootstrap import refresh_chat_baseline
+        try:
+            refresh_chat_baseline(
+                db=self.db,
+                prediction_doc=prediction_doc,
+                league_id=self.league.league_id if self.league else "nba",
+            )
+        except Exception as e:
+            print(f"Error refreshing chat baseline for {game_id}: {e}")
+
         return prediction_doc
 
     def get_predictions_for_date(self, game_date: str) -> Dict[str, Dict]:
@@ -0,0 +1,203 @@
+"""
+Prediction Service Registry
+
+Process-wide, long-lived PredictionService per league, so web endpoints and
+chat tools reuse warm PredictionContexts and deserialized models instead of
+rebuilding them on every request.
+
+Shared services are kept honest by two cheap, rate-limited checks on access:
+- Selected config: the selected classifier / points configs are fingerprinted;
+  when the selection (or its artifacts) changes, cached models are dropped.
+- Data: completed games and player stat rows for the current season are
+  counted; when either changes (e.g. a sync finished), cached contexts are
+  dropped and the next prediction preloads fresh data.
+
+Usage:
+    from bball.services.prediction_registry import get_prediction_service
+
+    service = get_prediction_service(db, league)
+    result = service.predict_matchup(home_team='LAL', away_team='BOS', game_date='2025-01-15')
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from datetime import date
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between selected-config checks per league
+CONFIG_CHECK_SECONDS = 5
+# Minimum seconds between data-version checks per league
+DATA_CHECK_SECONDS = 60
+
+
+def _config_token(config: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Fingerprint of the fields that decide which model artifacts get loaded."""
+    if not config:
+        return None
+    fields = {
+        k: config.get(k)
+        for k in ("_id", "model_artifact_path", "model_path", "ensemble_run_id", "config_hash",
+                  "trained_at", "updated_at")
+    }
+    return hashlib.md5(json.dumps(fields, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("service", "config_token", "data_token", "config_checked_at", "data_checked_at", "lock")
+
+    def __init__(self, service):
+        self.service = service
+        self.config_token = None
+        self.data_token = None
+        self.config_checked_at = 0.0
+        self.data_checked_at = 0.0
+        self.lock = threading.Lock()
+
+
+class PredictionServiceRegistry:
+    """Thread-safe registry of shared PredictionService instances, keyed by league."""
+
+    def __init__(
+        self,
+        config_check_seconds: float = CONFIG_CHECK_SECONDS,
+        data_check_seconds: float = DATA_CHECK_SECONDS,
+    ):
+        self.config_check_seconds = config_check_seconds
+        self.data_check_seconds = data_check_seconds
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, db, league=None):
+        """Shared PredictionService for (database, league), validated against config/data changes."""
+        key = self._key(db, league)
+        entry = self._entries.get(key)
+        if entry is None:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    from bball.services.prediction import PredictionService
+                    entry = _Entry(PredictionService(db=db, league=league))
+                    self._entries[key] = entry
+
+        self._validate(entry)
+        return entry.service
+
+    def invalidate(self, league_id: Optional[str] = None) -> None:
+        """Drop shared services (all, or those for one league)."""
+        with self._lock:
+            for key in list(self._entries):
+                if league_id is None or key[1] == league_id:
+                    del self._entries[key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Cached contexts and models per (database, league)."""
+        out = {}
+        for (db_name, league_id), entry in list(self._entries.items()):
+            service = entry.service
+            out[f"{db_name}:{league_id}"] = {
+                "contexts": len(service._context_cache),
+                "models": len(service._model_cache),
+                "points_models": len(service._points_model_cache),
+            }
+        return out
+
+    # --- Internals ---
+
+    @staticmethod
+    def _key(db, league) -> Tuple[str, str]:
+        league_id = league.league_id if league is not None else "nba"
+        return getattr(db, "name", None) or str(id(db)), league_id
+
+    def _validate(self, entry: _Entry) -> None:
+        now = time.time()
+        config_due = now - entry.config_checked_at >= self.config_check_seconds
+        data_due = now - entry.data_checked_at >= self.data_check_seconds
+        if not (config_due or data_due):
+            return
+        # One request validates; concurrent ones keep using the current caches
+        if not entry.lock.acquire(blocking=False):
+            return
+        try:
+            service = entry.service
+            if config_due:
+                token = self._config_version(service)
+                if entry.config_token is not None and token != entry.config_token:
+                    logger.info("[PredictionServiceRegistry] Selected config changed; dropping cached models")
+                    service.clear_model_cache()
+                entry.config_token = token
+                entry.config_checked_at = now
+            if data_due:
+                token = self._data_version(service)
+                if entry.data_token is not None and token != entry.data_token:
+                    logger.info("[PredictionServiceRegistry] Game data changed; dropping cached contexts")
+                    service.clear_context_cache()
+                entry.data_token = token
+                entry.data_checked_at = now
+        except Exception as e:
+            # Keep serving the warm service; the check runs again next interval
+            logger.warning(f"[PredictionServiceRegistry] Validation failed: {e}")
+        finally:
+            entry.lock.release()
+
+    @staticmethod
+    def _config_version(service) -> Tuple[Optional[str], Optional[str]]:
+        return (
+            _config_token(service._get_selected_classifier_config()),
+            _config_token(service._get_selected_points_config()),
+        )
+
+    @staticmethod
+    def _updated_watermark(coll, season: str) -> Any:
+        # Counts miss in-place corrections; writers stamp updated_at on every upsert
+        doc = coll.find_one(
+            {"season": season, "updated_at": {"$exists": True}},
+            {"updated_at": 1},
+            sort=[("updated_at", -1)],
+        )
+        return doc.get("updated_at") if doc else None
+
+    @classmethod
+    def _data_version(cls, service) -> Tuple[str, int, Any, int, Any, int, Any]:
+        league = service.league
+        games_coll = league.collections["games"] if league is not None else "stats_nba"
+        player_stats_coll = league.collections["player_stats"] if league is not None else "stats_nba_players"
+        elo_coll = league.collections["elo_cache"] if league is not None else "nba_cached_elo_ratings"
+        season = service._get_season_from_date(date.today())
+        # Contexts preload Elo too: a full replay rewrites ratings without new games
+        checkpoint = service.db[f"{elo_coll}_checkpoint"].find_one({"_id": "elo_engine"}, {"updated_at": 1})
+        return (
+            season,
+            service.db[games_coll].count_documents({"season": season, "homeWon": {"$exists": True}}),
+            cls._updated_watermark(service.db[games_coll], season),
+            service.db[player_stats_coll].count_documents({"season": season}),
+            cls._updated_watermark(service.db[player_stats_coll], season),
+            service.db[elo_coll].count_documents({"season": season}),
+            checkpoint.get("updated_at") if checkpoint else None,
+        )
+
+
+_registry: Optional[PredictionServiceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_prediction_registry() -> PredictionServiceRegistry:
+    """Process-wide PredictionServiceRegistry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = PredictionServiceRegistry()
+    return _registry
+
+
+def get_prediction_service(db=None, league=None):
+    """Shared, warm PredictionService for a league (see PredictionServiceRegistry)."""
+    if db is None:
+        from bball.mongo import Mongo
+        db = Mongo().db
+    return get_prediction_registry().get(db, league)
@@ -0,0 +1,351 @@
+"""
+Result Cache
+
+Bounded, thread-safe LRU + TTL cache for fetched content (news articles,
+SERP results, tool outputs), with an optional shared second tier.
+
+- Entry count and approximate byte budget, least-recently-used eviction
+- Per-entry TTL, checked on read and pruned on eviction
+- Single-flight get_or_compute: concurrent misses for the same key run the
+  fetch once and share its result (or exception)
+- Optional second tier (MongoCacheTier / DiskCacheTier) so gunicorn workers
+  and processes share fetched content; L2 hits are promoted into memory
+- Hit / miss / eviction counters via stats()
+
+Usage:
+    from bball.services.result_cache import ResultCache, DiskCacheTier
+
+    cache = ResultCache(max_entries=512, max_bytes=64 * 1024 * 1024,
+                        tier=DiskCacheTier("/tmp/bball_cache"))
+    html = cache.get_or_compute(f"article:{url}", lambda: fetch(url), ttl_s=3600)
+    cache.stats()
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def approx_size(value: Any) -> int:
+    """Approximate in-memory size of a JSON-like value, in bytes."""
+    if isinstance(value, str):
+        return len(value)
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, dict):
+        return 64 + sum(approx_size(k) + approx_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return 56 + sum(approx_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+# =============================================================================
+# Second tiers
+# =============================================================================
+
+class CacheTier(ABC):
+    """Shared second-tier store. Implementations must be best-effort."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Return (value, expires_at) or None."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        """Store value until expires_at (epoch seconds)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove key if present."""
+
+
+class MongoCacheTier(CacheTier):
+    """
+    Mongo-backed tier: one document per key, expired by a TTL index.
+
+    expires_at is stored as a datetime so Mongo's TTL monitor can prune it.
+    """
+
+    def __init__(self, db, collection_name: str = "result_cache"):
+        self.coll = db[collection_name]
+        try:
+            self.coll.create_index([("expires_at", 1)], expireAfterSeconds=0, name="expires_at_ttl")
+        except Exception:
+            # Cache still works best-effort without the TTL index
+            pass
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        doc = self.coll.find_one({"_id": key})
+        if not doc:
+            return None
+        expires_at = doc.get("expires_at")
+        if isinstance(expires_at, datetime):
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            expires_at = expires_at.timestamp()
+        return doc.get("value"), float(expires_at or 0)
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        self.coll.replace_one(
+            {"_id": key},
+            {
+                "_id": key,
+                "value": value,
+                "expires_at": datetime.fromtimestamp(expires_at, tz=timezone.utc),
+            },
+            upsert=True,
+        )
+
+    def delete(self, key: str) -> None:
+        self.coll.delete_one({"_id": key})
+
+
+class DiskCacheTier(CacheTier):
+    """Disk-backed tier: one JSON file per key (md5 of the key), written atomically."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.md5(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if payload.get("key") != key:
+            return None
+        return payload.get("value"), float(payload.get("expires_at") or 0)
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "value": value, "expires_at": expires_at}, f, default=str)
+            os.replace(tmp_path, self._path(key))
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+
+# =============================================================================
+# In-memory cache
+# =============================================================================
+
+class _Flight:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class ResultCache:
+    """Bounded LRU + TTL cache with single-flight fills and an optional second tier."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl_s: float = 60 * 60,
+        tier: Optional[CacheTier] = None,
+    ):
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+        self.default_ttl_s = default_ttl_s
+        self.tier = tier
+        # key -> (value, expires_at, size); most recently used last
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._inflight: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "tier_hits": 0,
+            "evictions": 0,
+            "expirations": 0,
+            "coalesced": 0,
+            "tier_errors": 0,
+        }
+
+    # --- Public API ---
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Cached value for key (memory, then second tier), or default."""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any, ttl_s: Optional[float] = None) -> None:
+        """Store value in memory and write it through to the second tier."""
+        ttl = self.default_ttl_s if ttl_s is None else ttl_s
+        expires_at = time.time() + ttl
+        self._store(key, value, expires_at)
+        if self.tier is not None:
+            try:
+                self.tier.set(key, value, expires_at)
+            except Exception as e:
+                self._count("tier_errors")
+                logger.debug(f"Cache tier write failed for {key}: {e}")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[2]
+        if self.tier is not None:
+            try:
+                self.tier.delete(key)
+            except Exception:
+                self._count("tier_errors")
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        *,
+        ttl_s: Optional[float] = None,
+        force_refresh: bool = False,
+    ) -> Any:
+        """
+        Cached value for key, computing and storing it on a miss.
+
+        Concurrent callers missing on the same key wait for a single compute()
+        and share its result. Exceptions propagate to every waiter and are not
+        cached.
+        """
+        if not force_refresh:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                return value
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+            else:
+                self._counters["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = compute()
+            self.set(key, flight.value, ttl_s)
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def clear(self) -> None:
+        """Drop all in-memory entries (the second tier is left alone)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counters plus current entry count and byte usage."""
+        with self._lock:
+            out = dict(self._counters)
+            out["entries"] = len(self._entries)
+            out["bytes"] = self._bytes
+        return out
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # --- Internals ---
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _lookup(self, key: str) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[1] > now:
+                    self._entries.move_to_end(key)
+                    self._counters["hits"] += 1
+                    return entry[0]
+                del self._entries[key]
+                self._bytes -= entry[2]
+                self._counters["expirations"] += 1
+
+        if self.tier is not None:
+            try:
+                found = self.tier.get(key)
+            except Exception as e:
+                self._count("tier_errors")
+                logger.debug(f"Cache tier read failed for {key}: {e}")
+                found = None
+            if found is not None and found[1] > now:
+                self._store(key, found[0], found[1])
+                self._count("tier_hits")
+                return found[0]
+
+        self._count("misses")
+        return _MISSING
+
+    def _store(self, key: str, value: Any, expires_at: float) -> None:
+        size = approx_size(value)
+        if size > self.max_bytes:
+            return  # Would evict everything else; serve it uncached
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._entries[key] = (value, expires_at, size)
+            self._bytes += size
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        if len(self._entries) <= self.max_entries and self._bytes <= self.max_bytes:
+            return
+        # Expired entries go first, then least recently used
+        now = time.time()
+        for key in [k for k, e in self._entries.items() if e[1] <= now]:
+            self._bytes -= self._entries.pop(key)[2]
+            self._counters["expirations"] += 1
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry[2]
+            self._counters["evictions"] += 1
@@ -308,7 +308,8 @@ class TrainingDataService:
 
         # Check if master CSV exists
         if os.path.exists(self.master_path):
-            master_df = pd.read_csv(self.master_path)
+            from bball.training.master_store import ensure_master_csv
+            master_df = pd.read_csv(ensure_master_csv(self.master_path))
 
             # Calculate season for each row to filter out regenerated seasons
             def get_season_from_row(row):
@@ -545,8 +546,9 @@ class TrainingDataService:
                 os.remove(temp_csv)
             return 0, self.master_path
 
-        # Read and merge
-        master_df = pd.read_csv(self.master_path)
+        # Read and merge (columns only in the master column store are exported first)
+        from bball.training.master_store import ensure_master_csv
+        master_df = pd.read_csv(ensure_master_csv(self.master_path))
         new_df = pd.read_csv(clf_csv)
 
         # Align columns
@@ -598,7 +600,8 @@ class TrainingDataService:
         if not os.path.exists(self.master_path):
             raise FileNotFoundError(f"Master training CSV not found: {self.master_path}")
 
-        df = pd.read_csv(self.master_path)
+        from bball.training.master_store import ensure_master_csv
+        df = pd.read_csv(ensure_master_csv(self.master_path))
 
         # Meta columns that should always be included
         meta_cols = ['Year', 'Month', 'Day', 'Home', 'Away', 'HomeWon', 'game_id']
@@ -657,7 +660,8 @@ class TrainingDataService:
         if not os.path.exists(self.master_path):
             raise FileNotFoundError(f"Master training CSV not found: {self.master_path}")
 
-        df = pd.read_csv(self.master_path)
+        from bball.training.master_store import ensure_master_csv
+        df = pd.read_csv(ensure_master_csv(self.master_path))
 
         # Filter by begin_year if provided
         if begin_year is not None:
@@ -761,11 +765,11 @@ class TrainingDataService:
         Returns:
             Tuple of (needs_regeneration: bool, missing_features: List[str])
         """
-        # Check actual CSV header first
+        # Check actual master columns first (column store manifest, else CSV header)
         try:
             if os.path.exists(self.master_path):
-                header_df = pd.read_csv(self.master_path, nrows=0)
-                master_cols = set(header_df.columns)
+                from bball.training.master_store import master_columns
+                master_cols = set(master_columns(self.master_path))
                 requested_set = set(requested_features or [])
 
                 missing = list(requested_set - master_cols)
@@ -803,6 +807,8 @@ class TrainingDataService:
             raise FileNotFoundError(f"Master training CSV not found: {master_path}")
 
         print(f"Reading existing master CSV: {master_path}")
+        from bball.training.master_store import ensure_master_csv
+        ensure_master_csv(master_path)
 
         # Read CSV with error handling
         try:
@@ -2,7 +2,8 @@
 Elo Rating Cache — thin wrapper around sportscore's EloCache.
 
 Auto-injects basketball's GamesRepository so callers don't need to
-pass games_repo explicitly.  All Elo logic lives in sportscore.
+pass games_repo explicitly.  All Elo logic lives in sportscore, except the
+checkpointed incremental refresh (bball.stats.elo_engine).
 """
 
 from typing import Optional
@@ -19,6 +20,21 @@ class EloCache(_BaseEloCache):
         if "games_repo" not in kwargs:
             kwargs["games_repo"] = GamesRepository(db, league=league)
         super().__init__(db, league=league, **kwargs)
+        self._engine_db = db
+        self._engine_league = league
+
+    def compute_and_cache_incremental(self, full: bool = False) -> dict:
+        """
+        Refresh cached ratings, replaying only games after the last checkpoint.
+
+        Args:
+            full: Ignore the checkpoint and replay every game
+
+        Returns:
+            Dict with games_processed, ratings_cached, last_date, full
+        """
+        from bball.stats.elo_engine import update_elo_cache
+        return update_elo_cache(self._engine_db, league=self._engine_league, full=full)
 
 
 def get_elo_cache(db: Database = None) -> EloCache:
@@ -0,0 +1,403 @@
+"""
+Elo Engine — one-pass Elo replay over integer-coded team arrays.
+
+Shared by BballModel (in-memory elo_history for training) and the Elo cache
+refresh in the pipelines. Teams are mapped to integer indices and ratings
+live in a numpy array. Games are replayed in (date, season) groups: within a
+day every team plays at most once, so a whole day's updates are applied with
+vectorized numpy indexing. Days where a team appears twice are replayed one
+game at a time, so results always match a sequential replay.
+
+The engine state (ratings, games played this season, last processed date) is
+a checkpoint: update_elo_cache() persists it next to the Elo cache, so
+nightly runs only replay games after the checkpoint and write their pre-game
+ratings with a single bulk_upsert_elos call. The checkpoint is kept
+REPLAY_TAIL_DAYS behind the newest game, so games synced late for recent
+dates are picked up by the next run.
+
+Usage:
+    from bball.stats.elo_engine import EloEngine, EloParams
+
+    engine = EloEngine(EloParams.from_league(league))
+    replay = engine.replay(games)
+    replay.history()      # {(team, date, season): pre-game elo}
+    replay.records()      # [{team, game_date, season, elo}, ...]
+"""
+
+import hashlib
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class EloParams:
+    """Elo update parameters (see the `elo:` block of the league YAML)."""
+    starting_rating: float = 1500.0
+    home_advantage: float = 100.0
+    # Fixed K, used when k_schedule is empty
+    k: float = 20.0
+    # Dynamic K: ((max_games, k), ...) by team games played this season;
+    # max_games None is the default. A game uses the mean of both teams' K.
+    k_schedule: Tuple[Tuple[Optional[int], float], ...] = ()
+    # Regress ratings toward carryover_mean by this factor at each new season
+    # (None: ratings carry over unchanged)
+    carryover_alpha: Optional[float] = None
+    carryover_mean: float = 1500.0
+    # Home advantage at neutral sites (None: same as home_advantage)
+    neutral_home_advantage: Optional[float] = None
+    # ((game_type, home_advantage), ...)
+    home_advantage_overrides: Tuple[Tuple[str, float], ...] = ()
+
+    @classmethod
+    def from_league(cls, league) -> "EloParams":
+        """Params from the league config `elo:` block (defaults when missing)."""
+        raw = {}
+        if league is not None:
+            raw = (getattr(league, "raw", None) or {}).get("elo") or {}
+        if not raw:
+            return cls()
+
+        k_schedule: List[Tuple[Optional[int], float]] = []
+        if raw.get("strategy", "dynamic") == "dynamic":
+            for entry in raw.get("k_schedule") or []:
+                if "default" in entry:
+                    k_schedule.append((None, float(entry["default"])))
+                else:
+                    k_schedule.append((int(entry["max_games"]), float(entry["k"])))
+
+        carryover = raw.get("carryover") or {}
+        neutral = raw.get("neutral_site") or {}
+        return cls(
+            starting_rating=float(raw.get("starting_rating", 1500)),
+            home_advantage=float(raw.get("home_advantage", 100)),
+            k=float(raw.get("k", 20)),
+            k_schedule=tuple(k_schedule),
+            carryover_alpha=float(carryover.get("alpha", 1.0)) if carryover.get("enabled") else None,
+            carryover_mean=float(carryover.get("mean_rating", raw.get("starting_rating", 1500))),
+            neutral_home_advantage=(
+                float(neutral["home_advantage"]) if "home_advantage" in neutral else None
+            ),
+            home_advantage_overrides=tuple(
+                (str(k), float(v)) for k, v in (raw.get("home_advantage_overrides") or {}).items()
+            ),
+        )
+
+    def home_advantage_override(self, game: Dict[str, Any]) -> Optional[float]:
+        """Neutral-site or game-type home advantage for a game, if one applies."""
+        if game.get("neutralSite") and self.neutral_home_advantage is not None:
+            return self.neutral_home_advantage
+        game_type = game.get("game_type")
+        for override_type, value in self.home_advantage_overrides:
+            if game_type == override_type:
+                return value
+        return None
+
+    def home_advantage_for(self, game: Dict[str, Any]) -> float:
+        override = self.home_advantage_override(game)
+        return self.home_advantage if override is None else override
+
+    def fingerprint(self) -> str:
+        """md5 of the params; checkpoints built with other params are discarded."""
+        return hashlib.md5(repr(sorted(asdict(self).items())).encode()).hexdigest()
+
+    def k_for_games_played(self, games_played: np.ndarray) -> np.ndarray:
+        """K per team given games already played this season."""
+        if not self.k_schedule:
+            return np.full(games_played.shape, self.k, dtype=float)
+        k = np.full(games_played.shape, np.nan, dtype=float)
+        default = self.k
+        for max_games, value in self.k_schedule:
+            if max_games is None:
+                default = value
+                continue
+            k = np.where(np.isnan(k) & (games_played < max_games), value, k)
+        return np.where(np.isnan(k), default, k)
+
+
+@dataclass
+class EloState:
+    """Checkpoint of the engine after the last processed date."""
+    teams: List[str] = field(default_factory=list)
+    ratings: List[float] = field(default_factory=list)
+    season_games: List[int] = field(default_factory=list)
+    season: str = ""
+    last_date: str = ""
+
+    def to_doc(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_doc(cls, doc: Dict[str, Any]) -> "EloState":
+        return cls(
+            teams=list(doc.get("teams") or []),
+            ratings=[float(r) for r in doc.get("ratings") or []],
+            season_games=[int(n) for n in doc.get("season_games") or []],
+            season=doc.get("season") or "",
+            last_date=doc.get("last_date") or "",
+        )
+
+
+class EloReplay:
+    """Pre-game ratings for the games processed by one EloEngine.replay call."""
+
+    def __init__(self, teams: List[str], home_idx, away_idx, dates, seasons, home_pre, away_pre):
+        self._teams = teams
+        self.home_idx = home_idx
+        self.away_idx = away_idx
+        self.dates = dates
+        self.seasons = seasons
+        self.home_pre = home_pre
+        self.away_pre = away_pre
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def history(self) -> Dict[Tuple[str, str, str], float]:
+        """{(team, date, season): pre-game elo}; later games win on duplicate keys."""
+        out: Dict[Tuple[str, str, str], float] = {}
+        teams = self._teams
+        for h, a, d, s, hp, ap in zip(self.home_idx.tolist(), self.away_idx.tolist(), self.dates,
+                                      self.seasons, self.home_pre.tolist(), self.away_pre.tolist()):
+            out[(teams[h], d, s)] = hp
+            out[(teams[a], d, s)] = ap
+        return out
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Records for EloRatingsCache.bulk_upsert_elos (one per team-game)."""
+        return [
+            {"team": team, "game_date": d, "season": s, "elo": elo}
+            for (team, d, s), elo in self.history().items()
+        ]
+
+
+def completed_games(games: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Games with season, date, teams and result, in replay (date) order."""
+    rows = [
+        g for g in games
+        if g.get("season") and "date" in g and "homeWon" in g and "homeTeam" in g and "awayTeam" in g
+    ]
+    # Stable sort: same-date games keep input order, like a sequential replay
+    rows.sort(key=lambda g: g.get("date", ""))
+    return rows
+
+
+def day_batches(dates: List[str], seasons: List[str]) -> Iterator[Tuple[int, int]]:
+    """(start, end) slices of consecutive games sharing a date and season."""
+    n = len(dates)
+    start = 0
+    while start < n:
+        end = start + 1
+        while end < n and dates[end] == dates[start] and seasons[end] == seasons[start]:
+            end += 1
+        yield start, end
+        start = end
+
+
+class EloEngine:
+    """One-pass Elo replay with a resumable state."""
+
+    def __init__(self, params: Optional[EloParams] = None, state: Optional[EloState] = None):
+        self.params = params or EloParams()
+        state = state or EloState()
+        self._teams: List[str] = list(state.teams)
+        self._index: Dict[str, int] = {t: i for i, t in enumerate(self._teams)}
+        self._ratings = np.array(state.ratings, dtype=float)
+        self._season_games = np.array(state.season_games, dtype=np.int64)
+        self.season = state.season
+        self.last_date = state.last_date
+
+    # --- State ---
+
+    def state(self) -> EloState:
+        return EloState(
+            teams=list(self._teams),
+            ratings=self._ratings.tolist(),
+            season_games=self._season_games.tolist(),
+            season=self.season,
+            last_date=self.last_date,
+        )
+
+    def ratings(self) -> Dict[str, float]:
+        """Current rating per team."""
+        return dict(zip(self._teams, self._ratings.tolist()))
+
+    def _team_index(self, team: str) -> int:
+        idx = self._index.get(team)
+        if idx is None:
+            idx = len(self._teams)
+            self._index[team] = idx
+            self._teams.append(team)
+        return idx
+
+    def _grow(self) -> None:
+        missing = len(self._teams) - len(self._ratings)
+        if missing > 0:
+            self._ratings = np.concatenate([self._ratings, np.full(missing, self.params.starting_rating)])
+            self._season_games = np.concatenate([self._season_games, np.zeros(missing, dtype=np.int64)])
+
+    def _start_season(self, season: str) -> None:
+        if self.season and self.params.carryover_alpha is not None:
+            mean = self.params.carryover_mean
+            self._ratings = mean + self.params.carryover_alpha * (self._ratings - mean)
+        self._season_games[:] = 0
+        self.season = season
+
+    # --- Replay ---
+
+    def replay(self, games: List[Dict[str, Any]]) -> EloReplay:
+        """
+        Replay completed games (homeWon set) in date order, updating the state.
+
+        Games without season, teams, date or result are skipped. Returns the
+        pre-game ratings of every processed game.
+        """
+        rows = completed_games(games)
+        n = len(rows)
+        home_idx = np.fromiter((self._team_index(g["homeTeam"]["name"]) for g in rows), dtype=np.int64, count=n)
+        away_idx = np.fromiter((self._team_index(g["awayTeam"]["name"]) for g in rows), dtype=np.int64, count=n)
+        home_won = np.fromiter((1.0 if g["homeWon"] else 0.0 for g in rows), dtype=float, count=n)
+        home_adv = np.fromiter((self.params.home_advantage_for(g) for g in rows), dtype=float, count=n)
+        dates = [g["date"] for g in rows]
+        seasons = [g["season"] for g in rows]
+        self._grow()
+
+        home_pre = np.empty(n, dtype=float)
+        away_pre = np.empty(n, dtype=float)
+
+        for start, end in day_batches(dates, seasons):
+            if seasons[start] != self.season:
+                self._start_season(seasons[start])
+            h = home_idx[start:end]
+            a = away_idx[start:end]
+            if len(np.unique(np.concatenate([h, a]))) == 2 * (end - start):
+                self._apply(h, a, home_won[start:end], home_adv[start:end],
+                            home_pre[start:end], away_pre[start:end])
+            else:
+                for i in range(start, end):
+                    self._apply(home_idx[i:i + 1], away_idx[i:i + 1], home_won[i:i + 1], home_adv[i:i + 1],
+                                home_pre[i:i + 1], away_pre[i:i + 1])
+            self.last_date = max(self.last_date, dates[start])
+
+        return EloReplay(self._teams, home_idx, away_idx, dates, seasons, home_pre, away_pre)
+
+    def _apply(self, h, a, won, adv, home_pre_out, away_pre_out) -> None:
+        """Apply one batch of games whose teams are all distinct."""
+        rh = self._ratings[h]
+        ra = self._ratings[a]
+        home_pre_out[:] = rh
+        away_pre_out[:] = ra
+        expected_home = 1 / (1 + 10 ** ((ra - (rh + adv)) / 400))
+        if self.params.k_schedule:
+            k = (self.params.k_for_games_played(self._season_games[h]) +
+                 self.params.k_for_games_played(self._season_games[a])) / 2
+        else:
+            k = self.params.k
+        change = k * (won - expected_home)
+        self._ratings[h] = rh + change
+        self._ratings[a] = ra - change
+        self._season_games[h] += 1
+        self._season_games[a] += 1
+
+
+# =============================================================================
+# Cache refresh with checkpoint
+# =============================================================================
+
+# Games without a result this many days back still count as "in progress"
+PENDING_LOOKBACK_DAYS = 3
+
+# The checkpoint stays this many days behind the newest replayed game; those
+# days are replayed again on the next run (espn_sync only stores finished
+# games, so a late game on a recent date appears after the run that covered it)
+REPLAY_TAIL_DAYS = PENDING_LOOKBACK_DAYS
+
+
+def _checkpoint_collection(db, league):
+    elo_coll = league.collections["elo_cache"] if league is not None else "nba_cached_elo_ratings"
+    return db[f"{elo_coll}_checkpoint"]
+
+
+def load_elo_games(db, league=None, after_date: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Games that feed Elo (excluded game types removed), only the fields the engine reads."""
+    from bball.data import GamesRepository
+
+    query: Dict[str, Any] = {
+        "season": {"$exists": True, "$ne": None},
+        "game_type": {"$nin": league.exclude_game_types if league is not None else ["preseason", "allstar"]},
+    }
+    if after_date:
+        query["date"] = {"$gt": after_date}
+    return GamesRepository(db, league=league).find(
+        query,
+        projection={"_id": 0, "date": 1, "season": 1, "homeTeam.name": 1, "awayTeam.name": 1,
+                    "homeWon": 1, "neutralSite": 1, "game_type": 1},
+    )
+
+
+def update_elo_cache(db, league=None, full: bool = False) -> Dict[str, Any]:
+    """
+    Bring the Elo cache up to date, replaying only games after the checkpoint.
+
+    The checkpoint stores the engine state REPLAY_TAIL_DAYS before the newest
+    replayed game, and each run replays everything after it, so games synced
+    late for those days are rated. Dates with games still missing a result
+    are left for the next run. A full replay happens when there is no
+    checkpoint, the Elo params changed, or full=True.
+
+    Returns:
+        Dict with games_processed, ratings_cached, last_date, full
+    """
+    from bball.data.cache import EloRatingsCache
+
+    params = EloParams.from_league(league)
+    checkpoints = _checkpoint_collection(db, league)
+    checkpoint = None if full else checkpoints.find_one({"_id": "elo_engine"})
+    if checkpoint and checkpoint.get("params") != params.fingerprint():
+        checkpoint = None
+    state = EloState.from_doc(checkpoint["state"]) if checkpoint else None
+
+    games = load_elo_games(db, league, after_date=state.last_date if state else None)
+
+    # Stop before the first recent date that still has unfinished games, so the
+    # checkpoint never moves past a partially played day. (Older games without
+    # a result are postponed/cancelled and are skipped, as in a full replay.)
+    recent = (date.today() - timedelta(days=PENDING_LOOKBACK_DAYS)).isoformat()
+    pending = [g["date"] for g in games if "homeWon" not in g and g.get("date", "") >= recent]
+    if pending:
+        cutoff = min(pending)
+        games = [g for g in games if g.get("date", "") < cutoff]
+
+    # Replay up to the tail, checkpoint there, then replay the tail
+    games = completed_games(games)
+    tail_start = ""
+    if games:
+        newest = datetime.strptime(games[-1]["date"][:10], "%Y-%m-%d").date()
+        tail_start = (newest - timedelta(days=REPLAY_TAIL_DAYS - 1)).isoformat()
+    engine = EloEngine(params, state)
+    head = engine.replay([g for g in games if g["date"] < tail_start])
+    checkpoint_state = engine.state()
+    tail = engine.replay([g for g in games if g["date"] >= tail_start])
+    records = head.records() + tail.records()
+    cached = EloRatingsCache(db, league=league).bulk_upsert_elos(records) if records else 0
+
+    if len(head):
+        checkpoints.replace_one(
+            {"_id": "elo_engine"},
+            {
+                "_id": "elo_engine",
+                "params": params.fingerprint(),
+                "state": checkpoint_state.to_doc(),
+                "updated_at": datetime.utcnow(),
+            },
+            upsert=True,
+        )
+
+    return {
+        "games_processed": len(head) + len(tail),
+        "ratings_cached": cached,
+        "last_date": engine.last_date,
+        "full": state is None,
+    }
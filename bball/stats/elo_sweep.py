@@ -0,0 +1,165 @@
+"""
+Elo Parameter Sweep — evaluate a grid of Elo parameters in one replay.
+
+Every (K, home advantage, season carryover) combination is a row of a
+(combos x teams) rating matrix, so one chronological pass over the games
+updates all combinations at once with numpy. Each combination is scored on
+its pre-game home win probabilities (log loss, Brier, accuracy), which makes
+picking Elo parameters a matter of seconds instead of a replay + retrain per
+candidate (see docs/elo-optimization.md).
+
+Games are replayed exactly as EloEngine does: same filtering and ordering,
+the same neutral-site / game-type home advantage overrides from the base
+params, and season carryover applied when the season changes.
+
+Usage:
+    from bball.stats.elo_engine import EloParams
+    from bball.stats.elo_sweep import sweep_elo_params
+
+    results = sweep_elo_params(
+        games,
+        k_values=[12, 16, 20, None],        # None = the base params' K rule
+        home_advantages=[40, 60, 80, 100],
+        carryover_alphas=[None, 0.75, 0.85],
+        base=EloParams.from_league(league),
+        eval_from_season="2015-2016",
+    )
+    results[0]  # best by log loss
+"""
+
+import itertools
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from bball.stats.elo_engine import EloParams, completed_games, day_batches
+
+# Default grid for the CLI / callers that don't pass one
+DEFAULT_K_VALUES = (12.0, 16.0, 20.0, 24.0, 28.0)
+DEFAULT_HOME_ADVANTAGES = (40.0, 60.0, 80.0, 100.0, 120.0)
+DEFAULT_CARRYOVER_ALPHAS = (None, 0.75, 0.85)
+
+_EPS = 1e-15
+
+
+def sweep_elo_params(
+    games: List[Dict[str, Any]],
+    k_values: Sequence[Optional[float]] = DEFAULT_K_VALUES,
+    home_advantages: Sequence[float] = DEFAULT_HOME_ADVANTAGES,
+    carryover_alphas: Sequence[Optional[float]] = DEFAULT_CARRYOVER_ALPHAS,
+    base: Optional[EloParams] = None,
+    eval_from_season: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Score every parameter combination over one chronological replay.
+
+    Args:
+        games: Game documents (season, date, homeTeam/awayTeam.name, homeWon)
+        k_values: Fixed K values; None uses base's K rule (k_schedule if set)
+        home_advantages: Regular home advantage values (overrides from base
+            still apply to neutral-site and overridden game types)
+        carryover_alphas: Season carryover factors; None = no regression
+        base: Params for starting rating, K schedule, carryover mean and
+            home advantage overrides (default EloParams())
+        eval_from_season: Only score games from this season on (earlier
+            seasons are warm-up)
+
+    Returns:
+        One dict per combination (k, home_advantage, carryover_alpha,
+        log_loss, brier, accuracy, games), sorted by log loss
+    """
+    base = base or EloParams()
+    grid = list(itertools.product(k_values, home_advantages, carryover_alphas))
+    if not grid:
+        return []
+    n_combos = len(grid)
+
+    rows = completed_games(games)
+    n = len(rows)
+    team_index: Dict[str, int] = {}
+    home_idx = np.fromiter((team_index.setdefault(g["homeTeam"]["name"], len(team_index)) for g in rows),
+                           dtype=np.int64, count=n)
+    away_idx = np.fromiter((team_index.setdefault(g["awayTeam"]["name"], len(team_index)) for g in rows),
+                           dtype=np.int64, count=n)
+    home_won = np.fromiter((1.0 if g["homeWon"] else 0.0 for g in rows), dtype=float, count=n)
+    # Fixed per-game home advantage (neutral site / game type), NaN = swept value
+    overrides = [base.home_advantage_override(g) for g in rows]
+    override = np.array([np.nan if v is None else v for v in overrides], dtype=float)
+    dates = [g["date"] for g in rows]
+    seasons = [g["season"] for g in rows]
+
+    # Per-combo parameters as column vectors (combos x 1)
+    uses_schedule = np.array([k is None for k, _, _ in grid])[:, None]
+    fixed_k = np.array([base.k if k is None else float(k) for k, _, _ in grid])[:, None]
+    home_adv = np.array([float(ha) for _, ha, _ in grid])[:, None]
+    has_carryover = np.array([a is not None for _, _, a in grid])[:, None]
+    alpha = np.array([1.0 if a is None else float(a) for _, _, a in grid])[:, None]
+
+    ratings = np.full((n_combos, len(team_index)), base.starting_rating, dtype=float)
+    # Games played doesn't depend on ratings, so one vector serves every combo
+    season_games = np.zeros(len(team_index), dtype=np.int64)
+
+    log_loss = np.zeros(n_combos)
+    brier = np.zeros(n_combos)
+    correct = np.zeros(n_combos)
+    scored = 0
+    season = ""
+
+    def apply(sl: slice, score: bool) -> None:
+        h = home_idx[sl]
+        a = away_idx[sl]
+        won = home_won[sl]
+        rh = ratings[:, h]
+        ra = ratings[:, a]
+        adv = np.where(np.isnan(override[sl]), home_adv, override[sl])
+        p_home = 1 / (1 + 10 ** ((ra - (rh + adv)) / 400))
+        if base.k_schedule and uses_schedule.any():
+            scheduled = (base.k_for_games_played(season_games[h]) +
+                         base.k_for_games_played(season_games[a])) / 2
+            k = np.where(uses_schedule, scheduled, fixed_k)
+        else:
+            k = fixed_k
+        change = k * (won - p_home)
+        ratings[:, h] = rh + change
+        ratings[:, a] = ra - change
+        season_games[h] += 1
+        season_games[a] += 1
+
+        if score:
+            p = np.clip(p_home, _EPS, 1 - _EPS)
+            log_loss[:] -= (won * np.log(p) + (1 - won) * np.log(1 - p)).sum(axis=1)
+            brier[:] += ((p_home - won) ** 2).sum(axis=1)
+            correct[:] += ((p_home > 0.5) == (won == 1.0)).sum(axis=1)
+
+    for start, end in day_batches(dates, seasons):
+        if seasons[start] != season:
+            if season:
+                mean = base.carryover_mean
+                ratings[:] = np.where(has_carryover, mean + alpha * (ratings - mean), ratings)
+            season_games[:] = 0
+            season = seasons[start]
+
+        score = eval_from_season is None or season >= eval_from_season
+        h = home_idx[start:end]
+        a = away_idx[start:end]
+        if len(np.unique(np.concatenate([h, a]))) == 2 * (end - start):
+            apply(slice(start, end), score)
+        else:
+            for i in range(start, end):
+                apply(slice(i, i + 1), score)
+        if score:
+            scored += end - start
+
+    results = []
+    for c, (k, ha, a) in enumerate(grid):
+        results.append({
+            "k": k,
+            "home_advantage": ha,
+            "carryover_alpha": a,
+            "log_loss": float(log_loss[c] / scored) if scored else None,
+            "brier": float(brier[c] / scored) if scored else None,
+            "accuracy": float(correct[c] / scored) if scored else None,
+            "games": scored,
+        })
+    results.sort(key=lambda r: float("inf") if r["log_loss"] is None else r["log_loss"])
+    return results
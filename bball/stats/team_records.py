@@ -0,0 +1,239 @@
+"""
+Team Records — materialized per (team, season) game results for W-L records.
+
+The game detail pages show overall / home / away / last-10 records for both
+teams. Instead of aggregating the games collection for every team on every
+render, each (team, season) keeps one document with its completed games as a
+date-sorted list of small entries:
+
+    {team, season, games: [{game_id, date, home, won, game_type, scored}, ...]}
+
+Records before any date are then one indexed lookup plus a short Python pass.
+Teams are stored under every identifier a game carries (the league's primary
+identifier and `name`), so lookups work the same way as the games queries.
+
+Entries are written incrementally as games are ingested (record_game, called
+from the ESPN sync). A season is served from the table once it has been fully
+built (rebuild_team_records, run on first read of a season); until then
+callers fall back to their aggregation.
+
+Usage:
+    from bball.stats.team_records import get_team_records
+
+    records = get_team_records(db, league, ['LAL', 'BOS'], '2024-2025', '2025-01-15')
+    records['LAL']['wins'], records['LAL']['last10_wins']
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+META_ID = "__meta__"
+DEFAULT_EXCLUDE_GAME_TYPES = ["preseason", "allstar"]
+
+_indexed = set()
+_indexed_lock = threading.Lock()
+
+
+def team_records_collection(db, league=None):
+    games_coll = league.collections["games"] if league is not None else "stats_nba"
+    coll = db[f"{games_coll}_team_records"]
+    key = (getattr(db, "name", None) or id(db), coll.name)
+    if key not in _indexed:
+        with _indexed_lock:
+            if key not in _indexed:
+                try:
+                    coll.create_index([("team", 1), ("season", 1)], unique=True)
+                except Exception as e:
+                    logger.warning(f"[team_records] Could not create index on {coll.name}: {e}")
+                _indexed.add(key)
+    return coll
+
+
+def _team_keys(side: Dict[str, Any], team_id_field: str) -> List[str]:
+    keys = []
+    for field in (team_id_field, "name"):
+        value = side.get(field)
+        if value not in (None, "") and str(value) not in keys:
+            keys.append(str(value))
+    return keys
+
+
+def _entries(game: Dict[str, Any], team_id_field: str) -> List[tuple]:
+    """(team_key, entry) pairs for a completed game; empty if it has no result."""
+    if "homeWon" not in game or not game.get("season") or not game.get("date"):
+        return []
+    home, away = game.get("homeTeam") or {}, game.get("awayTeam") or {}
+    home_won = bool(game["homeWon"])
+    scored = (home.get("points") or 0) > 0 and (away.get("points") or 0) > 0
+    out = []
+    for side, is_home in ((home, True), (away, False)):
+        entry = {
+            "game_id": str(game.get("game_id")),
+            "date": game["date"],
+            "home": is_home,
+            "won": home_won if is_home else not home_won,
+            "game_type": game.get("game_type"),
+            "scored": scored,
+        }
+        out.extend((key, entry) for key in _team_keys(side, team_id_field))
+    return out
+
+
+def record_game(db, league, game: Dict[str, Any]) -> int:
+    """
+    Add (or replace) one completed game in the team records.
+
+    Safe to call repeatedly for the same game; games without homeWon are ignored.
+
+    Returns:
+        Number of team documents updated
+    """
+    coll = team_records_collection(db, league)
+    team_id_field = league.team_primary_identifier if league is not None else "name"
+    updated = 0
+    for key, entry in _entries(game, team_id_field):
+        doc_filter = {"team": key, "season": game["season"]}
+        coll.update_one(doc_filter, {"$pull": {"games": {"game_id": entry["game_id"]}}})
+        coll.update_one(
+            doc_filter,
+            {"$push": {"games": {"$each": [entry], "$sort": {"date": 1}}}},
+            upsert=True,
+        )
+        updated += 1
+    return updated
+
+
+def rebuild_team_records(db, league=None, seasons: Optional[Iterable[str]] = None) -> Dict[str, int]:
+    """
+    Rebuild team records from the games collection and mark the seasons as built.
+
+    Args:
+        seasons: Seasons to rebuild (default: every season in the games collection)
+
+    Returns:
+        Dict of season -> number of team documents written
+    """
+    games_coll = db[league.collections["games"] if league is not None else "stats_nba"]
+    coll = team_records_collection(db, league)
+    team_id_field = league.team_primary_identifier if league is not None else "name"
+
+    query: Dict[str, Any] = {"homeWon": {"$exists": True}}
+    if seasons is not None:
+        seasons = list(seasons)
+        query["season"] = {"$in": seasons}
+    projection = {"_id": 0, "game_id": 1, "date": 1, "season": 1, "homeWon": 1, "game_type": 1}
+    for side in ("homeTeam", "awayTeam"):
+        for field in {team_id_field, "name", "points"}:
+            projection[f"{side}.{field}"] = 1
+
+    by_team: Dict[tuple, Dict[str, Dict[str, Any]]] = defaultdict(dict)
+    for game in games_coll.find(query, projection):
+        for key, entry in _entries(game, team_id_field):
+            by_team[(game["season"], key)][entry["game_id"]] = entry
+
+    written: Dict[str, int] = {s: 0 for s in (seasons or [])}
+    for (season, team), entries in by_team.items():
+        coll.replace_one(
+            {"team": team, "season": season},
+            {"team": team, "season": season,
+             "games": sorted(entries.values(), key=lambda e: e["date"])},
+            upsert=True,
+        )
+        written[season] = written.get(season, 0) + 1
+
+    # Drop teams that no longer have games in a rebuilt season
+    for season in written:
+        teams = [team for (s, team) in by_team if s == season]
+        coll.delete_many({"season": season, "team": {"$nin": teams}})
+
+    coll.update_one(
+        {"_id": META_ID},
+        {"$addToSet": {"seasons": {"$each": list(written)}}, "$set": {"updated_at": datetime.utcnow()}},
+        upsert=True,
+    )
+    return written
+
+
+def summarize_entries(
+    entries: List[Dict[str, Any]],
+    before_date: str,
+    exclude_game_types: Optional[List[str]] = None,
+    scored_only: bool = False,
+) -> Dict[str, int]:
+    """W-L counts (overall, home, away, last 10) from date-sorted entries before a date."""
+    excluded = set(exclude_game_types or [])
+    games = [
+        e for e in entries
+        if e["date"] < before_date
+        and e.get("game_type") not in excluded
+        and (e.get("scored") or not scored_only)
+    ]
+    home_wins = sum(1 for e in games if e["home"] and e["won"])
+    home_losses = sum(1 for e in games if e["home"] and not e["won"])
+    away_wins = sum(1 for e in games if not e["home"] and e["won"])
+    away_losses = sum(1 for e in games if not e["home"] and not e["won"])
+    last10 = games[-10:]
+    last10_wins = sum(1 for e in last10 if e["won"])
+    return {
+        "wins": home_wins + away_wins,
+        "losses": home_losses + away_losses,
+        "home_wins": home_wins,
+        "home_losses": home_losses,
+        "away_wins": away_wins,
+        "away_losses": away_losses,
+        "last10_wins": last10_wins,
+        "last10_losses": len(last10) - last10_wins,
+    }
+
+
+def get_team_records(
+    db,
+    league,
+    teams: Iterable[str],
+    season: str,
+    before_date: str,
+    exclude_game_types: Optional[List[str]] = None,
+    scored_only: bool = False,
+    build_missing: bool = True,
+) -> Optional[Dict[str, Dict[str, int]]]:
+    """
+    Records for several teams before a date with one indexed lookup.
+
+    Args:
+        teams: Team identifiers (primary identifier or name)
+        exclude_game_types: Game types to skip (default: the league's exclude_game_types)
+        scored_only: Only count games where both teams scored (web page semantics)
+        build_missing: Build the season first if it has not been materialized yet
+
+    Returns:
+        Dict of team -> summarize_entries() counts, or None if the season is not
+        materialized (callers fall back to aggregating the games collection)
+    """
+    if not season:
+        return None
+    teams = [str(t) for t in teams]
+    if exclude_game_types is None:
+        exclude_game_types = getattr(league, "exclude_game_types", None) or DEFAULT_EXCLUDE_GAME_TYPES
+    coll = team_records_collection(db, league)
+
+    def lookup():
+        docs = list(coll.find({"$or": [{"_id": META_ID}, {"season": season, "team": {"$in": teams}}]}))
+        meta = next((d for d in docs if d.get("_id") == META_ID), None)
+        return meta, {d["team"]: d.get("games", []) for d in docs if d.get("_id") != META_ID}
+
+    meta, by_team = lookup()
+    if season not in (meta or {}).get("seasons", []):
+        if not build_missing:
+            return None
+        rebuild_team_records(db, league, seasons=[season])
+        meta, by_team = lookup()
+
+    return {
+        team: summarize_entries(by_team.get(team, []), before_date, exclude_game_types, scored_only)
+        for team in teams
+    }
@@ -25,13 +25,15 @@ from bball.training.schemas import DatasetSpec
 class DatasetBuilder:
     """Builds training datasets with caching"""
 
-    def __init__(self, db=None, league=None):
+    def __init__(self, db=None, league=None, cache_dir=None):
         """
         Initialize DatasetBuilder.
 
         Args:
             db: MongoDB database instance (optional)
             league: LeagueConfig instance for league-specific paths
+            cache_dir: Directory for built dataset CSVs (default:
+                model_output/dataset_cache/<league>)
         """
         if db is None:
             mongo = Mongo()
@@ -45,9 +47,11 @@ class DatasetBuilder:
         self.master_training_path = get_master_training_path(league) if league else MASTER_TRAINING_PATH
 
         # Cache directory for datasets — namespaced by league to prevent cross-league collisions
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(script_dir))
-        self.cache_dir = os.path.join(project_root, 'model_output', 'dataset_cache', self.league_id)
+        if cache_dir is None:
+            script_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = os.path.dirname(os.path.dirname(script_dir))
+            cache_dir = os.path.join(project_root, 'model_output', 'dataset_cache', self.league_id)
+        self.cache_dir = cache_dir
         os.makedirs(self.cache_dir, exist_ok=True)
     
     def merge_point_predictions(self, df, point_model_id: str):
@@ -207,14 +211,13 @@ class DatasetBuilder:
             features = spec.individual_features
         elif spec.feature_blocks:
             # Get features from blocks using master CSV (not FEATURE_SETS)
-            # Read master CSV to get available features
-            import pandas as pd
+            # Read master columns (column store manifest, else CSV header) to get available features
+            from bball.training import master_store
             master_features = set()
             if os.path.exists(self.master_training_path):
                 try:
-                    master_df = pd.read_csv(self.master_training_path, nrows=0)
                     meta_cols = ['Year', 'Month', 'Day', 'Home', 'Away', 'game_id', 'HomeWon', 'home_points', 'away_points']
-                    master_features = set([c for c in master_df.columns if c not in meta_cols])
+                    master_features = set([c for c in master_store.master_columns(self.master_training_path) if c not in meta_cols])
                 except Exception as e:
                     import logging
                     logging.error(f"Failed to read master CSV to get features: {e}")
@@ -335,10 +338,9 @@ class DatasetBuilder:
             valid_blocks = []
             if os.path.exists(self.master_training_path):
                 try:
-                    import pandas as pd
-                    master_df = pd.read_csv(self.master_training_path, nrows=0)
+                    from bball.training import master_store
                     meta_cols = ['Year', 'Month', 'Day', 'Home', 'Away', 'HomeWon']
-                    master_features = set([c for c in master_df.columns if c not in meta_cols])
+                    master_features = set([c for c in master_store.master_columns(self.master_training_path) if c not in meta_cols])
                     
                     # Use same mapping logic as support_tools._map_master_features_to_blocks
                     from collections import defaultdict
@@ -437,12 +439,13 @@ class DatasetBuilder:
         use_master = False
         missing_in_master = []
         try:
-            import pandas as pd
-            # Quick check: read just the header
-            master_df = pd.read_csv(self.master_training_path, nrows=0)
+            from bball.training import master_store
+            # Quick check: just the column names (the column store manifest sees
+            # columns written since the CSV was last exported)
             # Metadata and target columns (not features)
             meta_target_cols = ['Year', 'Month', 'Day', 'Home', 'Away', 'game_id', 'HomeWon', 'home_points', 'away_points']
-            master_features = [c for c in master_df.columns if c not in meta_target_cols]
+            master_columns = master_store.master_columns(self.master_training_path)
+            master_features = [c for c in master_columns if c not in meta_target_cols]
             master_features_set = set(master_features)
             
             # Check which requested features exist in master
@@ -486,8 +489,16 @@ class DatasetBuilder:
             import pandas as pd
             from bball.services.training_data import extract_features_from_master
             
-            # Read pre-computed features CSV
-            master_df = pd.read_csv(self.master_training_path)
+            # Read pre-computed features (only the columns this dataset needs),
+            # from the master column store when it is in sync with the CSV
+            from bball.training.master_store import MasterColumnStore
+            needed_cols = set(meta_target_cols) | set(features)
+            usecols = [c for c in master_columns if c in needed_cols]
+            store = MasterColumnStore.open_current(self.master_training_path)
+            if store is not None:
+                master_df = store.read(usecols)
+            else:
+                master_df = pd.read_csv(self.master_training_path, usecols=usecols)
             
             # Apply date/year filters
             # Default to 2012 (2012-2013 season) if not specified
@@ -0,0 +1,194 @@
+"""
+Master Export — streaming export of training CSVs for downloads.
+
+The master training CSV is hundreds of MB. Downloads are streamed in fixed
+size blocks (or row by row when only some columns are requested) instead of
+loading the file, and can be gzip-compressed on the fly. Each export has an
+ETag built from the file stat and the master metadata, so an unchanged file
+is answered with 304 Not Modified, and full gzip exports are written once to
+a precompressed cache next to the file and reused until the file changes. The
+web download builds that cache on a background thread and serves the plain
+CSV until it is ready, so no request waits for the whole file to compress.
+
+Usage:
+    from bball.training.master_export import export_etag, iter_csv, iter_gzip
+
+    etag = export_etag(path, metadata=meta, columns=['Year', 'Home', 'HomeWon'])
+    for block in iter_gzip(iter_csv(path, columns=['Year', 'Home', 'HomeWon'])):
+        ...
+"""
+
+import csv
+import glob
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+import zlib
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bytes per block for whole-file streaming
+BLOCK_SIZE = 1 << 20
+# Rows per block for projected streaming
+ROWS_PER_BLOCK = 5000
+# Precompressed copies live in this directory next to the CSV
+EXPORT_CACHE_DIR = ".export_cache"
+
+# Gzip cache targets being built in the background (one builder per target)
+_building = set()
+_building_lock = threading.Lock()
+
+
+def export_etag(
+    path: str,
+    metadata: Optional[Dict] = None,
+    columns: Optional[List[str]] = None,
+    gzip: bool = False,
+) -> str:
+    """ETag for an export: file size/mtime, master metadata version, projection and encoding."""
+    st = os.stat(path)
+    parts = [
+        os.path.abspath(path),
+        str(st.st_size),
+        str(st.st_mtime_ns),
+        str((metadata or {}).get("updated_at") or ""),
+        str((metadata or {}).get("feature_count") or ""),
+        ",".join(columns or []),
+        "gzip" if gzip else "identity",
+    ]
+    return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+def last_modified(path: str) -> datetime:
+    """File modification time as an aware UTC datetime (HTTP resolution: seconds)."""
+    return datetime.fromtimestamp(int(os.stat(path).st_mtime), tz=timezone.utc)
+
+
+def read_header(path: str) -> List[str]:
+    with open(path, newline="") as f:
+        return next(csv.reader(f), [])
+
+
+def iter_csv(path: str, columns: Optional[List[str]] = None) -> Iterator[bytes]:
+    """
+    Stream a CSV as byte blocks, optionally keeping only some columns.
+
+    Without columns the file is copied block by block. With columns, rows are
+    re-written with just those columns (in the requested order); unknown
+    columns raise ValueError before anything is yielded.
+    """
+    if not columns:
+        return _iter_blocks(path)
+
+    header = read_header(path)
+    positions = {name: i for i, name in enumerate(header)}
+    missing = [c for c in columns if c not in positions]
+    if missing:
+        raise ValueError(f"Columns not in {os.path.basename(path)}: {missing[:10]}")
+    idx = [positions[c] for c in columns]
+    return _iter_projected(path, columns, idx)
+
+
+def _iter_blocks(path: str) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while True:
+            block = f.read(BLOCK_SIZE)
+            if not block:
+                return
+            yield block
+
+
+def _iter_projected(path: str, columns: List[str], idx: List[int]) -> Iterator[bytes]:
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(columns)
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)
+        rows = 0
+        for row in reader:
+            writer.writerow([row[i] if i < len(row) else "" for i in idx])
+            rows += 1
+            if rows % ROWS_PER_BLOCK == 0:
+                yield buf.getvalue().encode()
+                buf.seek(0)
+                buf.truncate()
+    if buf.tell():
+        yield buf.getvalue().encode()
+
+
+def iter_gzip(blocks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """gzip-compress a stream of byte blocks on the fly."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for block in blocks:
+        out = compressor.compress(block)
+        if out:
+            yield out
+    yield compressor.flush()
+
+
+def gzip_cache_path(path: str, etag: str) -> str:
+    directory = os.path.join(os.path.dirname(os.path.abspath(path)), EXPORT_CACHE_DIR)
+    return os.path.join(directory, f"{os.path.basename(path)}.{etag}.gz")
+
+
+def ensure_gzip_cache(path: str, etag: str, wait: bool = True) -> Optional[str]:
+    """
+    Precompressed copy of a whole CSV for this ETag, building it if needed.
+
+    With wait=False a missing copy is built on a background thread (at most one
+    per target) and None is returned; callers serve the plain CSV meanwhile.
+    Older copies of the same file are removed once the new one is in place.
+    """
+    target = gzip_cache_path(path, etag)
+    if os.path.exists(target):
+        return target
+    if wait:
+        _build_gzip_cache(path, target)
+        return target
+
+    with _building_lock:
+        if target in _building:
+            return None
+        _building.add(target)
+    threading.Thread(
+        target=_build_in_background, args=(path, target), name="gzip-cache", daemon=True,
+    ).start()
+    return None
+
+
+def _build_in_background(path: str, target: str) -> None:
+    try:
+        _build_gzip_cache(path, target)
+    except Exception as e:
+        logger.warning(f"[master_export] gzip cache for {os.path.basename(path)} failed: {e}")
+    finally:
+        with _building_lock:
+            _building.discard(target)
+
+
+def _build_gzip_cache(path: str, target: str) -> None:
+    directory = os.path.dirname(target)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as out:
+            for block in iter_gzip(iter_csv(path)):
+                out.write(block)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+    for stale in glob.glob(os.path.join(directory, f"{glob.escape(os.path.basename(path))}.*.gz")):
+        if stale != target:
+            try:
+                os.unlink(stale)
+            except OSError:
+                pass
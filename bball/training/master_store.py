@@ -0,0 +1,389 @@
+"""
+Master Column Store — column-per-file copy of the master training CSV.
+
+Every master column is stored as its own .npy file in a directory next to the
+CSV (MASTER_TRAINING.csv -> MASTER_TRAINING.columns/), described by a
+manifest.json: row count, column order, the row-key columns (Year, Month,
+Day, Home, Away, game_id) and the file holding each column.
+
+Adding or regenerating a feature writes only that column's file and then
+atomically replaces the manifest, so the other columns are never read or
+rewritten. Column files are versioned (a new file per write), so the manifest
+swap is the only step that changes what readers see. Manifest updates take an
+exclusive file lock (writers run in separate processes, e.g. populate jobs
+spawned by the web app). Superseded files are kept for RETIRED_GRACE_S so
+readers holding the previous manifest can finish; snapshot() pins a manifest
+(and its files) as a cheap backup.
+
+The CSV stays the interchange format for everything else, exported lazily:
+column writes only mark it stale, and ensure_master_csv() streams the store
+back to the CSV in row blocks when a CSV reader needs it. Column lists come
+from master_columns(), which reads the manifest. The manifest records the
+CSV's size/mtime so a CSV rewritten elsewhere (full regeneration, column
+delete) is detected and the store rebuilt from it.
+
+Usage:
+    from bball.training.master_store import MasterColumnStore, ensure_master_csv, master_columns
+
+    store = MasterColumnStore.for_csv(master_csv_path)   # build/refresh if stale
+    df = store.read(store.key_columns + ['elo|none|raw|diff'])
+    store.write_columns({'new|feature|raw|diff': values})
+    columns = master_columns(master_csv_path)             # includes the new column
+    ensure_master_csv(master_csv_path)                    # CSV readers: export if stale
+"""
+
+import fcntl
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = "manifest.json"
+LOCK_FILE = "manifest.lock"
+KEY_COLUMNS = ["Year", "Month", "Day", "Home", "Away", "game_id"]
+PRED_COLUMNS = ["pred_home_points", "pred_away_points", "pred_margin", "pred_point_total", "pred_total"]
+TARGET_COLUMNS = ["HomeWon", "home_points", "away_points"]
+# Rows per block when building from / exporting to CSV
+CSV_CHUNK_ROWS = 5000
+# Superseded column files are deleted this long after the manifest stops referencing them
+RETIRED_GRACE_S = 3600
+
+
+def master_column_order(columns: Iterable[str]) -> List[str]:
+    """Master CSV column order: keys, sorted features, predictions, targets."""
+    columns = list(dict.fromkeys(columns))
+    present = set(columns)
+    keys = [c for c in KEY_COLUMNS if c in present]
+    preds = [c for c in PRED_COLUMNS if c in present]
+    targets = [c for c in TARGET_COLUMNS if c in present]
+    excluded = set(keys) | set(preds) | set(targets)
+    features = sorted(c for c in columns if c not in excluded)
+    return keys + features + preds + targets
+
+
+def store_dir_for(csv_path: str) -> str:
+    return os.path.splitext(os.path.abspath(csv_path))[0] + ".columns"
+
+
+def master_columns(csv_path: str) -> List[str]:
+    """Master column names: the store manifest when in sync with the CSV, else the CSV header."""
+    store = MasterColumnStore.open_current(csv_path)
+    if store is not None:
+        return store.columns
+    return list(pd.read_csv(csv_path, nrows=0).columns)
+
+
+def ensure_master_csv(csv_path: str) -> str:
+    """Export the CSV if the store has columns the CSV doesn't have yet; returns the path."""
+    store = MasterColumnStore.open_current(csv_path)
+    if store is not None and store.csv_stale:
+        store.export_csv()
+    return csv_path
+
+
+def _csv_signature(csv_path: str) -> Optional[Dict[str, int]]:
+    if not os.path.exists(csv_path):
+        return None
+    st = os.stat(csv_path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _to_array(values) -> np.ndarray:
+    arr = np.asarray(values)
+    if arr.dtype == object:
+        # Strings (team names, ids): NaN becomes empty string
+        arr = pd.Series(values).fillna("").astype(str).to_numpy().astype(str)
+    return arr
+
+
+def _atomic_write(path: str, write) -> None:
+    tmp_path = _write_temp(path, write)
+    os.replace(tmp_path, path)
+
+
+def _write_temp(path: str, write) -> str:
+    """Write to a temp file next to path; the caller os.replace()s it into place."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return tmp_path
+
+
+class MasterColumnStore:
+    """Column-per-file master training data with an atomically replaced manifest."""
+
+    def __init__(self, csv_path: str, directory: Optional[str] = None):
+        self.csv_path = csv_path
+        self.directory = directory or store_dir_for(csv_path)
+        self.manifest = self._load_manifest()
+
+    # --- Construction ---
+
+    @classmethod
+    def open_current(cls, csv_path: str) -> Optional["MasterColumnStore"]:
+        """Existing store if it matches the CSV on disk, else None."""
+        store = cls(csv_path)
+        return store if store.is_current() else None
+
+    @classmethod
+    def for_csv(cls, csv_path: str) -> "MasterColumnStore":
+        """Store for a master CSV, (re)built from the CSV if missing or stale."""
+        store = cls(csv_path)
+        if not store.is_current():
+            with store._locked():
+                # Another process may have rebuilt it while we waited
+                store.manifest = store._load_manifest()
+                if not store.is_current():
+                    store._build_from_csv()
+        return store
+
+    def build_from_csv(self) -> None:
+        """Split the CSV into column files (read in row chunks)."""
+        with self._locked():
+            self._build_from_csv()
+
+    def _build_from_csv(self) -> None:
+        parts: Dict[str, List[np.ndarray]] = {}
+        order: List[str] = []
+        rows = 0
+        for chunk in pd.read_csv(self.csv_path, chunksize=CSV_CHUNK_ROWS, low_memory=False):
+            if not order:
+                order = list(chunk.columns)
+            for name in order:
+                parts.setdefault(name, []).append(_to_array(chunk[name]))
+            rows += len(chunk)
+        if not order:
+            order = list(pd.read_csv(self.csv_path, nrows=0).columns)
+
+        columns = {}
+        for name in order:
+            chunks = parts.get(name, [])
+            if any(c.dtype.kind == "U" for c in chunks):
+                chunks = [c.astype(str) for c in chunks]
+            arr = np.concatenate(chunks) if chunks else np.array([], dtype=float)
+            columns[name] = self._write_file(name, arr)
+
+        self._commit({
+            "rows": rows,
+            "columns": order,
+            "files": columns,
+            "key_columns": [c for c in KEY_COLUMNS if c in columns],
+            "csv": _csv_signature(self.csv_path),
+            "csv_stale": False,
+        }, previous=self._load_manifest())
+
+    # --- Reading ---
+
+    @property
+    def exists(self) -> bool:
+        return self.manifest is not None
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.manifest["columns"]) if self.manifest else []
+
+    @property
+    def key_columns(self) -> List[str]:
+        return list(self.manifest["key_columns"]) if self.manifest else []
+
+    @property
+    def rows(self) -> int:
+        return self.manifest["rows"] if self.manifest else 0
+
+    @property
+    def csv_stale(self) -> bool:
+        """True when columns were written since the CSV was last exported."""
+        return bool(self.manifest and self.manifest.get("csv_stale"))
+
+    def is_current(self) -> bool:
+        return self.manifest is not None and self.manifest.get("csv") == _csv_signature(self.csv_path)
+
+    def read_column(self, name: str) -> np.ndarray:
+        return self._load_file(self.manifest["files"][name])
+
+    def read(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """DataFrame of the given columns (default: all), in store column order."""
+        wanted = set(columns) if columns is not None else None
+        names = [c for c in self.columns if wanted is None or c in wanted]
+        return pd.DataFrame({name: np.array(self.read_column(name)) for name in names},
+                            index=pd.RangeIndex(self.rows))
+
+    def row_index(self) -> Dict[tuple, int]:
+        """Row-key index: (Year, Month, Day, Home, Away) -> row number."""
+        keys = [self.read_column(c) for c in ("Year", "Month", "Day", "Home", "Away")]
+        return {
+            (int(y), int(m), int(d), str(h), str(a)): i
+            for i, (y, m, d, h, a) in enumerate(zip(*keys))
+        }
+
+    # --- Writing ---
+
+    def write_columns(self, values: Dict[str, Iterable], export_csv: bool = False) -> List[str]:
+        """
+        Add or replace columns; only their files are written.
+
+        Args:
+            values: column name -> values in store row order (len == rows)
+            export_csv: Also rewrite the CSV from the store now. Otherwise the
+                CSV is marked stale and exported by ensure_master_csv() when a
+                CSV reader needs it.
+
+        Returns:
+            Column names written
+        """
+        if not values:
+            return []
+        arrays = {name: _to_array(column) for name, column in values.items()}
+        for name, arr in arrays.items():
+            if len(arr) != self.rows:
+                raise ValueError(f"Column {name!r} has {len(arr)} rows, store has {self.rows}")
+        # Column files are new versions nobody references yet: write them unlocked
+        files = {name: self._write_file(name, arr) for name, arr in arrays.items()}
+        with self._locked():
+            manifest = self._load_manifest()
+            if manifest["rows"] != self.rows:
+                for filename in files.values():
+                    os.unlink(os.path.join(self.directory, filename))
+                raise ValueError("Master store was rebuilt with a different row count; reload and retry")
+            self._commit({
+                **manifest,
+                "files": {**manifest["files"], **files},
+                "columns": master_column_order(list(manifest["columns"]) + list(values)),
+                "csv_stale": True,
+            }, previous=manifest)
+        if export_csv:
+            self.export_csv()
+        return list(values)
+
+    def drop_columns(self, names: Iterable[str]) -> None:
+        names = set(names)
+        with self._locked():
+            manifest = self._load_manifest()
+            self._commit({
+                **manifest,
+                "files": {k: v for k, v in manifest["files"].items() if k not in names},
+                "columns": [c for c in manifest["columns"] if c not in names],
+                "csv_stale": True,
+            }, previous=manifest)
+
+    def export_csv(self, path: Optional[str] = None) -> str:
+        """Write the store back to CSV in row blocks (atomic replace)."""
+        path = path or self.csv_path
+        with self._locked():
+            exported = self._load_manifest()
+        columns = exported["columns"]
+        arrays = {name: self._load_file(exported["files"][name]) for name in columns}
+
+        def write(f):
+            for start in range(0, max(exported["rows"], 1), CSV_CHUNK_ROWS):
+                block = pd.DataFrame({name: arrays[name][start:start + CSV_CHUNK_ROWS] for name in columns})
+                f.write(block.to_csv(index=False, header=(start == 0)).encode())
+
+        tmp_path = _write_temp(path, write)
+        if os.path.abspath(path) != os.path.abspath(self.csv_path):
+            os.replace(tmp_path, path)
+            return path
+        with self._locked():
+            os.replace(tmp_path, path)
+            manifest = self._load_manifest()
+            self._commit({
+                **manifest,
+                "csv": _csv_signature(self.csv_path),
+                # Still stale if columns were written while this export ran
+                "csv_stale": manifest["files"] != exported["files"],
+            }, previous=manifest)
+        return path
+
+    def snapshot(self) -> str:
+        """
+        Pin the current manifest as a backup (manifest.<timestamp>.json).
+
+        Files a snapshot references are never cleaned up; copy it over
+        manifest.json to restore.
+        """
+        with self._locked():
+            manifest = self._load_manifest()
+            path = os.path.join(self.directory, f"manifest.{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.json")
+            payload = json.dumps(manifest, indent=1).encode()
+            _atomic_write(path, lambda f: f.write(payload))
+        return path
+
+    # --- Internals ---
+
+    def _load_manifest(self) -> Optional[Dict]:
+        try:
+            with open(os.path.join(self.directory, MANIFEST)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    @contextmanager
+    def _locked(self):
+        """Exclusive lock for manifest read-modify-write, across threads and processes."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, LOCK_FILE), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _load_file(self, filename: str) -> np.ndarray:
+        return np.load(os.path.join(self.directory, filename), mmap_mode="r")
+
+    def _write_file(self, name: str, arr: np.ndarray) -> str:
+        digest = hashlib.md5(name.encode()).hexdigest()[:16]
+        version = datetime.utcnow().strftime("%Y%m%d%H%M%S%f")
+        filename = f"{digest}.{version}.npy"
+        _atomic_write(os.path.join(self.directory, filename), lambda f: np.save(f, arr, allow_pickle=False))
+        return filename
+
+    def _commit(self, manifest: Dict, previous: Optional[Dict] = None) -> None:
+        """
+        Atomically replace the manifest (caller holds _locked()).
+
+        Files the previous manifest referenced and this one doesn't are retired,
+        and deleted once retired for RETIRED_GRACE_S: readers that loaded the
+        previous manifest keep working until they reload it.
+        """
+        now = time.time()
+        live = set(manifest["files"].values())
+        retired = {k: v for k, v in (manifest.get("retired") or {}).items() if k not in live}
+        for filename in set((previous or {}).get("files", {}).values()) - live:
+            retired.setdefault(filename, now)
+        expired = {k for k, t in retired.items() if now - t >= RETIRED_GRACE_S}
+        if expired:
+            # Files a snapshot references stay retired (and on disk) until it is removed
+            for path in glob.glob(os.path.join(self.directory, "manifest.*.json")):
+                try:
+                    with open(path) as f:
+                        expired -= set(json.load(f).get("files", {}).values())
+                except (OSError, json.JSONDecodeError):
+                    continue
+
+        manifest = {
+            **manifest,
+            "retired": {k: t for k, t in retired.items() if k not in expired},
+            "updated_at": datetime.utcnow().isoformat(),
+        }
+        payload = json.dumps(manifest, indent=1).encode()
+        _atomic_write(os.path.join(self.directory, MANIFEST), lambda f: f.write(payload))
+        self.manifest = manifest
+
+        for filename in expired:
+            try:
+                os.unlink(os.path.join(self.directory, filename))
+            except OSError:
+                pass
@@ -0,0 +1,464 @@
+"""
+Benchmarks - throughput of the hot paths, with JSON baselines.
+
+Each benchmark times one hot path against the database it is given and
+reports a single headline number:
+
+- features_row:  SharedFeatureContext.calculate_features_for_row (rows/s)
+- per_game:      PERCalculator.get_game_per_features (games/s)
+- predict_date:  PredictionService.predict_date (s/date)
+- master_load:   master training CSV load (rows/s)
+- dataset_build: DatasetBuilder.build_dataset, forced rebuild (s)
+
+One-time setup (context preload, model load) is reported separately in each
+result's details and is not part of the headline number. A benchmark that
+can't run (no master CSV, no selected model) is recorded as skipped. A
+synthetic league has no master CSV or trained model of its own, so
+predict_date, master_load and dataset_build are skipped for it.
+
+benchmark_database() picks the database: an in-memory synthetic league
+(mongomock), an explicit --uri/--db-name, or the configured database only
+when explicitly allowed. Every component gets that database, and files the
+benchmarks write (dataset_build's cached datasets) go to a temporary
+directory. The master CSV benchmarks read the league's master CSV.
+
+Reports are saved as JSON baselines; compare_reports() flags any benchmark
+that moved by more than a threshold in the bad direction.
+
+Usage:
+    from bball.utils.benchmarks import run_benchmarks, save_report, load_report, compare_reports
+
+    db = benchmark_database(configured_db, league, synthetic=True)
+    report = run_benchmarks(league, db, rows=200, synthetic=True)
+    save_report(report, 'benchmarks/baselines/nba/main.json')
+    rows = compare_reports(report, load_report('benchmarks/baselines/nba/main.json'))
+"""
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+BASELINE_DIR = os.path.join(_PROJECT_ROOT, "benchmarks", "baselines")
+# Relative change in the bad direction that counts as a regression
+DEFAULT_THRESHOLD = 0.10
+# Synthetic league generated by benchmark_database(synthetic=True)
+SYNTHETIC_SEASONS = 2
+SYNTHETIC_DB_NAME = "bball_bench_synthetic"
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark whose inputs aren't available."""
+
+
+def result(value: float, unit: str, higher_is_better: bool, samples: int, **details) -> Dict:
+    return {
+        "value": value,
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+        "samples": samples,
+        "details": details,
+    }
+
+
+def timed_repeats(fn: Callable[[], int], repeats: int) -> Dict:
+    """Run fn `repeats` times; fn returns the number of items it processed."""
+    seconds, items = [], 0
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        items = fn()
+        seconds.append(time.perf_counter() - start)
+    return {"median_s": statistics.median(seconds), "min_s": min(seconds), "items": items}
+
+
+def benchmark_database(
+    configured_db,
+    league,
+    uri: Optional[str] = None,
+    db_name: Optional[str] = None,
+    synthetic: bool = False,
+    allow_configured_db: bool = False,
+    seasons: int = SYNTHETIC_SEASONS,
+    scale: float = 1.0,
+):
+    """
+    Database to benchmark against.
+
+    Args:
+        configured_db: The configured (production) database
+        league: LeagueConfig
+        uri, db_name: Benchmark this database (db_name required)
+        synthetic: Generate a synthetic league into an in-memory mongomock database
+        allow_configured_db: Permit benchmarking the configured database
+        seasons, scale: Synthetic league size
+
+    Raises:
+        ValueError: the configured database was selected without allow_configured_db,
+            or --synthetic without mongomock installed
+    """
+    if synthetic:
+        try:
+            import mongomock
+        except ImportError:
+            raise ValueError("--synthetic requires the mongomock package (pip install mongomock)")
+        from bball.data.synthetic import SyntheticLeagueSpec, generate_synthetic_league
+
+        db = mongomock.MongoClient()[SYNTHETIC_DB_NAME]
+        spec = SyntheticLeagueSpec(seasons=seasons, scale=scale)
+        print(f"[bench] generating synthetic {league.league_id}: {spec.team_count} teams x {seasons} season(s)")
+        generate_synthetic_league(db, league, spec)
+        return db
+
+    if uri and not db_name:
+        raise ValueError("--uri requires --db-name")
+    configured_name = getattr(configured_db, "name", None)
+    if db_name and (db_name != configured_name or allow_configured_db):
+        from pymongo import MongoClient
+
+        return MongoClient(uri or "mongodb://localhost:27017")[db_name]
+    if allow_configured_db:
+        return configured_db
+    raise ValueError(
+        f"Refusing to benchmark the configured database ({configured_name}); use --synthetic or "
+        "--uri/--db-name for another database, or pass --allow-configured-db"
+    )
+
+
+class BenchmarkInputs:
+    """Shared, lazily loaded inputs: the benchmark season and sample games."""
+
+    def __init__(
+        self,
+        league,
+        db,
+        rows: int = 200,
+        repeats: int = 3,
+        season: Optional[str] = None,
+        work_dir: Optional[str] = None,
+        synthetic: bool = False,
+    ):
+        self.league = league
+        self.db = db
+        # db holds a generated league: no master CSV or trained model matches it
+        self.synthetic = synthetic
+        self.rows = rows
+        self.repeats = repeats
+        # Scratch directory for files benchmarks write
+        self.work_dir = work_dir or tempfile.gettempdir()
+        self._season = season
+        self._games = None
+
+    @property
+    def games_collection(self) -> str:
+        return self.league.collections.get("games", "stats_nba")
+
+    @property
+    def season(self) -> str:
+        if self._season is None:
+            latest = self.db[self.games_collection].find_one(
+                {"homeWon": {"$exists": True}}, {"season": 1}, sort=[("date", -1)],
+            )
+            if not latest:
+                raise BenchmarkSkipped(f"no completed games in {self.games_collection}")
+            self._season = latest["season"]
+        return self._season
+
+    @property
+    def preload_seasons(self) -> List[str]:
+        start = int(self.season.split("-")[0])
+        return [f"{start - 1}-{start}", self.season]
+
+    def sample_games(self) -> List[Dict]:
+        """The season's most recent completed games (up to `rows`), oldest first."""
+        if self._games is None:
+            cursor = self.db[self.games_collection].find(
+                {"season": self.season, "homeWon": {"$exists": True}},
+                {"game_id": 1, "date": 1, "season": 1, "homeTeam.name": 1, "awayTeam.name": 1, "_id": 0},
+            ).sort("date", -1).limit(self.rows)
+            self._games = list(reversed(list(cursor)))
+            if not self._games:
+                raise BenchmarkSkipped(f"no completed games in {self.season}")
+        return self._games
+
+    def require_real_league(self, needs: str) -> None:
+        if self.synthetic:
+            raise BenchmarkSkipped(f"synthetic league has no {needs}")
+
+
+def bench_features_row(inputs: BenchmarkInputs) -> Dict:
+    from bball.pipeline.config import PipelineConfig
+    from bball.pipeline.shared_context import SharedFeatureContext
+    from bball.pipeline.training_pipeline import get_default_features
+
+    feature_names = get_default_features(PipelineConfig.from_league(inputs.league))
+    games = inputs.sample_games()
+
+    start = time.perf_counter()
+    context = SharedFeatureContext(
+        feature_names, inputs.league, preload_seasons=inputs.preload_seasons, db=inputs.db,
+    )
+    setup_s = time.perf_counter() - start
+
+    def run():
+        for g in games:
+            year, month, day = (int(p) for p in str(g["date"])[:10].split("-"))
+            context.calculate_features_for_row(
+                home_team=g["homeTeam"]["name"], away_team=g["awayTeam"]["name"],
+                season=g["season"], year=year, month=month, day=day, game_id=str(g.get("game_id")),
+            )
+        return len(games)
+
+    timing = timed_repeats(run, inputs.repeats)
+    return result(
+        timing["items"] / timing["median_s"], "rows/s", True, timing["items"],
+        features=len(feature_names), setup_s=round(setup_s, 3), median_s=timing["median_s"],
+    )
+
+
+def bench_per_game(inputs: BenchmarkInputs) -> Dict:
+    from bball.stats.per_calculator import PERCalculator
+
+    games = inputs.sample_games()
+    start = time.perf_counter()
+    calculator = PERCalculator(inputs.db, preload=True, league=inputs.league, preload_seasons=inputs.preload_seasons)
+    setup_s = time.perf_counter() - start
+
+    def run():
+        for g in games:
+            calculator.get_game_per_features(
+                g["homeTeam"]["name"], g["awayTeam"]["name"], g["season"], str(g["date"])[:10],
+                game_id=str(g.get("game_id")),
+            )
+        return len(games)
+
+    timing = timed_repeats(run, inputs.repeats)
+    return result(
+        timing["items"] / timing["median_s"], "games/s", True, timing["items"],
+        setup_s=round(setup_s, 3), median_s=timing["median_s"],
+    )
+
+
+def bench_predict_date(inputs: BenchmarkInputs, dates: int = 3) -> Dict:
+    inputs.require_real_league("trained model")
+    from bball.services.prediction import PredictionService
+
+    game_dates = sorted({str(g["date"])[:10] for g in inputs.sample_games()})[-dates:]
+    service = PredictionService(db=inputs.db, league=inputs.league)
+    try:
+        start = time.perf_counter()
+        service.predict_date(game_dates[0])  # warm-up: model load and preload
+        setup_s = time.perf_counter() - start
+    except Exception as e:
+        raise BenchmarkSkipped(f"predict_date failed: {e}")
+
+    def run():
+        return sum(len(service.predict_date(d)) for d in game_dates)
+
+    timing = timed_repeats(run, inputs.repeats)
+    return result(
+        timing["median_s"] / len(game_dates), "s/date", False, len(game_dates),
+        games=timing["items"], setup_s=round(setup_s, 3),
+    )
+
+
+def bench_master_load(inputs: BenchmarkInputs) -> Dict:
+    inputs.require_real_league("master training CSV")
+    path = inputs.league.master_training_csv
+    if not os.path.exists(path):
+        raise BenchmarkSkipped(f"no master training CSV at {path}")
+    import pandas as pd
+    from bball.training.master_store import MasterColumnStore
+    shape = {}
+
+    def run():
+        # Same source as DatasetBuilder: the column store when in sync, else the CSV
+        store = MasterColumnStore.open_current(path)
+        df = store.read() if store is not None else pd.read_csv(path)
+        shape["columns"] = len(df.columns)
+        return len(df)
+
+    timing = timed_repeats(run, inputs.repeats)
+    return result(
+        timing["items"] / timing["median_s"], "rows/s", True, timing["items"],
+        columns=shape["columns"], mb=round(os.path.getsize(path) / 1e6, 1), median_s=timing["median_s"],
+    )
+
+
+def bench_dataset_build(inputs: BenchmarkInputs, features: int = 100) -> Dict:
+    inputs.require_real_league("master training CSV")
+    from bball.training.dataset_builder import DatasetBuilder
+    from bball.training.master_store import master_columns
+
+    builder = DatasetBuilder(
+        db=inputs.db, league=inputs.league, cache_dir=os.path.join(inputs.work_dir, "dataset_cache"),
+    )
+    if not os.path.exists(builder.master_training_path):
+        raise BenchmarkSkipped(f"no master training CSV at {builder.master_training_path}")
+    meta = {"Year", "Month", "Day", "Home", "Away", "game_id", "HomeWon", "home_points", "away_points"}
+    columns = [c for c in master_columns(builder.master_training_path) if c not in meta]
+    spec = {"individual_features": columns[:features], "force_rebuild": True}
+    built = {}
+
+    def run():
+        built.update(builder.build_dataset(spec))
+        return built.get("row_count", 0)
+
+    timing = timed_repeats(run, inputs.repeats)
+    return result(
+        timing["median_s"], "s", False, 1,
+        rows=timing["items"], features=len(spec["individual_features"]),
+    )
+
+
+BENCHMARKS: Dict[str, Callable[[BenchmarkInputs], Dict]] = {
+    "features_row": bench_features_row,
+    "per_game": bench_per_game,
+    "predict_date": bench_predict_date,
+    "master_load": bench_master_load,
+    "dataset_build": bench_dataset_build,
+}
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_PROJECT_ROOT,
+            capture_output=True, text=True, timeout=5,
+        )
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(
+    league,
+    db,
+    names: Optional[List[str]] = None,
+    rows: int = 200,
+    repeats: int = 3,
+    season: Optional[str] = None,
+    benchmarks: Optional[Dict[str, Callable[[BenchmarkInputs], Dict]]] = None,
+    synthetic: bool = False,
+) -> Dict:
+    """
+    Run benchmarks and return a report.
+
+    Args:
+        league: LeagueConfig
+        db: MongoDB database
+        names: Benchmarks to run (default: all)
+        rows: Sample games for per-row benchmarks
+        repeats: Timed repeats per benchmark (the median is reported)
+        season: Season to sample (default: latest with completed games)
+        benchmarks: Registry to run from (default: BENCHMARKS)
+        synthetic: db holds a synthetic league (skips the model and master CSV benchmarks)
+
+    Returns:
+        {created_at, league, database, git_rev, python, host, rows, repeats,
+         results: {name: {value, unit, higher_is_better, samples, details} | {skipped}}}
+    """
+    registry = benchmarks if benchmarks is not None else BENCHMARKS
+    unknown = [n for n in names or [] if n not in registry]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {unknown} (available: {sorted(registry)})")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bball_bench_") as work_dir:
+        inputs = BenchmarkInputs(league, db, rows=rows, repeats=repeats, season=season, work_dir=work_dir,
+                                 synthetic=synthetic)
+        for name in names or list(registry):
+            print(f"[bench] {name}...", flush=True)
+            try:
+                results[name] = registry[name](inputs)
+            except BenchmarkSkipped as e:
+                results[name] = {"skipped": str(e)}
+            print(f"[bench] {name}: {format_result(results[name])}", flush=True)
+
+    return {
+        "created_at": datetime.utcnow().isoformat(),
+        "league": league.league_id,
+        "database": getattr(db, "name", None),
+        "git_rev": _git_revision(),
+        "python": platform.python_version(),
+        "host": platform.node(),
+        "rows": rows,
+        "repeats": repeats,
+        "season": inputs._season,
+        "results": results,
+    }
+
+
+def format_result(entry: Dict) -> str:
+    if "skipped" in entry:
+        return f"skipped ({entry['skipped']})"
+    value = entry["value"]
+    return f"{value:,.1f} {entry['unit']}" if value >= 10 else f"{value:.3f} {entry['unit']}"
+
+
+def baseline_path(league_id: str, name: str, baseline_dir: Optional[str] = None) -> str:
+    """A baseline name ('main') or an explicit .json path."""
+    if name.endswith(".json"):
+        return name
+    return os.path.join(baseline_dir or BASELINE_DIR, league_id, f"{name}.json")
+
+
+def save_report(report: Dict, path: str) -> str:
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return path
+
+
+def load_report(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_reports(current: Dict, baseline: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Compare two reports benchmark by benchmark.
+
+    Returns:
+        One row per benchmark in either report: name, baseline, current,
+        change (relative, positive = better), status ('regression',
+        'improved', 'ok', 'skipped', 'new' or 'missing')
+    """
+    rows = []
+    names = list(dict.fromkeys(list(baseline.get("results", {})) + list(current.get("results", {}))))
+    for name in names:
+        base = baseline.get("results", {}).get(name)
+        cur = current.get("results", {}).get(name)
+        row = {"name": name, "baseline": base, "current": cur, "change": None}
+        if base is None:
+            row["status"] = "new"
+        elif cur is None:
+            row["status"] = "missing"
+        elif "skipped" in base or "skipped" in cur or not base["value"]:
+            row["status"] = "skipped"
+        else:
+            change = (cur["value"] - base["value"]) / base["value"]
+            if not cur.get("higher_is_better", True):
+                change = -change
+            row["change"] = change
+            if change < -threshold:
+                row["status"] = "regression"
+            elif change > threshold:
+                row["status"] = "improved"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return rows
@@ -24,7 +24,6 @@ import sys
 import os
 import argparse
 import pandas as pd
-import shutil
 import threading
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
@@ -41,6 +40,7 @@ from bball.mongo import Mongo
 from bball.models.bball_model import BballModel
 from bball.services.training_data import MASTER_TRAINING_PATH, get_all_possible_features
 from bball.features.dependencies import resolve_dependencies, categorize_features
+from bball.training.master_store import MasterColumnStore
 from bball.features.registry import FeatureRegistry
 from bball.features.prediction_mapping import (
     is_pred_feature,
@@ -1513,6 +1513,33 @@ def extract_predictions_from_selected_model(
     return df
 
 
+def _columns_to_load(store: MasterColumnStore, columns: List[str], needs_all: bool = False) -> List[str]:
+    """Store columns a populate run reads: row keys, targets, requested columns and their inputs."""
+    if needs_all:
+        # Point predictions are built from the selected model's feature columns
+        return store.columns
+    needed = set(store.key_columns) | {'HomeWon', 'home_points', 'away_points'} | set(columns)
+    all_features, _ = resolve_dependencies(
+        [c for c in columns if c not in ('game_id', 'home_points', 'away_points')],
+        include_transitive=True
+    )
+    needed |= set(all_features)
+    # Share features fall back to the existing raw injury PER value in the row
+    for col in columns:
+        stat, _, rest = col.partition('|')
+        if stat in ('inj_per_share', 'inj_per_weighted_share'):
+            needed.add(f'inj_per|{rest}')
+    return [c for c in store.columns if c in needed]
+
+
+def _same_values(old: np.ndarray, new: np.ndarray) -> bool:
+    if old.shape != new.shape:
+        return False
+    if old.dtype.kind in 'fiub' and new.dtype.kind in 'fiub':
+        return bool(np.array_equal(old, new, equal_nan=True))
+    return bool(np.array_equal(old.astype(str), new.astype(str)))
+
+
 def populate_columns(
     master_csv_path: str,
     columns: List[str] = None,
@@ -1526,6 +1553,11 @@ def populate_columns(
 ) -> str:
     """
     Populate additional columns in master training CSV.
+
+    Columns are written to the master column store (bball.training.master_store):
+    only the row keys and the columns the computation needs are read, and only
+    new or changed columns are written. The CSV itself is not rewritten; it is
+    exported on demand when a CSV reader needs the new columns.
     
     Args:
         master_csv_path: Path to master training CSV
@@ -1533,7 +1565,7 @@ def populate_columns(
         feature_substrings: List of substrings to match features (optional if columns provided)
         match_mode: 'OR' to match features containing ANY substring, 'AND' to match features containing ALL substrings
         overwrite: If True, overwrite existing columns
-        backup: If True, create backup before modifying
+        backup: If True, snapshot the column store manifest before modifying
         job_id: Optional job ID for progress updates
         chunk_size: Batch size for processing (default: 500 rows)
         progress_callback: Optional callback function for progress updates
@@ -1570,12 +1602,12 @@ def populate_columns(
     # If feature_substrings provided, match features by substring
     if feature_substrings:
         print(f"Matching features by substrings: {feature_substrings}")
-        # Read CSV to get all features
-        df_temp = pd.read_csv(master_csv_path)
+        # Master columns (column store manifest, else CSV header) to get all features
+        from bball.training.master_store import master_columns
         metadata_cols = ['Year', 'Month', 'Day', 'Home', 'Away', 'game_id', 'HomeWon', 
                         'home_points', 'away_points', 'pred_home_points', 'pred_away_points', 
                         'pred_margin', 'pred_point_total', 'pred_total']
-        all_features = [c for c in df_temp.columns if c not in metadata_cols]
+        all_features = [c for c in master_columns(master_csv_path) if c not in metadata_cols]
         
         # Match features with match mode
         matching_features = find_features_by_substrings(all_features, feature_substrings, match_mode)
@@ -1635,17 +1667,6 @@ def populate_columns(
     if job_id:
         update_job_progress(job_id, 0, f"[STEP 7/8] Starting column processing. Columns to process: {len(columns)}", db)
     
-    # Create backup if requested
-    if backup:
-        backup_path = f"{master_csv_path}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        print(f"Creating backup: {backup_path}")
-        shutil.copy2(master_csv_path, backup_path)
-    
-    # Read existing CSV
-    print(f"Reading master training CSV: {master_csv_path}")
-    df = pd.read_csv(master_csv_path)
-    print(f"  Loaded {len(df)} rows, {len(df.columns)} columns")
-    
     # Separate columns into metadata, prediction, and feature columns
     metadata_cols = []
     prediction_cols = []
@@ -1659,6 +1680,18 @@ def populate_columns(
             prediction_cols.append(col)
         else:
             feature_cols.append(col)
+
+    # Read only the columns this run needs from the master column store
+    # (built from the CSV on first use, rebuilt if the CSV changed elsewhere)
+    print(f"Opening master column store for: {master_csv_path}")
+    store = MasterColumnStore.for_csv(master_csv_path)
+    if backup:
+        # Pins the current column files; no copy of the CSV is made
+        print(f"Snapshot of the column store manifest: {store.snapshot()}")
+    load_cols = _columns_to_load(store, columns, needs_all=bool(prediction_cols))
+    df = store.read(load_cols)
+    loaded_values = {c: df[c].to_numpy().copy() for c in df.columns}
+    print(f"  Loaded {len(df)} rows, {len(df.columns)} of {len(store.columns)} columns")
     
     # Check which columns already exist
     existing_cols = [col for col in columns if col in df.columns]
@@ -1747,47 +1780,20 @@ def populate_columns(
                             update_job_progress(job_id, int(progress_pct), 
                                               f"Calculated {feature_name} ({features_done}/{len(feature_cols)} features)", db)
     
-    # Reorder columns to match expected format:
-    # [Year, Month, Day, Home, Away, game_id, ...features..., pred_home_points, pred_away_points, pred_margin, pred_point_total, HomeWon, home_points, away_points]
-    meta_cols = ['Year', 'Month', 'Day', 'Home', 'Away']
-    if 'game_id' in df.columns:
-        meta_cols.append('game_id')
-    
-    # Prediction columns (if they exist)
-    pred_cols = []
-    for pred_col in ['pred_home_points', 'pred_away_points', 'pred_margin', 'pred_point_total', 'pred_total']:
-        if pred_col in df.columns and pred_col not in pred_cols:
-            pred_cols.append(pred_col)
-    
-    target_cols = []
-    if 'HomeWon' in df.columns:
-        target_cols.append('HomeWon')
-    if 'home_points' in df.columns:
-        target_cols.append('home_points')
-    if 'away_points' in df.columns:
-        target_cols.append('away_points')
-    
-    # Feature columns are everything else (exclude metadata, predictions, and targets)
-    excluded_cols = meta_cols + pred_cols + target_cols
-    feature_cols_in_df = [c for c in df.columns if c not in excluded_cols]
-    
-    # Reorder
-    new_column_order = meta_cols + sorted(feature_cols_in_df) + pred_cols + target_cols
-    df = df[new_column_order]
-    
-    # Write updated CSV
-    print(f"\nWriting updated CSV: {master_csv_path}")
+    # Write only the new/changed columns to the column store (manifest swap is atomic).
+    # Column order follows the master format: keys, sorted features, predictions, targets.
+    changed = {
+        c: df[c].to_numpy() for c in df.columns
+        if c not in loaded_values or not _same_values(loaded_values[c], df[c].to_numpy())
+    }
+    print(f"\nWriting {len(changed)} column(s) to master column store: {store.directory}")
     if job_id:
-        update_job_progress(job_id, 95, "Writing updated CSV to disk...", db)
-    
-    # Write to temporary file first, then swap (atomic operation)
-    temp_file_path = f"{master_csv_path}.tmp_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    df.to_csv(temp_file_path, index=False)
-    
-    # Swap files
-    shutil.move(temp_file_path, master_csv_path)
-    
-    print(f"  Updated: {len(df)} rows, {len(df.columns)} columns")
+        update_job_progress(job_id, 95, f"Writing {len(changed)} column(s) to the master column store...", db)
+    # Only the new column files are written; the CSV is marked stale and exported
+    # on demand (ensure_master_csv) when a CSV reader needs it.
+    store.write_columns(changed)
+
+    print(f"  Updated: {store.rows} rows, {len(store.columns)} columns")
     print(f"  Regenerated columns: {len(columns)}")
 
     # Update job: completed
@@ -1853,13 +1859,13 @@ Examples:
         '--backup',
         action='store_true',
         default=True,
-        help='Create backup before modifying (default: True)'
+        help='Snapshot the column store manifest before modifying (default: True)'
     )
     
     parser.add_argument(
         '--no-backup',
         action='store_true',
-        help='Skip creating backup'
+        help='Skip the manifest snapshot'
     )
     
     parser.add_argument(
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Test the benchmark suite plumbing (bball.utils.benchmarks).
+
+Tests:
+1. run_benchmarks runs a registry, records skipped benchmarks, and the report
+   round-trips through save_report/load_report; master_load times a real CSV
+2. compare_reports flags regressions in the bad direction only (rows/s down,
+   s/date up) and reports new/missing/skipped benchmarks
+3. benchmark_database refuses the configured database unless allowed, and
+   --synthetic generates a league into an in-memory database (needs mongomock);
+   benchmarks get a scratch work_dir that is removed afterwards
+4. A synthetic run skips predict_date, master_load and dataset_build with a
+   reason instead of reading the production master CSV
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_benchmarks.py
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.utils.benchmarks import (
+    BENCHMARKS,
+    BenchmarkSkipped,
+    baseline_path,
+    benchmark_database,
+    bench_master_load,
+    compare_reports,
+    load_report,
+    result,
+    run_benchmarks,
+    save_report,
+)
+
+
+def _report(**values):
+    return {'results': {
+        name: ({'skipped': 'n/a'} if v is None else result(v[0], v[1], v[1] != 's/date', 10))
+        for name, v in values.items()
+    }}
+
+
+def test_run_save_load():
+    def skipped(inputs):
+        raise BenchmarkSkipped('no model')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        pd.DataFrame({'Year': range(500), 'elo|none|raw|diff': 0.5}).to_csv(csv_path, index=False)
+        league = SimpleNamespace(league_id='nba', master_training_csv=csv_path, collections={})
+
+        registry = {'master_load': bench_master_load, 'predict_date': skipped}
+        report = run_benchmarks(league, db=None, repeats=2, season='2024-2025', benchmarks=registry)
+        load = report['results']['master_load']
+        assert load['unit'] == 'rows/s' and load['samples'] == 500 and load['value'] > 0
+        assert load['details']['columns'] == 2
+        assert report['results']['predict_date'] == {'skipped': 'no model'}
+
+        try:
+            run_benchmarks(league, db=None, names=['nope'], benchmarks=registry)
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+        path = baseline_path('nba', 'main', baseline_dir=tmp)
+        assert path == os.path.join(tmp, 'nba', 'main.json')
+        assert baseline_path('nba', '/x/run.json') == '/x/run.json'
+        save_report(report, path)
+        assert load_report(path) == report
+    print("✅ Registry runs, skips are recorded, reports round-trip")
+
+
+def test_compare_directions():
+    baseline = _report(features_row=(100.0, 'rows/s'), predict_date=(2.0, 's/date'),
+                       master_load=(1000.0, 'rows/s'), per_game=None, old=(1.0, 'rows/s'))
+    current = _report(features_row=(80.0, 'rows/s'), predict_date=(1.5, 's/date'),
+                      master_load=(1050.0, 'rows/s'), per_game=(5.0, 'games/s'), new=(1.0, 'rows/s'))
+    rows = {r['name']: r for r in compare_reports(current, baseline, threshold=0.10)}
+
+    assert rows['features_row']['status'] == 'regression' and abs(rows['features_row']['change'] + 0.2) < 1e-9
+    assert rows['predict_date']['status'] == 'improved' and rows['predict_date']['change'] > 0
+    assert rows['master_load']['status'] == 'ok'
+    assert rows['per_game']['status'] == 'skipped'
+    assert rows['old']['status'] == 'missing' and rows['new']['status'] == 'new'
+
+    slower = _report(predict_date=(2.5, 's/date'))
+    rows = {r['name']: r for r in compare_reports(slower, baseline)}
+    assert rows['predict_date']['status'] == 'regression'
+    print("✅ Comparisons flag regressions in the bad direction only")
+
+
+def test_database_selection():
+    configured = SimpleNamespace(name='bball')
+    league = SimpleNamespace(league_id='nba', collections={})
+    for kwargs in ({}, {'db_name': 'bball'}, {'uri': 'mongodb://other:27017'}):
+        try:
+            benchmark_database(configured, league, **kwargs)
+            assert False, f"expected ValueError for {kwargs}"
+        except ValueError:
+            pass
+    assert benchmark_database(configured, league, allow_configured_db=True) is configured
+
+    work_dirs = []
+    def records_work_dir(inputs):
+        work_dirs.append(inputs.work_dir)
+        assert os.path.isdir(inputs.work_dir)
+        raise BenchmarkSkipped('n/a')
+    run_benchmarks(league, db=configured, benchmarks={'x': records_work_dir})
+    assert work_dirs and not os.path.exists(work_dirs[0])
+
+    if importlib.util.find_spec('mongomock') is None:
+        print("⚠️  mongomock not installed; skipping --synthetic database")
+    else:
+        nba = SimpleNamespace(
+            league_id='nba', include_team_id=True, team_primary_identifier='name',
+            collections={'games': 'stats_nba', 'player_stats': 'stats_nba_players', 'players': 'players_nba',
+                         'teams': 'teams_nba', 'venues': 'nba_venues', 'rosters': 'nba_rosters'},
+        )
+        db = benchmark_database(configured, nba, synthetic=True, seasons=1, scale=0.2)
+        assert db is not configured
+        assert db['stats_nba'].count_documents({'homeWon': {'$exists': True}}) > 0
+    print("✅ Configured database refused unless allowed; synthetic league generated in memory")
+
+
+def test_synthetic_skips_production_inputs():
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        pd.DataFrame({'Year': range(10)}).to_csv(csv_path, index=False)
+        league = SimpleNamespace(league_id='nba', master_training_csv=csv_path, collections={})
+        names = ['predict_date', 'master_load', 'dataset_build']
+        report = run_benchmarks(league, db=None, names=names, repeats=1, season='2024-2025', synthetic=True)
+    for name in names:
+        assert report['results'][name]['skipped'].startswith('synthetic league has no'), name
+    assert set(names) < set(BENCHMARKS)
+    print("✅ Synthetic runs skip the model and master CSV benchmarks")
+
+
+if __name__ == "__main__":
+    test_run_save_load()
+    test_compare_directions()
+    test_database_selection()
+    test_synthetic_skips_production_inputs()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Test the materialized matchup chat baseline (prediction_bootstrap).
+
+Tests:
+1. materialize_chat_baselines builds one doc per stored prediction with
+   team metadata and p_home
+2. ensure_shared_context_baseline warm-starts from that doc without touching
+   the games/teams collections or PredictionService
+3. PredictionService.save_prediction refreshes the baseline's p_home, and a
+   baseline for different teams is dropped
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_chat_baseline.py
+"""
+
+import os
+import sys
+from collections import defaultdict
+from unittest.mock import MagicMock, patch
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.services.matchup_chat import prediction_bootstrap as pb
+
+
+def _db():
+    collections = defaultdict(MagicMock)
+    db = MagicMock()
+    db.__getitem__.side_effect = collections.__getitem__
+    return db
+
+
+def test_materialize():
+    db = _db()
+    db["nba_model_predictions"].find.return_value = [
+        {"game_id": "401", "game_date": "2025-01-15", "home_team": "LAL", "away_team": "BOS",
+         "home_win_prob": 61.0, "predicted_at": "2025-01-15T10:00:00+00:00"},
+    ]
+    db["teams_nba"].find.return_value = [
+        {"abbreviation": "LAL", "team_id": 13, "displayName": "Los Angeles Lakers"},
+        {"abbreviation": "BOS", "team_id": 2, "displayName": "Boston Celtics"},
+    ]
+
+    assert pb.materialize_chat_baselines(db=db, league=None, game_date="2025-01-15") == 1
+    ops = db["nba_matchup_chat_baselines"].bulk_write.call_args[0][0]
+    doc = ops[0]._doc["$set"]
+    assert doc["game"]["home"] == {"name": "LAL", "full_name": "Los Angeles Lakers", "team_id": "13"}
+    assert doc["ensemble_model"] == {"p_home": 0.61}
+    assert doc["version"] == pb.CHAT_BASELINE_VERSION
+    print("✅ Materialize chat baselines")
+
+
+def test_warm_start():
+    db = _db()
+    baseline = {
+        "game_id": "401",
+        "version": pb.CHAT_BASELINE_VERSION,
+        "game": {"date": "2025-01-15", "home": {"name": "LAL"}, "away": {"name": "BOS"}},
+        "ensemble_model": {"p_home": 0.61},
+        "home_win_prob": 61.0,
+    }
+    db["nba_matchup_chat_baselines"].find_one.return_value = baseline
+    existing = {"market_snapshot": {"timestamp": "2999-01-01T00:00:00+00:00", "source": "baseline"}}
+
+    with patch.object(pb, "get_prediction_service") as service:
+        fields, info = pb.ensure_shared_context_baseline(db=db, league=None, game_id="401", existing=existing)
+
+    assert fields["game"] == baseline["game"]
+    assert fields["ensemble_model"] == {"p_home": 0.61}
+    assert fields["market_snapshot"] is existing["market_snapshot"]
+    assert info is baseline
+    service.assert_not_called()
+    db["stats_nba"].find_one.assert_not_called()
+    db["teams_nba"].find_one.assert_not_called()
+    print("✅ Warm start from chat baseline")
+
+
+def test_save_prediction_refreshes_baseline():
+    from types import SimpleNamespace
+    from bball.services.prediction import PredictionService
+
+    db = _db()
+    service = PredictionService.__new__(PredictionService)
+    service.db = db
+    service.league = None
+    result = SimpleNamespace(
+        predicted_winner="LAL", home_win_prob=72.0, away_win_prob=28.0, home_odds=-257, away_odds=257,
+        features_dict={}, home_injured_players=[], away_injured_players=[], feature_players={},
+        home_points_pred=None, away_points_pred=None, point_diff_pred=None,
+    )
+    baselines = db["nba_matchup_chat_baselines"]
+    baselines.update_one.return_value = MagicMock(matched_count=1)
+
+    from datetime import date
+    doc = service.save_prediction(result, "401", date(2025, 1, 15), "LAL", "BOS")
+    query, update = baselines.update_one.call_args[0]
+    assert query == {"game_id": "401", "game.home.name": "LAL", "game.away.name": "BOS"}
+    assert update["$set"]["ensemble_model"] == {"p_home": 0.72}
+    assert update["$set"]["predicted_at"] == doc["predicted_at"]
+    baselines.delete_one.assert_not_called()
+
+    baselines.update_one.return_value = MagicMock(matched_count=0)
+    service.save_prediction(result, "401", date(2025, 1, 15), "LAL", "BOS")
+    baselines.delete_one.assert_called_once_with({"game_id": "401"})
+    print("✅ Saving a prediction refreshes the chat baseline")
+
+
+if __name__ == "__main__":
+    test_materialize()
+    test_warm_start()
+    test_save_prediction_refreshes_baseline()
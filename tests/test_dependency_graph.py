@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Test the memoized feature dependency graph (bball.features.dependencies).
+
+Tests:
+1. resolve_dependencies (graph closures) matches the fixed-point resolution
+   over get_direct_dependencies, with and without transitive dependencies
+2. topological_order puts every dependency before its dependents and agrees
+   with get_regeneration_order
+3. get_dependency_graph returns the shared graph and rebuilds it only when the
+   registry inputs change
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_dependency_graph.py
+"""
+
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.features import dependencies
+from bball.features.dependencies import (
+    EXPLICIT_DEPENDENCIES,
+    get_dependency_graph,
+    get_direct_dependencies,
+    get_regeneration_order,
+    resolve_dependencies,
+)
+
+FEATURES = [
+    'exp_points_matchup|season|derived|diff',
+    'inj_impact|none|blend:severity:0.45/top1_per:0.35/rotation:0.20|diff',
+    'points|blend:season:0.7/games_10:0.3|avg|diff',
+    'off_rtg|delta:games_5-season|avg|home',
+    'pace|season|avg|home',
+]
+
+
+def _fixed_point(feature_names, include_transitive=True):
+    """Resolution by repeated get_direct_dependencies calls (no graph)."""
+    all_features = set(feature_names)
+    dependency_map = {f: set(get_direct_dependencies(f)) for f in feature_names}
+    if not include_transitive:
+        for deps in dependency_map.values():
+            all_features.update(deps)
+        return all_features, dependency_map
+    to_process = set(feature_names)
+    processed = set()
+    while to_process:
+        current = to_process.pop()
+        processed.add(current)
+        for dep in get_direct_dependencies(current):
+            all_features.add(dep)
+            if dep not in processed:
+                to_process.add(dep)
+    return all_features, dependency_map
+
+
+def test_closure_parity():
+    for include_transitive in (True, False):
+        assert resolve_dependencies(FEATURES, include_transitive) == _fixed_point(FEATURES, include_transitive)
+
+    graph = get_dependency_graph()
+    for feature in FEATURES:
+        expected, _ = _fixed_point([feature])
+        assert graph.closure(feature) == expected - {feature}, feature
+
+    all_features, _ = resolve_dependencies(FEATURES)
+    assert 'pace|season|avg|away' in all_features  # exp_points_matchup -> ... -> pace_interaction -> pace
+    print("✅ Graph closures match fixed-point resolution")
+
+
+def test_topological_order():
+    all_features, _ = resolve_dependencies(FEATURES)
+    graph = get_dependency_graph()
+    order = graph.topological_order(all_features)
+    assert sorted(order) == sorted(all_features)
+    position = {f: i for i, f in enumerate(order)}
+    for feature in all_features:
+        for dep in graph.direct(feature):
+            if dep in all_features:
+                assert position[dep] < position[feature], (dep, feature)
+    assert get_regeneration_order(all_features) == order
+    print("✅ Topological order puts dependencies first")
+
+
+def test_graph_shared_until_registry_changes():
+    graph = get_dependency_graph()
+    assert get_dependency_graph() is graph
+
+    key = 'custom_metric|season|avg|home'
+    EXPLICIT_DEPENDENCIES[key] = ['points|season|avg|home']
+    try:
+        rebuilt = get_dependency_graph()
+        assert rebuilt is not graph and rebuilt.version != graph.version
+        assert 'points|season|avg|home' in rebuilt.closure(key)
+    finally:
+        del EXPLICIT_DEPENDENCIES[key]
+    assert get_dependency_graph().version == graph.version
+    assert dependencies._registry_identity() == dependencies._GRAPH_IDENTITY
+    print("✅ Shared graph rebuilt only when the registry changes")
+
+
+if __name__ == "__main__":
+    test_closure_parity()
+    test_topological_order()
+    test_graph_shared_until_registry_changes()
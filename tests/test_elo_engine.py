@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Test the vectorized Elo engine (bball.stats.elo_engine).
+
+Tests:
+1. Replay matches a sequential game-by-game Elo loop, including days where a
+   team plays twice
+2. Resuming from a saved EloState gives the same ratings as a full replay
+   (dynamic K and season carryover)
+3. EloParams.from_league reads the league `elo:` block
+4. update_elo_cache rates a game synced after the run that covered its date,
+   and incremental runs leave the cache equal to a full replay
+5. Parity with sportscore's EloCache.compute_and_cache_all on the same games
+   with the NBA league config (dynamic K, carryover, neutral site and
+   game-type overrides); needs mongomock
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_elo_engine.py
+"""
+
+import os
+import random
+import sys
+from collections import defaultdict
+from types import SimpleNamespace
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.stats import elo_engine
+from bball.stats.elo_engine import EloEngine, EloParams, EloState
+
+TEAMS = [f"T{i}" for i in range(10)]
+
+
+def _games(seed=7):
+    rng = random.Random(seed)
+    games = []
+    for day in range(120):
+        date_str = f"2024-{day // 28 + 1:02d}-{day % 28 + 1:02d}"
+        season = "2023-2024" if day < 60 else "2024-2025"
+        for _ in range(rng.randint(1, 6)):
+            home, away = rng.sample(TEAMS, 2)
+            games.append({
+                'date': date_str,
+                'season': season,
+                'homeTeam': {'name': home},
+                'awayTeam': {'name': away},
+                'homeWon': rng.random() < 0.6,
+            })
+    rng.shuffle(games)
+    return games
+
+
+def _sequential(games, K=20, home_advantage=100):
+    elo = defaultdict(lambda: 1500.0)
+    history = {}
+    for game in sorted(games, key=lambda g: g['date']):
+        home, away = game['homeTeam']['name'], game['awayTeam']['name']
+        history[(home, game['date'], game['season'])] = elo[home]
+        history[(away, game['date'], game['season'])] = elo[away]
+        expected = 1 / (1 + 10 ** ((elo[away] - (elo[home] + home_advantage)) / 400))
+        change = K * ((1 if game['homeWon'] else 0) - expected)
+        elo[home] += change
+        elo[away] -= change
+    return history, dict(elo)
+
+
+def test_matches_sequential_loop():
+    games = _games()
+    expected_history, expected_ratings = _sequential(games)
+
+    engine = EloEngine(EloParams())
+    history = engine.replay(games).history()
+
+    assert history.keys() == expected_history.keys()
+    assert all(abs(history[k] - expected_history[k]) < 1e-9 for k in history)
+    assert all(abs(engine.ratings()[t] - expected_ratings[t]) < 1e-9 for t in expected_ratings)
+    print("✅ Replay matches sequential loop")
+
+
+def test_checkpoint_resume_matches_full_replay():
+    params = EloParams(
+        home_advantage=65,
+        k_schedule=((10, 28.0), (30, 22.0), (None, 16.0)),
+        carryover_alpha=0.85,
+    )
+    games = sorted(_games(seed=11), key=lambda g: g['date'])
+    cutoff = "2024-03-10"
+
+    full = EloEngine(params)
+    full_history = full.replay(games).history()
+
+    first = EloEngine(params)
+    history = first.replay([g for g in games if g['date'] <= cutoff]).history()
+    state = EloState.from_doc(first.state().to_doc())
+    assert state.last_date == cutoff
+
+    resumed = EloEngine(params, state)
+    history.update(resumed.replay([g for g in games if g['date'] > cutoff]).history())
+
+    assert history.keys() == full_history.keys()
+    assert all(abs(history[k] - full_history[k]) < 1e-9 for k in history)
+    assert all(abs(resumed.ratings()[t] - full.ratings()[t]) < 1e-9 for t in TEAMS)
+    print("✅ Checkpoint resume matches full replay")
+
+
+def test_params_from_league():
+    league = SimpleNamespace(raw={'elo': {
+        'starting_rating': 1500,
+        'home_advantage': 65,
+        'carryover': {'enabled': True, 'mean_rating': 1500, 'alpha': 0.85},
+        'strategy': 'dynamic',
+        'k_schedule': [{'max_games': 10, 'k': 28}, {'max_games': 30, 'k': 22}, {'default': 16}],
+        'neutral_site': {'home_advantage': 0},
+        'home_advantage_overrides': {'playoffs': 55},
+    }})
+    params = EloParams.from_league(league)
+
+    assert params.home_advantage == 65
+    assert params.carryover_alpha == 0.85
+    assert params.k_schedule == ((10, 28.0), (30, 22.0), (None, 16.0))
+    assert params.neutral_home_advantage == 0
+    assert EloParams.from_league(None) == EloParams()
+    assert params.fingerprint() != EloParams().fingerprint()
+    print("✅ Params from league config")
+
+
+class _Checkpoints:
+    def __init__(self):
+        self.doc = None
+
+    def find_one(self, query):
+        return self.doc
+
+    def replace_one(self, query, doc, upsert=False):
+        self.doc = doc
+
+
+class _RatingsCache:
+    stored = {}
+
+    def __init__(self, db, league=None):
+        pass
+
+    def bulk_upsert_elos(self, records):
+        for r in records:
+            self.stored[(r['team'], r['game_date'], r['season'])] = r['elo']
+        return len(records)
+
+
+def test_late_game_rated_next_run():
+    from bball.data import cache
+
+    games = sorted(_games(seed=3), key=lambda g: g['date'])
+    last_date = games[-1]['date']
+    late = next(g for g in reversed(games) if g['date'] < last_date)
+    synced = [g for g in games if g is not late]
+    checkpoints = _Checkpoints()
+    db = {'nba_cached_elo_ratings_checkpoint': checkpoints}
+
+    def load(db, league=None, after_date=None):
+        return [g for g in synced if not after_date or g['date'] > after_date]
+
+    originals = (elo_engine.load_elo_games, cache.EloRatingsCache)
+    elo_engine.load_elo_games, cache.EloRatingsCache = load, _RatingsCache
+    _RatingsCache.stored = {}
+    try:
+        elo_engine.update_elo_cache(db)
+        assert checkpoints.doc['state']['last_date'] < late['date']
+        synced.append(late)  # espn_sync stores the game after the run
+        stats = elo_engine.update_elo_cache(db)
+        assert not stats['full']
+        elo_engine.update_elo_cache(db)
+    finally:
+        elo_engine.load_elo_games, cache.EloRatingsCache = originals
+
+    expected = EloEngine(EloParams()).replay(games).history()
+    assert _RatingsCache.stored.keys() == expected.keys()
+    assert all(abs(_RatingsCache.stored[k] - expected[k]) < 1e-9 for k in expected)
+    print("✅ Late-synced games are rated by the next incremental run")
+
+
+def test_parity_with_sportscore_elo_cache():
+    try:
+        import mongomock
+    except ImportError:
+        print("⚠️  mongomock not installed; skipping sportscore Elo parity")
+        return
+    from bball.league_config import load_league_config
+    from bball.stats.elo_cache import EloCache
+
+    league = load_league_config('nba')
+    rng = random.Random(5)
+    games = []
+    for i, g in enumerate(sorted(_games(seed=5), key=lambda g: g['date'])):
+        g = dict(g, game_id=str(i), game_type='regseason', neutralSite=rng.random() < 0.05)
+        if g['date'] >= '2024-05-01' and rng.random() < 0.3:
+            g['game_type'] = 'playoffs'
+        games.append(g)
+
+    db = mongomock.MongoClient().db
+    db[league.collections['games']].insert_many([dict(g) for g in games])
+    elo_coll = db[league.collections['elo_cache']]
+
+    EloCache(db, league=league).compute_and_cache_all()
+    reference = {(d['team'], d['game_date'], d['season']): d['elo'] for d in elo_coll.find()}
+    elo_coll.delete_many({})
+    elo_engine.update_elo_cache(db, league=league, full=True)
+    engine = {(d['team'], d['game_date'], d['season']): d['elo'] for d in elo_coll.find()}
+
+    assert reference and engine.keys() == reference.keys()
+    worst = max(abs(engine[k] - reference[k]) for k in reference)
+    assert worst < 1e-6, worst
+    print("✅ EloEngine matches sportscore compute_and_cache_all")
+
+
+if __name__ == "__main__":
+    test_matches_sequential_loop()
+    test_checkpoint_resume_matches_full_replay()
+    test_params_from_league()
+    test_late_game_rated_next_run()
+    test_parity_with_sportscore_elo_cache()
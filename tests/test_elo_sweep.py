@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test the batched Elo parameter sweep (bball.stats.elo_sweep).
+
+Tests:
+1. Every combination's log loss / Brier matches a single-params EloEngine
+   replay scored the same way (fixed K, league K schedule, carryover,
+   neutral-site override)
+2. eval_from_season limits scoring to later seasons and results are sorted
+   by log loss
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_elo_sweep.py
+"""
+
+import math
+import os
+import random
+import sys
+from dataclasses import replace
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.stats.elo_engine import EloEngine, EloParams, completed_games
+from bball.stats.elo_sweep import sweep_elo_params
+
+BASE = EloParams(
+    home_advantage=65,
+    k_schedule=((10, 28.0), (30, 22.0), (None, 16.0)),
+    carryover_alpha=0.85,
+    neutral_home_advantage=0,
+)
+
+
+def _games(seed=3):
+    rng = random.Random(seed)
+    teams = [f"T{i}" for i in range(12)]
+    games = []
+    for s in range(3):
+        for day in range(80):
+            for _ in range(rng.randint(2, 7)):
+                home, away = rng.sample(teams, 2)
+                games.append({
+                    'date': f"{2020 + s}-{day // 28 + 1:02d}-{day % 28 + 1:02d}",
+                    'season': f"{2020 + s}-{2021 + s}",
+                    'homeTeam': {'name': home},
+                    'awayTeam': {'name': away},
+                    'homeWon': rng.random() < 0.58,
+                    'neutralSite': rng.random() < 0.05,
+                })
+    return games
+
+
+def _reference(games, params, eval_from_season=None):
+    rows = completed_games(games)
+    replay = EloEngine(params).replay(games)
+    log_loss = brier = 0.0
+    n = 0
+    for game, home_pre, away_pre in zip(rows, replay.home_pre, replay.away_pre):
+        if eval_from_season and game['season'] < eval_from_season:
+            continue
+        adv = params.home_advantage_for(game)
+        p = 1 / (1 + 10 ** ((away_pre - (home_pre + adv)) / 400))
+        y = 1.0 if game['homeWon'] else 0.0
+        log_loss -= y * math.log(p) + (1 - y) * math.log(1 - p)
+        brier += (p - y) ** 2
+        n += 1
+    return log_loss / n, brier / n
+
+
+def test_matches_engine_replay():
+    games = _games()
+    results = sweep_elo_params(
+        games, k_values=[16, 24, None], home_advantages=[40, 80], carryover_alphas=[None, 0.75], base=BASE
+    )
+    assert len(results) == 12
+
+    for r in results:
+        if r['k'] is None:
+            params = replace(BASE, home_advantage=r['home_advantage'], carryover_alpha=r['carryover_alpha'])
+        else:
+            params = replace(BASE, k=r['k'], k_schedule=(), home_advantage=r['home_advantage'],
+                             carryover_alpha=r['carryover_alpha'])
+        log_loss, brier = _reference(games, params)
+        assert abs(r['log_loss'] - log_loss) < 1e-9
+        assert abs(r['brier'] - brier) < 1e-9
+    print("✅ Sweep matches engine replay")
+
+
+def test_eval_from_season_and_ordering():
+    games = _games()
+    all_seasons = sweep_elo_params(games, k_values=[20], home_advantages=[65], carryover_alphas=[None], base=BASE)
+    later = sweep_elo_params(games, k_values=[20], home_advantages=[65], carryover_alphas=[None], base=BASE,
+                             eval_from_season="2022-2023")
+    assert later[0]['games'] == sum(1 for g in games if g['season'] >= "2022-2023")
+    assert later[0]['games'] < all_seasons[0]['games']
+
+    results = sweep_elo_params(games, k_values=[8, 20, 40], home_advantages=[0, 100], carryover_alphas=[None])
+    losses = [r['log_loss'] for r in results]
+    assert losses == sorted(losses)
+    print("✅ eval_from_season and ordering")
+
+
+if __name__ == "__main__":
+    test_matches_engine_replay()
+    test_eval_from_season_and_ordering()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Test the persistent feature value cache (bball.pipeline.feature_cache).
+
+Tests:
+1. Fingerprints: a late game invalidates team-scope cells only for its teams'
+   later games, and league-scope cells for every later game; forward-looking
+   and player/injury features and cross-season h2h stats are never cached
+2. A correction two seasons back invalidates league-scope (Elo) cells through
+   the history chain, even when only two seasons are preloaded; without a
+   chain Elo cells are not cached
+3. Cached cells survive a new cache instance (flush + reload) and a
+   fingerprint change turns them into misses
+4. process_chunk only calculates the cells the cache can't supply
+5. calculate_features_for_row compiles row subsets outside the shared plan cache
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_feature_cache.py
+"""
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.pipeline.feature_cache import (
+    FeatureValueCache,
+    GameDataFingerprints,
+    feature_scope,
+    league_history_chain,
+)
+
+SEASON = '2024-2025'
+SCHEDULE = [
+    ('2024-11-01', 'BOS', 'NYK', 1), ('2024-11-01', 'LAL', 'GSW', 2),
+    ('2024-11-03', 'NYK', 'LAL', 3), ('2024-11-03', 'GSW', 'BOS', 4),
+    ('2024-11-05', 'BOS', 'LAL', 5), ('2024-11-05', 'GSW', 'NYK', 6),
+]
+
+
+def _game(date_str, home, away, gid, season=SEASON):
+    return {'game_id': str(gid), 'season': season, 'date': date_str,
+            'homeTeam': {'name': home, 'points': 100 + gid}, 'awayTeam': {'name': away, 'points': 99}}
+
+
+def _games(schedule):
+    games_home, games_away = {}, {}
+    for date_str, home, away, gid in schedule:
+        game = _game(date_str, home, away, gid)
+        games_home.setdefault(SEASON, {}).setdefault(date_str, {})[home] = game
+        games_away.setdefault(SEASON, {}).setdefault(date_str, {})[away] = game
+    return games_home, games_away
+
+
+def _fingerprints(schedule, older=()):
+    history = league_history_chain(list(older) + [_game(*entry) for entry in schedule])
+    return GameDataFingerprints(*_games(schedule), league_history=history)
+
+
+def _row_fps(fingerprints):
+    return {gid: fingerprints.row(SEASON, d, h, a) for d, h, a, gid in SCHEDULE}
+
+
+def test_fingerprint_scopes():
+    before = _row_fps(_fingerprints(SCHEDULE))
+    # A late-ingested game between BOS and NYK on 11-02
+    after = _row_fps(_fingerprints(SCHEDULE + [('2024-11-02', 'BOS', 'NYK', 7)]))
+
+    for gid in (1, 2):
+        assert after[gid] == before[gid]
+    # Every later game involves BOS or NYK
+    assert after[3]['team'] != before[3]['team'] and after[4]['team'] != before[4]['team']
+    assert after[5]['team'] != before[5]['team'] and after[6]['team'] != before[6]['team']
+    for gid in (3, 4, 5, 6):
+        assert after[gid]['league'] != before[gid]['league']
+
+    assert GameDataFingerprints(*_games(SCHEDULE)).row(SEASON, '2024-11-02', 'BOS', 'NYK') is None
+    assert feature_scope('points|season|avg|diff') == 'team'
+    assert feature_scope('elo|none|raw|diff') == 'league'
+    assert feature_scope('player_per|season|top3_avg|home') is None
+    assert feature_scope('inj_impact|none|raw|diff') is None
+    assert feature_scope('inj_per_share|none|top3_sum|home') is None
+    assert feature_scope('first_of_b2b|none|raw|diff') is None
+    assert feature_scope('b2b|none|raw|diff') == 'team'
+    assert feature_scope('h2h_win_pct|season|raw|diff') == 'team'
+    assert feature_scope('h2h_win_pct|last_5|raw|diff') is None
+    assert feature_scope('margin_h2h|last_3|avg|home') is None
+    assert feature_scope('h2h_games_count|last_5|raw|diff') is None
+    print("✅ Late games invalidate only the affected scopes")
+
+
+def test_league_history_covers_all_seasons():
+    older = [_game('2022-01-10', 'BOS', 'LAL', 100, '2021-2022'),
+             _game('2023-01-10', 'NYK', 'GSW', 101, '2022-2023')]
+    before = _row_fps(_fingerprints(SCHEDULE, older))
+    corrected = [dict(older[0], homeTeam={'name': 'BOS', 'points': 90})] + older[1:]
+    after = _row_fps(_fingerprints(SCHEDULE, corrected))
+    for gid in before:
+        assert after[gid]['team'] == before[gid]['team']
+        assert after[gid]['league'] != before[gid]['league']
+
+    fps = GameDataFingerprints(*_games(SCHEDULE)).row(SEASON, '2024-11-05', 'BOS', 'LAL')
+    assert fps['league'] is None
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FeatureValueCache(tmp, GameDataFingerprints(*_games(SCHEDULE)))
+        cache.store(SEASON, '5', {'points|season|avg|diff': 1.0, 'elo|none|raw|diff': 2.0}, fps)
+        assert cache.flush() == 1
+        assert cache.lookup(SEASON, '5', ['elo|none|raw|diff'], fps) == ({}, ['elo|none|raw|diff'])
+    print("✅ Elo cells are keyed on the whole game history")
+
+
+def test_cache_persists_and_validates():
+    features = ['points|season|avg|diff', 'elo|none|raw|diff', 'inj_per_share|none|top3_sum|home']
+    with tempfile.TemporaryDirectory() as tmp:
+        fingerprints = _fingerprints(SCHEDULE)
+        cache = FeatureValueCache(tmp, fingerprints)
+        fps = cache.row_fingerprints(SEASON, '2024-11-05', 'BOS', 'LAL')
+        assert cache.lookup(SEASON, '5', features, fps) == ({}, features)
+        cache.store(SEASON, '5', {features[0]: 1.5, features[1]: None, features[2]: 0.3}, fps)
+        assert cache.flush() == 2
+
+        reloaded = FeatureValueCache(tmp, fingerprints)
+        cached, missing = reloaded.lookup(SEASON, '5', features, fps)
+        assert cached == {features[0]: 1.5, features[1]: None} and missing == [features[2]]
+
+        changed = dict(fps, team=fps['team'] + 1)
+        cached, missing = reloaded.lookup(SEASON, '5', features, changed)
+        assert cached == {features[1]: None} and missing == [features[0], features[2]]
+    print("✅ Cells persist across runs and are checked against fingerprints")
+
+
+class _FakeContext:
+    def __init__(self):
+        self.calls = []
+
+    def normalize_team_name(self, name):
+        return name
+
+    def calculate_features_for_row(self, feature_names=None, **kwargs):
+        self.calls.append(feature_names)
+        return {f: float(len(f)) for f in (feature_names or FEATURES)}
+
+
+FEATURES = ['points|season|avg|diff', 'elo|none|raw|diff']
+
+
+def test_process_chunk_uses_cache():
+    from bball.pipeline.training_pipeline import process_chunk
+
+    df = pd.DataFrame([{'Home': h, 'Away': a, 'Season': SEASON, 'Date': d, 'game_id': gid}
+                       for d, h, a, gid in SCHEDULE])
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = FeatureValueCache(tmp, _fingerprints(SCHEDULE))
+        context = _FakeContext()
+        first = process_chunk(df.copy(), 0, FEATURES, context, feature_cache=cache)
+        assert context.calls == [None] * len(SCHEDULE)
+        cache.flush()
+
+        # Second run over the same data with one new feature: only it is calculated
+        rerun = FeatureValueCache(tmp, _fingerprints(SCHEDULE))
+        context = _FakeContext()
+        second = process_chunk(df.copy(), 0, FEATURES + ['pace|season|avg|diff'], context, feature_cache=rerun)
+        assert context.calls == [['pace|season|avg|diff']] * len(SCHEDULE)
+        pd.testing.assert_frame_equal(first[FEATURES], second[FEATURES])
+    print("✅ process_chunk calculates only uncached cells")
+
+
+def test_row_subsets_not_in_plan_cache():
+    from bball.features import plan
+    from bball.pipeline.shared_context import SharedFeatureContext
+
+    plan.clear_feature_plan_cache()
+    context = SharedFeatureContext.__new__(SharedFeatureContext)
+    context._plan = plan.compile_feature_plan(FEATURES)
+    context.feature_names = FEATURES
+    context._subset_plan = None
+    context.normalize_team_name = lambda name: name
+    context.venue_guid_cache = {}
+    context.per_calculator = None
+    context._computer = type('Computer', (), {
+        'execute_plan': lambda self, row_plan, *args, **kwargs: {f: 1.0 for f in row_plan.stat_feature_names},
+    })()
+
+    for i in range(5):
+        subset = [f'points|games_{i + 2}|avg|diff']
+        values = context.calculate_features_for_row('BOS', 'NYK', SEASON, 2024, 11, 5, feature_names=subset)
+        assert values == {subset[0]: 1.0}
+        assert context._subset_plan[0] == tuple(subset)
+    assert len(plan._PLAN_CACHE) == 1
+    print("✅ Row subsets are compiled outside the shared plan cache")
+
+
+if __name__ == "__main__":
+    test_fingerprint_scopes()
+    test_league_history_covers_all_seasons()
+    test_cache_persists_and_validates()
+    test_process_chunk_uses_cache()
+    test_row_subsets_not_in_plan_cache()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Test compiled feature plans (bball.features.plan).
+
+Tests:
+1. Features are routed to special / regular / composite / PER / injury buckets
+2. Composite time periods expand into weighted sub-feature terms (blend is a
+   weighted mean, delta subtracts the baseline)
+3. Engine sub-features are de-duplicated and grouped by window
+4. Plans are cached by feature-set hash in a bounded LRU; uncached compiles
+   are not stored
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_feature_plan.py
+"""
+
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.features import plan as plan_module
+from bball.features.plan import compile_feature_plan, compile_uncached_feature_plan, FAILED
+
+
+FEATURES = [
+    'Year',
+    'pred_margin',
+    'points|season|avg|home',
+    'points|blend:season:0.7/games_10:0.3|avg|home',
+    'points|delta:games_5-season|avg|diff',
+    'pace|blend-delta:games_5:0.6/games_10:0.4-season|avg|home',
+    'player_team_per|season|weighted_MIN|home',
+    'inj_per|none|top3_sum|home',
+]
+
+
+def test_routing():
+    plan = compile_feature_plan(FEATURES)
+    assert plan.special == ('Year', 'pred_margin')
+    assert [op.name for op in plan.regular] == ['points|season|avg|home']
+    assert len(plan.composite) == 3
+    assert plan.per == ('player_team_per|season|weighted_MIN|home',)
+    assert plan.injury == ('inj_per|none|top3_sum|home',)
+    assert plan.special_values(2024, 11, 3) == {'Year': 2024, 'pred_margin': 0.0}
+    print("✅ Routing")
+
+
+def test_composite_terms_and_windows():
+    plan = compile_feature_plan(FEATURES)
+    blend, delta, blend_delta = plan.composite
+
+    assert blend.terms == (
+        ('points|season|avg|home', 0.7),
+        ('points|games_10|avg|home', 0.3),
+    )
+    assert delta.terms == (('points|games_5|avg|diff', 1.0),)
+    assert delta.baseline_terms == (('points|season|avg|diff', 1.0),)
+    assert blend_delta.baseline_terms == (('pace|season|avg|home', 1.0),)
+
+    # 'points|season|avg|home' is shared by the regular feature and the blend
+    season_window = plan.windows['season']
+    assert season_window.count('points|season|avg|home') == 1
+
+    values = {
+        'points|season|avg|home': 110.0,
+        'points|games_10|avg|home': 100.0,
+        'points|games_5|avg|diff': 4.0,
+        'points|season|avg|diff': 1.0,
+        'pace|games_5|avg|home': None,
+        'pace|games_10|avg|home': 98.0,
+        'pace|season|avg|home': FAILED,
+    }
+    assert abs(blend.evaluate(values) - 107.0) < 1e-9
+    assert delta.evaluate(values) == 3.0
+    try:
+        blend_delta.evaluate(values)
+        raise AssertionError("failed sub-feature should propagate")
+    except ValueError:
+        pass
+    print("✅ Composite terms and windows")
+
+
+def test_plan_cache():
+    assert compile_feature_plan(list(FEATURES)) is compile_feature_plan(tuple(FEATURES))
+    assert compile_feature_plan(FEATURES) is not compile_feature_plan(FEATURES[::-1])
+
+    first = compile_feature_plan(FEATURES)
+    for i in range(plan_module.PLAN_CACHE_MAX_ENTRIES + 10):
+        compile_feature_plan([f'points|games_{i + 1}|avg|home'])
+        compile_feature_plan(FEATURES)  # recently used, never evicted
+    assert len(plan_module._PLAN_CACHE) == plan_module.PLAN_CACHE_MAX_ENTRIES
+    assert compile_feature_plan(FEATURES) is first
+
+    size = len(plan_module._PLAN_CACHE)
+    subset = compile_uncached_feature_plan(FEATURES[2:4])
+    assert subset.feature_names == tuple(FEATURES[2:4]) and len(plan_module._PLAN_CACHE) == size
+    print("✅ Plan cache")
+
+
+if __name__ == "__main__":
+    test_routing()
+    test_composite_terms_and_windows()
+    test_plan_cache()
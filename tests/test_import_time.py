@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the CLI and feature modules.
+
+Each check runs in a fresh interpreter so module caches don't hide the cost:
+1. `python -m bball.cli --help` finishes well under a second
+2. Importing bball.features / bball.features.sets does not build FEATURE_SETS
+3. Importing bball.models.bball_model does not import sklearn
+
+Running the script directly also prints the slowest modules reported by
+`python -X importtime` for `import bball.cli`.
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_import_time.py
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+CLI_HELP_BUDGET_SECONDS = 1.0
+
+
+def _run(args, **kwargs):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = project_root + os.pathsep + env.get('PYTHONPATH', '')
+    return subprocess.run(
+        [sys.executable] + args,
+        cwd=project_root, env=env, capture_output=True, text=True, **kwargs
+    )
+
+
+def _check(code):
+    result = _run(['-c', code])
+    assert result.returncode == 0, result.stderr
+    return result.stdout.strip()
+
+
+def test_cli_help_startup():
+    start = time.perf_counter()
+    result = _run(['-m', 'bball.cli', '--help'])
+    elapsed = time.perf_counter() - start
+    assert result.returncode == 0, result.stderr
+    assert elapsed < CLI_HELP_BUDGET_SECONDS, f"--help took {elapsed:.2f}s"
+    print(f"✅ bball.cli --help in {elapsed:.2f}s")
+
+
+def test_feature_sets_are_lazy():
+    out = _check(
+        "import bball.features, bball.features.sets as s; "
+        "print(s._TABLES is None); "
+        "print(len(bball.features.FEATURE_SETS) > 0); "
+        "print(s._TABLES is not None)"
+    )
+    assert out.split() == ['True', 'True', 'True'], out
+    print("✅ FEATURE_SETS built on first access")
+
+
+def test_bball_model_defers_sklearn():
+    out = _check(
+        "import sys, bball.models.bball_model; "
+        "print(any(m == 'sklearn' or m.startswith('sklearn.') for m in sys.modules))"
+    )
+    assert out == 'False', "bball.models.bball_model imported sklearn at module load"
+    print("✅ bball.models.bball_model import does not load sklearn")
+
+
+def print_import_profile(top=15):
+    """Print the slowest cumulative imports for `import bball.cli`."""
+    result = _run(['-X', 'importtime', '-c', 'import bball.cli; bball.cli.create_cli()'])
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, self_us, cumulative_us, module = [p.strip() for p in line.split('|', 3)]
+        rows.append((int(cumulative_us), module))
+    rows.sort(reverse=True)
+    print(f"\nSlowest imports (cumulative, top {top}):")
+    for cumulative_us, module in rows[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    test_cli_help_startup()
+    test_feature_sets_are_lazy()
+    test_bball_model_defers_sklearn()
+    print_import_profile()
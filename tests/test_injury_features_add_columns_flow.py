@@ -164,7 +164,9 @@ def main() -> int:
     )
 
     print("Validating non-zero values...")
-    df_out = pd.read_csv(sample_csv)
+    # populate_columns writes the column store; export the CSV before reading it
+    from bball.training.master_store import ensure_master_csv
+    df_out = pd.read_csv(ensure_master_csv(sample_csv))
     counts = _scan_nonzero(df_out, targets)
 
     failed = [col for col, cnt in counts.items() if cnt == 0]
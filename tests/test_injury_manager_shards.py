@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test the per-season injury maps in InjuryManager.
+
+Builds a season shard by hand and checks the injury rules:
+1. Did not play, last prior game for the team within RECENCY_THRESHOLD_DAYS
+2. Still on the roster (played for the team later, or last game was for
+   this team this season)
+3. Released shards are dropped
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_injury_manager_shards.py
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.services.injury_manager import InjuryManager, _SeasonShard
+
+SEASON = '2024-2025'
+
+
+def _manager():
+    mgr = InjuryManager(MagicMock())
+    mgr._maps_built = True
+
+    shard = _SeasonShard()
+    shard.team_dates = {
+        'LAL': {
+            'played': ['2024-11-01', '2024-11-10'],
+            'recent': ['2024-11-01', '2024-11-20'],     # out for the game, back later
+            'stale': ['2024-10-01', '2024-12-20'],      # last prior game > 25 days ago
+            'traded': ['2024-11-05'],                   # last game was for BOS
+            'season_end': ['2024-11-08'],               # last game ever, for LAL this season
+        },
+    }
+    shard.played = {('g1', 'LAL'): {'played'}}
+    mgr._season_shards[SEASON] = shard
+
+    mgr._player_team_last_date = {
+        ('played', 'LAL'): '2024-11-10',
+        ('recent', 'LAL'): '2024-11-20',
+        ('stale', 'LAL'): '2024-12-20',
+        ('traded', 'LAL'): '2024-11-05',
+        ('season_end', 'LAL'): '2024-11-08',
+    }
+    mgr._player_last_game_info = {
+        'traded': {'date': '2024-11-09', 'team': 'BOS', 'season': SEASON},
+        'season_end': {'date': '2024-11-08', 'team': 'LAL', 'season': SEASON},
+    }
+    return mgr
+
+
+def test_injury_rules():
+    mgr = _manager()
+    game = {
+        'game_id': 'g1', 'date': '2024-11-12', 'season': SEASON,
+        'homeTeam': {'name': 'LAL'}, 'awayTeam': {'name': 'BOS'},
+    }
+    home, away = mgr.compute_injuries_for_game(game)
+    assert home == ['recent', 'season_end'], home
+    assert away == []
+    print("✅ Injury rules")
+
+
+def test_release_season():
+    mgr = _manager()
+    mgr.release_season(SEASON)
+    assert SEASON not in mgr._season_shards
+    print("✅ Release season")
+
+
+if __name__ == "__main__":
+    test_injury_rules()
+    test_release_season()
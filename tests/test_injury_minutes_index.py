@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test the per team-season minutes index used by injury usage features.
+
+Tests:
+1. TeamSeasonMinutes.stats_as_of matches re-aggregating the records before
+   each date (MPG, games played, last played date)
+2. Max MPG and rotation MPG from the preloaded index match the per-record sums
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_injury_minutes_index.py
+"""
+
+import os
+import random
+import sys
+from collections import defaultdict
+from datetime import datetime
+from types import SimpleNamespace
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.features.injury import InjuryFeatureCalculator, TeamSeasonMinutes
+
+DATES = [f"2024-{m:02d}-{d:02d}" for m in (11, 12) for d in range(1, 29, 2)]
+
+
+def _records(seed=11):
+    rng = random.Random(seed)
+    records = []
+    for date_str in DATES:
+        for pid in rng.sample(range(15), 10):
+            records.append({
+                'player_id': pid, 'team': 'BOS', 'season': '2024-2025',
+                'date': date_str, 'stats': {'min': round(rng.uniform(1, 40), 1)},
+            })
+    return records
+
+
+def _aggregate(records, before_date):
+    agg = defaultdict(lambda: {'total': 0.0, 'games': 0, 'last': None})
+    for r in records:
+        if r['date'] < before_date:
+            a = agg[str(r['player_id'])]
+            a['total'] += r['stats']['min']
+            a['games'] += 1
+            a['last'] = max(filter(None, [a['last'], datetime.strptime(r['date'], '%Y-%m-%d').date()]))
+    return {pid: (a['total'] / a['games'], a['games'], a['last']) for pid, a in agg.items()}
+
+
+def test_stats_as_of_matches_aggregation():
+    records = _records()
+    index = TeamSeasonMinutes('BOS', records)
+    for before_date in ['2024-10-01'] + DATES + ['2025-01-01']:
+        expected = _aggregate(records, before_date)
+        got = index.stats_as_of(before_date)
+        assert set(got) == set(expected), before_date
+        for pid, (mpg, games, last) in expected.items():
+            s = got[pid]
+            assert s['mpg'] == mpg and s['games_played'] == games and s['last_played_date'] == last
+            assert s['last_game_team'] == 'BOS'
+    print("✅ Prefix-sum stats match re-aggregation")
+
+
+def test_team_mpg_queries_from_index():
+    records = _records(seed=5)
+    league = SimpleNamespace(exclude_game_types=['preseason'], raw={'player_filters': {'mpg_thresh': 20}})
+    calc = InjuryFeatureCalculator(db=None, league=league)
+    calc._injury_preloaded_players[('BOS', '2024-2025')] = records
+    calc._injury_cache_loaded = True
+
+    for before_date in ('2024-11-10', '2024-12-15', '2025-01-01'):
+        expected = _aggregate(records, before_date)
+        mpgs = [mpg for mpg, _, _ in expected.values()]
+        assert calc._get_max_mpg_on_team('BOS', '2024-2025', before_date) == max(mpgs)
+        rotation = calc._get_team_rotation_mpg('BOS', '2024-2025', before_date)
+        assert abs(rotation - sum(m for m in mpgs if m >= 20)) < 1e-9
+        stats = calc._get_player_season_stats('BOS', '2024-2025', before_date, ['1', '2', '99'])
+        assert set(stats) == {'1', '2'} & set(expected)
+    print("✅ Max/rotation MPG answered from the index")
+
+
+if __name__ == "__main__":
+    test_stats_as_of_matches_aggregation()
+    test_team_mpg_queries_from_index()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test the slate-level Kalshi market snapshot (get_slate_market_data).
+
+Tests:
+1. One nested-markets events listing serves every game and fills the
+   per-game cache used by get_game_market_data
+2. A game missing from a complete listing is not re-fetched per event
+3. An incomplete listing falls back to per-event requests
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_kalshi_slate_snapshot.py
+"""
+
+import os
+import sys
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.market import kalshi
+
+GAME_DATE = date(2026, 1, 28)
+
+
+def _event(away, home):
+    ticker = f"KXNBAGAME-26JAN28{away}{home}"
+    return {
+        'event_ticker': ticker,
+        'markets': [
+            {'ticker': f"{ticker}-{home}", 'last_price': 60, 'yes_bid': 59, 'yes_ask': 61,
+             'volume': 10, 'status': 'active', 'liquidity_dollars': '100'},
+            {'ticker': f"{ticker}-{away}", 'last_price': 40, 'yes_bid': 39, 'yes_ask': 41,
+             'volume': 5, 'status': 'active', 'liquidity_dollars': '50'},
+        ],
+    }
+
+
+def _client(pages):
+    client = MagicMock()
+    client.get_events.side_effect = pages
+    client.get_event.side_effect = lambda ticker: {'markets': _event(ticker[-6:-3], ticker[-3:])['markets']}
+    return client
+
+
+def _run(client, matchups):
+    kalshi.clear_market_cache()
+    with patch.object(kalshi, 'get_public_client', return_value=client), \
+            patch.object(kalshi, 'load_league_config', return_value=MagicMock(raw={})):
+        return kalshi.get_slate_market_data(GAME_DATE, matchups)
+
+
+def test_single_listing_fills_cache():
+    client = _client([{'events': [_event('SAS', 'HOU'), _event('BOS', 'LAL')], 'cursor': ''}])
+    results = _run(client, [('SAS', 'HOU'), ('BOS', 'LAL'), ('MIA', 'NYK')])
+
+    assert set(results) == {('SAS', 'HOU'), ('BOS', 'LAL')}
+    assert results[('SAS', 'HOU')].home_yes_price == 0.6
+    assert client.get_events.call_count == 1
+    assert client.get_event.call_count == 0  # MIA@NYK has no event in a complete listing
+    assert kalshi._market_cache.get("market:KXNBAGAME-26JAN28BOSLAL") is not None
+    print("✅ Single listing fills cache")
+
+
+def test_incomplete_listing_falls_back():
+    client = _client([{'events': [_event('SAS', 'HOU')], 'cursor': 'next'}] * 5)
+    results = _run(client, [('SAS', 'HOU'), ('BOS', 'LAL')])
+
+    assert set(results) == {('SAS', 'HOU'), ('BOS', 'LAL')}
+    assert client.get_event.call_count == 1
+    print("✅ Incomplete listing falls back per event")
+
+
+if __name__ == "__main__":
+    test_single_listing_fills_cache()
+    test_incomplete_listing_falls_back()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test the shared live snapshot poller (bball.services.live_snapshots).
+
+Tests:
+1. Concurrent first reads of a feed share one upstream fetch
+2. The snapshot version only changes when the data does
+3. A failed refresh keeps the previous data and records the error
+4. snapshot_events pushes one event per version, sends keep-alives, ends
+   after its lifetime and stops when the client disconnects (generator closed)
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_live_snapshots.py
+"""
+
+import os
+import sys
+import threading
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.services.live_snapshots import SnapshotPoller, snapshot_events
+
+
+def test_single_flight():
+    poller = SnapshotPoller()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return {'g1': {'home_score': 10}}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(poller.get(('live', 'nba', 'd'), fetch, 60)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1, len(calls)
+    assert all(r.version == 1 and r.data == {'g1': {'home_score': 10}} for r in results)
+    print("✅ Single-flight first read")
+
+
+def test_version_and_errors():
+    poller = SnapshotPoller()
+    responses = [{'a': 1}, {'a': 1}, {'a': 2}, RuntimeError('upstream down')]
+
+    def fetch():
+        value = responses.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+    key = ('markets', 'nba', 'd')
+    snapshot = poller.get(key, fetch, 60)
+    assert snapshot.version == 1
+
+    feed = poller._feeds[key]
+    poller._refresh(feed)
+    assert feed.snapshot.version == 1          # unchanged data
+    poller._refresh(feed)
+    assert feed.snapshot.version == 2 and feed.snapshot.data == {'a': 2}
+    poller._refresh(feed)
+    assert feed.snapshot.version == 2 and feed.snapshot.data == {'a': 2}
+    assert feed.snapshot.error == 'upstream down'
+    print("✅ Versioning and error handling")
+
+
+def test_event_stream_lifetime():
+    poller = SnapshotPoller()
+    key = ('live', 'nba', 'd')
+    data = [{'g1': 1}]
+
+    def fetch():
+        return dict(data[0])
+
+    start = time.time()
+    events = list(snapshot_events(poller, key, fetch, 60, 'games', max_seconds=0.5, keepalive=0.1))
+    assert time.time() - start < 2.0
+    assert events[0].startswith('retry: ')
+    snapshots = [e for e in events if e.startswith('id: ')]
+    assert len(snapshots) == 1 and '"games": {"g1": 1}' in snapshots[0]
+    assert any(e.startswith(': keep-alive') for e in events)
+
+    stream = snapshot_events(poller, key, fetch, 60, 'games', max_seconds=60, keepalive=0.1)
+    next(stream)
+    assert next(stream).startswith('id: 1')
+    stream.close()  # what the server does when the client disconnects
+    try:
+        next(stream)
+        assert False, "closed stream should stop"
+    except StopIteration:
+        pass
+    print("✅ Event streams end after their lifetime and on disconnect")
+
+
+if __name__ == "__main__":
+    test_single_flight()
+    test_version_and_errors()
+    test_event_stream_lifetime()
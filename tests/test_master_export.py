@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test streaming export of training CSVs (bball.training.master_export).
+
+Tests:
+1. Whole-file and column-projected streams reproduce the CSV, with and
+   without on-the-fly gzip
+2. The ETag changes with the file, the projection and the encoding; the
+   precompressed gzip copy is reused until the file changes
+3. Without waiting, a missing gzip copy is built once in the background
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_master_export.py
+"""
+
+import csv
+import gzip
+import io
+import os
+import sys
+import tempfile
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.training import master_export
+from bball.training.master_export import ensure_gzip_cache, export_etag, iter_csv, iter_gzip
+
+
+def _write_master(path, rows=12000):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Year', 'Month', 'Day', 'Home', 'Away', 'elo|diff', 'HomeWon'])
+        for i in range(rows):
+            writer.writerow([2024, 1 + i % 12, 1 + i % 28, f'H{i % 30}', f'A,{i % 7}', i * 0.5, i % 2])
+
+
+def test_streams_reproduce_csv():
+    master_export.BLOCK_SIZE = 4096
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        _write_master(path)
+        raw = open(path, 'rb').read()
+
+        assert b''.join(iter_csv(path)) == raw
+        assert gzip.decompress(b''.join(iter_gzip(iter_csv(path)))) == raw
+
+        columns = ['Home', 'Away', 'HomeWon']
+        projected = b''.join(iter_csv(path, columns=columns)).decode()
+        expected = [[r['Home'], r['Away'], r['HomeWon']] for r in csv.DictReader(open(path, newline=''))]
+        got = list(csv.reader(io.StringIO(projected)))
+        assert got[0] == columns and got[1:] == expected
+
+        try:
+            iter_csv(path, columns=['Home', 'nope'])
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+    print("✅ Streams reproduce the CSV (whole, projected, gzip)")
+
+
+def test_etag_and_gzip_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        _write_master(path, rows=100)
+        meta = {'updated_at': '2025-01-01T00:00:00', 'feature_count': 1}
+
+        etag = export_etag(path, metadata=meta)
+        assert etag == export_etag(path, metadata=meta)
+        assert etag != export_etag(path, metadata=meta, columns=['Home'])
+        assert etag != export_etag(path, metadata=meta, gzip=True)
+        assert etag != export_etag(path, metadata={**meta, 'updated_at': '2025-01-02'})
+
+        gz_etag = export_etag(path, metadata=meta, gzip=True)
+        cached = ensure_gzip_cache(path, gz_etag)
+        built_at = os.stat(cached).st_mtime_ns
+        assert ensure_gzip_cache(path, gz_etag) == cached
+        assert os.stat(cached).st_mtime_ns == built_at
+        assert gzip.decompress(open(cached, 'rb').read()) == open(path, 'rb').read()
+
+        time.sleep(0.01)
+        _write_master(path, rows=101)
+        new_etag = export_etag(path, metadata=meta, gzip=True)
+        assert new_etag != gz_etag
+        rebuilt = ensure_gzip_cache(path, new_etag)
+        assert rebuilt != cached and not os.path.exists(cached)
+    print("✅ ETag tracks file/projection/encoding; gzip cache reused until the file changes")
+
+
+def test_background_gzip_cache():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        _write_master(path, rows=2000)
+        etag = export_etag(path, gzip=True)
+
+        assert ensure_gzip_cache(path, etag, wait=False) is None
+        assert ensure_gzip_cache(path, etag, wait=False) in (None, master_export.gzip_cache_path(path, etag))
+        deadline = time.time() + 10
+        while (ready := ensure_gzip_cache(path, etag, wait=False)) is None and time.time() < deadline:
+            time.sleep(0.01)
+        assert ready == master_export.gzip_cache_path(path, etag)
+        assert gzip.decompress(open(ready, 'rb').read()) == open(path, 'rb').read()
+        assert not master_export._building
+        assert not [f for f in os.listdir(os.path.dirname(ready)) if f.endswith('.tmp')]
+    print("✅ gzip cache builds in the background")
+
+
+if __name__ == "__main__":
+    test_streams_reproduce_csv()
+    test_etag_and_gzip_cache()
+    test_background_gzip_cache()
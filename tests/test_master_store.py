@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Test the master column store (bball.training.master_store).
+
+Tests:
+1. Building from the CSV and exporting back reproduces the data; reads return
+   only the requested columns
+2. Writing a column adds one file and swaps the manifest without touching the
+   other column files; a CSV changed elsewhere marks the store stale
+3. Column writes leave the CSV alone: master_columns() sees the new column
+   from the manifest and ensure_master_csv() exports it on demand
+4. Writers in separate processes don't lose each other's columns; superseded
+   files outlive the manifest swap until the grace period (or a snapshot) ends
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_master_store.py
+"""
+
+import multiprocessing
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.training import master_store
+from bball.training.master_store import MasterColumnStore, ensure_master_csv, master_columns
+
+
+def _master(rows=1200):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'Year': 2024, 'Month': 1 + np.arange(rows) % 12, 'Day': 1 + np.arange(rows) % 28,
+        'Home': [f'H{i % 30}' for i in range(rows)], 'Away': [f'A{i % 29}' for i in range(rows)],
+        'game_id': np.arange(rows) + 400000000,
+        'elo|none|raw|diff': rng.normal(size=rows),
+        'points|season|avg|diff': rng.normal(size=rows),
+        'HomeWon': rng.integers(0, 2, size=rows),
+    })
+
+
+def test_build_read_export_roundtrip():
+    master_store.CSV_CHUNK_ROWS = 500
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        expected = _master()
+        expected.to_csv(path, index=False)
+
+        store = MasterColumnStore.for_csv(path)
+        assert store.is_current() and store.rows == len(expected)
+        assert store.key_columns == ['Year', 'Month', 'Day', 'Home', 'Away', 'game_id']
+        pd.testing.assert_frame_equal(store.read(), expected)
+
+        subset = store.read(['Home', 'HomeWon', 'missing'])
+        assert list(subset.columns) == ['Home', 'HomeWon']
+        assert store.row_index()[(2024, 2, 2, 'H1', 'A1')] == 1
+
+        store.export_csv()
+        pd.testing.assert_frame_equal(pd.read_csv(path), expected)
+        assert store.is_current()
+    print("✅ Build/read/export round-trips the master")
+
+
+def test_column_write_touches_one_file():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        _master().to_csv(path, index=False)
+        store = MasterColumnStore.for_csv(path)
+        before = dict(store.manifest['files'])
+
+        values = np.linspace(0, 1, store.rows)
+        store.write_columns({'new|season|avg|diff': values})
+        after = MasterColumnStore(path).manifest
+        assert {k: v for k, v in after['files'].items() if k != 'new|season|avg|diff'} == before
+        assert after['columns'][6:9] == ['elo|none|raw|diff', 'new|season|avg|diff', 'points|season|avg|diff']
+        assert np.array_equal(store.read_column('new|season|avg|diff'), values)
+        on_disk = {f for f in os.listdir(store.directory) if f.endswith('.npy')}
+        assert on_disk == set(after['files'].values())
+
+        try:
+            store.write_columns({'short': values[:10]})
+            assert False, "expected ValueError"
+        except ValueError:
+            pass
+
+        # Store still matches the (unchanged) CSV until the CSV is rewritten elsewhere
+        assert store.is_current()
+        with open(path, 'a') as f:
+            f.write('2025,1,1,X,Y,1,0.0,0.0,1\n')
+        assert not MasterColumnStore(path).is_current()
+        assert MasterColumnStore.for_csv(path).rows == store.rows + 1
+    print("✅ Column writes add one file and swap the manifest")
+
+
+def test_lazy_csv_export():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        _master().to_csv(path, index=False)
+        store = MasterColumnStore.for_csv(path)
+        csv_before = open(path, 'rb').read()
+
+        store.write_columns({'new|season|avg|diff': np.arange(store.rows, dtype=float)})
+        assert open(path, 'rb').read() == csv_before
+        assert store.csv_stale and store.is_current()
+        assert 'new|season|avg|diff' in master_columns(path)
+        assert 'new|season|avg|diff' not in pd.read_csv(path, nrows=0).columns
+
+        assert ensure_master_csv(path) == path
+        assert list(pd.read_csv(path, nrows=0).columns) == master_columns(path)
+        reopened = MasterColumnStore(path)
+        assert reopened.is_current() and not reopened.csv_stale
+    print("✅ CSV exported lazily; columns come from the manifest")
+
+
+def _write_in_process(path, prefix, n):
+    store = MasterColumnStore(path)
+    for i in range(n):
+        store.write_columns({f'{prefix}{i}|season|avg|diff': np.full(store.rows, float(i))})
+
+
+def test_process_writers_and_retention():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'MASTER_TRAINING.csv')
+        _master(rows=200).to_csv(path, index=False)
+        store = MasterColumnStore.for_csv(path)
+
+        ctx = multiprocessing.get_context('fork')
+        procs = [ctx.Process(target=_write_in_process, args=(path, p, 8)) for p in ('a', 'b')]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+            assert proc.exitcode == 0
+        written = {c for c in MasterColumnStore(path).columns if c[0] in 'ab' and c[1].isdigit()}
+        assert len(written) == 16, sorted(written)
+
+        # Overwrite: the old file stays for readers that loaded the old manifest
+        old = store.manifest['files']['elo|none|raw|diff']
+        snapshot = store.snapshot()
+        store.write_columns({'elo|none|raw|diff': np.zeros(store.rows)})
+        assert os.path.exists(os.path.join(store.directory, old)) and old in store.manifest['retired']
+        assert np.array_equal(np.load(os.path.join(store.directory, old)), pd.read_csv(path)['elo|none|raw|diff'])
+
+        grace = master_store.RETIRED_GRACE_S
+        master_store.RETIRED_GRACE_S = 0
+        try:
+            store.write_columns({'points|season|avg|diff': np.zeros(store.rows)})
+            # Past the grace period, but pinned by the snapshot
+            assert os.path.exists(os.path.join(store.directory, old))
+            os.unlink(snapshot)
+            store.write_columns({'points|season|avg|diff': np.ones(store.rows)})
+            assert not os.path.exists(os.path.join(store.directory, old))
+            assert not store.manifest['retired']
+        finally:
+            master_store.RETIRED_GRACE_S = grace
+    print("✅ Process writers and retired-file grace period")
+
+
+if __name__ == "__main__":
+    test_build_read_export_roundtrip()
+    test_column_write_touches_one_file()
+    test_lazy_csv_export()
+    test_process_writers_and_retention()
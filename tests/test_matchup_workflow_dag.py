@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test the matchup chat workflow DAG (bball.services.matchup_chat.workflow).
+
+Tests:
+1. Dependencies follow prompt inputs, same-agent order and experimenter barriers
+2. Independent steps run concurrently; dependent steps wait
+3. Parallel steps land in shared-context history in step order, not finish order
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_matchup_workflow_dag.py
+"""
+
+import os
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.services.matchup_chat.schemas import ControllerOptions
+from bball.services.matchup_chat.workflow import build_step_dependencies, run_steps
+
+
+def _wf(*agents):
+    return [{"agent": a, "instruction": ""} for a in agents]
+
+
+def test_dependencies():
+    # research reads stats, stats reads model_inspector
+    assert build_step_dependencies(_wf("model_inspector", "stats_agent", "research_media_agent")) == [set(), {0}, {1}]
+    # research before stats has no input yet: independent of the others
+    assert build_step_dependencies(_wf("research_media_agent", "model_inspector", "stats_agent")) == [set(), set(), {1}]
+    # experimenter waits for everything before it; later steps wait for it
+    assert build_step_dependencies(_wf("research_media_agent", "experimenter", "model_inspector")) == [set(), {0}, {1}]
+    # repeated agent stays ordered
+    assert build_step_dependencies(_wf("research_media_agent", "research_media_agent")) == [set(), {0}]
+    print("✅ Step dependencies")
+
+
+def test_parallel_run():
+    deps = build_step_dependencies(_wf("research_media_agent", "model_inspector", "stats_agent"))
+    started = {}
+    lock = threading.Lock()
+
+    def run(i):
+        with lock:
+            started[i] = time.time()
+        time.sleep(0.2)
+        return i * 10
+
+    t0 = time.time()
+    results = run_steps(3, deps, run, max_workers=4)
+    elapsed = time.time() - t0
+
+    assert results == [0, 10, 20]
+    assert abs(started[0] - started[1]) < 0.1          # independent: concurrent
+    assert started[2] - started[1] >= 0.19             # stats waited for model_inspector
+    assert elapsed < 0.55, elapsed                     # two waves, not three
+    assert run_steps(3, deps, lambda i: i, max_workers=1) == [0, 1, 2]
+    print("✅ Parallel execution")
+
+
+def test_history_in_step_order():
+    from bball.services.matchup_chat import controller as controller_mod
+
+    appended = []
+    repo = MagicMock()
+    repo.get.return_value = {}
+    repo.append_history.side_effect = lambda game_id, entry: appended.append(entry["agent"])
+    ctl = controller_mod.Controller.__new__(controller_mod.Controller)
+    ctl.db, ctl.league, ctl.league_id = None, None, "nba"
+    ctl.repo, ctl.tool_cache = repo, MagicMock()
+    ctl._history_lock = threading.Lock()
+
+    def fake_agent(self, *, game_id, agent, agent_actions, history=None, **_):
+        # The first step finishes last.
+        time.sleep(0.2 if agent == "research_media_agent" else 0.0)
+        self._record_tool_event(game_id=game_id, agent=agent, tool_name="t", args={}, output=None,
+                                agent_actions=agent_actions, history=history)
+        self._record_agent_output(game_id=game_id, agent=agent, output=agent, agent_actions=agent_actions, history=history)
+        return agent
+
+    plan = {"workflow": [{"agent": "research_media_agent", "instruction": ""}, {"agent": "model_inspector", "instruction": ""}]}
+    with patch.object(controller_mod, "ensure_shared_context_baseline", return_value=({}, None)), \
+            patch.object(controller_mod.Controller, "_run_network_agent", fake_agent), \
+            patch.object(controller_mod.Controller, "_default_turn_plan", lambda self, **_: dict(plan)):
+        ctl.handle_user_message(game_id="g1", user_message="tell me about tonight", options=ControllerOptions())
+
+    steps = [a for a in appended if a in ("research_media_agent", "model_inspector")]
+    assert steps == ["research_media_agent"] * 2 + ["model_inspector"] * 2, appended
+    assert appended[0] == "planner" and appended[-1] == "final_synthesizer", appended
+    print("✅ History merged in step order")
+
+
+if __name__ == "__main__":
+    test_dependencies()
+    test_parallel_run()
+    test_history_in_step_order()
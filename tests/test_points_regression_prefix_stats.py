@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test prefix-sum base features in PointsRegressionTrainer.
+
+Checks that season-to-date and last-N window stats computed from the
+per (team, season) cumulative arrays match a direct sum over the same games.
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_points_regression_prefix_stats.py
+"""
+
+import os
+import random
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.models.points_regression import PointsRegressionTrainer
+
+
+def _make_games(n=60, seed=7):
+    rng = random.Random(seed)
+    games = []
+    for i in range(n):
+        opp = rng.choice(['BOS', 'MIA', 'NYK'])
+        home = rng.random() < 0.5
+        team_box = {f: rng.randint(5, 110) for f in PointsRegressionTrainer.BASE_TEAM_FIELDS}
+        opp_box = {f: rng.randint(5, 110) for f in PointsRegressionTrainer.BASE_TEAM_FIELDS}
+        team_box['name'] = 'LAL'
+        opp_box['name'] = opp
+        game = {
+            'date': f"2024-{1 + i // 28:02d}-{1 + i % 28:02d}",
+            'homeTeam': team_box if home else opp_box,
+            'awayTeam': opp_box if home else team_box,
+        }
+        if i % 17 == 0:
+            game['homeTeam']['points'] = 0  # incomplete game keeps its slot
+        games.append(game)
+    return games
+
+
+def _direct_stats(games, team):
+    complete = [g for g in games if g['homeTeam']['points'] > 0]
+    if not complete:
+        return {}
+    pts = poss = opp_pts = 0.0
+    for g in complete:
+        side, opp = ('homeTeam', 'awayTeam') if g['homeTeam']['name'] == team else ('awayTeam', 'homeTeam')
+        t = g[side]
+        pts += t['points']
+        opp_pts += g[opp]['points']
+        poss += t['FG_att'] - t['off_reb'] + t['TO'] + 0.4 * t['FT_att']
+    return {
+        'offRtg': 100 * pts / poss,
+        'defRtg': 100 * opp_pts / poss,
+        'pace': poss / len(complete),
+        'points_avg': pts / len(complete),
+    }
+
+
+def test_prefix_windows_match_direct_sums():
+    """Every (lo, hi) window from prefix sums equals a direct sum over games[lo:hi]."""
+    trainer = PointsRegressionTrainer.__new__(PointsRegressionTrainer)
+    games = _make_games()
+    prefix = trainer._build_team_stat_prefix('LAL', games)
+
+    for hi in range(len(games) + 1):
+        for window in (None, 10, 5):
+            lo = 0 if window is None else max(0, hi - window)
+            expected = _direct_stats(games[lo:hi], 'LAL')
+            actual = trainer._window_team_stats(prefix, lo, hi)
+            if not expected:
+                assert actual == {}
+                continue
+            for key, value in expected.items():
+                assert abs(actual[key] - value) < 1e-9, (hi, window, key, actual[key], value)
+
+    print("✅ Prefix-sum windows match direct sums")
+
+
+if __name__ == "__main__":
+    test_prefix_windows_match_direct_sums()
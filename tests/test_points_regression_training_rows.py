@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test PointsRegressionTrainer.create_training_data against the original per-game loop.
+
+Tests:
+1. The DataFrame (features, targets, Year/Month/Day/Home/Away metadata) matches
+   the original loop's output row for row, including skipped unscored games
+   and games whose feature build raises
+2. Progress callbacks fire on the first, every 50th and the last game
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_points_regression_training_rows.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.models import points_regression
+from bball.models.points_regression import PointsRegressionTrainer
+
+FEATURES = ['off_rtg|season|avg|diff', 'pace|games_10|avg|home']
+
+
+def _games(n=130):
+    games = []
+    for i in range(n):
+        games.append({
+            'game_id': str(i),
+            'year': 2024, 'month': 1 + i // 28, 'day': 1 + i % 28,
+            'season': '2023-2024',
+            'homeTeam': {'name': 'LAL', 'points': 0 if i % 13 == 0 else 100 + i % 9},
+            'awayTeam': {'name': 'BOS', 'points': 95 + i % 7},
+        })
+    return games
+
+
+def _feature_vector(game, before_date, selected_features):
+    if game['game_id'] == '7':
+        raise ValueError("bad game")
+    base = int(game['game_id'])
+    return [base * 1.5, base + len(before_date)], list(selected_features)
+
+
+def _original_loop(games, selected_features):
+    """The per-game loop create_training_data used before the preload changes."""
+    X_list, y_home, y_away, metadata, names = [], [], [], [], []
+    for game in games:
+        try:
+            year, month, day = game.get('year', 0), game.get('month', 0), game.get('day', 0)
+            before_date = f"{year}-{month:02d}-{day:02d}"
+            feature_vector, feature_names = _feature_vector(game, before_date, selected_features)
+            names = names or feature_names
+            home_points = game.get('homeTeam', {}).get('points', 0)
+            away_points = game.get('awayTeam', {}).get('points', 0)
+            if home_points > 0 and away_points > 0:
+                X_list.append(feature_vector)
+                y_home.append(home_points)
+                y_away.append(away_points)
+                metadata.append({'year': year, 'month': month, 'day': day,
+                                 'home': game['homeTeam']['name'], 'away': game['awayTeam']['name']})
+        except Exception:
+            continue
+    df = pd.DataFrame(np.array(X_list), columns=names)
+    df['home_points'] = y_home
+    df['away_points'] = y_away
+    for i, meta in enumerate(metadata):
+        df.loc[i, 'Year'] = meta['year']
+        df.loc[i, 'Month'] = meta['month']
+        df.loc[i, 'Day'] = meta['day']
+        df.loc[i, 'Home'] = meta['home']
+        df.loc[i, 'Away'] = meta['away']
+    return df
+
+
+class _GamesRepository:
+    games = []
+
+    def __init__(self, db, league=None):
+        pass
+
+    def find(self, query, projection=None, sort=None):
+        return list(self.games)
+
+
+def _trainer():
+    trainer = PointsRegressionTrainer.__new__(PointsRegressionTrainer)
+    trainer.db = None
+    trainer.league = None
+    trainer.feature_names = None
+    trainer.per_calculator = None
+    trainer._injury_calculator = None
+    trainer._venue_location_cache = {}
+    trainer._top_ppg_cache = {}
+    trainer._preload_training_games = lambda games: ['2023-2024']
+    trainer._build_venue_location_cache = lambda: None
+    trainer._build_top_ppg_cache = lambda games: None
+    trainer._build_feature_vector = _feature_vector
+    return trainer
+
+
+def _create(progress=None):
+    original = points_regression.GamesRepository
+    points_regression.GamesRepository = _GamesRepository
+    try:
+        return _trainer().create_training_data(
+            query={}, selected_features=FEATURES, progress_callback=progress,
+        )
+    finally:
+        points_regression.GamesRepository = original
+
+
+def test_matches_original_loop():
+    games = _games()
+    _GamesRepository.games = games
+    df = _create()
+    expected = _original_loop(games, FEATURES)
+    assert len(df) == len(expected) == len([g for g in games if g['homeTeam']['points'] and g['game_id'] != '7'])
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    print("✅ Training rows match the original per-game loop")
+
+
+def test_progress_callback():
+    _GamesRepository.games = _games()
+    calls = []
+    _create(progress=lambda done, total, pct: calls.append((done, total)))
+    assert [c[0] for c in calls] == [1, 50, 100, 130] and all(c[1] == 130 for c in calls)
+    print("✅ Progress reported on first, every 50th and last game")
+
+
+if __name__ == "__main__":
+    test_matches_original_loop()
+    test_progress_callback()
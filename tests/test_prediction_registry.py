@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Test the shared per-league PredictionService registry.
+
+Tests:
+1. One service per league, created once even under concurrent access
+2. A selected-config change drops cached models; a data change (games, player
+   stats, an in-place game correction or an Elo cache rewrite) drops cached
+   contexts; both checks are rate-limited
+3. predict_matchup builds the context and player lists outside _predict_lock
+   and holds it only while binding the model and predicting
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_prediction_registry.py
+"""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.services import prediction
+from bball.services.prediction import PredictionService
+from bball.services.prediction_registry import PredictionServiceRegistry
+
+
+class FakeService:
+    created = 0
+
+    def __init__(self, db=None, league=None):
+        time.sleep(0.01)
+        FakeService.created += 1
+        self.db = db
+        self.league = league
+        self.selected = {'_id': 'cfg1', 'model_artifact_path': '/models/a.pkl'}
+        self.completed_games = 100
+        self.model_clears = 0
+        self.context_clears = 0
+        self._context_cache = {}
+        self._model_cache = {}
+        self._points_model_cache = {}
+        db['stats_nba'].count_documents.side_effect = lambda q: self.completed_games
+        self.games_updated_at = 't1'
+        db['stats_nba'].find_one.side_effect = (
+            lambda q, projection=None, sort=None: {'updated_at': self.games_updated_at}
+        )
+        db['stats_nba_players'].find_one.return_value = None
+        db['stats_nba_players'].count_documents.return_value = 2000
+        db['nba_cached_elo_ratings'].count_documents.return_value = 3000
+        self.elo_updated_at = 'run1'
+        db['nba_cached_elo_ratings_checkpoint'].find_one.side_effect = (
+            lambda q, projection=None: {'updated_at': self.elo_updated_at}
+        )
+
+    def _get_selected_classifier_config(self):
+        return self.selected
+
+    def _get_selected_points_config(self):
+        return None
+
+    def _get_season_from_date(self, d):
+        return '2025-2026'
+
+    def clear_model_cache(self):
+        self.model_clears += 1
+
+    def clear_context_cache(self):
+        self.context_clears += 1
+
+
+def _league(league_id):
+    return SimpleNamespace(
+        league_id=league_id,
+        collections={'games': 'stats_nba', 'player_stats': 'stats_nba_players',
+                     'elo_cache': 'nba_cached_elo_ratings'},
+    )
+
+
+def _db():
+    db = MagicMock()
+    db.name = 'bball'
+    collections = {}
+    db.__getitem__.side_effect = lambda name: collections.setdefault(name, MagicMock())
+    return db
+
+
+def test_one_service_per_league():
+    FakeService.created = 0
+    registry = PredictionServiceRegistry()
+    db = _db()
+    with patch('bball.services.prediction.PredictionService', FakeService):
+        services = []
+        threads = [threading.Thread(target=lambda: services.append(registry.get(db, _league('nba'))))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        other = registry.get(db, _league('cbb'))
+
+    assert FakeService.created == 2
+    assert all(s is services[0] for s in services)
+    assert other is not services[0]
+    print("✅ One shared service per league")
+
+
+def test_invalidation_on_config_and_data_change():
+    registry = PredictionServiceRegistry(config_check_seconds=0, data_check_seconds=0)
+    db = _db()
+    with patch('bball.services.prediction.PredictionService', FakeService):
+        service = registry.get(db, _league('nba'))
+        assert registry.get(db, _league('nba')) is service
+        assert service.model_clears == 0 and service.context_clears == 0
+
+        service.selected = {'_id': 'cfg2', 'model_artifact_path': '/models/b.pkl'}
+        registry.get(db, _league('nba'))
+        assert service.model_clears == 1 and service.context_clears == 0
+
+        service.completed_games = 105
+        registry.get(db, _league('nba'))
+        assert service.model_clears == 1 and service.context_clears == 1
+
+        service.elo_updated_at = 'full_replay'
+        registry.get(db, _league('nba'))
+        assert service.context_clears == 2
+
+        # Same counts, corrected game: the updated_at watermark moves
+        service.games_updated_at = 't2'
+        registry.get(db, _league('nba'))
+        assert service.context_clears == 3
+
+        # Rate-limited: changes are only seen once the check interval passes
+        registry.config_check_seconds = registry.data_check_seconds = 3600
+        service.selected = {'_id': 'cfg3'}
+        service.completed_games = 110
+        registry.get(db, _league('nba'))
+        assert service.model_clears == 1 and service.context_clears == 3
+    print("✅ Config and data changes invalidate caches")
+
+
+def _held_elsewhere(lock):
+    """True if another thread holds lock."""
+    result = []
+    def probe():
+        acquired = lock.acquire(blocking=False)
+        result.append(not acquired)
+        if acquired:
+            lock.release()
+    t = threading.Thread(target=probe)
+    t.start()
+    t.join()
+    return result[0]
+
+
+def test_predict_lock_scope():
+    service = PredictionService.__new__(PredictionService)
+    service.db = MagicMock()
+    service.league = None
+    service._team_abbrev_map = {}
+    service._games_repo = MagicMock()
+    service._context_cache = prediction.OrderedDict()
+    service._context_lock = threading.Lock()
+    service._predict_lock = threading.RLock()
+    service._get_selected_classifier_config = lambda: {'_id': 'cfg1'}
+    service._build_prediction_result = lambda *args: 'result'
+
+    held = {}
+
+    class FakeContext:
+        def __init__(self, **kwargs):
+            held['context'] = _held_elsewhere(service._predict_lock)
+
+    def player_lists(**kwargs):
+        held['players'] = _held_elsewhere(service._predict_lock)
+        return {}
+
+    model = MagicMock()
+    def load_model(config, context):
+        held['model'] = _held_elsewhere(service._predict_lock)
+        return model
+    service._load_classifier_model = load_model
+
+    with patch.object(prediction, 'PredictionContext', FakeContext), \
+            patch.object(prediction, 'build_player_lists_for_prediction', player_lists), \
+            patch.object(prediction.ModelConfigManager, 'validate_config_for_prediction',
+                         return_value=(True, None)):
+        result = service.predict_matchup('LAL', 'BOS', '2025-01-15', include_points=False)
+
+    assert result == 'result'
+    assert held == {'context': False, 'players': False, 'model': True}
+    assert model.predict_with_player_config.call_count == 1
+    print("✅ Only model binding and prediction run under the predict lock")
+
+
+if __name__ == "__main__":
+    test_one_service_per_league()
+    test_invalidation_on_config_and_data_change()
+    test_predict_lock_scope()
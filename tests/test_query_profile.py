@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test the query-shape profiler and index advisor (bball.data.query_profile).
+
+Tests:
+1. Commands are reduced to shapes (values dropped) and counted with latency,
+   and per-process profile files merge
+2. The advisor orders keys equality -> sort -> range, splits top-level $or
+   into one index per branch, and skips shapes existing indexes already serve
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_query_profile.py
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.data.query_profile import QueryProfiler, load_profiles, recommend_indexes
+
+LEAGUE = SimpleNamespace(
+    league_id='nba',
+    collections={'games': 'nba_games', 'player_stats': 'nba_player_stats'},
+)
+
+
+def _record(profiler, request_id, command_name, command, ms):
+    profiler.started(SimpleNamespace(command_name=command_name, command=command,
+                                     connection_id=('localhost', 27017), request_id=request_id))
+    profiler.succeeded(SimpleNamespace(duration_micros=int(ms * 1000),
+                                       connection_id=('localhost', 27017), request_id=request_id))
+
+
+def _profile():
+    profiler = QueryProfiler()
+    for i, date in enumerate(['2025-01-10', '2025-01-11', '2025-01-12']):
+        _record(profiler, 10 * i + 1, 'find', {
+            'find': 'nba_games',
+            'filter': {'season': '2024-2025', 'date': {'$lt': date}},
+            'sort': {'date': -1},
+        }, 40)
+        _record(profiler, 10 * i + 2, 'find', {
+            'find': 'nba_games',
+            'filter': {'$or': [{'homeTeam.name': 'LAL'}, {'awayTeam.name': 'LAL'}], 'date': {'$lt': date}},
+            'sort': {'date': -1},
+        }, 30)
+        _record(profiler, 10 * i + 3, 'find', {
+            'find': 'nba_player_stats',
+            'filter': {'team': 'LAL', 'season': '2024-2025', 'date': {'$lt': date}},
+        }, 20)
+        _record(profiler, 10 * i + 4, 'find', {'find': 'nba_games', 'filter': {'game_id': str(i)}}, 1)
+        _record(profiler, 10 * i + 5, 'insert', {'insert': 'nba_games', 'documents': []}, 1)
+    return profiler
+
+
+def test_shapes_and_merge():
+    profiler = _profile()
+    shapes = profiler.snapshot()
+    assert len(shapes) == 4
+    slowest = shapes[0]
+    assert slowest['collection'] == 'nba_games'
+    assert slowest['filter'] == {'date': {'$lt': '?'}, 'season': '?'}
+    assert slowest['sort'] == ['date']
+    assert slowest['count'] == 3 and abs(slowest['total_ms'] - 120) < 1e-6
+
+    directory = tempfile.mkdtemp()
+    first = profiler.dump(directory)
+    os.rename(first, os.path.join(directory, 'queries-1.json'))
+    profiler.dump(directory)
+    merged = load_profiles(directory)
+    assert len(merged) == 4
+    assert merged[0]['count'] == 6
+    print("✅ Query shapes recorded and merged")
+
+
+def test_recommendations():
+    shapes = _profile().snapshot()
+    existing = {
+        'nba_games': [{'key': [('_id', 1)]}, {'key': [('game_id', 1)], 'unique': True}],
+        'nba_player_stats': [{'key': [('team', 1), ('season', 1), ('date', 1)]}],
+    }
+    recs = recommend_indexes(shapes, league=LEAGUE, existing=existing)
+
+    games = [[tuple(k) for k in entry['keys']] for entry in recs['games']]
+    assert games[0] == [('season', 1), ('date', 1)]
+    assert [('homeTeam.name', 1), ('date', 1)] in games
+    assert [('awayTeam.name', 1), ('date', 1)] in games
+    assert len(games) == 3  # game_id lookups are served by the unique index
+    assert 'player_stats' not in recs  # team/season/date index already exists
+    print("✅ Index recommendations")
+
+
+if __name__ == "__main__":
+    test_shapes_and_merge()
+    test_recommendations()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Test the bounded LRU + TTL result cache (bball.services.result_cache).
+
+Tests:
+1. Entry and byte budgets evict least-recently-used entries; TTL expires
+2. Concurrent misses on one key run a single fetch (single-flight)
+3. A disk tier shares entries between caches (e.g. gunicorn workers); a tier
+   missing a method can't be created
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_result_cache.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.services.result_cache import CacheTier, DiskCacheTier, ResultCache
+
+
+def test_lru_and_ttl():
+    cache = ResultCache(max_entries=2, max_bytes=10_000)
+    cache.set("a", "x")
+    cache.set("b", "y")
+    assert cache.get("a") == "x"          # a is now most recent
+    cache.set("c", "z")
+    assert cache.get("b") is None         # b evicted
+    assert cache.get("a") == "x" and cache.get("c") == "z"
+
+    cache = ResultCache(max_entries=100, max_bytes=250)
+    cache.set("big1", "x" * 100)
+    cache.set("big2", "x" * 100)
+    cache.set("big3", "x" * 100)
+    assert cache.get("big1") is None and cache.stats()["bytes"] <= 250
+
+    cache.set("short", "v", ttl_s=-1)
+    assert cache.get("short") is None
+    stats = cache.stats()
+    assert stats["evictions"] >= 1 and stats["expirations"] == 1
+    print("✅ LRU eviction and TTL")
+
+
+def test_single_flight():
+    cache = ResultCache()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return "article text"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("article:u", fetch)))
+        for _ in range(6)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1 and results == ["article text"] * 6
+    assert cache.stats()["coalesced"] == 5
+    print("✅ Single-flight fetch")
+
+
+def test_disk_tier_shared():
+    with tempfile.TemporaryDirectory() as tmp:
+        worker_a = ResultCache(tier=DiskCacheTier(tmp))
+        worker_b = ResultCache(tier=DiskCacheTier(tmp))
+        worker_a.set("serp:q", [{"link": "https://x"}])
+        assert worker_b.get("serp:q") == [{"link": "https://x"}]
+        assert worker_b.stats()["tier_hits"] == 1
+        assert worker_b.get("serp:q") == [{"link": "https://x"}]
+        assert worker_b.stats()["hits"] == 1  # promoted into memory
+
+    class NoDelete(CacheTier):
+        def get(self, key):
+            return None
+
+        def set(self, key, value, expires_at):
+            pass
+
+    try:
+        NoDelete()
+        assert False, "expected TypeError"
+    except TypeError:
+        pass
+    print("✅ Disk tier shared across caches")
+
+
+if __name__ == "__main__":
+    test_lru_and_ttl()
+    test_single_flight()
+    test_disk_tier_shared()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Test the per (team, season) schedule index (bball.features.schedule).
+
+Tests:
+1. Days rest and plays-on-date are bisect lookups
+   that skip excluded game types
+2. Travel miles over days_N match a direct walk over the window, including
+   games without venue coordinates and the final leg to the target venue
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_schedule_index.py
+"""
+
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.features.custom_stats import haversine_miles
+from bball.features.schedule import ScheduleIndex
+
+VENUES = {
+    'LAL': (34.043, -118.267),
+    'BOS': (42.366, -71.062),
+    'MIA': (25.781, -80.188),
+    'DEN': (39.749, -105.008),
+}
+
+SEASON = '2024-2025'
+
+
+def _game(date, home, away, venue=True, game_type='regseason'):
+    game = {'date': date, 'homeTeam': {'name': home}, 'awayTeam': {'name': away}, 'game_type': game_type}
+    if venue:
+        game['venue_guid'] = home
+    return game
+
+
+GAMES = [
+    _game('2024-10-20', 'LAL', 'BOS', game_type='preseason'),
+    _game('2024-11-01', 'LAL', 'BOS'),
+    _game('2024-11-03', 'MIA', 'LAL'),
+    _game('2024-11-04', 'BOS', 'LAL', venue=False),
+    _game('2024-11-06', 'DEN', 'LAL'),
+    _game('2024-11-07', 'LAL', 'MIA'),
+]
+
+
+def _index():
+    team_games_index = {SEASON: {'LAL': [(g['date'], g) for g in GAMES]}}
+    return ScheduleIndex(team_games_index, VENUES, ['preseason', 'allstar'])
+
+
+def test_rest_and_counts():
+    schedule = _index().get('LAL', SEASON)
+    assert schedule.days_rest('2024-11-01') == 7       # preseason game excluded
+    assert schedule.days_rest('2024-11-03') == 2
+    assert schedule.days_rest('2024-11-07') == 1
+    assert schedule.days_rest('2024-12-31') == 7       # capped
+    assert schedule.plays_on('2024-11-04')
+    assert not schedule.plays_on('2024-11-05')
+    assert not schedule.plays_on('2024-10-20')
+    assert _index().get('NYK', SEASON) is None
+    print("✅ Rest and plays-on-date")
+
+
+def test_travel_miles():
+    schedule = _index().get('LAL', SEASON)
+    # 2024-11-04 has no venue, so the chain is MIA -> DEN, then DEN -> target (LAL)
+    expected = (
+        haversine_miles(*VENUES['MIA'], *VENUES['DEN']) +
+        haversine_miles(*VENUES['DEN'], *VENUES['LAL'])
+    )
+    actual = schedule.travel_miles('2024-11-07', 5, VENUES['LAL'])
+    assert abs(actual - expected) < 1e-6, (actual, expected)
+    assert schedule.travel_miles('2024-11-01', 5, VENUES['LAL']) == 0.0
+    print("✅ Travel miles")
+
+
+if __name__ == "__main__":
+    test_rest_and_counts()
+    test_travel_miles()
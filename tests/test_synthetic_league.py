@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test the synthetic league generator (bball.data.synthetic).
+
+Tests:
+1. Games carry the espn_sync schema and box scores add up: made <= att,
+   points = 2*FG + three + FT, quarters + OT = points, winner = homeWon
+2. Player lines add up to their team's box score; injured players appear in
+   injured_players and as DNP documents; ids and seasons line up with rosters
+3. Scale knobs: team count, games per team, generation is seeded; a non-empty
+   games collection is refused without drop
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_synthetic_league.py
+"""
+
+import os
+import sys
+from collections import Counter, defaultdict
+from types import SimpleNamespace
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.data.synthetic import (
+    SyntheticLeagueGenerator,
+    SyntheticLeagueSpec,
+    _BulkWriter,
+    generate_synthetic_league,
+)
+
+LEAGUE = SimpleNamespace(
+    league_id='nba',
+    include_team_id=True,
+    collections={
+        'games': 'stats_nba', 'player_stats': 'stats_nba_players', 'players': 'players_nba',
+        'teams': 'teams_nba', 'venues': 'nba_venues', 'rosters': 'nba_rosters',
+    },
+)
+
+
+class _Collection(list):
+    def insert_many(self, docs, ordered=True):
+        self.extend(docs)
+
+    def estimated_document_count(self):
+        return len(self)
+
+
+class _Db(dict):
+    def __missing__(self, name):
+        self[name] = _Collection()
+        return self[name]
+
+
+def _generate(**spec_kwargs):
+    spec = SyntheticLeagueSpec(end_season='2023-2024', **spec_kwargs)
+    db = _Db()
+    SyntheticLeagueGenerator(LEAGUE, spec, _BulkWriter(db)).run(spec.season_list())
+    return db
+
+
+def test_game_box_scores():
+    db = _generate(seasons=2, teams=6, games_per_team=10)
+    games = db['stats_nba']
+    assert {g['season'] for g in games} == {'2022-2023', '2023-2024'}
+    assert len({g['game_id'] for g in games}) == len(games)
+    venues = {v['venue_guid'] for v in db['nba_venues']}
+    for g in games:
+        assert g['venue_guid'] in venues and set(g['pregame_lines']) == {'over_under', 'spread', 'home_ml', 'away_ml'}
+        assert g['homeWon'] == (g['homeTeam']['points'] > g['awayTeam']['points'])
+        for side in ('homeTeam', 'awayTeam'):
+            t = g[side]
+            assert t['FG_made'] <= t['FG_att'] and t['three_made'] <= t['three_att'] and t['FT_made'] <= t['FT_att']
+            assert t['points'] == 2 * t['FG_made'] + t['three_made'] + t['FT_made']
+            assert t['points'] == sum(t[f'points{q}q'] for q in range(1, 5)) + t['pointsOT']
+            assert t['total_reb'] == t['off_reb'] + t['def_reb']
+            assert 0 < t['TO_metric'] < 1 and 0 < t['off_reb_metric'] < 1
+        assert g['OT'] == (g['homeTeam']['pointsOT'] > 0 or g['awayTeam']['pointsOT'] > 0)
+    assert Counter(g['game_type'] for g in games)['preseason'] == 2 * 2 * 3
+    print("✅ Game documents match the schema and box scores add up")
+
+
+def test_player_lines_match_team():
+    db = _generate(seasons=1, teams=4, games_per_team=20, injury_rate=0.05)
+    by_game = defaultdict(list)
+    for p in db['stats_nba_players']:
+        by_game[(p['game_id'], p['team'])].append(p)
+    rostered = {(r['team'], r['season']): {e['player_id'] for e in r['roster']} for r in db['nba_rosters']}
+    dnp_seen = 0
+    for g in db['stats_nba']:
+        for side, home in (('homeTeam', True), ('awayTeam', False)):
+            t = g[side]
+            players = by_game[(g['game_id'], t['name'])]
+            played = [p for p in players if not p['didNotPlay']]
+            dnp = sorted(p['player_id'] for p in players if p['didNotPlay'])
+            assert dnp == t['injured_players']
+            dnp_seen += len(dnp)
+            assert {p['player_id'] for p in players} == rostered[(t['name'], g['season'])]
+            assert all(p['home'] == home and p['team_id'] == t['team_id'] for p in players)
+            assert sum(p['stats']['pts'] for p in played) == t['points']
+            assert sum(p['stats']['fg_att'] for p in played) == t['FG_att']
+            assert sum(p['stats']['reb'] for p in played) == t['total_reb']
+            assert sum(p['starter'] for p in played) == 5
+            assert all(p['stats']['fg_made'] <= p['stats']['fg_att'] for p in played)
+    assert dnp_seen > 0
+    print("✅ Player lines add up to team totals; injuries are DNPs")
+
+
+def test_scale_and_seed():
+    spec = SyntheticLeagueSpec(teams=30, scale=5)
+    assert spec.team_count == 150
+    assert SyntheticLeagueSpec(teams=5).team_count == 6
+    assert SyntheticLeagueSpec(seasons=2, end_season='2024-2025').season_list() == ['2023-2024', '2024-2025']
+
+    db = _generate(seasons=1, teams=8, games_per_team=12, preseason_games=0)
+    per_team = Counter()
+    for g in db['stats_nba']:
+        per_team[g['homeTeam']['name']] += 1
+        per_team[g['awayTeam']['name']] += 1
+    assert len(db['teams_nba']) == 8 and set(per_team.values()) == {12}
+    again = _generate(seasons=1, teams=8, games_per_team=12, preseason_games=0)
+    strip = lambda docs: [{k: v for k, v in d.items() if k != 'updated_at'} for d in docs]
+    assert strip(db['stats_nba']) == strip(again['stats_nba'])
+
+    try:
+        generate_synthetic_league(db, LEAGUE, SyntheticLeagueSpec(seasons=1))
+        assert False, "expected ValueError"
+    except ValueError:
+        pass
+    print("✅ Scale knobs and seeding behave; existing data is not overwritten")
+
+
+if __name__ == "__main__":
+    test_game_box_scores()
+    test_player_lines_match_team()
+    test_scale_and_seed()
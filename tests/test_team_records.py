@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test the materialized team records (bball.stats.team_records).
+
+Tests:
+1. Records built from the entries match counting the games directly (overall,
+   home/away, last 10, excluded game types, scored-only)
+2. record_game replaces a game's entry under every team identifier and
+   ignores games without a result
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_team_records.py
+"""
+
+import os
+import random
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.stats.team_records import _entries, record_game, summarize_entries
+
+TEAMS = ['LAL', 'BOS', 'NYK', 'MIA']
+
+
+def _games(seed=3):
+    rng = random.Random(seed)
+    games = []
+    for i in range(200):
+        home, away = rng.sample(TEAMS, 2)
+        games.append({
+            'game_id': str(i),
+            'date': f"2025-{i // 28 + 1:02d}-{i % 28 + 1:02d}",
+            'season': '2024-2025',
+            'game_type': rng.choice(['regseason'] * 8 + ['preseason', 'playoffs']),
+            'homeTeam': {'name': home, 'points': 0 if rng.random() < 0.05 else 100},
+            'awayTeam': {'name': away, 'points': 95},
+            'homeWon': rng.random() < 0.55,
+        })
+    return games
+
+
+def _direct(games, team, before_date, excluded, scored_only):
+    played = sorted(
+        (g for g in games
+         if team in (g['homeTeam']['name'], g['awayTeam']['name'])
+         and g['date'] < before_date and g['game_type'] not in excluded
+         and (not scored_only or (g['homeTeam']['points'] > 0 and g['awayTeam']['points'] > 0))),
+        key=lambda g: g['date'],
+    )
+    results = [(g['homeTeam']['name'] == team, g['homeWon'] == (g['homeTeam']['name'] == team)) for g in played]
+    last10 = results[-10:]
+    return {
+        'wins': sum(w for _, w in results),
+        'losses': sum(not w for _, w in results),
+        'home_wins': sum(h and w for h, w in results),
+        'home_losses': sum(h and not w for h, w in results),
+        'away_wins': sum(not h and w for h, w in results),
+        'away_losses': sum(not h and not w for h, w in results),
+        'last10_wins': sum(w for _, w in last10),
+        'last10_losses': sum(not w for _, w in last10),
+    }
+
+
+def test_summary_matches_direct_count():
+    games = _games()
+    entries = {}
+    for game in games:
+        for team, entry in _entries(game, 'name'):
+            entries.setdefault(team, []).append(entry)
+    for team_entries in entries.values():
+        team_entries.sort(key=lambda e: e['date'])
+
+    for team in TEAMS:
+        for before_date in ('2025-01-15', '2025-04-01', '2025-12-31'):
+            for excluded in ([], ['preseason']):
+                for scored_only in (False, True):
+                    expected = _direct(games, team, before_date, excluded, scored_only)
+                    got = summarize_entries(entries[team], before_date, excluded, scored_only)
+                    assert got == expected, (team, before_date, excluded, scored_only, got, expected)
+    print("✅ Materialized records match direct counts")
+
+
+def test_record_game_updates_every_identifier():
+    db = MagicMock()
+    db.name = 'bball'
+    coll = MagicMock()
+    coll.name = 'cbb_games_team_records'
+    db.__getitem__.return_value = coll
+    league = SimpleNamespace(collections={'games': 'cbb_games'}, team_primary_identifier='id')
+
+    game = {
+        'game_id': '401', 'date': '2025-01-10', 'season': '2024-2025', 'game_type': 'regseason',
+        'homeTeam': {'id': '52', 'name': 'Duke', 'points': 80},
+        'awayTeam': {'id': '153', 'name': 'UNC', 'points': 75},
+        'homeWon': True,
+    }
+    assert record_game(db, league, game) == 4
+    calls = coll.update_one.call_args_list
+    assert [c.args[0]['team'] for c in calls] == ['52', '52', 'Duke', 'Duke', '153', '153', 'UNC', 'UNC']
+    # Each identifier: pull the old entry, then push the new one
+    assert calls[0].args[1] == {'$pull': {'games': {'game_id': '401'}}}
+    pushed = calls[1].args[1]['$push']['games']['$each'][0]
+    assert pushed['won'] is True and pushed['home'] is True
+    assert calls[5].args[1]['$push']['games']['$each'][0]['won'] is False
+
+    unfinished = {k: v for k, v in game.items() if k != 'homeWon'}
+    coll.update_one.reset_mock()
+    assert record_game(db, league, unfinished) == 0
+    assert not coll.update_one.called
+    print("✅ record_game updates every identifier, skips unfinished games")
+
+
+if __name__ == "__main__":
+    test_summary_matches_direct_count()
+    test_record_game_updates_every_identifier()
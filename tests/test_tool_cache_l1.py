@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the in-process L1 in front of the matchup chat ToolCache.
+
+Tests:
+1. Args hashes match the original JSON round-trip hashing
+2. After prefetch(game_id), hits and misses for the game make no Mongo calls
+3. Expired outputs are not served from L1
+4. Mutating a returned output leaves the cached value intact
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_tool_cache_l1.py
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.services.matchup_chat import tool_cache
+from bball.services.matchup_chat.tool_cache import ToolCache, _json_safe
+
+
+def _fresh_cache():
+    tool_cache._l1 = None
+    db = MagicMock()
+    return ToolCache(db=db, league_id="nba"), db["nba_agent_tool_cache"]
+
+
+def test_hash_compatible():
+    for args in [{}, {"team_id": "LAL", "window": "games10"}, {"ids": (1, 2), "name": "Dončić"}]:
+        payload = {"_v": 2, "args": _json_safe(args)}
+        expected = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+        assert ToolCache._hash_args(args, cache_schema_version=2) == expected, args
+    print("✅ Args hash compatible")
+
+
+def test_prefetch_then_no_round_trips():
+    cache, coll = _fresh_cache()
+    args_hash = ToolCache._hash_args({"team_id": "LAL"}, cache_schema_version=cache.cache_schema_version)
+    coll.find.return_value = [
+        {"tool": "get_team_stats", "args_hash": args_hash, "output": {"ppg": 115}, "expires_at": time.time() + 60},
+    ]
+
+    assert cache.prefetch("401") == 1
+    assert cache.get(game_id="401", tool="get_team_stats", args={"team_id": "LAL"}) == {"ppg": 115}
+    assert cache.get(game_id="401", tool="get_team_stats", args={"team_id": "BOS"}) is None
+    assert coll.find_one.call_count == 0
+    assert cache.prefetch("401") == 0          # still fresh
+    assert coll.find.call_count == 1
+    print("✅ Prefetch serves warm turns without Mongo")
+
+
+def test_expired_not_served():
+    cache, coll = _fresh_cache()
+    coll.find_one.return_value = {"output": {"ppg": 1}, "expires_at": time.time() - 1}
+    assert cache.get(game_id="402", tool="get_team_stats", args={}) is None
+    coll.find_one.return_value = {"output": {"ppg": 2}, "expires_at": time.time() + 60}
+    assert cache.get(game_id="402", tool="get_team_stats", args={}) == {"ppg": 2}
+    assert cache.get(game_id="402", tool="get_team_stats", args={}) == {"ppg": 2}
+    assert coll.find_one.call_count == 2       # second hit served from L1
+    print("✅ Expiry honored")
+
+
+def test_results_are_copies():
+    cache, coll = _fresh_cache()
+    cache.set(game_id="403", tool="get_team_games", args={}, output={"games": [{"pts": 100}]})
+    first = cache.get(game_id="403", tool="get_team_games", args={})
+    first["games"].append({"pts": 0})
+    first["games"][0]["pts"] = -1
+    assert cache.get(game_id="403", tool="get_team_games", args={}) == {"games": [{"pts": 100}]}
+
+    coll.find_one.return_value = {"output": {"ppg": [1]}, "expires_at": time.time() + 60}
+    fetched = cache.get(game_id="404", tool="get_team_stats", args={})
+    fetched["ppg"].append(2)
+    assert cache.get(game_id="404", tool="get_team_stats", args={}) == {"ppg": [1]}
+    print("✅ Callers get copies of cached outputs")
+
+
+if __name__ == "__main__":
+    test_hash_compatible()
+    test_prefetch_then_no_round_trips()
+    test_expired_not_served()
+    test_results_are_copies()
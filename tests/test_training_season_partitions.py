@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test per-season fan-out of training generation (generate_training_by_season).
+
+Tests:
+1. With training.season_processes > 1, generate_training_chunked hands each
+   season to its own partition (one season of rows, split thread workers)
+   and merges the results back by row index
+2. Rows of seasons outside target_seasons_override keep their values
+3. The feature cache's league history chain is built once in the parent and
+   handed to every partition
+4. On a small synthetic league, partitioned and single-context runs produce
+   the same rows, including head-to-head features over last_N games (which
+   read every earlier season)
+
+The process pool is swapped for a thread pool so partitions run in-process.
+Test 4 needs mongomock (skipped otherwise).
+
+Usage:
+    source venv/bin/activate
+    PYTHONPATH=/Users/pranav/Documents/basketball python tests/test_training_season_partitions.py
+"""
+
+import concurrent.futures
+import dataclasses
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(script_dir)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from bball.pipeline import training_pipeline
+from bball.pipeline.config import TrainingConfig
+
+FEATURES = ['points|season|avg|diff', 'elo|none|raw|diff']
+PARITY_FEATURES = [
+    'points|season|avg|diff', 'wins|season|avg|diff',
+    'h2h_win_pct|season|raw|diff', 'h2h_win_pct|last_5|raw|diff',
+    'margin_h2h|last_3|avg|diff', 'h2h_games_count|last_5|raw|diff',
+]
+
+
+class _InProcessPool(concurrent.futures.ThreadPoolExecutor):
+    def __init__(self, max_workers=None, mp_context=None):
+        super().__init__(max_workers=max_workers)
+
+
+def _run(df, seasons_override=None, **training_kwargs):
+    calls = []
+
+    def fake_partition(league_id, training, season_df, feature_names, league_history=None):
+        calls.append((season_df['Season'].unique().tolist(), training.workers, training.season_processes,
+                      league_history))
+        out = season_df.copy()
+        for f in feature_names:
+            out[f] = out['game_id'] * 10.0 + len(f)
+        return out[feature_names]
+
+    config = SimpleNamespace(
+        league=SimpleNamespace(league_id='nba'),
+        training=TrainingConfig(workers=8, season_processes=3, **training_kwargs),
+    )
+    original = (training_pipeline._generate_season_partition, concurrent.futures.ProcessPoolExecutor)
+    training_pipeline._generate_season_partition = fake_partition
+    concurrent.futures.ProcessPoolExecutor = _InProcessPool
+    try:
+        result = training_pipeline.generate_training_chunked(
+            df.copy(), FEATURES, config,
+            target_seasons_override=seasons_override, generate_predictions=False,
+        )
+    finally:
+        training_pipeline._generate_season_partition, concurrent.futures.ProcessPoolExecutor = original
+    return result, calls
+
+
+def _games():
+    seasons = ['2021-2022', '2022-2023', '2023-2024', '2024-2025']
+    return pd.DataFrame([
+        {'Season': seasons[i % 4], 'game_id': i, 'Home': 'BOS', 'Away': 'NYK'} for i in range(40)
+    ])
+
+
+def test_seasons_fan_out_and_merge():
+    df = _games()
+    result, calls = _run(df)
+    assert sorted(c[0][0] for c in calls) == sorted(df['Season'].unique())
+    assert all(len(seasons) == 1 and workers == 2 and procs == 0 and history is None
+               for seasons, workers, procs, history in calls)
+    for f in FEATURES:
+        assert (result[f] == df['game_id'] * 10.0 + len(f)).all()
+    assert list(result.index) == list(df.index)
+    print("✅ Seasons generated in separate partitions and merged by row")
+
+
+def test_untargeted_seasons_unchanged():
+    df = _games()
+    df[FEATURES[0]] = -1.0
+    result, calls = _run(df, seasons_override=['2023-2024', '2024-2025'])
+    assert sorted(c[0][0] for c in calls) == ['2023-2024', '2024-2025']
+    target = df['Season'].isin(['2023-2024', '2024-2025'])
+    assert (result.loc[~target, FEATURES[0]] == -1.0).all()
+    assert (result.loc[~target, FEATURES[1]] == 0.0).all()
+    assert (result.loc[target, FEATURES[0]] == df.loc[target, 'game_id'] * 10.0 + len(FEATURES[0])).all()
+    print("✅ Other seasons keep their values")
+
+
+def test_league_history_shared():
+    builds = []
+
+    def fake_build(db, league):
+        builds.append(league.league_id)
+        return (['2024-11-01'], [b'chain'])
+
+    with patch.object(training_pipeline, '_build_league_history', fake_build), patch('bball.mongo.Mongo'):
+        _, calls = _run(_games(), feature_cache_dir='/tmp/unused')
+    assert builds == ['nba'] and len(calls) == 4
+    assert all(c[3] == (['2024-11-01'], [b'chain']) for c in calls)
+    print("✅ League history chain built once and shared with partitions")
+
+
+def test_partition_parity_synthetic_league():
+    try:
+        import mongomock
+    except ImportError:
+        print("⚠️  mongomock not installed; skipping partition parity")
+        return
+    from bball.data.synthetic import SyntheticLeagueSpec, generate_synthetic_league
+    from bball.league_config import load_league_config
+    from bball.pipeline.config import PipelineConfig
+
+    league = load_league_config('nba')
+    db = mongomock.MongoClient()['bball_partition_parity']
+    # Six teams meet ~2-3 times a season, so last_5 h2h reaches back two seasons
+    spec = SyntheticLeagueSpec(seasons=4, end_season='2023-2024', teams=6, games_per_team=14,
+                               preseason_games=0, roster_size=8, injury_rate=0.0)
+    seasons = generate_synthetic_league(db, league, spec)['seasons']
+
+    config = PipelineConfig.from_league(league)
+    config.training = TrainingConfig(workers=2, chunk_size=40, preload_per_cache=False,
+                                     preload_injury_cache=False, feature_cache=False)
+    mongo = SimpleNamespace(db=db)
+    with patch('bball.mongo.Mongo', return_value=mongo), \
+            patch.object(training_pipeline, 'load_league_config', return_value=league), \
+            patch.object(concurrent.futures, 'ProcessPoolExecutor', _InProcessPool):
+        df = training_pipeline.load_games_for_training(config, min_season=seasons[1])
+        assert sorted(df['Season'].unique()) == seasons[1:]
+
+        single = training_pipeline.generate_training_chunked(
+            df.copy(), PARITY_FEATURES, config, generate_predictions=False,
+        )
+        config.training = dataclasses.replace(config.training, season_processes=3)
+        partitioned = training_pipeline.generate_training_chunked(
+            df.copy(), PARITY_FEATURES, config, generate_predictions=False,
+        )
+
+    pd.testing.assert_frame_equal(single[PARITY_FEATURES], partitioned[PARITY_FEATURES])
+    # The h2h window really reached past the previous season somewhere
+    last_season = df['Season'] == seasons[-1]
+    assert (single.loc[last_season, 'h2h_games_count|last_5|raw|diff'] != 0).any()
+    print("✅ Partitioned rows match a single-context run (h2h included)")
+
+
+if __name__ == "__main__":
+    test_seasons_fan_out_and_merge()
+    test_untargeted_seasons_unchanged()
+    test_league_history_shared()
+    test_partition_parity_synthetic_league()
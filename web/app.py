@@ -2250,6 +2250,23 @@ def calculate_team_records(team: str, season: str, game_date: date, league=None)
         games_collection = league.collections.get('games', 'stats_nba')
         exclude_game_types = getattr(league, 'exclude_game_types', exclude_game_types)
 
+    # Materialized (team, season) records: one indexed lookup instead of a per-team scan
+    try:
+        from bball.stats.team_records import get_team_records
+        records = get_team_records(db, league, [team], season, before_date,
+                                   exclude_game_types=exclude_game_types, scored_only=True)
+        if records is not None:
+            r = records[str(team)]
+            splits = {
+                'overall': (r['wins'], r['losses']),
+                'home': (r['home_wins'], r['home_losses']),
+                'away': (r['away_wins'], r['away_losses']),
+                'last10': (r['last10_wins'], r['last10_losses']),
+            }
+            return {k: {'wins': w, 'losses': l, 'record': f'{w}-{l}'} for k, (w, l) in splits.items()}
+    except Exception as e:
+        logger.warning(f"Team records lookup failed for {team} ({season}), scanning games instead: {e}")
+
     # Get all games for this team before the game date
     games = list(db[games_collection].find(
         {
@@ -3156,7 +3173,7 @@ def predict(league_id=None):
     Thin wrapper around core PredictionService.
     Rosters are the single source of truth for player lists.
     """
-    from bball.services.prediction import PredictionService
+    from bball.services.prediction_registry import get_prediction_service
 
     data = request.json
     if not data:
@@ -3187,10 +3204,10 @@ def predict(league_id=None):
         return jsonify({'success': False, 'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
 
     try:
-        # Use core PredictionService
+        # Use core PredictionService (shared per league: warm contexts and models)
         league = g.league
         logger.info(f"[predict] league={league.league_id}, collection={league.collections.get('model_config_classifier')}, game_id={game_id}")
-        service = PredictionService(db=db, league=league)
+        service = get_prediction_service(db=db, league=league)
 
         # Make prediction
         result = service.predict_matchup(
@@ -3604,19 +3621,84 @@ def get_calculation_details(league_id=None):
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+def _csv_download(csv_path: str, download_name: str, metadata: Optional[Dict] = None):
+    """
+    Streamed CSV download with ETag/Last-Modified (304 when unchanged).
+
+    Query params:
+        columns: comma-separated columns to export (default: all)
+        gzip: 1/true to download gzip-compressed (whole-file exports are
+              served from a precompressed cache, built in the background;
+              the plain CSV is sent until it is ready)
+    """
+    from flask import Response, stream_with_context
+    from bball.training.master_export import (
+        ensure_gzip_cache, export_etag, iter_csv, iter_gzip, last_modified,
+    )
+
+    columns = [c.strip() for c in (request.args.get('columns') or '').split(',') if c.strip()]
+    use_gzip = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+    etag = export_etag(csv_path, metadata=metadata, columns=columns, gzip=use_gzip)
+    modified = last_modified(csv_path)
+
+    if etag in request.if_none_match or (
+        not request.if_none_match and request.if_modified_since and request.if_modified_since >= modified
+    ):
+        response = Response(status=304)
+        response.set_etag(etag)
+        response.last_modified = modified
+        return response
+
+    if not columns:
+        path = csv_path
+        if use_gzip:
+            # The precompressed copy is built in the background; until then send the plain CSV
+            path = ensure_gzip_cache(csv_path, etag, wait=False)
+            if path is None:
+                path, use_gzip = csv_path, False
+                etag = export_etag(csv_path, metadata=metadata)
+        return send_file(
+            path,
+            as_attachment=True,
+            download_name=f'{download_name}.gz' if use_gzip else download_name,
+            mimetype='application/gzip' if use_gzip else 'text/csv',
+            etag=etag,
+            last_modified=modified,
+            conditional=True,
+        )
+
+    try:
+        blocks = iter_csv(csv_path, columns=columns)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    if use_gzip:
+        blocks = iter_gzip(blocks)
+        download_name = f'{download_name}.gz'
+    response = Response(
+        stream_with_context(blocks),
+        mimetype='application/gzip' if use_gzip else 'text/csv',
+        headers={'Content-Disposition': f'attachment; filename="{download_name}"'},
+    )
+    response.set_etag(etag)
+    response.last_modified = modified
+    return response
+
+
 @app.route('/<league_id>/api/download-master-training', methods=['GET'])
 @app.route('/api/download-master-training', methods=['GET'])
 def download_master_training(league_id=None):
-    """Download the master training data CSV file."""
+    """Download the master training data CSV file (streamed; see _csv_download)."""
     try:
         master_training_path = get_master_training_path()
         if os.path.exists(master_training_path):
-            return send_file(
-                master_training_path,
-                as_attachment=True,
-                download_name='MASTER_TRAINING.csv',
-                mimetype='text/csv'
-            )
+            try:
+                from bball.services.training_data import get_master_training_metadata
+                metadata = get_master_training_metadata(db=db, league=g.league)
+            except Exception:
+                metadata = None
+            # Columns written to the master column store since the last export are exported first
+            from bball.training.master_store import ensure_master_csv
+            return _csv_download(ensure_master_csv(master_training_path), 'MASTER_TRAINING.csv', metadata=metadata)
         else:
             return jsonify({'error': 'Master training data file not found'}), 404
     except Exception as e:
@@ -3662,13 +3744,8 @@ def download_config_training(league_id=None):
         
         # Get filename from path
         filename = os.path.basename(training_csv)
-        
-        return send_file(
-            training_csv,
-            as_attachment=True,
-            download_name=filename,
-            mimetype='text/csv'
-        )
+
+        return _csv_download(training_csv, filename)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -3801,7 +3878,7 @@ def predict_all(league_id=None):
     and returns job_id for frontend polling.
     """
     from bball.services.jobs import create_job, update_job_progress, complete_job, fail_job
-    from bball.services.prediction import PredictionService
+    from bball.services.prediction_registry import get_prediction_service
     from bball.league_config import load_league_config
 
     data = request.json
@@ -3841,7 +3918,8 @@ def predict_all(league_id=None):
             bg_db = Mongo().db
 
             # Use core PredictionService with job_id for progress tracking
-            service = PredictionService(db=bg_db, league=league_config)
+            # (shared per league, so the season context stays warm for /api/predict)
+            service = get_prediction_service(db=bg_db, league=league_config)
 
             game_date_obj = datetime.strptime(date_str, '%Y-%m-%d').date()
             successful = 0
@@ -5374,7 +5452,7 @@ def download_model_config_training_csv(config_id, league_id=None):
             db[classifier_config_collection].update_one({'_id': doc['_id']}, {'$set': {'training_csv': new_path}})
             csv_path = new_path
         filename = os.path.basename(csv_path)
-        return send_file(csv_path, as_attachment=True, download_name=filename)
+        return _csv_download(csv_path, filename)
     except Exception as e:
         import traceback
         return jsonify({'success': False, 'error': str(e), 'traceback': traceback.format_exc()}), 500
@@ -5475,11 +5553,11 @@ def resolve_feature_dependencies(league_id=None):
         if not os.path.exists(master_training_path):
             return jsonify({'success': False, 'error': 'Master training CSV not found'}), 404
 
-        df = pd.read_csv(master_training_path)
+        from bball.training.master_store import master_columns
         metadata_cols = ['Year', 'Month', 'Day', 'Home', 'Away', 'game_id', 'HomeWon', 
                         'home_points', 'away_points', 'pred_home_points', 'pred_away_points', 
                         'pred_margin', 'pred_point_total', 'pred_total']
-        all_features = [c for c in df.columns if c not in metadata_cols]
+        all_features = [c for c in master_columns(master_training_path) if c not in metadata_cols]
         
         # Find matching features by substring
         from bball.features.sets import find_features_by_substrings
@@ -5553,11 +5631,11 @@ def regenerate_master_features(league_id=None):
 
         # Load CSV to get feature info for job metadata
         import pandas as pd
-        df = pd.read_csv(master_training_path)
+        from bball.training.master_store import master_columns
         metadata_cols = ['Year', 'Month', 'Day', 'Home', 'Away', 'game_id', 'HomeWon', 
                         'home_points', 'away_points', 'pred_home_points', 'pred_away_points', 
                         'pred_margin', 'pred_point_total', 'pred_total']
-        all_csv_features = [c for c in df.columns if c not in metadata_cols]
+        all_csv_features = [c for c in master_columns(master_training_path) if c not in metadata_cols]
         
         # Find matching features
         from bball.features.sets import find_features_by_substrings
@@ -5674,9 +5752,10 @@ def delete_master_column(league_id=None):
                 'error': f'Cannot delete metadata column: {column_name}'
             }), 400
 
-        # Read CSV
+        # Read CSV (exporting columns only in the master column store first)
         import pandas as pd
-        df = pd.read_csv(master_training_path)
+        from bball.training.master_store import ensure_master_csv
+        df = pd.read_csv(ensure_master_csv(master_training_path))
         
         # Check if column exists
         if column_name not in df.columns:
@@ -6916,8 +6995,20 @@ def create_matchup_chat_session(league_id=None):
             })
 
         # No existing session found, create a new one
-        # Get game info
-        game = db[games_collection].find_one({'game_id': game_id})
+        # Get game info (from the chat baseline materialized by predict_date when present)
+        from bball.services.matchup_chat.prediction_bootstrap import CHAT_BASELINE_VERSION, chat_baselines_collection
+        baseline = db[chat_baselines_collection(g.league.league_id)].find_one(
+            {'game_id': game_id}, {'_id': 0, 'game': 1, 'version': 1}
+        )
+        if baseline and baseline.get('version') == CHAT_BASELINE_VERSION and baseline.get('game'):
+            baseline_game = baseline['game']
+            game = {
+                'homeTeam': {'name': (baseline_game.get('home') or {}).get('name', '')},
+                'awayTeam': {'name': (baseline_game.get('away') or {}).get('name', '')},
+                'date': baseline_game.get('date', ''),
+            }
+        else:
+            game = db[games_collection].find_one({'game_id': game_id})
         if not game:
             return jsonify({'error': f'Game {game_id} not found'}), 404
         
@@ -7372,6 +7463,12 @@ def master_training_columns(league_id=None):
         if not os.path.exists(master_training_path):
             return jsonify({'error': 'Master training CSV file not found'}), 404
 
+        # The master column store manifest has both when it is in sync with the CSV
+        from bball.training.master_store import MasterColumnStore
+        store = MasterColumnStore.open_current(master_training_path)
+        if store is not None:
+            return jsonify({'columns': store.columns, 'total_rows': store.rows})
+
         # Read just the header to get columns
         try:
             df = pd.read_csv(master_training_path, nrows=0, on_bad_lines='skip', engine='python')
@@ -7431,6 +7528,8 @@ def master_training_rows(league_id=None):
         requested_columns = [col.strip() for col in columns_param.split(',') if col.strip()] if columns_param else []
 
         # Read CSV in chunks to handle large files efficiently
+        from bball.training.master_store import ensure_master_csv
+        ensure_master_csv(master_training_path)
         try:
             df = pd.read_csv(master_training_path, on_bad_lines='skip', engine='python')
         except TypeError:
@@ -7533,74 +7632,94 @@ def master_training_rows(league_id=None):
         return jsonify({'error': str(e)}), 500
 
 
-@app.route('/<league_id>/api/market-prices', methods=['GET'])
-@app.route('/api/market-prices', methods=['GET'])
-def get_market_prices(league_id=None):
-    """
-    Get Kalshi market prices for all games on a specific date.
+def _market_prices_feed(date_str):
+    """(key, fetch) for the shared market-prices snapshot of the current league."""
+    from bball.services.live_snapshots import fetch_market_prices
+
+    league = g.league
+    league_id_str = league.league_id if league else 'nba'
+    return ('markets', league_id_str, date_str), lambda: fetch_market_prices(db, league, date_str)
+
+
+def _live_games_feed(date_str):
+    """(key, fetch) for the shared live-games snapshot of the current league."""
+    from bball.services.live_snapshots import fetch_live_games
+
+    league = g.league
+    league_id_str = league.league_id if league else 'nba'
+    return ('live', league_id_str, date_str), lambda: fetch_live_games(league, date_str)
 
-    Uses unauthenticated Kalshi public API to fetch live market prices.
-    Thin wrapper around core/market/kalshi.get_game_market_data().
-    """
-    from bball.market.kalshi import get_game_market_data
 
+def _parse_snapshot_date():
+    """Validate the ?date= parameter; returns (date_str, error_response)."""
     date_str = request.args.get('date')
     if not date_str:
-        return jsonify({'success': False, 'error': 'Missing date parameter'}), 400
-
+        return None, (jsonify({'success': False, 'error': 'Missing date parameter'}), 400)
     try:
-        game_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+        datetime.strptime(date_str, '%Y-%m-%d')
     except ValueError:
-        return jsonify({'success': False, 'error': 'Invalid date format'}), 400
+        return None, (jsonify({'success': False, 'error': 'Invalid date format'}), 400)
+    return date_str, None
 
-    # Get league config
-    league = g.league
-    league_id_str = league.league_id if league else 'nba'
-    games_collection = league.collections.get('games', 'stats_nba')
 
-    # Get games for this date
-    games = list(db[games_collection].find(
-        {'date': date_str},
-        {'game_id': 1, 'homeTeam.name': 1, 'awayTeam.name': 1}
-    ))
+def _snapshot_event_stream(key, fetch, interval, payload_key):
+    """Server-sent events for a shared snapshot: one event per new version, bounded lifetime."""
+    from flask import Response, stream_with_context
+    from bball.services.live_snapshots import get_snapshot_poller, snapshot_events
 
-    if not games:
-        return jsonify({
-            'success': True,
-            'markets': {},
-            'message': 'No games found for this date'
-        })
+    events = snapshot_events(get_snapshot_poller(), key, fetch, interval, payload_key)
+    return Response(
+        stream_with_context(events),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
 
-    # Fetch market data for each game
-    markets = {}
-    for game in games:
-        game_id = game.get('game_id')
-        home_team = game.get('homeTeam', {}).get('name', '')
-        away_team = game.get('awayTeam', {}).get('name', '')
 
-        if not home_team or not away_team:
-            continue
+@app.route('/<league_id>/api/market-prices', methods=['GET'])
+@app.route('/api/market-prices', methods=['GET'])
+def get_market_prices(league_id=None):
+    """
+    Get Kalshi market prices for all games on a specific date.
 
-        try:
-            market_data = get_game_market_data(
-                game_date=game_date,
-                away_team=away_team,
-                home_team=home_team,
-                league_id=league_id_str,
-                use_cache=True,
-                cache_ttl=30  # 30 second cache for live data
-            )
+    Served from the shared background snapshot (bball.services.live_snapshots),
+    so upstream Kalshi load does not grow with the number of open dashboards.
+    """
+    from bball.services.live_snapshots import get_snapshot_poller, MARKET_POLL_SECONDS
 
-            if market_data:
-                markets[game_id] = market_data.to_dict()
-        except Exception as e:
-            logger.warning(f"Failed to fetch market data for game {game_id}: {e}")
-            continue
+    date_str, error_response = _parse_snapshot_date()
+    if error_response:
+        return error_response
 
-    return jsonify({
+    key, fetch = _market_prices_feed(date_str)
+    snapshot = get_snapshot_poller().get(key, fetch, MARKET_POLL_SECONDS)
+    if snapshot.data is None:
+        # Same contract as before the shared poller: a failed Kalshi fetch is an empty slate
+        logger.warning(f"Failed to fetch market data for {date_str}: {snapshot.error}")
+        return jsonify({'success': True, 'markets': {}})
+
+    response = {
         'success': True,
-        'markets': markets
-    })
+        'markets': snapshot.data,
+        'version': snapshot.version,
+        'updated_at': datetime.utcfromtimestamp(snapshot.fetched_at).isoformat() + 'Z',
+    }
+    if not snapshot.data:
+        response['message'] = 'No markets found for this date'
+    return jsonify(response)
+
+
+@app.route('/<league_id>/api/market-prices/stream', methods=['GET'])
+@app.route('/api/market-prices/stream', methods=['GET'])
+def stream_market_prices(league_id=None):
+    """Server-sent events stream of the shared market-prices snapshot."""
+    from bball.services.live_snapshots import MARKET_POLL_SECONDS
+
+    date_str, error_response = _parse_snapshot_date()
+    if error_response:
+        return error_response
+
+    key, fetch = _market_prices_feed(date_str)
+    return _snapshot_event_stream(key, fetch, MARKET_POLL_SECONDS, 'markets')
 
 
 @app.route('/<league_id>/api/market/dashboard', methods=['GET'])
@@ -8026,110 +8145,40 @@ def get_live_games(league_id=None):
     Get live game data (scores, period, clock, status) from ESPN API.
 
     Used for live polling to update game cards and modal with real-time data.
+    Served from the shared background snapshot (bball.services.live_snapshots).
     """
-    date_str = request.args.get('date')
-    if not date_str:
-        return jsonify({'success': False, 'error': 'Missing date parameter'}), 400
+    from bball.services.live_snapshots import get_snapshot_poller, LIVE_POLL_SECONDS
 
-    try:
-        game_date = datetime.strptime(date_str, '%Y-%m-%d').date()
-    except ValueError:
-        return jsonify({'success': False, 'error': 'Invalid date format'}), 400
-
-    # Get league config
-    league = g.league
-    league_id_str = league.league_id if league else 'nba'
+    date_str, error_response = _parse_snapshot_date()
+    if error_response:
+        return error_response
 
-    # Fetch from ESPN API using league config template
-    date_yyyymmdd = date_str.replace('-', '')
-    try:
-        espn_url = league.espn_endpoint('scoreboard_site_template').format(YYYYMMDD=date_yyyymmdd)
-    except Exception:
-        # Fallback for NBA
-        espn_url = f"https://site.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard?dates={date_yyyymmdd}"
+    key, fetch = _live_games_feed(date_str)
+    snapshot = get_snapshot_poller().get(key, fetch, LIVE_POLL_SECONDS)
+    if snapshot.data is None:
+        logger.warning(f"Failed to fetch live games from ESPN: {snapshot.error}")
+        return jsonify({'success': False, 'error': snapshot.error}), 500
 
-    live_games = {}
-    try:
-        import requests
-        resp = requests.get(espn_url, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-
-        for event in data.get('events', []):
-            game_id = event.get('id')
-            if not game_id:
-                continue
+    return jsonify({
+        'success': True,
+        'games': snapshot.data,
+        'version': snapshot.version,
+        'updated_at': datetime.utcfromtimestamp(snapshot.fetched_at).isoformat() + 'Z',
+    })
 
-            # Extract status - can be string or dict
-            status_obj = event.get('status', {})
-            game_status = 'pre'
-            game_completed = False
-            period = None
-            clock = None
-            status_detail = None
-
-            if isinstance(status_obj, str):
-                if status_obj.lower() in ('final', 'completed', 'post'):
-                    game_status = 'post'
-                    game_completed = True
-                elif status_obj.lower() in ('active', 'in', 'in progress', 'live'):
-                    game_status = 'in'
-                else:
-                    game_status = 'pre'
-            elif isinstance(status_obj, dict):
-                status_type = status_obj.get('type', {})
-                if isinstance(status_type, dict):
-                    raw_status = status_type.get('name', '').lower()
-                    game_completed = status_type.get('completed', False)
-                    # Get human-readable status detail (e.g., "Halftime", "End of 3rd")
-                    status_detail = status_type.get('shortDetail') or status_type.get('detail')
-                    # Normalize ESPN status names to 'pre', 'in', or 'post'
-                    if game_completed or 'final' in raw_status or 'post' in raw_status:
-                        game_status = 'post'
-                    elif 'progress' in raw_status or 'halftime' in raw_status or raw_status == 'in':
-                        game_status = 'in'
-                    else:
-                        game_status = 'pre'
-                period = status_obj.get('period')
-                clock = status_obj.get('displayClock')
 
-            # Extract scores from competitors
-            home_score = None
-            away_score = None
-            competitions = event.get('competitions', [])
-            if competitions:
-                competitors = competitions[0].get('competitors', [])
-                for comp in competitors:
-                    score_val = comp.get('score')
-                    # Only parse if score exists and is not empty
-                    if score_val is not None and score_val != '':
-                        try:
-                            score = int(score_val)
-                            if comp.get('homeAway') == 'home':
-                                home_score = score
-                            else:
-                                away_score = score
-                        except (ValueError, TypeError):
-                            pass
-
-            live_games[game_id] = {
-                'status': game_status,
-                'completed': game_completed,
-                'period': period,
-                'clock': clock,
-                'status_detail': status_detail,
-                'home_score': home_score,
-                'away_score': away_score
-            }
+@app.route('/<league_id>/api/live-games/stream', methods=['GET'])
+@app.route('/api/live-games/stream', methods=['GET'])
+def stream_live_games(league_id=None):
+    """Server-sent events stream of the shared live-games snapshot."""
+    from bball.services.live_snapshots import LIVE_POLL_SECONDS
 
-    except Exception as e:
-        logger.warning(f"Failed to fetch live games from ESPN: {e}")
-        return jsonify({'success': False, 'error': str(e)}), 500
+    date_str, error_response = _parse_snapshot_date()
+    if error_response:
+        return error_response
 
-    return jsonify({
-        'success': True,
-        'games': live_games
-    })
+    key, fetch = _live_games_feed(date_str)
+    return _snapshot_event_stream(key, fetch, LIVE_POLL_SECONDS, 'games')
 
 
 @app.route('/<league_id>/api/portfolio/game-positions', methods=['GET'])